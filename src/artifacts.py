@@ -0,0 +1,173 @@
+"""
+Test artifacts pipeline.
+
+With workers the slow part of artifacts handling (moving big files, decoding screenshots,
+dumping http flows, compressing) is done by a background thread pool, so the next test
+starts right away. The test only renames its files out of the way, that is instant.
+Text logs may be compressed with zstd. When all the test artifacts are done
+the manifest listing them is written. Without workers everything is done in place.
+"""
+import base64
+import itertools
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import zstandard
+
+COMPRESSED_SUFFIXES = ('.log', '.tsv', '.json')
+
+_executor = None
+_compress = False
+_lock = threading.Lock()
+_pending = {}
+_entries = {}
+_ended = {}
+_staged = itertools.count()
+
+
+def configure(workers=0, compress=False):
+    global _executor, _compress
+    _executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='artifacts') if workers else None
+    _compress = compress
+
+
+def write(test, dest, content, base64_encoded=False):
+    """Writes str or bytes content, base64 content is decoded in background."""
+
+    def produce():
+        data = base64.b64decode(content.encode('utf-8')) if base64_encoded else content
+        with open(dest, 'wb' if isinstance(data, bytes) else 'w') as f:
+            f.write(data)
+    _submit(test, produce, [dest])
+
+
+def move(test, src, dest):
+    staged = _stage(src)
+    _submit(test, lambda: shutil.move(staged, dest), [dest])
+
+
+def copy(test, src, dest):
+    """For files the still running process keeps writing to, so the copy is made right away."""
+
+    if _executor is None:
+        _submit(test, lambda: shutil.copy(src, dest), [dest])
+        return
+
+    staged = f'{src}.{next(_staged)}.staged'
+    shutil.copy(src, staged)
+    _submit(test, lambda: shutil.move(staged, dest), [dest])
+
+
+def run(test, func, outputs, src=None):
+    """
+    Runs func producing outputs files. Optional src file or directory is moved out of the way first,
+    passed to func and removed afterwards.
+    """
+
+    if src is None:
+        _submit(test, func, outputs)
+        return
+
+    staged = _stage(src)
+
+    def produce():
+        try:
+            func(staged)
+        finally:
+            if os.path.isdir(staged):
+                shutil.rmtree(staged)
+            else:
+                os.remove(staged)
+    _submit(test, produce, outputs)
+
+
+def end_test(test, manifest_path):
+    """Manifest is written to manifest_path(folder) for each folder with the test artifacts once they are done."""
+
+    with _lock:
+        _ended[test] = manifest_path
+        done = not _pending.get(test)
+    if done:
+        _write_manifests(test)
+
+
+def flush():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+    for test in list(_ended):
+        _write_manifests(test)
+
+
+def _stage(src):
+    if _executor is None:
+        return src
+
+    staged = f'{src}.{next(_staged)}.staged'
+    os.rename(src, staged)
+    return staged
+
+
+def _submit(test, func, outputs):
+    with _lock:
+        _pending[test] = _pending.get(test, 0) + 1
+
+    if _executor is None:
+        _process(test, func, outputs)
+    else:
+        _executor.submit(_process, test, func, outputs)
+
+
+def _process(test, func, outputs):
+    start = time.perf_counter()
+    error = None
+    try:
+        func()
+        if _compress:
+            outputs = [_compress_file(path) if path.endswith(COMPRESSED_SUFFIXES) else path for path in outputs]
+    except Exception as e:
+        print(f'Unable to process artifacts {outputs} of [{test}]: {e}')
+        error = str(e)
+
+    seconds = time.perf_counter() - start
+    with _lock:
+        for path in outputs:
+            size = os.path.getsize(path) if os.path.exists(path) else None
+            _entries.setdefault(test, []).append({'path': path, 'size': size, 'seconds': seconds, 'error': error})
+        _pending[test] -= 1
+        done = _pending[test] == 0 and test in _ended
+
+    if done:
+        _write_manifests(test)
+
+
+def _compress_file(path):
+    dest = f'{path}.zst'
+    with open(path, 'rb') as src, open(dest, 'wb') as out:
+        zstandard.ZstdCompressor(level=3).copy_stream(src, out)
+    os.remove(path)
+    return dest
+
+
+def _write_manifests(test):
+    with _lock:
+        manifest_path = _ended.pop(test, None)
+        entries = _entries.pop(test, [])
+        _pending.pop(test, None)
+
+    if manifest_path is None or not entries:
+        return
+
+    folders = {}
+    for entry in entries:
+        folders.setdefault(os.path.dirname(entry['path']), []).append(entry)
+
+    for folder, folder_entries in folders.items():
+        with open(manifest_path(folder), 'w') as f:
+            json.dump({'test': test, 'artifacts': folder_entries}, f, indent=1)
@@ -0,0 +1,55 @@
+"""
+Compares two bench_harness.py results: `python bench_compare.py BASE.json NEW.json [--threshold 10]`.
+Exits with 1 if some metric got slower by more than threshold percent (and by more than --min-delta ms).
+"""
+import argparse
+import json
+import sys
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(base, new, stat='p50', threshold=10.0, min_delta_ms=5.0):
+    """Returns rows of (name, base, new, change percent, regressed) for metrics present in both."""
+
+    rows = []
+    for name in sorted(set(base['metrics']) & set(new['metrics'])):
+        before = base['metrics'][name][stat]
+        after = new['metrics'][name][stat]
+        change = (after - before) / before * 100 if before else 0.0
+        regressed = change > threshold and (after - before) * 1000 > min_delta_ms
+        rows.append((name, before, after, change, regressed))
+
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare two harness benchmark results.')
+    parser.add_argument('base')
+    parser.add_argument('new')
+    parser.add_argument('--stat', default='p50', choices=('mean', 'p50', 'p90', 'p95', 'p99', 'max'),
+        help='Statistic to compare (default: p50)')
+    parser.add_argument('--threshold', type=float, default=10.0, help='Allowed slowdown in percent (default: 10)')
+    parser.add_argument('--min-delta', type=float, default=5.0,
+        help='Slowdowns less than that many ms are noise (default: 5)')
+    args = parser.parse_args()
+
+    base = load(args.base)
+    new = load(args.new)
+    print(f"{base['commit'][:12]} -> {new['commit'][:12]}, {args.stat} seconds")
+    for key in sorted(set(base['options']) | set(new['options'])):
+        if base['options'].get(key) != new['options'].get(key):
+            print(f"Option {key} differs: {base['options'].get(key)} -> {new['options'].get(key)}")
+
+    rows = compare(base, new, args.stat, args.threshold, args.min_delta)
+    for name, before, after, change, regressed in rows:
+        print(f"{name:50}{before:10.3f}{after:10.3f}{change:+9.1f}%{'  SLOWER' if regressed else ''}")
+
+    sys.exit(1 if any(row[-1] for row in rows) else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""
+Benchmark of the harness itself against the local stand-in SUT (see bench_sut.py).
+
+Not collected by default, run it explicitly, e.g. `./run --headless --bench` or
+`pytest bench_harness.py --headless` inside the container. Every fixture setup and teardown,
+navigation, wait and helper is a timing span, their stats are written into `bench-results.json`
+with the commit id (E2E_COMMIT env or git), compare two of them with `bench_compare.py`.
+db_conn benchmark wipes the database, so it needs --destructive.
+"""
+import datetime
+import json
+import os
+import subprocess
+
+import pytest
+
+import timing
+from bench_sut import BenchServer
+from load import distribution
+from stuff import clear_element, clear_non_input_element, click_with_js, hover_then_click, \
+    wait_for_element_to_be_clickable, wait_for_element_to_be_visible, wait_for_file_to_be_downloaded
+
+RESULTS_FN = 'bench-results.json'
+# Options that change the harness overhead, they are saved with the results
+OPTIONS = ('--headless-backend', '--browser-pool', '--persistent-proxy', '--record-screen', '--record-screen-mode',
+           '--cpu-sampler', '--firefox-log', '--wait-backend', '--pacing', '--artifact-workers', '--proxy-replay')
+
+
+def commit_id():
+    if os.environ.get('E2E_COMMIT'):
+        return os.environ['E2E_COMMIT']
+
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def bench_results(config):
+    metrics = {}
+    for span in timing.spans():
+        metrics.setdefault(span.name, []).append(span.duration)
+
+    return {
+        'commit': commit_id(),
+        'timestamp': datetime.datetime.now().isoformat(),
+        'options': {name: config.getoption(name) for name in OPTIONS},
+        'metrics': {
+            name: {'mean': sum(durations) / len(durations), **distribution(durations)}
+            for name, durations in sorted(metrics.items())
+        },
+    }
+
+
+@pytest.fixture(scope='session', autouse=True)
+def bench_report(request):
+    # Session fixtures go first, so all the tests fixtures are recorded
+    timing.enable()
+    yield
+    log_dir = os.path.join('/tmp', 'logs')
+    os.makedirs(log_dir, exist_ok=True)
+    with open(os.path.join(log_dir, RESULTS_FN), 'w') as f:
+        json.dump(bench_results(request.config), f, indent=1)
+
+
+@pytest.fixture(scope='session')
+def bench_sut():
+    server = BenchServer().start()
+    yield server.url
+    server.stop()
+
+
+@pytest.fixture(scope='module')
+def sut_location(bench_sut):
+    return bench_sut + '/'
+
+
+@pytest.fixture(scope='session')
+def cached_firefox_profile(cached_firefox_profile):
+    # Otherwise Firefox bypasses the proxy for localhost and proxy overhead is not measured
+    cached_firefox_profile.set_preference('network.proxy.allow_hijacking_localhost', True)
+    cached_firefox_profile.update_preferences()
+    return cached_firefox_profile
+
+
+@pytest.fixture
+def bench_page(not_logged_in_selenium, bench_sut):
+    def open_page(path):
+        with timing.span('navigate'):
+            not_logged_in_selenium.get(bench_sut + path)
+        return not_logged_in_selenium
+
+    return open_page
+
+
+@pytest.mark.nondestructive
+def test_bench_start(not_logged_in_selenium):
+    """Fixtures and browser start only."""
+
+
+@pytest.mark.nondestructive
+def test_bench_wait_for_slow_element(bench_page):
+    driver = bench_page('/slow-render?delay_ms=500')
+    wait_for_element_to_be_visible(driver, '//div[@id="late"]')
+
+
+@pytest.mark.nondestructive
+def test_bench_click_delayed_button(bench_page):
+    driver = bench_page('/delayed-button?delay_ms=500')
+    wait_for_element_to_be_clickable(driver, '//button[@id="go"]')
+    hover_then_click(driver, '//button[@id="go"]')
+
+
+@pytest.mark.nondestructive
+def test_bench_clicks_and_clears(not_logged_in_selenium):
+    driver = not_logged_in_selenium
+    hover_then_click(driver, '//button[@id="button"]')
+    click_with_js(driver, '//button[@id="button"]')
+    clear_element(driver, '//input[@id="text"]')
+    clear_non_input_element(driver, '//div[@id="editable"]')
+
+
+@pytest.mark.nondestructive
+def test_bench_many_assets(bench_page):
+    driver = bench_page('/assets?count=100')
+    wait_for_element_to_be_visible(driver, '(//img)[100]')
+
+
+@pytest.mark.nondestructive
+def test_bench_download(not_logged_in_selenium, clear_downloads_dir):
+    hover_then_click(not_logged_in_selenium, '//a[@id="download"]')
+    assert wait_for_file_to_be_downloaded('bench-download.bin')
+
+
+@pytest.mark.destructive
+def test_bench_db_conn(db_conn):
+    """db_conn setup and teardown only, see --db-template."""
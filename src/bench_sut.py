@@ -0,0 +1,120 @@
+"""
+Local stand-in SUT for the harness benchmark (see bench_harness.py).
+
+Pages are deterministic, delays come from the query string:
+
+    /                          index with the form
+    /slow-render?delay_ms=N    element #late appears after N ms
+    /delayed-button?delay_ms=N button #go is enabled after N ms
+    /assets?count=N            page with N scripts, styles and images
+    /download?size=N           N bytes file download
+
+Run standalone with `python bench_sut.py [PORT]`.
+"""
+import sys
+import threading
+
+from flask import Flask, Response, request
+from werkzeug.serving import make_server
+
+app = Flask(__name__)
+
+PAGE = '''<!DOCTYPE html>
+<html><head><title>{title}</title>{head}</head>
+<body>{body}</body></html>
+'''
+
+
+def page(title, body, head=''):
+    return PAGE.format(title=title, head=head, body=body)
+
+
+@app.route('/')
+def index():
+    return page('bench', '''
+<input id="text" value="some text to clear">
+<div id="editable" contenteditable="true">some editable text to clear</div>
+<button id="button" onclick="this.textContent = 'clicked'">click</button>
+<a id="download" href="/download?size=10485760&name=bench-download.bin">download</a>
+''')
+
+
+@app.route('/slow-render')
+def slow_render():
+    delay = int(request.args.get('delay_ms', 500))
+    return page('slow render', f'''
+<script>
+setTimeout(() => {{
+    const el = document.createElement('div');
+    el.id = 'late';
+    el.textContent = 'late element';
+    document.body.appendChild(el);
+}}, {delay});
+</script>
+''')
+
+
+@app.route('/delayed-button')
+def delayed_button():
+    delay = int(request.args.get('delay_ms', 500))
+    return page('delayed button', f'''
+<button id="go" disabled onclick="this.textContent = 'clicked'">go</button>
+<script>setTimeout(() => document.getElementById('go').disabled = false, {delay});</script>
+''')
+
+
+@app.route('/assets')
+def assets():
+    count = int(request.args.get('count', 50))
+    head = ''.join(f'<link rel="stylesheet" href="/asset/{i}.css"><script src="/asset/{i}.js"></script>' for i in range(count))
+    body = ''.join(f'<img src="/asset/{i}.svg" width="10" height="10">' for i in range(count))
+    return page('assets', body, head)
+
+
+@app.route('/asset/<int:number>.<ext>')
+def asset(number, ext):
+    content, mimetype = {
+        'css': (f'.a{number} {{ color: #{number % 0xffffff:06x}; }}', 'text/css'),
+        'js': (f'window.asset{number} = {number};', 'application/javascript'),
+        'svg': (f'<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"><text>{number}</text></svg>', 'image/svg+xml'),
+    }[ext]
+    return Response(content, mimetype=mimetype)
+
+
+@app.route('/download')
+def download():
+    size = int(request.args.get('size', 2**20))
+    name = request.args.get('name', f'bench-{size}.bin')
+
+    def generate():
+        chunk = b'\0' * 65536
+        left = size
+        while left > 0:
+            yield chunk[:min(left, len(chunk))]
+            left -= len(chunk)
+
+    return Response(generate(), mimetype='application/octet-stream', headers={
+        'Content-Disposition': f'attachment; filename="{name}"',
+        'Content-Length': str(size),
+    })
+
+
+class BenchServer:
+    """Serves the app from the background thread, port 0 picks a free one."""
+
+    def __init__(self, host='127.0.0.1', port=0):
+        self.server = make_server(host, port, app, threaded=True)
+        self.url = f'http://{host}:{self.server.server_port}'
+        self.thread = threading.Thread(target=self.server.serve_forever, name='bench-sut', daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.thread.join()
+
+
+if __name__ == '__main__':
+    app.run(port=int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,91 @@
+from selenium.common.exceptions import WebDriverException
+
+
+# Runs in the browser chrome context, so it clears all origins at once, not only the current one
+CLEAR_DATA_SCRIPT = '''
+const done = arguments[arguments.length - 1];
+const flags = Ci.nsIClearDataService.CLEAR_COOKIES | Ci.nsIClearDataService.CLEAR_DOM_STORAGES;
+Services.clearData.deleteData(flags, () => done(true));
+'''
+
+RESET_STORAGE_SCRIPT = '''
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+'''
+
+
+class BrowserPool:
+    """
+    Keeps warm browser sessions between tests.
+    Session is recycled (quit) after max_uses tests or after a failed test.
+    """
+
+    def __init__(self, max_uses=20):
+        self.max_uses = max_uses
+        self._idle = []
+        self._uses = {}
+
+    def acquire(self, factory):
+        while self._idle:
+            driver = self._idle.pop()
+            if self._is_alive(driver):
+                self._uses[driver] += 1
+                return driver
+            self._discard(driver)
+
+        driver = factory()
+        self._uses[driver] = 1
+        return driver
+
+    def release(self, driver, failed=False):
+        if failed or self._uses.get(driver, 0) >= self.max_uses:
+            self._discard(driver)
+            return
+
+        try:
+            reset_session(driver)
+        except WebDriverException as e:
+            print(f'Unable to reset browser session, recycling it: {e}')
+            self._discard(driver)
+            return
+
+        self._idle.append(driver)
+
+    def close(self):
+        while self._idle:
+            self._discard(self._idle.pop())
+
+    def _discard(self, driver):
+        self._uses.pop(driver, None)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    @staticmethod
+    def _is_alive(driver):
+        try:
+            driver.current_window_handle
+            return True
+        except WebDriverException:
+            return False
+
+
+def reset_session(driver):
+    """Brings the browser back to the state of the fresh session."""
+
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+
+    try:
+        with driver.context(driver.CONTEXT_CHROME):
+            driver.execute_async_script(CLEAR_DATA_SCRIPT)
+    except WebDriverException:
+        # Only the current origin can be cleared from the content context
+        driver.delete_all_cookies()
+        driver.execute_script(RESET_STORAGE_SCRIPT)
+
+    driver.get('about:blank')
@@ -0,0 +1,39 @@
+"""
+Firefox profile zipped once for all the sessions of the worker (see firefox_profile fixture).
+"""
+import tempfile
+
+from selenium import webdriver
+
+
+class CachedFirefoxProfile(webdriver.FirefoxProfile):
+    """
+    Profile is zipped and sent to the driver on every session start, this one is zipped once.
+    Preferences must be set before the first session. Drivers get for_driver() copies, as Firefox.quit
+    removes the profile dir it was given.
+    """
+
+    _encoded = None
+
+    @property
+    def encoded(self):
+        if self._encoded is None:
+            self._encoded = super().encoded
+        return self._encoded
+
+    def for_driver(self):
+        return DriverFirefoxProfile(self.encoded)
+
+
+class DriverFirefoxProfile(webdriver.FirefoxProfile):
+    """Already zipped profile of a single driver, its path is an empty temp dir for Firefox.quit to remove."""
+
+    def __init__(self, encoded):
+        # FirefoxProfile would copy the whole profile dir, the driver needs the zip only
+        self.profile_dir = tempfile.mkdtemp()
+        self.tempfolder = None
+        self._encoded = encoded
+
+    @property
+    def encoded(self):
+        return self._encoded
@@ -0,0 +1,60 @@
+"""
+Sends pytest args to the test server (see server.py) and prints the job output,
+exits with the job exit code: `python client.py -k test_google_must_search_for_a_query_string`.
+"""
+import json
+import shutil
+import socket
+import struct
+import sys
+import time
+
+from server import EXIT, JOB, OUTPUT, SOCKET_PATH, recv_frame, send_frame
+
+# Server may be still warming up right after the start
+CONNECT_TIMEOUT = 60
+# run.sh options, the server is already started with or without them
+RUN_SH_OPTIONS = ('--headless',)
+
+
+def connect(timeout=CONNECT_TIMEOUT):
+    end = time.monotonic() + timeout
+    while True:
+        conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            conn.connect(SOCKET_PATH)
+            return conn
+        except (FileNotFoundError, ConnectionRefusedError):
+            conn.close()
+            if time.monotonic() > end:
+                raise
+            time.sleep(0.2)
+
+
+def main(args):
+    job = {
+        'args': [arg for arg in args if arg not in RUN_SH_OPTIONS],
+        'tty': sys.stdout.isatty(),
+        'columns': shutil.get_terminal_size().columns,
+    }
+    with connect() as conn:
+        send_frame(conn, JOB, json.dumps(job).encode())
+        while True:
+            frame = recv_frame(conn)
+            if frame is None:
+                print('Server closed the connection')
+                return 1
+
+            kind, payload = frame
+            if kind == OUTPUT:
+                sys.stdout.buffer.write(payload)
+                sys.stdout.buffer.flush()
+            elif kind == EXIT:
+                return struct.unpack('>i', payload)[0]
+
+
+if __name__ == '__main__':
+    try:
+        sys.exit(main(sys.argv[1:]))
+    except KeyboardInterrupt:
+        sys.exit(130)
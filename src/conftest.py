@@ -1,16 +1,16 @@
-import base64
 import contextlib
+import glob
+import math
 import os
 import pathlib
 import pytest
+import random
 import re
 import shutil
 import subprocess
 import shlex
 import time
-import binascii
-import psycopg
-from image_hex import image
+from psycopg_pool import ConnectionPool
 from datetime import datetime
 from selenium.common.exceptions import StaleElementReferenceException, WebDriverException
 from selenium.webdriver.common.by import By
@@ -21,7 +21,26 @@ from selenium import webdriver
 from selenium.webdriver.common.proxy import Proxy
 from selenium.webdriver.common.desired_capabilities import DesiredCapabilities
 
-from defs import DEFAULT_SUT_LOCAITON, DEFAULT_TIMEOUT, DEFAULT_API_BASE_URL, FIREFOX_PROFILE
+import artifacts
+import history
+import proxy_control
+from proc_sampler import ProcSampler
+import proxy_replay
+import dom_wait
+import fixture_assets
+import pacing
+import timing
+import login_state
+from browser_pool import BrowserPool
+from cached_profile import CachedFirefoxProfile
+from downloads import DownloadWatcher
+from screen_shots import ScreenShotRecorder, make_clip
+from db import MAINTENANCE_DB, conninfo, create_database, drop_database, ensure_template, restore_from_template, \
+    run_migrations
+from perf_metrics import PerfRecorder, load_budgets
+from flow_reader import DEFAULT_MAX_BODY_SIZE, dump_flows
+from defs import DEFAULT_SUT_LOCAITON, DEFAULT_TIMEOUT, DEFAULT_API_BASE_URL, FIREFOX_PROFILE, DOWNLOAD_DIR, \
+    DISPLAY_NUM, PROXY_PORT, WORKER_ID, WORKER_TMP_DIR, WORKER_SHM_DIR
 from stuff import hover_then_click, wait_for_element_to_be_visible, get_current_day, random_str, \
     hover_then_click_then_send_keys, wait_for_element_to_be_clickable, scroll_to_then_back, \
     clear_element, click_with_js
@@ -29,13 +48,30 @@ from stuff import hover_then_click, wait_for_element_to_be_visible, get_current_
 LOG_DIR = '/tmp/logs'
 FAILURE_DIR = '/tmp/failure_logs'
 USER_DATA_DIR = '/chrome-user-data-dir'
-VIDEO_PATH = "/tmp/screen.mkv"
-CPUSTAT_PATH = "/tmp/cpustat.log"
+VIDEO_PATH = f'{WORKER_TMP_DIR}/screen.mkv'
+SCREEN_SEGMENTS_DIR = f'{WORKER_TMP_DIR}/screen-segments'
+SCREEN_SEGMENT_SECONDS = 10
+SCREEN_SHOTS_DIR = f'{WORKER_TMP_DIR}/screen-shots'
+SCREEN_SIZE = (1920, 1080)
+HEADLESS_BACKENDS = ('xvfb', 'native')
+CPUSTAT_PATH = f'{WORKER_TMP_DIR}/cpustat.log'
+CPUSTAT_JSON_PATH = f'{WORKER_TMP_DIR}/cpustat.json'
 FIREFOX_LOG_FN = 'firefox.log'
-FIREFOX_SRC_LOG_FN = f"/tmp/{FIREFOX_LOG_FN}"
+FIREFOX_SRC_LOG_FN = f"{WORKER_TMP_DIR}/{FIREFOX_LOG_FN}"
 FIREFOX_DEST_LOG_FN = f'{FIREFOX_SRC_LOG_FN}.moz_log'
-FULL_HTTP_LOG_FN = '/tmp/full-http.log'
-HTTP_LOG_FN = '/tmp/http.log'
+# tmpfs, in failure tier Firefox rotates the log there keeping only the last megabytes
+FIREFOX_RING_LOG_FN = f'{WORKER_SHM_DIR}/{FIREFOX_LOG_FN}'
+FIREFOX_RING_SNAPSHOT_FN = f'{FIREFOX_SRC_LOG_FN}.ring'
+FIREFOX_LOG_MODULES = 'timestamp,nsHttp:1,cache2:1,nsHostResolver:1,cookie:1'
+FIREFOX_LOG_TIERS = ('off', 'failure', 'full')
+GECKODRIVER_LOG_LEVELS = {'off': 'fatal', 'failure': 'debug', 'full': 'trace'}
+FULL_HTTP_LOG_FN = f'{WORKER_TMP_DIR}/full-http.log'
+HTTP_LOG_FN = f'{WORKER_TMP_DIR}/http.log'
+PROXY_CONTROL_SOCKET = f'/tmp/mitmdump-{PROXY_PORT}.sock'
+# Logs of the workers are merged into the single folder
+WORKER_SUFFIX = f'-w{WORKER_ID}' if WORKER_ID else ''
+MITMDUMP = '/home/chrome/proxy/mitmdump'
+REPLAY_CACHE_DIR = '/home/chrome/replay-cache'
 
 
 # pylint: disable=maybe-no-member
@@ -49,13 +85,186 @@ def pytest_addoption(parser):
     parser.addoption('--google-account', action='store', default='', 
         help='Google account to use for authorization if there is (default: \'\')')
     parser.addoption('--record-screen', action='store_true', default=False, help='Record screen for every running test')
+    parser.addoption('--record-screen-mode', action='store', default='full', choices=('full', 'failure'), 
+        help='full encodes the whole test into webm, failure keeps cheaply encoded last seconds '
+            + 'and transcodes them only if the test fails (default: full)')
+    parser.addoption('--record-buffer-seconds', action='store', type=int, default=60, 
+        help='Seconds of the screen kept in failure recording mode (default: 60)')
+    parser.addoption('--headless-backend', action='store', default='xvfb', choices=HEADLESS_BACKENDS, 
+        help='xvfb runs the browser on the virtual X screen recorded by ffmpeg, native starts Firefox with -headless '
+            + 'without X server and records the screen as a stream of screenshots (default: xvfb)')
+    parser.addoption('--screenshot-interval', action='store', type=float, default=5.0, 
+        help='Seconds between screenshots recording the screen with native headless backend (default: 5.0)')
     parser.addoption('--skip-db-wipe', action='store_true', default=False, help='Don\'t wipe database on RC')
     parser.addoption('--collect-logs', action='store_true', help='Collect passed test logs')
+    parser.addoption('--cpu-sampler', action='store', default='mpstat', choices=('mpstat', 'proc'), 
+        help='mpstat logs system wide CPU every second, proc samples system and per process CPU and RSS '
+            + 'of browser, driver, proxy, recorder and X server into cpustat.json (default: mpstat)')
+    parser.addoption('--sample-interval', action='store', type=float, default=0.5, 
+        help='proc sampler interval in seconds (default: 0.5)')
+    parser.addoption('--firefox-log', action='store', default='full', choices=FIREFOX_LOG_TIERS, 
+        help='Firefox MOZ_LOG and geckodriver logging: off, failure keeps last --firefox-log-size megabytes '
+            + 'in memory and saves them for failed tests, full writes everything to disk (default: full)')
+    parser.addoption('--firefox-log-size', action='store', type=int, default=16, 
+        help='Firefox log size cap in megabytes in failure tier (default: 16)')
+    parser.addoption('--login-cache-ttl', action='store', type=int, default=0, 
+        help='Log in once and put the captured cookies and storage into the next sessions '
+            + 'for that many seconds, 0 logs in every test (default: 0)')
+    parser.addoption('--login-origin', action='append', default=[], 
+        help='Extra origin whose cookies and storage are cached with the SUT one, may be repeated')
     parser.addoption('--open-dev-tools', action='store_true', help='Opens dev tools on browser start')
     parser.addoption('--open-js-console', action='store_true', help='Opens js console on browser start')
+    parser.addoption('--num-shards', action='store', type=int, default=1, 
+        help='Split collected tests into this many shards, one per worker (default: 1)')
+    parser.addoption('--shard-id', action='store', type=int, default=1, 
+        help='1-based shard to run out of --num-shards (default: 1)')
+    parser.addoption('--browser-pool', action='store_true', 
+        help='Reuse warm browser sessions between tests instead of starting a new one for each test')
+    parser.addoption('--browser-pool-max-uses', action='store', type=int, default=20, 
+        help='Number of tests a pooled browser session is used for before it is recycled (default: 20)')
+    parser.addoption('--persistent-proxy', action='store_true', 
+        help='Run one proxy for the whole session and rotate its flow file per test')
+    parser.addoption('--flow-max-body-size', action='store', type=int, default=DEFAULT_MAX_BODY_SIZE, 
+        help=f'Truncate and hash http bodies above this size in full-http.log (default: {DEFAULT_MAX_BODY_SIZE})')
+    parser.addoption('--flow-host', action='append', default=[], 
+        help='Only keep flows of this host in full-http.log, may be repeated')
+    parser.addoption('--flow-status', action='append', default=[], 
+        help='Only keep flows with this status (e.g. 404 or 5xx) in full-http.log, may be repeated')
+    parser.addoption('--flow-content-type', action='append', default=[], 
+        help='Only keep flows with this content type in full-http.log, may be repeated')
+    parser.addoption('--db-template', action='store_true', 
+        help='Restore database from the template built once by migrations and seed instead of wiping it')
+    parser.addoption('--db-restore-scope', action='store', default='function', choices=('session', 'module', 'function'), 
+        help='How often the database is restored from the template (default: function)')
+    parser.addoption('--db-per-worker', action='store_true', 
+        help='Create own database for this worker named after the configured one and drop it at the end')
+    parser.addoption('--wait-backend', action='store', default=dom_wait.POLLING, choices=dom_wait.BACKENDS, 
+        help=f'How helpers wait for elements, {dom_wait.OBSERVER} returns as soon as DOM changes (default: {dom_wait.POLLING})')
+    parser.addoption('--pacing', action='store', default=pacing.HUMAN, choices=pacing.PROFILES, 
+        help=f'Pauses between interaction steps: {pacing.HUMAN} pauses, {pacing.FAST} waits for element readiness '
+            + f'instead, {pacing.ZERO} does neither (default: {pacing.HUMAN})')
+    parser.addoption('--timing', action='store_true', 
+        help=f'Record tests phases timeline into {LOG_DIR} and show the slowest phases at the end')
+    parser.addoption('--timing-trace', action='store_true', 
+        help=f'Also write timeline in Chrome trace-event format into {LOG_DIR}, implies --timing')
+    parser.addoption('--perf-metrics', action='store_true', 
+        help=f'Save browser navigation, resource and paint timing of the SUT pages into {LOG_DIR}')
+    parser.addoption('--perf-budgets', action='store', default='', 
+        help='JSON file with performance budgets per url regexp, fails the test exceeding it, implies --perf-metrics')
+    parser.addoption('--proxy-replay', action='store', default='off', choices=('off',) + proxy_replay.MODES, 
+        help=f'Serve SUT responses from the local cache: {proxy_replay.RECORD} only fills the cache, '
+            + f'{proxy_replay.ASSETS} serves static assets and {proxy_replay.STRICT} serves everything (default: off)')
+    parser.addoption('--replay-cache', action='store', default=REPLAY_CACHE_DIR, 
+        help=f'Replay cache directory (default: {REPLAY_CACHE_DIR})')
+    parser.addoption('--replay-pattern', action='append', default=[], 
+        help='Url regexp served from the cache in assets mode, may be repeated (default: static assets)')
+    parser.addoption('--history-db', action='store', default='', 
+        help='sqlite file with the tests results history, it drives --history-* options and the shards balance')
+    parser.addoption('--history-run-id', action='store', default=str(int(time.time())), 
+        help='Id of the run, parallel workers must share it (default: start timestamp)')
+    parser.addoption('--history-order', action='store', default=history.COLLECTION, choices=history.ORDERS, 
+        help=f'Tests order by their duration in history: {history.FASTEST} for quick feedback, '
+            + f'{history.LONGEST} for shards balance (default: {history.COLLECTION})')
+    parser.addoption('--history-failed-first', action='store_true', 
+        help='Run the last failed and then flaky tests first')
+    parser.addoption('--history-last-failed', action='store_true', 
+        help='Run only the tests failed last time, all if there are none')
+    parser.addoption('--changed-only', action='store_true', 
+        help='Run only the tests failed last time, new ones and the ones whose file or support files '
+            + '(conftest.py, helpers) changed since their last run')
+    parser.addoption('--think-time', action='store', type=float, default=0, 
+        help='Average pause in seconds after each test like a user makes between journeys (default: 0)')
+    parser.addoption('--stop-after', action='store', type=float, default=0, 
+        help='Stop the session after that many seconds finishing the running test, 0 runs all (default: 0)')
+    parser.addoption('--loop', action='store_true', 
+        help='Run the selected tests over and over till --stop-after seconds are over')
+    parser.addoption('--artifact-workers', action='store', type=int, default=0, 
+        help='Process test artifacts in that many background threads, 0 processes them in place (default: 0)')
+    parser.addoption('--compress-logs', action='store_true', 
+        help='Compress text logs artifacts with zstd')
+
+
+def pytest_configure(config):
+    if config.getoption('--loop') and not config.getoption('--stop-after'):
+        raise pytest.UsageError('--loop needs --stop-after')
+
+    dom_wait.set_backend(config.getoption('--wait-backend'))
+    pacing.set_profile(config.getoption('--pacing'))
+    timing.enable(config.getoption('--timing') or config.getoption('--timing-trace'))
+    artifacts.configure(config.getoption('--artifact-workers'), config.getoption('--compress-logs'))
+
+    global _history, _support_hash
+    if config.getoption('--history-db'):
+        _history = history.History(config.getoption('--history-db'), config.getoption('--history-run-id'))
+        root = str(config.rootdir)
+        _support_hash = history.file_hash(
+            [p for p in glob.glob(os.path.join(root, '*.py')) if not os.path.basename(p).startswith('test_')]
+            + glob.glob(os.path.join(root, '*.ini')))
+
+
+def pytest_terminal_summary(terminalreporter):
+    config = terminalreporter.config
+    if _option_given(config, '--firefox-log'):
+        terminalreporter.write_line(f"Firefox log tier [{config.getoption('--firefox-log')}]")
+
+    stats = pacing.stats()
+    if stats['pauses'] or stats['readiness_checks'] or _option_given(config, '--pacing'):
+        terminalreporter.write_line(
+            f"Pacing profile [{stats['profile']}]: {stats['pauses']} pauses of {stats['pause_delay_seconds']:.1f}s "
+            + f"configured delay, {stats['readiness_checks']} readiness checks took {stats['readiness_seconds']:.1f}s")
+
+    if timing.is_enabled():
+        terminalreporter.write_sep('-', 'slowest phases')
+        for name, count, total, longest in timing.slowest():
+            terminalreporter.write_line(f'{total:8.2f}s total {longest:8.2f}s max {count:6d} calls  {name}')
+
+
+def _option_given(config, name):
+    return any(arg == name or arg.startswith(f'{name}=') for arg in config.invocation_params.args)
+
+
+def pytest_sessionfinish(session):
+    with timing.span('artifacts.flush'):
+        artifacts.flush()
+
+    if _history is not None:
+        _history.close()
+
+    if not timing.is_enabled():
+        return
+
+    timing.write_timeline(os.path.join(LOG_DIR, f'timing-session{WORKER_SUFFIX}.json'))
+    if session.config.getoption('--timing-trace'):
+        timing.write_chrome_trace(os.path.join(LOG_DIR, f'timing-trace{WORKER_SUFFIX}.json'))
+
+
+_fixture_teardown_starts = {}
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    start = time.time()
+    counter = time.perf_counter()
+    yield
+    if not timing.is_enabled():
+        return
+
+    timing.add(f'fixture.{fixturedef.argname}.setup', start, time.perf_counter() - counter)
+
+    # Runs before the fixture own teardown as finalizers are called in reverse order
+    def teardown_started():
+        _fixture_teardown_starts[id(fixturedef)] = (time.time(), time.perf_counter())
+    fixturedef.addfinalizer(teardown_started)
+
+
+def pytest_fixture_post_finalizer(fixturedef, request):
+    started = _fixture_teardown_starts.pop(id(fixturedef), None)
+    if started is not None:
+        timing.add(f'fixture.{fixturedef.argname}.teardown', started[0], time.perf_counter() - started[1])
 
 
 def pytest_runtest_setup(item):
+    timing.set_current_test(item.nodeid)
     if 'nondestructive' in item.keywords:
         return
     elif 'destructive' in item.keywords:
@@ -88,8 +297,142 @@ def pytest_generate_tests(metafunc):
     #     )
 
 
+_history = None
+_support_hash = None
+_file_hashes = {}
+_test_files = {}
+_results = {}
+
+
+# After -k and -m deselection, so the shards and the order are of the tests that run
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    stats = {}
+    if _history is not None:
+        stats = _history.stats()
+        for item in items:
+            path = str(item.fspath)
+            _test_files[item.nodeid] = path
+            if path not in _file_hashes:
+                _file_hashes[path] = history.file_hash([path])
+        _select_by_history(config, items, stats)
+
+    num_shards = config.getoption('--num-shards')
+    shard_id = config.getoption('--shard-id')
+    if num_shards > 1:
+        assert 1 <= shard_id <= num_shards, f'--shard-id must be in range [1, {num_shards}]'
+        if stats:
+            # Balanced by the known durations, every worker computes the same shards from the same history
+            shard = set(history.assign_shards(items, stats, num_shards)[shard_id - 1])
+            in_shard = lambda i, item: item in shard
+        else:
+            # Round robin over the stable collection order so that every worker gets its own share
+            in_shard = lambda i, item: i % num_shards == shard_id - 1
+
+        selected = []
+        deselected = []
+        for i, item in enumerate(items):
+            if in_shard(i, item):
+                selected.append(item)
+            else:
+                deselected.append(item)
+
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+    if stats:
+        items[:] = history.order(items, stats, config.getoption('--history-order'), 
+            config.getoption('--history-failed-first'))
+
+
+def _select_by_history(config, items, stats):
+    last_failed = config.getoption('--history-last-failed')
+    changed_only = config.getoption('--changed-only')
+    if not (last_failed or changed_only):
+        return
+
+    def failed(item):
+        test_stats = stats.get(item.nodeid)
+        return test_stats is not None and test_stats.last_outcome == history.FAILED
+
+    def changed(item):
+        test_stats = stats.get(item.nodeid)
+        return test_stats is None or test_stats.support_hash != _support_hash \
+            or test_stats.file_hash != _file_hashes[str(item.fspath)]
+
+    if last_failed and not any(failed(item) for item in items):
+        return
+
+    selected = []
+    deselected = []
+    for item in items:
+        if failed(item) or (changed_only and changed(item)):
+            selected.append(item)
+        else:
+            deselected.append(item)
+
+    config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+
+def pytest_runtest_logreport(report):
+    if _history is None:
+        return
+
+    duration, outcome = _results.get(report.nodeid, (0.0, history.PASSED))
+    if report.failed:
+        outcome = history.FAILED
+    elif report.skipped and outcome == history.PASSED:
+        outcome = 'skipped'
+    _results[report.nodeid] = (duration + report.duration, outcome)
+
+
+_session_started = time.monotonic()
+_looping = False
+
+
 def pytest_sessionstart(session):
-    pass
+    global _session_started
+    _session_started = time.monotonic()
+    for directory in (DOWNLOAD_DIR, WORKER_TMP_DIR, WORKER_SHM_DIR):
+        pathlib.Path(directory).mkdir(parents=True, exist_ok=True)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item, nextitem):
+    yield
+    # Outside of the test reports, so it doesn't count into the test duration
+    think_time = item.config.getoption('--think-time')
+    if think_time:
+        time.sleep(random.uniform(0.5, 1.5) * think_time)
+
+    stop_after = item.config.getoption('--stop-after')
+    if stop_after and time.monotonic() - _session_started > stop_after:
+        item.session.shouldstop = f'Stopped after {stop_after} seconds'
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtestloop(session):
+    # Unlike pytest-repeat the items are collected once and run again, nextitem wraps around, 
+    # so session and module fixtures stay set up between the rounds
+    if not session.config.getoption('--loop') or session.config.option.collectonly or not session.items:
+        return None
+
+    global _looping
+    _looping = True
+    spans_path = os.path.join(LOG_DIR, f'timing-spans{WORKER_SUFFIX}.jsonl')
+    _ensure_file_absent(spans_path)
+    items = session.items
+    while True:
+        for i, item in enumerate(items):
+            nextitem = items[(i + 1) % len(items)]
+            item.config.hook.pytest_runtest_protocol(item=item, nextitem=nextitem)
+            if session.shouldfail:
+                raise session.Failed(session.shouldfail)
+            if session.shouldstop:
+                raise session.Interrupted(session.shouldstop)
+        # The session timeline would grow with every round
+        timing.drain(spans_path)
 
 
 def get_option(request, name):
@@ -124,6 +467,47 @@ def skip_db_wipe(request):
     return get_option(request, '--skip-db-wipe')
 
 
+@pytest.fixture(scope='session')
+def browser_pool(request):
+    if not get_option(request, '--browser-pool'):
+        yield None
+        return
+
+    pool = BrowserPool(max_uses=get_option(request, '--browser-pool-max-uses'))
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def selenium(request, browser_pool):
+    # Overrides pytest-selenium fixture of the same name to take the browser from the pool if enabled
+    if browser_pool is None:
+        _clear_firefox_ring_log(request.config)
+        driver = request.getfixturevalue('driver')
+        with _screen_shots(request, driver):
+            yield driver
+        return
+
+    def start_driver():
+        _clear_firefox_ring_log(request.config)
+        driver_class = request.getfixturevalue('driver_class')
+        kwargs = request.getfixturevalue('driver_kwargs')
+        driver = driver_class(**kwargs)
+        # geckodriver keeps writing into the log of the test that started it
+        driver._e2e_driver_log = kwargs.get('service_log_path')
+        return driver
+
+    driver = browser_pool.acquire(start_driver)
+    # pytest-selenium takes screenshot and logs of failed test from here
+    request.node._driver = driver
+    request.config._driver_log = driver._e2e_driver_log
+    if driver._e2e_driver_log and os.path.exists(driver._e2e_driver_log):
+        request.node._driver_log_offset = os.path.getsize(driver._e2e_driver_log)
+    with _screen_shots(request, driver):
+        yield driver
+    browser_pool.release(driver, failed=_test_failed(request.node))
+
+
 @pytest.fixture(scope='module')
 def collect_logs(request):
     return get_option(request, '--collect-logs')
@@ -139,35 +523,51 @@ def open_js_console(request):
     return get_option(request, '--open-js-console')
 
 
-@pytest.fixture
-def firefox_profile():
+@pytest.fixture(scope='session')
+def cached_firefox_profile():
     home_dir = os.environ['HOME']
     # HINT: 
     # 
     # Put real firefox profile here with already logged in user into google if you want to test and use 
     # google auth (logged_in_selenium fixture).
-    profile = webdriver.FirefoxProfile(os.path.join(home_dir, FIREFOX_PROFILE))
+    profile = CachedFirefoxProfile(os.path.join(home_dir, FIREFOX_PROFILE))
     profile.set_preference("dom.webdriver.enabled", False)
     profile.set_preference('useAutomationExtension', False)
     profile.set_preference('devtools.selfxss.count', 100)
     profile.set_preference("browser.download.folderList", 2)
     profile.set_preference("browser.download.manager.showWhenStarting", False)
     profile.set_preference("browser.helperApps.alwaysAsk.force", False)
-    profile.set_preference("browser.download.dir", "/home/chrome/Downloads")
+    profile.set_preference("browser.download.dir", DOWNLOAD_DIR)
     profile.set_preference("browser.helperApps.neverAsk.saveToDisk", "application/octet-stream")
     profile.set_preference("network.proxy.type", 1)
     profile.set_preference("network.proxy.socks", "127.0.0.1")
-    profile.set_preference("network.proxy.socks_port", 1080)
+    profile.set_preference("network.proxy.socks_port", PROXY_PORT)
     profile.update_preferences()
 
     return profile
 
 
 @pytest.fixture
-def firefox_options(firefox_options, open_dev_tools, open_js_console):
-    firefox_options.log.level = "trace"
-    firefox_options.add_argument('--MOZ_LOG=timestamp,nsHttp:1,cache2:1,nsHostResolver:1,cookie:1')
-    firefox_options.add_argument(f'--MOZ_LOG_FILE={FIREFOX_SRC_LOG_FN}')
+def firefox_profile(cached_firefox_profile):
+    # Driver's quit removes the profile dir, so every driver gets its own one
+    return cached_firefox_profile.for_driver()
+
+
+@pytest.fixture
+def firefox_options(request, firefox_options, open_dev_tools, open_js_console):
+    tier = request.config.getoption('--firefox-log')
+    firefox_options.log.level = GECKODRIVER_LOG_LEVELS[tier]
+    if tier == 'full':
+        firefox_options.add_argument(f'--MOZ_LOG={FIREFOX_LOG_MODULES}')
+        firefox_options.add_argument(f'--MOZ_LOG_FILE={FIREFOX_SRC_LOG_FN}')
+    elif tier == 'failure':
+        firefox_options.add_argument(f"--MOZ_LOG={FIREFOX_LOG_MODULES},rotate:{request.config.getoption('--firefox-log-size')}")
+        firefox_options.add_argument(f'--MOZ_LOG_FILE={FIREFOX_RING_LOG_FN}')
+
+    if request.config.getoption('--headless-backend') == 'native':
+        firefox_options.add_argument('-headless')
+        firefox_options.add_argument(f'--width={SCREEN_SIZE[0]}')
+        firefox_options.add_argument(f'--height={SCREEN_SIZE[1]}')
 
     if open_dev_tools:
         firefox_options.add_argument('--devtools')
@@ -178,23 +578,120 @@ def firefox_options(firefox_options, open_dev_tools, open_js_console):
     return firefox_options
 
 
+@pytest.fixture(scope='session')
+def proxy_addons(request):
+    mode = get_option(request, '--proxy-replay')
+    if mode == 'off':
+        return ''
+
+    script = os.path.join(os.path.dirname(__file__), 'proxy_replay.py')
+    args = ['-s', script, '--set', f'replay_mode={mode}', '--set', f"replay_cache={request.config.getoption('--replay-cache')}"]
+    for pattern in request.config.getoption('--replay-pattern'):
+        args += ['--set', f'replay_patterns={pattern}']
+
+    return ' '.join(shlex.quote(arg) for arg in args)
+
+
+@pytest.fixture(scope='session')
+def persistent_proxy(request, proxy_addons):
+    if not get_option(request, '--persistent-proxy'):
+        yield False
+        return
+
+    _ensure_file_absent(PROXY_CONTROL_SOCKET)
+    script = os.path.join(os.path.dirname(__file__), 'proxy_control.py')
+    cmd = f'{MITMDUMP} --showhost --mode socks5 --listen-port {PROXY_PORT} -s {script} ' \
+        + f'--set control_socket={PROXY_CONTROL_SOCKET} {proxy_addons}'
+    with _background_process(cmd) as proc:
+        proxy_control.wait_for_control_socket(PROXY_CONTROL_SOCKET, proc, timeout=DEFAULT_TIMEOUT)
+        yield True
+
+
 @pytest.fixture
-def proxy():
+def proxy(persistent_proxy, proxy_addons):
+    if persistent_proxy:
+        _ensure_file_absent(FULL_HTTP_LOG_FN)
+        proxy_control.send_command(PROXY_CONTROL_SOCKET, f'rotate {FULL_HTTP_LOG_FN}')
+        yield
+        proxy_control.send_command(PROXY_CONTROL_SOCKET, 'rotate')
+        return
+
     # fixme stdout redirection prevents proxy from exiting
-    # with _background_process(f'bash -c "/home/chrome/proxy/mitmdump --showhost --mode socks5 --listen-port 1080 -w {FULL_HTTP_LOG_FN} &> {HTTP_LOG_FN}"'):
-    with _background_process(f'bash -c "/home/chrome/proxy/mitmdump --showhost --mode socks5 --listen-port 1080 -w {FULL_HTTP_LOG_FN}"'):
+    # with _background_process(f'bash -c "{MITMDUMP} --showhost --mode socks5 --listen-port {PROXY_PORT} -w {FULL_HTTP_LOG_FN} &> {HTTP_LOG_FN}"'):
+    with _background_process(f'{MITMDUMP} --showhost --mode socks5 --listen-port {PROXY_PORT} -w {FULL_HTTP_LOG_FN} {proxy_addons}'):
         yield
 
 
+@pytest.fixture(scope='session')
+def perf_budgets(request):
+    path = get_option(request, '--perf-budgets')
+    return load_budgets(path) if path else []
+
+
 @pytest.fixture
-def logged_in_selenium(proxy, selenium, firefox_options, sut_location, google_account):
+def perf_metrics(request, perf_budgets):
+    if not (request.config.getoption('--perf-metrics') or perf_budgets):
+        yield None
+        return
+
+    marker = request.node.get_closest_marker('perf_budget')
+    recorder = PerfRecorder(perf_budgets, marker.kwargs if marker else None)
+    yield recorder
+
+    test_name = request.node.name
+    recorder.write(make_artifact_filename(test_name, 'perf.json', folder=LOG_DIR))
+    violations = recorder.violations()
+    if violations or _test_failed(request.node):
+        pathlib.Path(FAILURE_DIR).mkdir(parents=True, exist_ok=True)
+        recorder.write(make_artifact_filename(test_name, 'perf.json'))
+
+    if violations:
+        pytest.fail('Performance budget exceeded:\n' + '\n'.join(violations))
+
+
+@pytest.fixture(scope='session')
+def login_state_cache(request):
+    ttl = get_option(request, '--login-cache-ttl')
+    return login_state.LoginStateCache(ttl) if ttl > 0 else None
+
+
+@pytest.fixture
+def logged_in_selenium(proxy, selenium, firefox_options, sut_location, google_account, perf_metrics, login_state_cache, request):
     selenium.set_window_size(1920, 1080)
     selenium.set_window_position(0, 0)
     selenium.maximize_window()
-    selenium.get(sut_location)
+
+    state = login_state_cache.get(google_account) if login_state_cache else None
+    if state is not None:
+        with timing.span('login.restore'):
+            login_state.restore(selenium, state)
+
+    with timing.span('navigate'):
+        selenium.get(sut_location)
+    if perf_metrics:
+        perf_metrics.collect(selenium)
     size = selenium.get_window_size()
     print(f"\033[34mWindow size: width = {size['width']}px, height = {size['height']}px\033[0m")
 
+    if state is None or not _is_logged_in(selenium):
+        if state is not None:
+            print(f'Cached login of [{google_account}] is rejected, logging in')
+            login_state_cache.invalidate(google_account)
+
+        with timing.span('login'):
+            _log_in(selenium, google_account)
+
+        if login_state_cache:
+            origins = {login_state.origin_of(sut_location)} \
+                | {login_state.origin_of(url) for url in request.config.getoption('--login-origin')}
+            login_state_cache.put(google_account, login_state.capture(selenium, origins))
+
+    yield selenium
+    if perf_metrics:
+        perf_metrics.collect(selenium)
+
+
+def _log_in(selenium, google_account):
     # HINT:
     #   Uncomment and adjust below code to perform your app login
     #
@@ -209,21 +706,36 @@ def logged_in_selenium(proxy, selenium, firefox_options, sut_location, google_ac
     # Put here your page conditions to wait for after authorization
     # to be sure the login completed
     # wait_for_element_to_be_visible(selenium, '//div[contains(@class, "q-img__content")]/ancestor::div[contains(@class, "cursor-pointer")]', timeout=300)
+    pass
 
-    yield selenium
-    selenium.quit()
+
+def _is_logged_in(selenium):
+    """Tells whether the SUT accepted the restored login state."""
+
+    # HINT:
+    #
+    # Put here your page condition that holds only for the logged in user, e.g.
+    # try:
+    #     wait_for_element_to_be_visible(selenium, '//div[contains(@class, "q-img__content")]', timeout=10)
+    # except TimeoutException:
+    #     return False
+    return True
 
 
 @pytest.fixture
-def not_logged_in_selenium(proxy, selenium, firefox_options, sut_location):
+def not_logged_in_selenium(proxy, selenium, firefox_options, sut_location, perf_metrics):
     selenium.set_window_size(1920, 1080)
     selenium.set_window_position(0, 0)
     selenium.maximize_window()
-    selenium.get(sut_location)
+    with timing.span('navigate'):
+        selenium.get(sut_location)
+    if perf_metrics:
+        perf_metrics.collect(selenium)
     size = selenium.get_window_size()
     print(f"\033[34mWindow size: width = {size['width']}px, height = {size['height']}px\033[0m")
     yield selenium
-    selenium.quit()
+    if perf_metrics:
+        perf_metrics.collect(selenium)
 
 
 @pytest.fixture
@@ -237,9 +749,15 @@ def wait_nl(not_logged_in_selenium):
 
 
 @pytest.fixture
-def clear_downloads_dir():
+def download_watcher():
+    with DownloadWatcher(DOWNLOAD_DIR) as watcher:
+        yield watcher
+
+
+@pytest.fixture
+def clear_downloads_dir(download_watcher):
     yield
-    os.system('rm -rf /home/chrome/Downloads/*')
+    download_watcher.clear()
 
 
 # @pytest.fixture
@@ -256,72 +774,164 @@ def logs_capture(request, collect_logs):
         return 
 
     print('logs_capture')
+    with timing.span('logs_capture'):
+        _collect_logs(request)
+
+
+def _collect_logs(request):
     test_name = request.function.__name__
+    key = request.node.nodeid
+    # ffmpeg and mpstat fixtures depend on logs_capture, so they are torn down before it 
+    # and the recording and samples are complete here
     if os.path.exists(VIDEO_PATH):
-        shutil.copy(VIDEO_PATH, make_artifact_filename(test_name, 'screen.mkv', folder=LOG_DIR))
+        artifacts.move(key, VIDEO_PATH, make_artifact_filename(test_name, 'screen.mkv', folder=LOG_DIR))
 
     if os.path.exists(CPUSTAT_PATH):
-        shutil.copy(CPUSTAT_PATH, make_artifact_filename(test_name, 'cpustat.log', folder=LOG_DIR))
+        artifacts.move(key, CPUSTAT_PATH, make_artifact_filename(test_name, 'cpustat.log', folder=LOG_DIR))
 
-    if os.path.exists(FIREFOX_DEST_LOG_FN):
-        shutil.copy(FIREFOX_DEST_LOG_FN, make_artifact_filename(test_name, FIREFOX_LOG_FN, folder=LOG_DIR))
+    if os.path.exists(CPUSTAT_JSON_PATH):
+        artifacts.move(key, CPUSTAT_JSON_PATH, make_artifact_filename(test_name, 'cpustat.json', folder=LOG_DIR))
+
+    # Pooled browser keeps writing its log
+    firefox_log = request.config.getoption('--firefox-log')
+    if firefox_log == 'full' and os.path.exists(FIREFOX_DEST_LOG_FN):
+        artifacts.copy(key, FIREFOX_DEST_LOG_FN, make_artifact_filename(test_name, FIREFOX_LOG_FN, folder=LOG_DIR))
+    elif firefox_log == 'failure':
+        _save_firefox_ring_log(key, make_artifact_filename(test_name, FIREFOX_LOG_FN, folder=LOG_DIR))
 
     if os.path.exists(FULL_HTTP_LOG_FN):
-        subprocess.run(shlex.split(f'bash -c \'python read_proxy_flow.py {FULL_HTTP_LOG_FN} > {make_artifact_filename(test_name, "full-http.log", folder=LOG_DIR)}\''))
+        dump_http_log(request.config, key, test_name, folder=LOG_DIR)
 
     if os.path.exists(HTTP_LOG_FN):
-        shutil.copy(HTTP_LOG_FN, make_artifact_filename(test_name, 'http.log', folder=LOG_DIR))
+        artifacts.copy(key, HTTP_LOG_FN, make_artifact_filename(test_name, 'http.log', folder=LOG_DIR))
 
 
 def make_artifact_filename(name, suffix, folder=FAILURE_DIR):
     now = datetime.now()
     dt_string = now.strftime('%Y%m%dT%H%M%S-')
-    return os.path.join(folder, f'{dt_string}{get_valid_filename(name)}.{suffix}')
+    return os.path.join(folder, f'{dt_string}{get_valid_filename(name)}{WORKER_SUFFIX}.{suffix}')
+
 
+def dump_http_log(config, key, name, folder=FAILURE_DIR):
+    """Dumps and removes the proxy flows file."""
 
-def write_file(name, content, suffix, attrs):
-    filename = make_artifact_filename(name, suffix)
-    with open(filename, attrs) as f:
-        f.write(content)
+    dest = make_artifact_filename(name, 'full-http.log', folder=folder)
+    index_dest = make_artifact_filename(name, 'http-index.tsv', folder=folder)
+
+    def dump(src):
+        dump_flows(src, dest, 
+            index_dest=index_dest, 
+            max_body_size=config.getoption('--flow-max-body-size'), 
+            hosts=config.getoption('--flow-host'), 
+            statuses=config.getoption('--flow-status'), 
+            content_types=config.getoption('--flow-content-type'))
+    artifacts.run(key, dump, [dest, index_dest], src=FULL_HTTP_LOG_FN)
 
 
 def pytest_selenium_capture_debug(item, report, extra):
+    with timing.span('capture_debug'):
+        _capture_debug(item, report, extra)
+
+
+def _capture_debug(item, report, extra):
     fixture_request = getattr(item, '_request', None)
     pathlib.Path(FAILURE_DIR).mkdir(parents=True, exist_ok=True)
 
+    key = item.nodeid
     driver_log_written = False # at the moment the are two driver logs, second is empty, it looks like a bug
     for log_type in extra:
         if log_type['name'] == 'Driver Log' and not driver_log_written:
             driver_log_written = True
-            content = log_type['content']
-            write_file(item.name, content, 'driver.log', 'w')
+            artifacts.write(key, make_artifact_filename(item.name, 'driver.log'), _driver_log_content(item, log_type['content']))
         elif log_type['name'] == 'Browser Log':
-            content = log_type['content']
-            write_file(item.name, content, 'browser.log', 'w')
+            artifacts.write(key, make_artifact_filename(item.name, 'browser.log'), log_type['content'])
         elif log_type['name'] == 'Screenshot':
-            content = base64.b64decode(log_type['content'].encode('utf-8'))
-            write_file(item.name, content, 'screenshot.png', 'wb')
+            artifacts.write(key, make_artifact_filename(item.name, 'screenshot.png'), log_type['content'], 
+                base64_encoded=True)
 
-    if fixture_request.config.getoption('--record-screen'):
+    # In failure mode the recording is saved by ffmpeg fixture once the recorder is stopped, 
+    # screenshots of native headless backend are assembled by selenium fixture
+    if fixture_request.config.getoption('--record-screen') and fixture_request.config.getoption('--record-screen-mode') == 'full' \
+            and fixture_request.config.getoption('--headless-backend') == 'xvfb':
         assert os.path.exists(VIDEO_PATH)
-        shutil.move(VIDEO_PATH, make_artifact_filename(item.name, 'screen.mkv'))
+        artifacts.move(key, VIDEO_PATH, make_artifact_filename(item.name, 'screen.mkv'))
 
-    assert os.path.exists(CPUSTAT_PATH)
-    shutil.move(CPUSTAT_PATH, make_artifact_filename(item.name, 'cpustat.log'))
+    # proc sampler saves its samples once the test is finished, see mpstat fixture
+    if item.config.getoption('--cpu-sampler') == 'mpstat':
+        assert os.path.exists(CPUSTAT_PATH)
+        artifacts.move(key, CPUSTAT_PATH, make_artifact_filename(item.name, 'cpustat.log'))
 
-    assert os.path.exists(FIREFOX_DEST_LOG_FN)
-    shutil.move(FIREFOX_DEST_LOG_FN, make_artifact_filename(item.name, FIREFOX_LOG_FN))
+    firefox_log = item.config.getoption('--firefox-log')
+    if firefox_log == 'full':
+        assert os.path.exists(FIREFOX_DEST_LOG_FN)
+        artifacts.move(key, FIREFOX_DEST_LOG_FN, make_artifact_filename(item.name, FIREFOX_LOG_FN))
+    elif firefox_log == 'failure':
+        _save_firefox_ring_log(key, make_artifact_filename(item.name, FIREFOX_LOG_FN))
 
     assert os.path.exists(FULL_HTTP_LOG_FN)
-    subprocess.run(shlex.split(f'bash -c \'python read_proxy_flow.py {FULL_HTTP_LOG_FN} > {make_artifact_filename(item.name, "full-http.log")}\''))
-    os.remove(FULL_HTTP_LOG_FN)
+    dump_http_log(item.config, key, item.name)
 
     # assert os.path.exists(HTTP_LOG_FN)
     # shutil.move(HTTP_LOG_FN, make_artifact_filename(item.name, 'http.log'))
 
 
+def _driver_log_content(item, content):
+    # Pooled browser log has the earlier tests too, only the part written since the checkout is saved
+    offset = getattr(item, '_driver_log_offset', None)
+    if offset is None:
+        return content
+
+    with open(item.config._driver_log, 'rb') as f:
+        f.seek(offset)
+        return f.read().decode('utf8', errors='replace')
+
+
+def _clear_firefox_ring_log(config):
+    # Rotated files of the previous browser would be saved with the log of the new one
+    if config.getoption('--firefox-log') == 'failure':
+        for path in glob.glob(f'{FIREFOX_RING_LOG_FN}.moz_log*'):
+            os.remove(path)
+
+
+def _save_firefox_ring_log(key, dest):
+    # Rotated files are <name>.moz_log.<generation>, the browser keeps rotating them, 
+    # so the snapshot is taken right away, it's capped and comes from memory anyway
+    files = sorted(glob.glob(f'{FIREFOX_RING_LOG_FN}.moz_log*'), key=os.path.getmtime)
+    if not files:
+        print(f'No firefox log found in {os.path.dirname(FIREFOX_RING_LOG_FN)}')
+        return
+
+    with open(FIREFOX_RING_SNAPSHOT_FN, 'wb') as out:
+        for path in files:
+            with open(path, 'rb') as f:
+                shutil.copyfileobj(f, out)
+    artifacts.move(key, FIREFOX_RING_SNAPSHOT_FN, dest)
+
+
+@pytest.hookimpl(tryfirst=True, hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f'rep_{report.when}', report)
+    timing.add(f'test.{report.when}', call.start, call.duration, test=item.nodeid)
+
+
+def _test_failed(item):
+    return any(getattr(getattr(item, f'rep_{when}', None), 'failed', False) for when in ('setup', 'call'))
+
+
 def pytest_runtest_logfinish(nodeid, location):
     test_name = location[2]
+    # Looping tests would write a timeline every round, their spans are in the session ones
+    if timing.is_enabled() and not _looping:
+        timing.write_timeline(make_artifact_filename(test_name, 'timing.json', folder=LOG_DIR), test=nodeid)
+    artifacts.end_test(nodeid, lambda folder: make_artifact_filename(test_name, 'manifest.json', folder=folder))
+    timing.end_test(nodeid)
+    timing.set_current_test(None)
+
+    if nodeid in _results:
+        duration, outcome = _results.pop(nodeid)
+        _history.record(nodeid, duration, outcome, _file_hashes.get(_test_files.get(nodeid)), _support_hash)
 
 
 # def pytest_runtest_teardown(item, nextitem):
@@ -337,7 +947,7 @@ def get_valid_filename(s):
 def wait_element_to_be_visible_and_enabled(selenium, timeout_in_seconds, locator, allow_stale=True):
     while True:
         try:
-            WebDriverWait(selenium, timeout_in_seconds).until(EC.element_to_be_clickable(locator))
+            dom_wait.wait_until(selenium, *locator, dom_wait.CLICKABLE, timeout_in_seconds)
             return
         except StaleElementReferenceException:
             if not allow_stale:
@@ -348,7 +958,7 @@ def wait_element_to_be_visible_and_enabled(selenium, timeout_in_seconds, locator
 def click_element(selenium, timeout_in_seconds, locator, allow_stale=True):
     while True:
         try:
-            WebDriverWait(selenium, timeout_in_seconds).until(EC.element_to_be_clickable(locator)).click()
+            dom_wait.wait_until(selenium, *locator, dom_wait.CLICKABLE, timeout_in_seconds).click()
             return
         except StaleElementReferenceException:
             if not allow_stale:
@@ -365,24 +975,111 @@ def click_by_xpath(selenium, xpath):
     pytest.helpers.click_element(selenium, DEFAULT_TIMEOUT, (By.XPATH, xpath))
 
 
+SCREEN_GRAB_ARGS = f'-loglevel fatal -r 10 -f x11grab -draw_mouse 0 -s {SCREEN_SIZE[0]}x{SCREEN_SIZE[1]} -i :{DISPLAY_NUM}'
+SCREEN_TIME_ARGS = '-vf drawtext="fontfile=/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf: text=%{localtime}: fontcolor=white: fontsize=24: box=1: boxcolor=black@0.5: boxborderw=5: x=(w-text_w): y=0"'
+
+
 @pytest.fixture(autouse=True, scope="function")
-def ffmpeg(request):
+def ffmpeg(request, logs_capture):
+    # Depends on logs_capture, so the recording is finished before the logs are collected
     _ensure_file_absent(VIDEO_PATH)
-    if request.config.getoption('--record-screen'):
+    # There is no X screen to grab with native headless backend, see _screen_shots
+    if not request.config.getoption('--record-screen') or request.config.getoption('--headless-backend') == 'native':
+        yield
+        return
+
+    if request.config.getoption('--record-screen-mode') == 'full':
         print('Recoding screen...')
-        cmd = 'ffmpeg -loglevel fatal -r 10 -f x11grab -draw_mouse 0 -s 1920x1080 -i :99 -c:v libvpx -quality realtime -cpu-used 0 ' \
+        cmd = f'ffmpeg {SCREEN_GRAB_ARGS} -c:v libvpx -quality realtime -cpu-used 0 ' \
             + '-b:v 384k -qmin 10 -qmax 42 -maxrate 384k -bufsize 1000k -an ' \
-            + '-vf drawtext="fontfile=/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf: text=%{localtime}: fontcolor=white: fontsize=24: box=1: boxcolor=black@0.5: boxborderw=5: x=(w-text_w): y=0" ' \
-            + VIDEO_PATH
+            + f'{SCREEN_TIME_ARGS} {VIDEO_PATH}'
         with _background_process(cmd):
             yield
-    else:
+        return
+
+    # Short x264 ultrafast segments overwrite each other in a ring, so only the last seconds are kept
+    shutil.rmtree(SCREEN_SEGMENTS_DIR, ignore_errors=True)
+    os.makedirs(SCREEN_SEGMENTS_DIR)
+    segments = math.ceil(request.config.getoption('--record-buffer-seconds') / SCREEN_SEGMENT_SECONDS) + 1
+    cmd = f'ffmpeg {SCREEN_GRAB_ARGS} -c:v libx264 -preset ultrafast -tune zerolatency -crf 30 -an {SCREEN_TIME_ARGS} ' \
+        + f'-f segment -segment_time {SCREEN_SEGMENT_SECONDS} -segment_wrap {segments} -reset_timestamps 1 ' \
+        + os.path.join(SCREEN_SEGMENTS_DIR, '%03d.mkv')
+    with _background_process(cmd):
+        yield
+
+    if not _test_failed(request.node):
+        shutil.rmtree(SCREEN_SEGMENTS_DIR)
+        return
+
+    pathlib.Path(FAILURE_DIR).mkdir(parents=True, exist_ok=True)
+    dest = make_artifact_filename(request.node.name, 'screen.mkv')
+    artifacts.run(request.node.nodeid, lambda src: _transcode_screen_segments(src, dest), [dest], src=SCREEN_SEGMENTS_DIR)
+
+
+def _transcode_screen_segments(segments_dir, dest):
+    segments = sorted(glob.glob(os.path.join(segments_dir, '*.mkv')), key=os.path.getmtime)
+    list_path = os.path.join(segments_dir, 'segments.txt')
+    with open(list_path, 'w') as f:
+        f.writelines(f"file '{path}'\n" for path in segments)
+
+    cmd = f'nice -n 19 ffmpeg -loglevel fatal -f concat -safe 0 -i {list_path} -c:v libvpx -quality good -cpu-used 4 ' \
+        + f'-b:v 384k -qmin 10 -qmax 42 -an {dest}'
+    subprocess.run(shlex.split(cmd), check=True)
+
+
+@contextlib.contextmanager
+def _screen_shots(request, driver):
+    config = request.config
+    if not config.getoption('--record-screen') or config.getoption('--headless-backend') != 'native':
         yield
+        return
+
+    # The same buffer as x11grab failure mode, full mode keeps every frame, the clip is only made on failure anyway
+    shutil.rmtree(SCREEN_SHOTS_DIR, ignore_errors=True)
+    interval = config.getoption('--screenshot-interval')
+    keep = None if config.getoption('--record-screen-mode') == 'full' \
+        else math.ceil(config.getoption('--record-buffer-seconds') / interval)
+    recorder = ScreenShotRecorder(driver, SCREEN_SHOTS_DIR, interval, keep).start()
+    try:
+        yield
+    finally:
+        recorder.stop()
+
+    if not _test_failed(request.node):
+        shutil.rmtree(SCREEN_SHOTS_DIR)
+        return
+
+    pathlib.Path(FAILURE_DIR).mkdir(parents=True, exist_ok=True)
+    dest = make_artifact_filename(request.node.name, 'screen.mkv')
+    frames = recorder.frames()
+    artifacts.run(request.node.nodeid, lambda src: make_clip(src, frames, dest), [dest], src=SCREEN_SHOTS_DIR)
+
+
+@pytest.fixture(scope='session')
+def proc_sampler(request):
+    if get_option(request, '--cpu-sampler') != 'proc':
+        yield None
+        return
+
+    sampler = ProcSampler(request.config.getoption('--sample-interval'))
+    sampler.start()
+    yield sampler
+    sampler.stop()
 
 
 @pytest.fixture(autouse=True, scope="function")
-def mpstat():
+def mpstat(request, proc_sampler, logs_capture):
     _ensure_file_absent(CPUSTAT_PATH)
+    _ensure_file_absent(CPUSTAT_JSON_PATH)
+    if proc_sampler is not None:
+        proc_sampler.clear()
+        yield
+        proc_sampler.write(CPUSTAT_JSON_PATH, spans=timing.spans(request.node.nodeid))
+        if _test_failed(request.node):
+            pathlib.Path(FAILURE_DIR).mkdir(parents=True, exist_ok=True)
+            artifacts.copy(request.node.nodeid, CPUSTAT_JSON_PATH, make_artifact_filename(request.node.name, 'cpustat.json'))
+        return
+
     with _background_process(f'bash -c "mpstat 1 > {CPUSTAT_PATH}"'):
         yield
 
@@ -402,36 +1099,94 @@ def _background_process(cmd, stdin=None, stdout=None, stderr=None):
 
 @pytest.fixture
 def somefile():
-    filename = os.path.join(os.environ['HOME'], 'example.jpeg')
-    file_content = binascii.unhexlify(image)
-    with open(filename, 'wb') as f:
-        f.write(file_content)
-        yield filename
-    os.remove(filename)
+    return fixture_assets.path('example.jpeg')
+
+
+@pytest.fixture(scope='session')
+def make_payload(tmp_path_factory):
+    """
+    Upload payload factory, e.g. make_payload('pdf', 50 * 2**20) returns the path to 50MB pdf.
+    Files are generated once per session, see fixture_assets.KINDS.
+    """
+
+    directory = tmp_path_factory.mktemp('payloads')
+    return lambda kind, size: fixture_assets.generate(directory, kind, size)
 
 
 DB_HOST = os.environ['DB_SQL_HOST']
 DB_USERNAME = os.environ['DB_SQL_USERNAME']
 DB_PASSWORD = os.environ['DB_SQL_PASSWORD']
 DB_NAME = os.environ['DB_SQL_DATABASE']
+# Not DB_SQL_POOL_*, those are the SUT backend settings, tests of the worker take a few connections at most
+DB_POOL_MIN = int(os.environ.get('E2E_DB_POOL_MIN', '0'))
+DB_POOL_MAX = int(os.environ.get('E2E_DB_POOL_MAX', '4'))
 BACKEND_API_DIR = os.environ['BACKEND_API_DIR']
+ADMIN_CONNINFO = conninfo(DB_USERNAME, DB_PASSWORD, DB_HOST, MAINTENANCE_DB)
 
 
 @pytest.fixture(scope='session')
-def db_name():
+def db_name(request, skip_db_wipe):
     assert DB_NAME != ''
-    return DB_NAME
+    if skip_db_wipe or not get_option(request, '--db-per-worker'):
+        yield DB_NAME
+        return
+
+    worker_db_name = f'{DB_NAME}_w{WORKER_ID}'
+    print(f'Creating worker database {worker_db_name}')
+    create_database(ADMIN_CONNINFO, worker_db_name)
+    yield worker_db_name
+    print(f'Dropping worker database {worker_db_name}')
+    drop_database(ADMIN_CONNINFO, worker_db_name)
+
+
+@pytest.fixture(scope='session')
+def db_pool(db_name, skip_db_wipe):
+    if skip_db_wipe:
+        yield None
+        return
+
+    with ConnectionPool(conninfo(DB_USERNAME, DB_PASSWORD, DB_HOST, db_name), 
+                        min_size=DB_POOL_MIN, max_size=max(DB_POOL_MAX, 1)) as pool:
+        yield pool
+
+
+def _db_conn_scope(fixture_name, config):
+    # Database restored from the template gets a new connection on each restore
+    if config.getoption('--db-template') and not config.getoption('--skip-db-wipe'):
+        return config.getoption('--db-restore-scope')
+    return 'session'
 
 
 @pytest.fixture(scope='session')
-def db_conn(db_name, skip_db_wipe):
+def db_template(request, skip_db_wipe):
+    if skip_db_wipe or not get_option(request, '--db-template'):
+        return None
+
+    # Shared by all the workers even if they have their own databases
+    template_name = f'{DB_NAME}_template'
+    ensure_template(ADMIN_CONNINFO, template_name, BACKEND_API_DIR)
+    return template_name
+
+
+@pytest.fixture(scope=_db_conn_scope)
+def db_conn(db_name, db_template, db_pool, skip_db_wipe):
     if skip_db_wipe:
         print('No db wipe')
         yield
         return
 
+    if db_template:
+        print(f'Restoring database {db_name} from template {db_template}')
+        restore_from_template(ADMIN_CONNINFO, db_name, db_template)
+        # Pooled connections to the dropped database are broken now
+        db_pool.check()
+        with db_pool.connection() as test_conn:
+            yield test_conn
+        print('Teardown db connection')
+        return
+
     print(f'Setup db connection, using database {db_name}')
-    with psycopg.connect(f'user={DB_USERNAME} password={DB_PASSWORD} host={DB_HOST} dbname={db_name}') as conn:
+    with db_pool.connection() as conn:
         with conn.cursor() as cur:
             cur.execute("select tablename from pg_tables where schemaname = 'public' order by tablename ;")
             rows = cur.fetchall()
@@ -440,20 +1195,16 @@ def db_conn(db_name, skip_db_wipe):
                 cur.execute(f"drop table {row[0]} cascade")
         conn.commit()
         
-    with psycopg.connect(f'user={DB_USERNAME} password={DB_PASSWORD} host={DB_HOST} dbname={db_name}') as test_conn:
+    with db_pool.connection() as test_conn:
         yield test_conn
     print('Teardown db connection')
 
 
 # @pytest.fixture(autouse=True, scope='session')
 @pytest.fixture
-def wipe_db(db_conn, skip_db_wipe):
-    if skip_db_wipe:
+def wipe_db(db_conn, db_name, skip_db_wipe, db_template):
+    # Database restored from the template by db_conn already has migrations and seed applied
+    if skip_db_wipe or db_template:
         return 
 
-    proc = subprocess.run(['npm', 'run', 'migration:run'], cwd=BACKEND_API_DIR)
-    print(proc.stdout, proc.stderr, proc.returncode)
-    assert proc.returncode == 0
-    proc = subprocess.run(['npm', 'run', 'migration:seed:run'], cwd=BACKEND_API_DIR)
-    print(proc.stdout, proc.stderr, proc.returncode)
-    assert proc.returncode == 0
+    run_migrations(BACKEND_API_DIR, db_name)
@@ -0,0 +1,101 @@
+"""
+Postgres helpers to restore the test database from a template instead of
+dropping every table and running all the migrations and seeds again.
+
+Template database is built once by running migrations and seed into it
+and is rebuilt only when the migrations content hash changes.
+The hash is kept as the template database comment. Template is shared by all the
+workers, building it takes exclusive advisory lock while restoring takes shared one.
+"""
+import hashlib
+import os
+import subprocess
+
+import psycopg
+
+MAINTENANCE_DB = 'postgres'
+HASH_COMMENT_PREFIX = 'e2e-migrations:'
+HASH_EXCLUDE_DIRS = {'.git', 'node_modules'}
+
+
+def conninfo(user, password, host, dbname):
+    return f'user={user} password={password} host={host} dbname={dbname}'
+
+
+def migrations_hash(migrations_dir):
+    """Content hash of all the files in the migrations repo except vcs and installed packages."""
+
+    digest = hashlib.sha256()
+    for root, dirs, files in os.walk(migrations_dir):
+        dirs[:] = sorted(d for d in dirs if d not in HASH_EXCLUDE_DIRS)
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            digest.update(os.path.relpath(path, migrations_dir).encode())
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 16), b''):
+                    digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def run_migrations(migrations_dir, db_name):
+    env = dict(os.environ, DB_SQL_DATABASE=db_name)
+    for script in ('migration:run', 'migration:seed:run'):
+        proc = subprocess.run(['npm', 'run', script], cwd=migrations_dir, env=env)
+        print(proc.stdout, proc.stderr, proc.returncode)
+        assert proc.returncode == 0, f'npm run {script} failed for database {db_name}'
+
+
+def ensure_template(admin_conninfo, template_name, migrations_dir):
+    """Builds template database unless it's already built from the same migrations."""
+
+    expected = HASH_COMMENT_PREFIX + migrations_hash(migrations_dir)
+    with psycopg.connect(admin_conninfo, autocommit=True) as conn:
+        # Lock is released when connection is closed
+        conn.execute('select pg_advisory_lock(hashtext(%s))', (template_name,))
+        row = conn.execute(
+            "select shobj_description(oid, 'pg_database') from pg_database where datname = %s",
+            (template_name,)).fetchone()
+        if row is not None and row[0] == expected:
+            print(f'Template database {template_name} is up to date')
+            return False
+
+        print(f'Building template database {template_name}')
+        _terminate_connections(conn, template_name)
+        conn.execute(f'drop database if exists "{template_name}"')
+        conn.execute(f'create database "{template_name}"')
+        run_migrations(migrations_dir, template_name)
+        conn.execute(f'comment on database "{template_name}" is \'{expected}\'')
+
+    return True
+
+
+def restore_from_template(admin_conninfo, db_name, template_name):
+    """Recreates database as a copy of template, that is much faster than migrations."""
+
+    with psycopg.connect(admin_conninfo, autocommit=True) as conn:
+        conn.execute('select pg_advisory_lock_shared(hashtext(%s))', (template_name,))
+        # Nobody may be connected neither to the source nor to the target database
+        _terminate_connections(conn, template_name)
+        _terminate_connections(conn, db_name)
+        conn.execute(f'drop database if exists "{db_name}"')
+        conn.execute(f'create database "{db_name}" template "{template_name}"')
+
+
+def create_database(admin_conninfo, db_name):
+    with psycopg.connect(admin_conninfo, autocommit=True) as conn:
+        row = conn.execute('select 1 from pg_database where datname = %s', (db_name,)).fetchone()
+        if row is None:
+            conn.execute(f'create database "{db_name}"')
+
+
+def drop_database(admin_conninfo, db_name):
+    with psycopg.connect(admin_conninfo, autocommit=True) as conn:
+        _terminate_connections(conn, db_name)
+        conn.execute(f'drop database if exists "{db_name}"')
+
+
+def _terminate_connections(conn, db_name):
+    conn.execute(
+        'select pg_terminate_backend(pid) from pg_stat_activity where datname = %s and pid <> pg_backend_pid()',
+        (db_name,))
@@ -1,8 +1,18 @@
+import os
+
 DEFAULT_DELAY = 0.3
 DEFAULT_TIMEOUT = 30
 STAGE_SUT_LOCATION = 'https://stage.example.com/'
 STAGE_API_BASE_URL = 'https://api-stage.example.com/'
 DEFAULT_SUT_LOCAITON = STAGE_SUT_LOCATION
 DEFAULT_API_BASE_URL = STAGE_API_BASE_URL
-DOWNLOAD_DIR = '/home/chrome/Downloads'
+# Each parallel worker (see --workers in ./run) or load user (see load.py) gets its own display,
+# proxy port, downloads dir and scratch dirs for the recordings and logs being written
+WORKER_ID = int(os.environ.get('E2E_WORKER_ID', '0'))
+DISPLAY_NUM = 99 + WORKER_ID
+PROXY_PORT = 1080 + WORKER_ID
+WORKER_TMP_DIR = f'/tmp/worker{WORKER_ID}'
+WORKER_SHM_DIR = f'/dev/shm/worker{WORKER_ID}'
+# Worker 0 gets a subdir too, clearing its downloads mustn't touch the dirs of the others
+DOWNLOAD_DIR = f'/home/chrome/Downloads/worker{WORKER_ID}'
 FIREFOX_PROFILE = '.mozilla/firefox/3fdkgzzo.default-esr'
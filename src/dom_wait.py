@@ -0,0 +1,195 @@
+"""
+Element waits with selectable backend.
+
+`polling` backend is plain WebDriverWait, each poll is a WebDriver round trip every 0.5 seconds.
+`observer` backend installs MutationObserver via execute_async_script, so the condition is checked
+in the browser on every DOM change (and on a short in-page timer for changes like css transitions
+that don't mutate DOM) and the wait returns as soon as it holds. It falls back to polling
+for non xpath/css locators and when the async script can't run, e.g. the page is being reloaded.
+"""
+import time
+
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, \
+    TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+import timing
+
+POLLING = 'polling'
+OBSERVER = 'observer'
+BACKENDS = (POLLING, OBSERVER)
+
+PRESENT = 'present'
+VISIBLE = 'visible'
+CLICKABLE = 'clickable'
+
+# Async script returns this often to let python recheck overall timeout and to survive navigation
+SLICE_TIMEOUT = 5
+# Slice ends that much earlier than the driver script timeout, which is left as is
+SCRIPT_TIMEOUT_MARGIN = 1
+# W3C default when the session doesn't tell its script timeout
+DEFAULT_SCRIPT_TIMEOUT = 30
+RECHECK_INTERVAL_MS = 100
+# Things that are not observable in DOM like new windows are polled this often by the observer backend
+FAST_POLL_FREQUENCY = 0.1
+
+_EXPECTED_CONDITIONS = {
+    PRESENT: EC.presence_of_element_located,
+    VISIBLE: EC.visibility_of_element_located,
+    CLICKABLE: EC.element_to_be_clickable,
+}
+
+_SCRIPT_BY = {
+    By.XPATH: 'xpath',
+    By.CSS_SELECTOR: 'css',
+}
+
+WAIT_SCRIPT = '''
+const [by, selector, condition, timeoutMs, recheckMs, done] = arguments;
+
+function find() {
+    if (by === 'xpath') {
+        return document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return document.querySelector(selector);
+}
+
+function isVisible(el) {
+    const style = window.getComputedStyle(el);
+    if (style.visibility === 'hidden' || style.display === 'none' || style.opacity === '0') {
+        return false;
+    }
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+
+function check() {
+    const el = find();
+    if (!el || (condition !== 'present' && !isVisible(el)) || (condition === 'clickable' && el.disabled)) {
+        return null;
+    }
+    return el;
+}
+
+let finished = false;
+let scheduled = false;
+let observer = null;
+let timer = null;
+let deadline = null;
+
+function finish(el) {
+    if (finished) {
+        return;
+    }
+    finished = true;
+    if (observer) observer.disconnect();
+    clearInterval(timer);
+    clearTimeout(deadline);
+    done(el);
+}
+
+function recheck() {
+    const el = check();
+    if (el) finish(el);
+}
+
+const el = check();
+if (el) {
+    finish(el);
+    return;
+}
+
+observer = new MutationObserver(() => {
+    // Many mutations usually come in a batch, check once per batch
+    if (!scheduled) {
+        scheduled = true;
+        Promise.resolve().then(() => { scheduled = false; recheck(); });
+    }
+});
+observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+timer = setInterval(recheck, recheckMs);
+deadline = setTimeout(() => finish(null), timeoutMs);
+'''
+
+_backend = POLLING
+
+
+def set_backend(name):
+    global _backend
+    assert name in BACKENDS, f'Unknown wait backend [{name}], must be one of {BACKENDS}'
+    _backend = name
+
+
+def get_backend():
+    return _backend
+
+
+def poll_frequency():
+    return FAST_POLL_FREQUENCY if _backend == OBSERVER else 0.5
+
+
+def wait_until(driver, by, selector, condition, timeout):
+    """
+    Waits for the element to be present, visible or clickable (see condition) and returns it.
+    Raises TimeoutException like WebDriverWait does.
+    """
+    with timing.span(f'wait.{condition}'):
+        return _wait_until(driver, by, selector, condition, timeout)
+
+
+def _wait_until(driver, by, selector, condition, timeout):
+    if _backend == POLLING or by not in _SCRIPT_BY:
+        return _poll(driver, by, selector, condition, timeout)
+
+    slice_timeout = _slice_timeout(driver)
+    if slice_timeout <= 0:
+        return _poll(driver, by, selector, condition, timeout)
+
+    end = time.monotonic() + timeout
+    while True:
+        left = end - time.monotonic()
+        if left <= 0:
+            break
+
+        try:
+            element = driver.execute_async_script(WAIT_SCRIPT, _SCRIPT_BY[by], selector, condition,
+                int(min(left, slice_timeout) * 1000), RECHECK_INTERVAL_MS)
+        except WebDriverException:
+            return _poll(driver, by, selector, condition, max(end - time.monotonic(), 0))
+
+        if element is None:
+            continue
+        if _confirmed(element, condition):
+            return element
+
+        # Visible for the page but not for the WebDriver yet, the script would return it right away again
+        time.sleep(min(poll_frequency(), max(end - time.monotonic(), 0)))
+
+    raise TimeoutException(f'Element [{selector}] is not {condition} in {timeout} seconds')
+
+
+def _poll(driver, by, selector, condition, timeout):
+    return WebDriverWait(driver, timeout).until(_EXPECTED_CONDITIONS[condition]((by, selector)))
+
+
+def _confirmed(element, condition):
+    # In-page visibility check is an approximation, final word is for the WebDriver
+    if condition == PRESENT:
+        return True
+
+    try:
+        return element.is_displayed()
+    except (NoSuchElementException, StaleElementReferenceException):
+        return False
+
+
+def _slice_timeout(driver):
+    # Script timeout is shared by every execute_async_script caller, so the slice fits into it instead
+    # of changing it. Null script timeout means no timeout.
+    timeouts = (driver.capabilities or {}).get('timeouts', {})
+    script_ms = timeouts.get('script', DEFAULT_SCRIPT_TIMEOUT * 1000)
+    if script_ms is None:
+        return SLICE_TIMEOUT
+    return min(SLICE_TIMEOUT, script_ms / 1000 - SCRIPT_TIMEOUT_MARGIN)
@@ -0,0 +1,164 @@
+"""
+Downloads dir watcher.
+
+Firefox writes the download into `<name>.part` next to the empty `<name>` placeholder
+and renames `.part` file to `<name>` when it's done. So the download is complete when
+the file is renamed, or, if the rename wasn't seen, when there is no `.part` file for it
+and its size stays the same for a while. Directory changes are waited for with inotify,
+with polling fallback where inotify is not available.
+"""
+import collections
+import ctypes
+import ctypes.util
+import fnmatch
+import os
+import select
+import shutil
+import struct
+import time
+
+PART_SUFFIX = '.part'
+POLL_INTERVAL = 0.2
+SETTLE_TIME = 0.3
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+EVENT_HEADER = struct.Struct('iIII')
+
+
+class Download(collections.namedtuple('Download', 'path size seconds')):
+    """seconds is since the wait started or the file appeared, None if it was there when the wait started."""
+
+    @property
+    def throughput(self):
+        """Bytes per second, None if the file was already there."""
+        return self.size / self.seconds if self.seconds else None
+
+
+class DownloadWatcher:
+    def __init__(self, directory):
+        self.directory = directory
+        self._fd = _inotify_watch(directory)
+        self._moved_in = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def wait(self, patterns, timeout):
+        """
+        Waits until for each of the glob patterns there is completely downloaded file.
+        Returns list of Download in patterns order or None on timeout.
+        """
+        start = time.monotonic()
+        end = start + timeout
+        first_seen = {}
+        already_there = None
+        sizes = {}
+
+        while True:
+            now = time.monotonic()
+            names = set(os.listdir(self.directory))
+            for name in names:
+                first_seen.setdefault(_strip_part(name), now)
+            if already_there is None:
+                already_there = set(first_seen)
+
+            found = []
+            pending = False
+            for pattern in patterns:
+                download = None
+                for name in sorted(fnmatch.filter(names, pattern)):
+                    if name.endswith(PART_SUFFIX) or name + PART_SUFFIX in names:
+                        pending = True
+                        continue
+
+                    size = os.path.getsize(os.path.join(self.directory, name))
+                    if name not in self._moved_in:
+                        last = sizes.get(name)
+                        if last is None or last[0] != size:
+                            sizes[name] = (size, now)
+                            pending = True
+                            continue
+                        if now - last[1] < SETTLE_TIME:
+                            pending = True
+                            continue
+
+                    seconds = None if name in already_there else now - first_seen.get(name, start)
+                    download = Download(os.path.join(self.directory, name), size, seconds)
+                    break
+
+                found.append(download)
+
+            if all(found):
+                return found
+
+            if now >= end:
+                return None
+
+            self._wait_for_changes(min(end - now, SETTLE_TIME if pending or self._fd is None else end - now))
+
+    def clear(self):
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if os.path.isdir(path) and not os.path.islink(path):
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                os.remove(path)
+        self._moved_in.clear()
+
+    def _wait_for_changes(self, timeout):
+        if self._fd is None:
+            time.sleep(min(timeout, POLL_INTERVAL))
+            return
+
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return
+
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+
+        offset = 0
+        while offset < len(data):
+            _, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0').decode(errors='replace')
+            offset += length
+            if mask & IN_MOVED_TO and not name.endswith(PART_SUFFIX):
+                self._moved_in.add(name)
+
+
+def _strip_part(name):
+    return name[:-len(PART_SUFFIX)] if name.endswith(PART_SUFFIX) else name
+
+
+def _inotify_watch(directory):
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+
+    if fd < 0:
+        return None
+
+    if libc.inotify_add_watch(fd, os.fsencode(directory), WATCH_MASK) < 0:
+        os.close(fd)
+        return None
+
+    return fd
@@ -0,0 +1,128 @@
+"""
+Binary test assets and generated upload payloads.
+
+Assets live in `assets` folder next to the tests, they are memory mapped on first use
+and kept mapped for the session. Payloads of the given type and size are streamed to disk
+chunk by chunk, so large uploads don't need large blobs in memory or in sources.
+Generated files are valid enough for the browser and the server to accept them:
+JPEG is the example image padded with comment segments, PNG is 1x1 image padded with
+private ancillary chunks, PDF has a single page padded with comment lines, zip stores random bytes.
+"""
+import functools
+import mmap
+import os
+import struct
+import zipfile
+import zlib
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
+KINDS = ('jpeg', 'png', 'pdf', 'zip')
+CHUNK_SIZE = 2**20
+# Max JPEG segment length minus the length field itself
+JPEG_COMMENT_SIZE = 65533
+
+
+def path(name):
+    return os.path.join(ASSETS_DIR, name)
+
+
+@functools.lru_cache(maxsize=None)
+def load(name):
+    """Read only memory map of the asset, it supports len, slicing and bytes()."""
+
+    with open(path(name), 'rb') as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def generate(directory, kind, size):
+    """Returns path to the file of the kind at least size bytes long, the file is reused if already generated."""
+
+    assert kind in KINDS, f'Unknown payload kind [{kind}], must be one of {KINDS}'
+    dest = os.path.join(directory, f'payload-{size}.{kind}')
+    if os.path.exists(dest):
+        return dest
+
+    partial = f'{dest}.part'
+    with open(partial, 'wb') as f:
+        _GENERATORS[kind](f, size)
+    os.replace(partial, dest)
+    return dest
+
+
+def _padding(size):
+    while size > 0:
+        chunk = min(size, CHUNK_SIZE)
+        yield os.urandom(chunk)
+        size -= chunk
+
+
+def _write_jpeg(f, size):
+    image = load('example.jpeg')
+    # Comments go after SOI and APPn segments, so JFIF header stays the first one
+    header = 2
+    while image[header] == 0xff and 0xe0 <= image[header + 1] <= 0xef:
+        header += 2 + struct.unpack('>H', image[header + 2:header + 4])[0]
+
+    f.write(image[:header])
+    left = size - len(image)
+    while left > 0:
+        length = min(max(left - 4, 0), JPEG_COMMENT_SIZE)
+        f.write(b'\xff\xfe' + struct.pack('>H', length + 2) + os.urandom(length))
+        left -= length + 4
+    f.write(image[header:])
+
+
+def _png_chunk(f, kind, data):
+    f.write(struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data)))
+
+
+def _write_png(f, size):
+    f.write(b'\x89PNG\r\n\x1a\n')
+    _png_chunk(f, b'IHDR', struct.pack('>IIBBBBB', 1, 1, 8, 2, 0, 0, 0))
+    _png_chunk(f, b'IDAT', zlib.compress(b'\x00\xff\xff\xff'))
+    # Lowercase first letter makes the chunk ancillary, decoders skip it
+    for chunk in _padding(size - f.tell() - 12):
+        _png_chunk(f, b'paDd', chunk)
+    _png_chunk(f, b'IEND', b'')
+
+
+def _write_pdf(f, size):
+    offsets = []
+
+    def obj(body):
+        offsets.append(f.tell())
+        f.write(f'{len(offsets)} 0 obj\n{body}\nendobj\n'.encode())
+
+    f.write(b'%PDF-1.4\n')
+    obj('<< /Type /Catalog /Pages 2 0 R >>')
+    obj('<< /Type /Pages /Kids [3 0 R] /Count 1 >>')
+    obj('<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R >>')
+
+    # Content stream is comment lines of hex, 2 hex chars per random byte plus "% " and newline
+    line_bytes = 64
+    lines = max((size - f.tell()) // (line_bytes * 2 + 3), 1)
+    offsets.append(f.tell())
+    f.write(f'4 0 obj\n<< /Length {lines * (line_bytes * 2 + 3)} >>\nstream\n'.encode())
+    for _ in range(lines):
+        f.write(b'% ' + os.urandom(line_bytes).hex().encode() + b'\n')
+    f.write(b'endstream\nendobj\n')
+
+    xref = f.tell()
+    f.write(f'xref\n0 {len(offsets) + 1}\n0000000000 65535 f \n'.encode())
+    f.writelines(f'{offset:010d} 00000 n \n'.encode() for offset in offsets)
+    f.write(f'trailer\n<< /Size {len(offsets) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n'.encode())
+
+
+def _write_zip(f, size):
+    with zipfile.ZipFile(f, 'w', compression=zipfile.ZIP_STORED) as archive:
+        with archive.open('payload.bin', 'w', force_zip64=True) as entry:
+            for chunk in _padding(size):
+                entry.write(chunk)
+
+
+_GENERATORS = {
+    'jpeg': _write_jpeg,
+    'png': _write_png,
+    'pdf': _write_pdf,
+    'zip': _write_zip,
+}
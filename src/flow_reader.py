@@ -0,0 +1,117 @@
+"""
+Read mitmproxy dump files in-process.
+
+Flows are streamed one by one, bodies above the size limit are truncated and hashed.
+Besides the full dump a compact tab separated index (method, url, status, timing, size)
+can be written to triage huge pages quickly.
+"""
+import hashlib
+import pprint
+
+from mitmproxy import io, http
+from mitmproxy.exceptions import FlowReadException
+
+DEFAULT_MAX_BODY_SIZE = 64 * 1024
+INDEX_HEADER = 'start_ms\tduration_ms\tmethod\tstatus\tsize\tcontent_type\turl\n'
+
+
+def iter_flows(path, hosts=None, statuses=None, content_types=None):
+    """
+    Yields flows from the dump file matching all the given filters.
+    Filter is a list of allowed values, empty or None filter matches everything.
+    Hosts also match their subdomains, statuses may be exact like '404' or classes like '5xx',
+    content types are matched as substrings of Content-Type header.
+    """
+    with open(path, 'rb') as f:
+        for flow in io.FlowReader(f).stream():
+            if _matches(flow, hosts, statuses, content_types):
+                yield flow
+
+
+def write_flows(path, out, index_out=None, max_body_size=DEFAULT_MAX_BODY_SIZE,
+                hosts=None, statuses=None, content_types=None):
+    pp = pprint.PrettyPrinter(indent=4, stream=out)
+    if index_out is not None:
+        index_out.write(INDEX_HEADER)
+
+    count = 0
+    first_start = None
+    try:
+        for flow in iter_flows(path, hosts, statuses, content_types):
+            count += 1
+            out.write(f'{flow}\n')
+            if isinstance(flow, http.HTTPFlow):
+                out.write(f'{flow.request.host}\n')
+                if first_start is None:
+                    first_start = flow.request.timestamp_start
+                if index_out is not None:
+                    index_out.write(_index_line(flow, first_start))
+            pp.pprint(_shrink_state(flow.get_state(), max_body_size))
+            out.write('\n')
+    except FlowReadException as e:
+        out.write(f'Flow file corrupted: {e}\n')
+
+    return count
+
+
+def dump_flows(path, dest, index_dest=None, **kwargs):
+    with open(dest, 'w') as out:
+        if index_dest is None:
+            return write_flows(path, out, **kwargs)
+
+        with open(index_dest, 'w') as index_out:
+            return write_flows(path, out, index_out, **kwargs)
+
+
+def _matches(flow, hosts, statuses, content_types):
+    if not (hosts or statuses or content_types):
+        return True
+
+    if not isinstance(flow, http.HTTPFlow):
+        return False
+
+    if hosts:
+        host = flow.request.host
+        if not any(host == h or host.endswith(f'.{h}') for h in hosts):
+            return False
+
+    if statuses:
+        code = str(flow.response.status_code) if flow.response else ''
+        if not any(code == s or (s.endswith('xx') and code[:1] == s[:1]) for s in statuses):
+            return False
+
+    if content_types:
+        content_type = flow.response.headers.get('content-type', '') if flow.response else ''
+        if not any(ct in content_type for ct in content_types):
+            return False
+
+    return True
+
+
+def _shrink_body(content, max_body_size):
+    if content is None or len(content) <= max_body_size:
+        return content
+
+    digest = hashlib.sha256(content).hexdigest()
+    return content[:max_body_size] + f'... <truncated, {len(content)} bytes, sha256={digest}>'.encode()
+
+
+def _shrink_state(state, max_body_size):
+    for part in ('request', 'response'):
+        message = state.get(part)
+        if message and 'content' in message:
+            message['content'] = _shrink_body(message['content'], max_body_size)
+
+    return state
+
+
+def _index_line(flow, first_start):
+    request = flow.request
+    response = flow.response
+    start_ms = (request.timestamp_start - first_start) * 1000
+    end = response.timestamp_end if response and response.timestamp_end else None
+    duration_ms = f'{(end - request.timestamp_start) * 1000:.1f}' if end else ''
+    status = response.status_code if response else (flow.error.msg if flow.error else '')
+    size = len(response.raw_content) if response and response.raw_content is not None else ''
+    content_type = response.headers.get('content-type', '') if response else ''
+    return f'{start_ms:.1f}\t{duration_ms}\t{request.method}\t{status}\t{size}\t{content_type}\t{request.pretty_url}\n'
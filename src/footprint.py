@@ -0,0 +1,86 @@
+"""
+Per browser footprint from proc sampler samples (`--cpu-sampler proc --collect-logs`), e.g. to compare
+headless backends or Firefox log tiers: `python footprint.py xvfb=logs-xvfb native=logs-native`.
+
+Every LABEL=DIR is a logs folder of one run, all its `*cpustat.json` samples are put together,
+`*cpustat.json.zst` ones of `--compress-logs` too (that needs zstandard).
+CPU is in percent of one core, RSS in megabytes, `browser` is the sum of the groups of the one worker.
+The table is printed in markdown, so it can be pasted into the README as is.
+"""
+import glob
+import json
+import os
+import sys
+
+from load import percentile
+from proc_sampler import GROUPS
+
+
+def load_samples(directory):
+    columns = {}
+    paths = glob.glob(os.path.join(directory, '*cpustat.json')) + glob.glob(os.path.join(directory, '*cpustat.json.zst'))
+    for path in sorted(paths):
+        for name, values in _read_json(path)['samples'].items():
+            columns.setdefault(name, []).extend(values)
+
+    return columns
+
+
+def _read_json(path):
+    if not path.endswith('.zst'):
+        with open(path) as f:
+            return json.load(f)
+
+    # Only compressed logs need it, the script is usually run on the host
+    import zstandard
+    with open(path, 'rb') as f:
+        return json.load(zstandard.ZstdDecompressor().stream_reader(f))
+
+
+def footprint(columns, groups=GROUPS):
+    """Returns {group: (mean cpu, p95 cpu, mean rss, max rss)} of the groups seen and of them all as browser."""
+
+    rows = {}
+    count = len(columns.get('time', ()))
+    if not count:
+        return rows
+
+    totals = {'cpu': [0.0] * count, 'rss_mb': [0.0] * count}
+    for group in groups:
+        cpu = columns[f'{group}_cpu']
+        rss = columns[f'{group}_rss_mb']
+        if not any(rss):
+            continue
+
+        rows[group] = _stats(cpu, rss)
+        for i in range(count):
+            totals['cpu'][i] += cpu[i]
+            totals['rss_mb'][i] += rss[i]
+
+    rows['browser'] = _stats(totals['cpu'], totals['rss_mb'])
+    return rows
+
+
+def _stats(cpu, rss):
+    return sum(cpu) / len(cpu), percentile(sorted(cpu), 95), sum(rss) / len(rss), max(rss)
+
+
+def main(runs):
+    print('| run | group | CPU % mean | CPU % p95 | RSS MB mean | RSS MB max |')
+    print('|---|---|---:|---:|---:|---:|')
+    for run in runs:
+        label, _, directory = run.partition('=')
+        rows = footprint(load_samples(directory or label))
+        if not rows:
+            print(f'No cpustat.json samples in {directory or label}', file=sys.stderr)
+
+        for group, (cpu_mean, cpu_p95, rss_mean, rss_max) in rows.items():
+            print(f'| {label} | {group} | {cpu_mean:.1f} | {cpu_p95:.1f} | {rss_mean:.0f} | {rss_max:.0f} |')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(f'Usage: {sys.argv[0]} LABEL=LOGS_DIR...')
+        sys.exit(1)
+
+    main(sys.argv[1:])
@@ -0,0 +1,133 @@
+"""
+Test results history kept in sqlite between runs.
+
+Every test result (duration of setup, call and teardown, outcome, hashes of the test file and of
+the support files like conftest.py) is stored with the run id. Stats of the last runs drive
+tests selection and order, see `order` and `assign_shards`. Results of the current run are
+excluded from the stats, so all the parallel workers see the same history.
+"""
+import collections
+import hashlib
+import sqlite3
+import time
+
+FASTEST = 'fastest'
+LONGEST = 'longest'
+COLLECTION = 'collection'
+ORDERS = (COLLECTION, FASTEST, LONGEST)
+
+PASSED = 'passed'
+FAILED = 'failed'
+
+# Stats are taken over that many last runs of the test
+WINDOW = 10
+RETENTION_DAYS = 90
+# Duration of the test without history, seconds
+DEFAULT_DURATION = 30
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS results (
+    test_id TEXT NOT NULL,
+    run_id TEXT NOT NULL,
+    duration REAL NOT NULL,
+    outcome TEXT NOT NULL,
+    file_hash TEXT,
+    support_hash TEXT,
+    finished_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_test_id ON results (test_id, finished_at);
+'''
+
+TestStats = collections.namedtuple('TestStats', 'duration last_outcome failure_rate flaky file_hash support_hash')
+
+
+def file_hash(paths):
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class History:
+    def __init__(self, path, run_id):
+        self.run_id = run_id
+        # Parallel workers write into the same file
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(SCHEMA)
+        self.conn.execute('DELETE FROM results WHERE finished_at < ?', (time.time() - RETENTION_DAYS * 86400,))
+
+    def record(self, test_id, duration, outcome, file_hash=None, support_hash=None):
+        self.conn.execute('INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (test_id, self.run_id, duration, outcome, file_hash, support_hash, time.time()))
+
+    def stats(self):
+        rows = self.conn.execute('SELECT test_id, duration, outcome, file_hash, support_hash FROM results '
+            + 'WHERE run_id != ? ORDER BY finished_at DESC', (self.run_id,))
+        runs = {}
+        for test_id, *row in rows:
+            test_runs = runs.setdefault(test_id, [])
+            if len(test_runs) < WINDOW:
+                test_runs.append(row)
+
+        stats = {}
+        for test_id, test_runs in runs.items():
+            outcomes = [outcome for _, outcome, _, _ in test_runs]
+            passed = [duration for duration, outcome, _, _ in test_runs if outcome == PASSED]
+            failures = outcomes.count(FAILED)
+            _, last_outcome, last_file_hash, last_support_hash = test_runs[0]
+            stats[test_id] = TestStats(
+                duration=sum(passed) / len(passed) if passed else test_runs[0][0],
+                last_outcome=last_outcome,
+                failure_rate=failures / len(outcomes),
+                flaky=0 < failures < len(outcomes),
+                file_hash=last_file_hash,
+                support_hash=last_support_hash)
+
+        return stats
+
+    def close(self):
+        self.conn.close()
+
+
+def expected_duration(stats, test_id):
+    test_stats = stats.get(test_id)
+    return test_stats.duration if test_stats else DEFAULT_DURATION
+
+
+def order(items, stats, strategy=COLLECTION, failed_first=False):
+    """Returns items sorted by the strategy, the last failed and then flaky ones go first if failed_first."""
+
+    if strategy == FASTEST:
+        items = sorted(items, key=lambda item: expected_duration(stats, item.nodeid))
+    elif strategy == LONGEST:
+        items = sorted(items, key=lambda item: -expected_duration(stats, item.nodeid))
+
+    if failed_first:
+        def priority(item):
+            test_stats = stats.get(item.nodeid)
+            if test_stats is None:
+                return 0
+            if test_stats.last_outcome == FAILED:
+                return -2
+            return -1 - test_stats.failure_rate if test_stats.flaky else 0
+        items = sorted(items, key=priority)
+
+    return list(items)
+
+
+def assign_shards(items, stats, num_shards):
+    """
+    Longest processing time first: the longest test goes to the least loaded shard,
+    so the shards finish at about the same time. Returns list of items per shard.
+    """
+
+    shards = [[] for _ in range(num_shards)]
+    loads = [0.0] * num_shards
+    for item in sorted(items, key=lambda item: -expected_duration(stats, item.nodeid)):
+        shard = loads.index(min(loads))
+        shards[shard].append(item)
+        loads[shard] += expected_duration(stats, item.nodeid)
+
+    return shards
@@ -1 +0,0 @@
-image = "ffd8ffe000104a46494600010101004800480000ffe202404943435f50524f46494c450001010000023000000000021000006d6e74725247422058595a2000000000000000000000000061637370000000000000000000000000000000000000000000000000000000010000f6d6000100000000d32d0000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000964657363000000f0000000747258595a00000164000000146758595a00000178000000146258595a0000018c0000001472545243000001a00000002867545243000001a00000002862545243000001a00000002877747074000001c80000001463707274000001dc000000546d6c756300000000000000010000000c656e5553000000580000001c0073005200470042000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000058595a200000000000006fa2000038f50000039058595a2000000000000062990000b785000018da58595a2000000000000024a000000f840000b6cf706172610000000000040000000266660000f2a700000d59000013d000000a5b000000000000000058595a20000000000000f6d6000100000000d32d6d6c756300000000000000010000000c656e5553000000380000001c0047006f006f0067006c006500200049006e0063002e00200032003000310036000000000000000000000000000000000000000000000000ffdb0043000403030403030404030405040405060a07060606060d090a080a0f0d10100f0d0f0e11131814111217120e0f151c151719191b1b1b10141d1f1d1a1f181a1b1affdb0043010405050605060c07070c1a110f111a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1a1affc2001108050003c003012200021101031101ffc4001c0000000701010000000000000000000000000102030405060708ffc4001a010101010101010100000000000000000000010203040506ffda000c03010002100310000001eaa842b7ccd0b48b6d4646951648a30b0d008518000831494247521849894a09195bfa1cde64e32ef9fbacc84000e970a6b2949779fd02bc4a205dd25d59cfba672de9dd7157d4399f484cb289be5897260c9e268ada1d959318575b5eb9d5c3aed626ea626322c9a223ea6836890da464b0d3f3321b75869665215890489a710daf38532b628db58e868d6542434f4b0c2869ad98c3f6a634a8f124944a589db6192669b35a8b1ccaeb71c43374651de328924a39a6db9c5515d9056a9c6d15210d1814a3437984a4c6e1b04e662c81c4ad43cfb6a4be5463ed97d2ca094b8ae887db31c4901c04156685893242025a05477984984855a5126b399c4d6079fd0e00201918b01464f499ed0a3e464d1dc53dbeb1cdba972ce9bd32d6fb05b9b2951211ce353e99dcc90888826bb5ce24fce682ad690833dabed2d2ccb9b117cf51c92b83343d94c7614d8320341262ca57968731a0c2d89938ee16ca4389a68c93a8f04bb2c637535b37097aa98f263c482512b789da64924e9f39a6b1788dbe2c2294acd8a72495c08285a5914a696741c24a3e88cc135942a0d4da8361f31a92ccca53d06692da7525a4a5afb623c4b522b8ed815ccdaaa290ee576d22aed7144edc2ca36ef88a46af1165115d9942772dd56aeccf2e2916f68bcfd54a254d00614dc6dd4ca6828af2c9202a6936b5763acf3ee8d82d674c5ceaf3b7350d223f2cb68751b846e0cd364eaaae20428e219711b3ca8ca279c03c1d7a1cec89c6a4e027c1911284693453a34b690d912a9b4b372a4a15a3884a8069558a51100071760a07ad25890d43c97415f9dd1d48bd154dca3795d2e5478d9310da930b513d0cb91db24478b1f599ad4552c99115794b618359ce32ba7233028dc8aed8fd8d54d8b310d4691d695db2e86c870db21e36c0eada58a36c2b8c290386908106d0a24a69c49245864a3059cd863fcfd5664ac6cc195090cbc998b8aab3498a4ae6933a0cbd672f73124f5c6aec6ba4d3d06d6aa737106d669a992175b2a0dac29b3dc541b0832c84ac95d43ad6235695b3212fb478495c693922ca1cda4dbd4cb9b436eb3636491b2541cb190e9211b852a03874d4854c97426e9eab29752ae00455d7bd1d275b55da595d9cd0d1c2164da041c0ca4a61a078e32689065a86fb521526a245bad225792d921a418ecc8b21644b873d1b2763569dd8ebeb1e086490711c2508e0789a03a1b492531dc1651cc75b6d03ca8a2a488c94928644b4387df60b8755992b9ec03081e65eaa192924b3710ecadbed2f48adcfaeebcf5e6716b4b45a3a69ce226ce04ad34f370dd7d9c4b608be3aa045fc52a65c5bb200ba6b39a75d845692d4d6302906ec333e1ce1725b9737092b46a25b7d55194f3a465be6321e48975007e4c0b05bf221a20896aa0a066cda096f32249b29e8e7d4a3b1d4d481a7e0e0f254bb594a97a91dc485529816486d0d8f136078cc419003b299709b361cdb51124c24d6585649eb254771b16b648925152386da878d858ea094263c93233331801a122cd8558e104cac72ceb3c9f8f435a1ce5d08c040e36e595f12ce98be75a7252302a66735790eb8dbc4722ea6f73ba7c94e6eb4132b612e430cca8a5b9938330ec60db43774d6b64e6e82832dfd460586b7b0b2b2b3a7eae4bcd445ce749d6b46fe7562ba9517d332c3536561cf433d11ac35856b0aa6d9924c8603b1aeb55bc0506a4b8491644832abb24336121993a991892e3c30496727e0be8852528d02492212a1490b6e9c23746d520b34c008a5b6a24ad8593e5c193455f3eaeb64fb2fef2452136b216636e11894be91b500198005b6a12d2da120c094021c64017ccba573fe7bae75b73875095120710e059ad465ecd0bcd3d2a4cc17184def3ceb8de47991353a263b6b9261a44a6e233e170c57dad5db726ee764bccce5abe6e6564d7a6ab5eb43582f495c30e3aaba696681d5474930e13e8e36dbcada640232a41d34a091f5d7b71a5b4c1067a8de71ad8eb3d163c7943e4600c498256a1f6ae6e24467ecc847990461b71ac89959d8c1388a421c42a83888085268dc69e65410734414914fb0fd4852564c510a4d658d7e5b67f8eebba67726c1da6b6887c9931e248551b011f43642d51dc50959a30c4a4918df40db729daafc7eff001fcf596710bf3f6525410946a8565f599ad4ba79b912a0dc35b3e77d1f01d31ba8d631b53a2c39208c72169184b411f15039fcb6b54e3d9d21e4255f114d5f7abee48c2de85979a774f6e4972515358baa31871bb7483a0835cad93ba4932a5bc8063513e9a1d6026c0c486a90ea124fd8e05e4ef565c077e7408ae482aebb5898cc3d7a5a99185ba24e7cbdea63029da959852dd11884edd062cb669318ded1158f5eb0264a4e884b966f54933322f4554aecd44371d222c3b264f3958bce4ebde2cb829ee77e6b829577b1c1d67705f125dbdd15c1d4bddecb8ef569cde4b4deb3250d984826c5925d09a904233f7f578b87333f376306a423350e67b474259c88d29418059e0f7587de7a13528b53566d3c1a9ccd13b8e539407594c48426c7560d9b6ac8396c98a1b0b49ba6760bfbdb31efef33ab9abc977a53e32f9dc562db12353439db47eb2fa6aba734f4cf6912a195a169656de6a63a0eb6b8cf373e0c210eb544ec54a69ba7f0a9e7a6e3735e9193efbb221871a6a59a849594e89f0754c19584000c88c4800040a8104c03480c240a349a9904846d99e6171a5efbad4850f2da55aeadb55ae3acb9aafbd19fd6ee7af716ed59f2a52a4382c02020c014491c26903f5f258cb9f1a4bcdddd536722cc80fd25dd42489902c1544a04dc8eb33fd33adbccfea69fb2acaeb2171a36e69d6ac571192eb36740cca6e6b1f365ea8c1b3a5d9a73a8fd179c2d6d9f50d959e74d26ca9269e8da5e7682de2418d2db66f51b9132fa5ace5d3289d5e4f73aa41e677ecc387d01db32e96f519aab1acc0c5e66af60d43458ef6ce650b65163285218246af18aaf4fdbf9a7b06176876579fa2a24a8762d833ef94a54346c282252e10d8581b2700d87cc8c4fa06c9c254a88834b291e364e3cc8e255d3aacc1aa9695eb4a5a1c14eb6eeb4b79b7ba6dfecbc6fb4e3ce058a679a0096d094920750da879c8c92c0e09473a66741f3f65a92ac8d49543b5f611ac856b49732ba088915b39bde6cb61cff0051b5372e8d0e256d70964a7a57b696534766c8bdcbf399675ee6f6acd6bb3507a447242da73397a0e63aa35646d4f3fe6a6b3311865755d14d5d410b16a6c12551565dd61c01e9b560d1554690596d39a252f911a7acba1937a69f399dbfb33d5fd4700551486a136b522bb4740f33f5ae77a2316cbcdcb8d437d265d3a64d99a3d13650a6f905215c36561cecf9668aab5a8c8b759542dd314eddbb0b4a9b26c8a24b18e9e715b6bed5d52156b8b6dcb54f32e5d38e36e6b4ebccbdad48ea7cafa64e3a2271bcf9090e90d2944121c4a8524404a90636a6fb3fe7e8e1a179ab34287489699cd0673423c4641c88c3533f94832771b5d85a2d1ec72d365b3caeded2305d0a3650d1e92b20cb735f9c9c747c1639fb3718776957b5e6f037725a64b47492c672492424cc4db044b8ecb6d9a74309247171cc90d1b8ad809a96a8ab91335504b6804ed3ba0c6dd54fded06425b2acd165465ada65a22ce845676beade4cebf1d4e04da9ca3b900b56c4eac16eba5157aacf04bfaa8843c1902db7144266d966762ebdc310d6f946186ec93c88e36e6bb2d6db974b5a17ad2d685ab8eb4e6b4f3cc3dbd3fd079eed9cb7a89039f8e2a5d3184ca2230906b11c9052464c86173b96d863f8f45292ac552d0a85b8d3c998d0505f8f011867195ba6d24e25ad06f25087a1a6b981c9e938d5764b131ace8188dccc6b98e86d6366e6a436525c3556512e96c2bb58ba225cd478f6c0a32bd45950f3d0aa4371dd09994d591838d6a242cd10600e1b6620de643b1ad553e4fa85c072c4726d72841f58c6e3ad35d0cd5cc48d66c5cc39f0059dcf4de78dfe75bd1964677ac1904d9b23c8b89a919c5d5f9522d2dcaadcb2c441709471d43c1a316683450483cbce34bdf65bad39a38b6d776e2d0e5d2dd6dcd571f61ede9ed6e4af19ebc94279780d20851b6154934890910869c68aec66e70fcb6168739e82d2b90de69e4cd5dd45aac8e6d718fdc54a89a4acda97b2ab6d241c1cbaccc697698dc4a28d6957dcee8d516b4897326a358aae6bd764fcb530b599ad2537a62c6b36fdd34333aaabecd2b59e9d353a0cd6d298ec6074e698ce1ea4752423c10aa49a9306eb6a0d2a748f29b416d58eb956f7b85df67553b6dc70cc76d0b7133364abbd8e125cdc5d56737c59bca25eb3da66f37e83c7d0a8f2119da189c653b77cd5cd22ae0551bb6c133b6721d1829edac551b23cb41d8b71a2b9f3d2d0aef1c5a176b8e34e5db8e36e5ae3ad3bbdb8eb4eeabd675b32bb39b1238fcf4b4fb48a2242a90848b2414a490c88c66d327cf50564be5a351290de439140d4ee77a91082ba4173496711f7d9962557a3b95ac72660ae33d281de959e89b97bacce3a46368dcdf7eb98b2f8f3e2dd1e6c33ac69c50398d5d1d64a9a944152b512726e6995671b790d47340cc88da2830e5c91bcd86a0a506890212f330f25998366e24bda56dfaeb3abe7d1f8fa31ecec693a72bdd3f21ea59d636a3a3e5adc522547df091d0f99dcaf684d4dbf0f4a419344970221264a12a524671c2104e01a8f3415ef4a559104933cda0c7ab8b8b42ee9c5a1cba5b885eb6e3adb9ad38f32f6b4f4a8b274eaf6d43a0e1e02536865d64923adb6816c844a84ada95bcee869b169569572d2944a4375a28cb61e444eb9529092625fd599ebd94a9ad2d062bd1c73bdb6467f3e997d073e8164c81ad819b4931e76106490c8928aa8b5a9de2f032e6744c4e7968dcb5458ccbae8b56ccc693232c48675222c33a8927c213cd3aab3665ab71e73322047b0a38f346685c3b92aec988f1dfb8449ef59ed0e9317d725e538ae8acef3b6c164bbe66f16cd69a074e3401d6ae767bae29d19abebbce5bf3ed2db058e8b48243341864690dc4243234d1806006a4f36128bd3c96b42f55d71b735b71c6dcba5bcd39ad3ae21dd69d7d97f4df6bf05bde1e24a5499cd2932a682d2ada1c6e56d2a4c37556b0b1730a4ab9d5292b8190d6f2ab22a0c7489207133aff3ed166e7eba6d36a74176ff0095af4bc34ade73e8c662e1dc6e0e666e74b68701db87a34976e6bcec4557336d59638ecb3944dad662dd158fcb35249a6a1cf6ec65286b510975bb9275b75641b5254469e59311dab2d1c8176bc74af76bacae1c85358492e40e839de37ab33cef3bed9c97b5635bd4733b8bfae72c6a39aef9f56e7dd13272e122e828b7c1b990949e84898fe818ed04c0e7dc88c210010cd260480004ba4a96e236eb876798c817a306eb4ee8e3ad2ee9e71a735b71d65ededd75973564bcc3f6e8fa6726ec1cbc91d12dbc708852116b485a46d2a6a50d291098f21bcdc72945caa9447197c258c6de639217453c366cb1f6b3e5def3ddf72cb21f6ce2fd4456c31f9ee7da340bdb331922f6979e9a2365147198de6c4a00b99d5aa6acb854072598f33271a6a2c967480f2d170fa2149a4469502c71f892694b1325413aec446d6c6929ab4562a2d3376d3a586635039eea975d6fd78d7eaabe04bd158c63bcfade767e11d2378cc6fa4601d1ab3d262ecc0f6ae53aad73c25774ee78cd1138d6b9c8f4079e76cbd1ca7c0e1eb093484a42c0126023086a25d0712762d485a79952b4fa301c6d7a38eb6e5dbae36e6f6b75b735a75c6dcba7de61ed2c3aef1fea98f3d9216df2f2a10e12b695b625b5a15095225242d396563d840e5555d658831d650e5ef30896632e0d19a48d322e6b02353ea6fb01d2b9e2ceb47edb9ef4988d472a9bd664669c95726709623aeb761868d175b3e1eb36a4ea71b8c7255735af6a6b74a366c22d919b711724eb0ba4c85bf2b26ec995222b5609ef49ceaaece33353aaee9bcd9333357f8e8d5669f3e58c7624eb1556d05fde2c0a14bc74ef986abe98de5a8626b34aee43bb87ae7d2b8ee8ee25e5f557749ae24f30a4ef8780def3f402058ea46648401a004a0d693b1d249d071b5279a92a2f4e0968553aeb2eeb6f38cbbadbae21776ebad3bbaebccbd6c9e93cd7739e3b2428b8f8d287da1a43c85690f32208ca5421d44b43577947c4ae4fd2b92d8e4984f68849b8961d0b97764c5c6d415f55e647a3731d495a0398b41226e6735ae8d02ff1d71b060408718913d2a45aa480a98948b06e6b359539300ccd8cecd6ded3975acd6815bab09be1da3dbf1edf3d6d24eb7b32359d030e81c893220b56da75cb4c6172bd5f6479d5758d4586f0c15953c6827554ae5db356d619cdf3b2aab7675994cc39b537b2f29939ded2a779c91bb0b1b9c36b186ee7cde7dc656bba1616ca60e3779dc76ce0fd4b1d6f480e7e800d286461096930c2934b20916a48b3cdc4a47a700d211e759735b79d69cde9f75876f475d61cd69f79877495aac9595cf5e2c2d979be7e9535d2475012a10a4048514a94a8a2bb3ba9cb73b98e7fa8cea15a088444e9a9491d4b0d1729b6f5cc69a3cbd6cf359595ce973125d7674f54d17475ae2d5e479f5af3870d2ea3427d0d0b72c661ceafd66d8ebd4934a3c996e831155fb4d166adda17347d2bc56aee3611f3d63373b2d2b629a4b9e4bb7e5daeb9b746873591bac8ddeb1371fa18d628535dd945a1ad5d96b4f3e472ed54fd55af4e55b6a8add62f27d5eaf9f5d7d2673a26995895bbcd4cc6035b49acf4de35bbcf6541127974e307a3f34bb97b1b6f0e1ea602c9481a501a40b520c00c51a4d479b9269f572200875d65cba7dc69cdd7dc657aeaf38d39ad3cf30e5b264c395bb430b60f79bc588b0d445ce1abbcd4093a45971b613bd3dc16cabb48e636b2ed720e35cef2c6d8d3229ad8f338d9c4c575532f48e4cadce0fa261f2b229117485d2701b813cead3612e633fdc3cff2eb7356b333bac92073daa33712a78ac3b8b3a87636f36aa8d2e0a2cc12c3baa98bace8769cdbb13775c7eea62f344227ef94aaed352635aae89c77a567a3fcb7a9d0e75476d93b891ccd5e55eb36650272d79cfa3d66e6a2d92af0a6b894a0dde7716e2be5cad662e871da5d47b759dab9bbe4e8b9dd498fb3c158de9723b24c2375d77d38e6c5a554765bbe6bd2b9f768968c7423004928825024529205110af3825c6fd3c8802453acb9aafbacbbbe8f2da5eba3ce30e5b21c65cd6a43d15fd9684c3e1c6d9faf95c7135d8ae6732ce3ae46abee15339281be52731da5bd79897ab2e2caa975171653f57e4bd5e5e67b0cd5fc4f8912c4155276354f09da8d4ef192dbf17cea4e63a6c3cde7fd1b9f29a2a8992b36ba4bcacd5ac932b7556b55bc4844d1645b68488762c84521a5af52fa9eb359965916b51b8f4b893b274d890bae7f117dcbb468f779e4b70d3f2e7eed355bc5c3520b3d296e2a6c37ca0582ea2af1499fc7be76de82e77ca1592e9f59dd67ae1ec75d6e315aadc6311366d950705f6299575517279cd3e6752cfb0f0cebd8d5f24d3cfd009490c8c0900212906292675e6f043d3c425490dc697a3eeb4e6ba3cb69dd745ad0ad69f71976d79c615ba2b5fadf3f9ade753cfe3ced5f8526590b65c916e36e4294950aa9b4a24c5a5cb5de33f6b4b3087d53976a6588f5e50cb66fdbe2e46facf2ce91b730dcc59b73abc3c6dbcde9301b5e513552bdef3bcc7e6d24bcee215d222aced4a2aa3ddd4eb2b90e2d5522b5d4e83512ac179a9c885acbfb3c5312a4372f794d831a4c6a892c4ba4486d8cdbf54791cfa51e8aa9cb26d3682366b0f52dd6e3751774f65b56cc5d8d4da1b995966cf399d69692d9b4b9d061373588eb3ca3a1e987dfe3ef8e7d7f0741654e7eceaae67d05922e697a1f3bd3c9d5803e5ea483011288223344833a0008f313c51fd3e3984955ea16daed7dd65dd74796d39bdbaa42eedd7195eab8da23b2dc3546e1e7b3b0a99dc716f32b272cc723bd2bce32e238b6d62f3f7f9e99c65d67f41d251cc446427e21cbb4a3ab11774d73515b16daa65dd574ecc5cf525d8e09aaee979db197118c7779263f61028a5d7e5047cd43735c9aac62dab3599f6146e45fb30eca29e6ceafd46e13ebaad493ba86b5912ca25962c6712cd9364b6e67716e6b5e96c28ae189ab45525ae35552a7e7779ba6d652d3dbd35aef9d6d80af2de9ade2e76f4ca3bd4a2e8fcead752ee240a8ad455e9b0d62ac37d98973917511ee68eceba2330ac6b5fd4ee0f429bc7d466472a41920040001066493cc2095e8f129f8b2aecd491ae921c65dd6dd719735b75c6d774b0846a9c6546cf26595278f29b3ab5fc66ea7d0cfcdb97604c9a92b6974eada5c8ee7ef69539fe9335a1e98a82b082467d822e2233a69535fd239b906743d1c4daa87b097a16266d0ea775f376e3099b71d569f41b9ccb13d44a57720f40d79ce0371f97a244038eb6732a2f2572a354c6355e238de4ea6caaf599cd3d652d3bb2e304524964301f9625b43725915f35996cca1ca9aa7bdaf3d66d29ad1ac689d833ac8d16ca9759baa5bb82b34a24f96836392d624039d9daea3c73b5728b7ac714e9fcf6e7af602fb3135a3cb3cc5c54c6d66535860c159d86f325ace3e9069134a2200234a183250859279803ac7a3c2a93165de8a093bb79c65dd69f5b4bdf4794c9dd2d01b44c6763f3e6d8059c4b7e2cfe709e65e87e545999b224c55b560f55925e56448d6632ea9a774e76b125439614694e54576ea9e4d1c6354aa8af6b25c0742c4a567dde5b459d53e828f6cb4545a083d39e99bccd3591f409a98e859dcfc273bbab8cacf5bc7a0cdcea158cca696e6a6c2908ba9cecade5f295022ca239331d20bf02dcaab25d6558d759b12c828f222bee6aa7d8ba8baa92d9519e9a89675577645a9bd8f0d3b5b7766774799d85514d5d51a7cdeae9e6b7191768acb58f4775acc48b74f9ade6dbac6cd5e60fa4737d61a4b8d6b1d1373cdfa3f2ee60167664668900280156243ab4f2b2240f4799121b35502174e3d19fd57d6caf5d1c083b4db36b312ca9bc73092399774d5fa2c211d8ae2b0ecc4d4039d265af95a30ce12c602f59c4bc92de6ce0c9812c97e4c32c2321d896ed659ab3a0a3b088ba5c85de3ae5255a5c6b14babc04c95dda637456505fe62cae2b33c25d455f4ad572efc4dbef7173786bfd230bd393fa0c33d64e6ce6cac41962c6e4d7aec5dfd13d8e964cda514b715b6adcad2abecaab2c214ab97614ead2e48cf9eebec6bed3726d26c716ba64cd12e0f5f90bed73a7bfcd355abcec309a7cfdc6a26b0d70ddc54096fd7b41f420b0aa78269394f5be5b71052a46f9eb7a9727eb1cfb806acedb0b3106b162540870d267960c27bf9d46936941274b759729e71972ed622865f8d677331929db495999bb5b25650dc92b58ca90aca28941613cf372cc3891d9a4a7bcabb28da798dc6d4b68b0652d2b872a3c0931a482da864c4bd166b55cfb55da53da429c8b3b370d2efeabb729399910ec93d76875be6f42c215cfa9a9070e2003018fee381efc73af554cedc224a34cd36ea1173650a6296d5966d3975afb0a2d0dcd0db34cd3f5b75425930a8e4d9f9678d148ca0b37195970ec5a34f692f3b9db5a0a6606af3b2dca5eb3cef37aee79d2d30b7502efa66467baae352aeaba573db1b4df67e5d8603758b9acc20d1be3a6ebbc83afe3b184d1e7a5f1d4d9b2a24a5a504a478341392576acb7e6c15774f3d39223af22b933bd565e9847adf51198bcba2bce014f2b6bd162996b4ac8a2b4ec44579cf0b04e4411e8b0e3e8753648d2a1bb66e33316f33f92144b8365e5cb6302622c5aa6d08e08db129b5f8bdbf2eb99b8a2d16755d3a9efa5abac9b1b788705e9f73d59681e4f62d4cac58094586ca5792455cbaafa5f2ff004f96ce189dbc9c498dca76b9e9962b4d87919b656140bb2ca9eeeb563b77f00872ce795bbec4db59a5cf957c6fb2965128a7d15d46839cf4ee656ecb33d0b1c8f6ab1d7b2f3def5c2fd1d73cfdfb19bb68f9cf44e626b79f749c753790d36065e818ad1e2328685a359d375ee4fd871d59caec29f3b39c4e8c8780c93e0614e8b31cb5c0ebe3999eacbfb73c36720c48da9186b5b9af59a5cfa417cc46b2a62ca266ce9b23965b9bd4d4d09a3aeaf7759512974d0742c74c92223539054617a5f3fe7a88f34ee6a1e43a26c687432aaaa53d12aca5d4e90f5f1acb3725a6cd6a38f5ca6bb23af5ca909fbc646e692cb59eae447e2f61b8d98b4a4a9690991d08355729ea987ebcb1b3a0e8bd1c286548d36758cb78f617341bccc68d26653598d5d0d0ddd152986842f7f90eb462ec9ecde8c44d756e552bb58cb9abca5dd6a3393d462a4e8d535710d3dfe06eea8bd01e69e8b66b6c78bea6b7b87af6ceb342d2d7255d36deb2193d167f2648126afa671c562f4eaee73b53a59bc57a324a0202d00016943919577dbcd216e0a48510622e60d2660f44b0ac928854aaecc2dde2b3911ab1ce686cec83d438df6433af30feb0ea92b01998827095b43c82361377ccb150e04e353659aa5a19f6d544cbba6dd592b2cebb66df33a3c3ad9c29f8ce3d275fe5614d5ed96561d8c2dc8dac7697339a1f17b1c491aa4949b0d26051190335a6cdeb3cf7519ad3fa3cf035f9999cfa573b16e77ce6555e65352ff393e9acbaaa2b3aad5dd67226f61e21a2d3a0e09fbd8da60b67cd4e8765535f6f3fd056754cb0f56f549bdc9cfb632afc99558bb297acb3985cdad5a2c2e9ead345cfa725c6830f60b5f0df8b084831f696d0e6df11799bd475fc1b6137d1a36c8fa63125af8b19c17518e3fb754ae9ca108b8c37188abdcae436f6d4e59a79f2a35b19fcecb3ab530252aaaf9154ed742158cea392e916618e239bc4e5b0e8ea9b50b093090a4ad1f3ad7e2f9ea72da7f366c3616391e6452d2c6924089b334eb839b37a3d9cc235c5d635574d3e573e969997eda5673336e0cff50e2bd071ad5049f2eaa09316495012b6c194d473fdf3a0b7a699e9f3bda2cde931ba9d365f4ba926a3595cb618fea7cf359dd9ded7595b4b329ab9ea42634b7fceaf8d9da6b726348ce7584e5f79436cb779adf604ccd95f4d9713ade75adb2059e734a979cd7a2649777ccbaaf214bab27a8ea0bf29241aad2534579a5563eb80226cfa451bada715dbaf49b1e733779ea765c72659d84721927297771412d3af59b139a41ec39d4e45b2e94feb198bf9b3d33726f9255e9e2584d56e17a5b51c5f967a820698991b9e779de05fd3d7ac491572ee6cdd8cbd6649c655af2020e754326372dbef34f0bb74428991a5aca5b8a7bb35f9f53eb7a73f1f65a595ef3b95ad1399ae3d23e9939f594fde64a519ede65b78dd5bf1adf70ebaa36873e8f25b21c4258a6b98ce87e8f3dadada556b19595a59a65fa4728d169611957a40cef46c3b532a77196cd6ef21469aa26153fa72a378893634157396fa6d647c6d8d1e4b4b5232d67019bd5cbccea6af6580e829c7b514dd24cccee63b534d957ac8a8a4b190b1e9d302c7e32512182b82895b9ac334bb57ca5d14cd72e2ebba6223963dd2206a51e86a6aacdddae711d7cb74dd42acd4cc8d367588e40635cefec71ca3a61739939defd78d992ea5aa9992c083a281ac4599055ace7b3bd233bcbbe0e0dbb38e9189d916461219d466b1dc4550849e353ee636aaccc56a2d65911199830cda52c5ceef153e51a6a1d36a5622b36e656043d3f3d573555a2cee0dfe56de5cec294eeb2fe5778b8cbea32b097a5172f5675b7cac6b8d62977f98d56b37389569b36454d9e46b524fa66b9cdcaeca9da8a7be1ea5d86633b75eb7aa2b5d27f5ce1c42b7d668828acbb7ea2f65a5b3a7d16742ab638eceede24e8bdb93a512742f598eb84ce6c73f6261ba4e6e3126ce99445acd5d12d425c69956db11d456d09659b43735f387c9a25749931d24800208d22139e8f0b8f34e55ce8b1568de86aa5c31e72249b16b0f0da2c641549bc5594d26c424696da66a74ba35e773abe95ed67270f714dc7d196a387ce8951b6796b60290f46bb538591acb61fa2951a08f0a5946a91157739fd02edf2ad6a2cb9c5ce9f5270ba487958e4a6dff002e89ca20ec91bcced7cb6b49b8397296d0a98676bcdf4dac6ad9cb09ab5c16c8593ed722fe6a6ea1dfabd96b6a99abb9a891e3f5615fd66abcfd787c9d6d67ab8c8a96e559a633a9f27a732e4d77e97828a1f40c859552e323bf0d05cd45bf0f4374b39ede27e6f5b912c65ea6833729d629adfaf2e69afca74ab3031abb4050d934b1ea5889244523497d6705b9cd752dc7970fd0790f4aab50d943a96c2800040c242583f578146955033554f28ab95f97097568fd53b2dcc8a57174a79d5ade152ad2d5554bb2dd550ecb0e42b9c6a74ff3de5761c3d592ed9d0acab9d79d7d35e62813226825d2276b1b9dc5d0f49aeac1455596a488506493eb27b25de8799e86af3495b9b2cada7e0c92f5be3315c764eb33a2564ed65acb5d1d516cac3bc575ee5f694bb0cbb79bb26b1ae599ed54ccf56f9a18d85f42a9749d8d6749cba68587f21e7ed175f497ab9dcb68f7bbcf2bd2e8b8ed754a3afd079fa65efb37debd1cb8963fd0bc2bb72aed0e70fb71dd5ae2fa1e7ae706f32bd39def29df50a6fb9fdfe4cd0cf99cd23435db0c694d750a3ac46d4940a4cf4dc5a308e7a959fb5c4553743e7fbdb2e8a3963724a39a3e193a74da09196857bbe6a94856a3810b871c4b8d2a4a664d13c958e29074b52554b712b47dd6942f3f8de43cfb686ab57ddf1bce74c7d134da56939879cbbd7049a5f56e57e845da55ead9b3055bd1a24707cffa0fcff2b0f5a65e254cb4cd8ce929e3ad9e92a6a497a5ca251726058adcc091718b3eb33f7d9d535f59d4a5f378c78acd4e3b73630fbc9ce890dd5cb7f8c7ac7529b6f82df24ea380da969999c9475237954307558db1ad3dd4c3305134faa78ad464e28ba2cdc59afb6c3757d4e4d07742ca8ed19ba6b9ce3f47dd173dc2fa1d89170fd9f8117f57d678b4681aa17a571aab762224c036d93ea90db7251cf50b98740e73a9337387d9d4d4d74de75c0ca564ae1a966aa1ac4825fbbe61a818b723ac96fc494b2e644914fbac3b521d61da7dd8cb89ce40c94d6b381e76df9f6a5ee1a8bfde2258267eb959341ae3e93610b9ae3dc23d1be7269ef46f9c3be9d58190943a446c56f88f21eb7418988376a931902bea40f5f93952aa25d4221dbdcd392a35f58ab548533173da45d2cbad185b04abbfceeeaca43d2372d3d9ae34b3d59caeb26d05d55d692febda86f38cece8de99559b4f393b2d4a0acd9612ad77f62346f299ad09d5794586653316379d7ea939d63631d5ec341ce3535b0eb35c9c83d0bcc1a2aba1f2aea8676263f667378fa3abcd8109291062cd371b2bc3b725175d073791e4ac2bd27ebf29bb8aa7ec22f3da14cb24c446930a4c91285acfe8fc96d6b7f5861cb15e7ac6083d6152223faccf9314f1d673116c2c5367c64b3e72e777e1ebc5f6aba3d662bedc4cdb75e64f3d2f186ac9a4be90657cabecef2414dd4b95db9ebf381383204182318f33fa7e92380c8cbdf9a8c9dce90e60c69b1d163d47946faa1eaea3192dc37a8dc58ff3056d0e4375aec5f3d58b79d7b3aaeb6a9db6b39c2d81cb9395a378a7b63a696dea69d1653df44b64996b450657e32b62552aeb192c4d10d5ea45cf6e79d6db7e8bcfe3a6fb9155f52ac13dd8b83171d478eeaab97c3dcf54929f258b8c6e375ca2aeaf6c316f96594b58f10d9baad1969d65076cc1779a090eb5133ba8e549c99485c5b74ce6dd824851b4519685aba8d8b5699cd44627d310e656b5db85eab2cb5bf55139d78de2e9e4596b369e5cd5dcecca33bdbd3732e66ddbc4d27639baebe93609987364b32f6570065e301a90a0c24d4f87f6fa93c80eceac8edbd9fc85e8736c00a0000191988f39fb0f97c72bd872db82e1d8d77184bd9f9996ff00a771ab0d4d4d56b241d179565374b8ab9aca4cb5e9c2cfcd8f2216b8a15e99a973c9d2293336f2992e91450d74380b476c83b7cbeb09b160e6211a56af346133310af75acbcbadbe4a9290e8b6197d1566f9e6e35e336fc6e4216b362e59ccba2717e8c6334f94ba20b1470893619b44498c190dc8bd663a1de32ce6bf1d0da9f9efb5f9bf509495d97dd9f8ff0069b12d3ad532c4a6e213339a880d4e466c498c3f2e92555e87a6181302d7b768a2a176b9ca95c333f08afed1aedb89590141268608298208608c0a49aa8240a040e59c0fd9dc2a392ea32e67a4f77e4edfd7733c969c781181498672be2fe8ae270de871332354ee2c87ac2b50373e5435baa071e232dc941aece8e23ca9bb2310adbda1cc4749872e00fa11c6166c88d2c9553c042bfce2b6bee83cd5f3a9d3e160167d2b2d6766bd18bcf4b65d6f9ecdad3631a051eb7a0e18e63d8788f524561f4b06bac73babc9a743a8878c5de612358c43484050df984cf4367af875b60c7db437a6178eed3170b799911b4ead80e89632875ba69a79b465b7d233127c38115e19d3bafc66a62f4969dc01ae1a6af8346ea9599f44d83e0046182301900cc806080608c30403320184814830715e3bec8f1ec479318eaf6e316674e7797aa375499f04f6a3b81382d62b12edb1493f538a2cdabe8656ee39fb4bb2b78cf582df02925d2d9ed2329176d0e5cdbdb2ad9732ab55c6663e82be98b76ef8a4a1e8b9929a1583f515f8292e5ecb9a687acf075d7a22978c28bddf4cb1ac4232fbc585231689355b6cbf37ad75ee6f206c6b6be0429e7a00d12db0fb4576f759a95d927521b1630a55b717231cc622559d2e641b34eb1aea5b4d1c6c24436e21104b319626119bb08c8e5b776fcef419deeaab11c3fb72bec9cff44d67ba724e146802c240a0921668314106282452c200e06c43810438100586c08f1ffab7c9c10206c53d5f54799d1e8bacae2577d060c95172cad6f57596464f01deca5e2ae89095d295216464f6108c86be8d276fabe55a6ab2cfb7a38cde83a766ab98d8f43d61c4ab7b066239dab6513371f71b2a989b273d5a686041ca69b1a4e8bb1ae110fd19c819c7a1b5016cac5bb182f4f7f964a355bec1d256d27642a4d9e1e5c284a52902d3b64cb755bcb5de48826c3222a04401c9fabf9f7368d485e36bbda3dbd9d226cc85acb8a86dacf3ab9c4937811ca424c348cc5ff0eb333949ceb7972f27f4eb2f75f88db200902c200b0814b0d8870362966d90e93643c4c90f947649c9a984682267a2d9754d020437c67b165f3ac11eeac21eb1916d59e77572e32f6578e90ac0d76bcf45592d70cc93c97a9aabce6becbc692a77194826bb2d2366629e9b5a316147646fe762b7c5167fae542d068e15659549d6a65e736fb6bbb9e1775daa90cb459789cd45c65660d42d4c5b330a98e2ab472b5672463719e4a6bc2aa5916d48d2692850faad84b881fd0759b331ba516f244a2a4050124e01b0e02abce3daf88634144acea4755e59ddb59d11b87acb61d319afb60b938bb54183b6d1439725cda066b1a2df39b914f34c4aae818cbf4bf265292046225144225144454e4c06d2c8aa58aba6e8dbaba62a929363b091d690d8719e2cd8a52c4b15162b20487d52a1d22d470d921f38c44b38409e75e72d92aacead574e45e9d0999de73dadb4e252b5b8c358ac8e914b397f96269c99852ee73928dbe7b39023712723afb74197dd4db386eb35518c83d3eb52cf0bb2cd4b36b64de19e7d891252af415eb633f2532c68a2b4acb8e1210735f54dd435aeea11286b290a0202c0925284851883511c639d5dd1f3da94472da7a3b87f79de4002e4035080ead58392b23392152f8bba04edd62d3cbd0cf972f676cda1c888d54e4d7a12c515a94b06a10a90d36100214082404485586cb25a42da6ca4b891152c5460f958d21e2962a64c314799c79d5aab8dc55eaf59ceccda43cb99a19d9006c23db47e5a666d353ee741b2e442ced0ff00119d1d7dbe79761e776eeaf351bba344aeb21db2e7d3a50ec151d4e1dd4d8a255cc0234624d49da60967502e5ee59a2a08e2350d66dd2d1929c57b1a278cc48d65c99ac8771e5da95ba6c75c1d9741cbfa7ea2819d24cc21051aa4282103251536b80389200e7a5b8d3e754ea794d8ef2dadc70696f2e5656e9cad9ac093333228869ce25371cc5a08511280906049989524e18c87ca18271ab49204059bcadbc1400123a4c269c3428506b3d2e932fcf731a9a7cb20c407452002851c8979b633ef2c7c7e9e5b6bad8bbcde95248f17aad50cc9b8e6c9d54efa1e4e6f1faca71ae502545f5715dbd2836f7bcadc8ea4de47430d42d23862ab7aa4eae493ba3b35cd6075064e68ef487ce647d5ecce2a9f40dad9c0f47d791584d1db376466643042abba819b442542c5b984abceb9e0f22ca931ad9f4ce2fbad4eaa10e6b2608299100c1043046a9e27dbbcc92d4292ac539f035e77cb2717a885a8e52350124b0241808191810e9e70d1b85080b2549292a825240a4261d434cabada0060dda43c0c51a0d541b6c79b4bb2254a82b3aab299cc7a2f33cb7f8fd4cbc2d467fd1f31a4a53d7ca64013b7f9bd0f93bd8261b5e6ef2df27654d2daab59adaeda56d3b6305eca3336f5f49b5ce5b6379cc2ede2fd0f0e40293d72149019182df5dce41d81fe61bc4d0ccad93a59488322c96ec57aa54886e930d858e10021b79b23c795188d1e4b1255d6dc55e348bdcd59d31c97d01c4aa26c30d7b2f68d3f30e97a8e103b082c085a8e12a5ad73de65ee3c2f342d070e75ce4de8b36e60e8183000020000001000c3a4d38802085a48a534040a4a5a1c690419070438642cd2a08cce54254dd28d6b84087875bacc54df63ba33f7559cbdf1ac6aac2850e833fac569ae477f96bd3cb2f37a0e32e273e88bfc6d8e9717152ef1dbb398764b08ef57e5264d63ab62b61eb987224c4a98fd659615dcdfa5d67af8f281d039ff00ab80322d4524cc43882369d0f84de576591596b63ce34ee8f3ac2c90ec7747d4d2c520c91a8d2584891a544958acb5819950e1c3ceb5b97b5bbe8f3fcd28d8bd0ba4718df9d31687f710a5ac696eaa56d6aaf8e11cfa44783325165eabe0de86a06083304182000000020c80304922e5010429921b1c6db4d8a49129a8ce01a142d4d14af9b254ea10b1d5c78c4fca52d063d3611e3b6d376104ef3b480b83c7e8b77143235c5e66d60c90557139cea98b38189651ee2c3984098ce35159817bbb090ed5cba78b48e2583f4d759ddc44994b3129ea1bbd591611a4e734c9b79d6b192d259ef97066efe07d0f2571cc6ea39490451251533b4f03b8aefaec29fa86a230dc68c92a8ee538100365c6d22c59b1222c792c49555b71578d39aec1ea35737cdfd13e7987779ceb5f1db749cf7a25a6667611980b8ef52f2a95c02a03ed688ed3bf624510301180118200000010608ce7c23a39490dc76c79a415184855868e1f7220262a12a5969600ebf1089c50eb09bca18a5e92ca766dac7a742ba17cbd7a3af3550d7b1e5d6951a56f9660a4eb65b85c1839d499b9e7b4bf6c31cf51c3351d7135ea591d39ec6452cfe1d1dabd43d9980bdd766b5665b66ae7874afaf7739e8e7bd5676c396ee6d295fd61991290cf2fcae833bf47c8e842f79097554c9be8094c956d3b37993b8d9ad233a419906b43828c284a5e222469f0c811e5c4922565bd6e6d3d856d6675daf94d8c9ae417d53213a3f56e0bba5eba10e6a021c94cd7355a6096a728771e6be9424000323004a8820640008304419128e5c848e70c88834990640a50460008c0b43912568773a6d9975d657f317e83ac42151f5100d4afddc2b3e5dda04fe6d7e9ebdce5d65c884be1bb2cfd855eb2dbd773ecc65813f65f37093c7a2a73116a7087189684bcb6d6d5d61c2d8627558de99b8b3a99d9b0f23d36376e585bf7a73a226e4753c935b61dd73e7d59d597e9e59bc9f589b1e7966544f67006474823206af26f1e9d555bfb930e86be5d82f9cd64bd70712871dd2b38da63b3bbc8629d820f2b8c9d0b39924cb3d98064b69a40b5b2b5b1d5d3d159dab49e6b1674be6605256b7844e3ec068b5e004a2308c00119040c8200008c04011ca8e23fc8e24c58446528232000419028375990292dc595ce5f6991e912ca93b96d9d7d80c00b67a2c65cf2ec9d3b7066a0bb5f231ab00c31cd676b9bd563563269e670db99fd255f5cc14eb234b4689321ad434a853055ba3892e71cdbb39d5551ebab062451cbc6ed99c9dcb5ab72aae9c70fa28394f466cece96ef9ee64a6cf927cda83eb8e6f8dd4c4fa3e4a47ee5ad480b5323cb8045b0dc744ae0a5e806a3cfc3bdc23882fab554b804eb594cba7a469ede24c77dadb38a1f4ecd99412de8aa3d65a19de89a9d42f952375ce3bacc90c01e7d36a479fa5eaf59ae9e0c0018400000418002008000088d20008e0b679f7fc7df4ced1d8f4e53490ade412d2248ca024129a42415b63ce6ca06cd3d62233a434b298454c96a576e6a95cf5b4a7a69b8ed7d2eaeebcdd6b9e7e4d91a53f272a4cff41519dd0e6a46772234aacc6e0da65dfe99d7bf9d97cb7398870e6f71a5c1dace5a36199f261f19d2a93d39c4eea99b5d1dcb127c3daf73ba763d7c3148d3cdceb0ac6c31c2292962fabcf3d154c7a78bec03de4940a80238ebbd6799f55a69d71534870280a25400a2092b4d41a7d0d2594f5b6b5a95ccbec655ad4e6a5da6c31dad5e5dc83b3f19d4204f22a6c45576aeb1c7bb00640066441804288001000204190201020c111e775a0fc5e87a4445adccdceccd73ba5c191d39ba923124a489234542e4bb8c1f48eb6b7352bc12c13a1803accacea7c424636adbd3ea7cdd6d9c855fe6eb21dacab9ad7bb8e7a6b7106b64ef9d6512b33de69d8acb09a8b7f6f7b9c153ec1b973555d227e37cc26e6ed7877d0dc666ff008a20b28ddf8d052ea70fd35a1b3a4b7f36f5b2296775e79f76f32117b02811da6b8a835d99c6b23e8de05f4fc55eb4abae0292ba6568b43bbeee9eea688ccc2511c0524528810640a56e96e2912b2b67d76b3063bf1b2623bf0f376fa2e6f4f9dea78b5ed1ef2dbf1666b2b52cf4ebdd7f9af498304030083046004000800048640044050040f3c183f0fa0cc8d54e367126656aeaedca79bbe53430bde14db8d1cdb3f2e276ca9e68aa23a4a024d22dc69dc694eccd471eac5cd5d9f93d11a1d8c49a8452efb5330ad2572ebaa1872622e5ba0d4d9cd346fd6f6cede5e46e3e7fab79330f69cb5aa73332379cf6927ddfa3954e33a3358d73b76c22f1d5353bd57ded758c5bdf470d359b569e2ecfc74c1e98a1a3d7e4f7bb6b8a66f9dd0f25d8f31f7f8da518f579c283745d6395faed5f5039419000014c100c810121b8668ec692c8d024c2b98b1de8f0d41b08b9b4f0ede2e6d4c7bb5db8b7b737dbcf2fd1769d2ea44b8418a046190000000110640832000085023486003cd1614cbf17a2e4e34a9a0a4a83524e16e32a26c8ac72e6c4a32ba73e4ed4a87e8e4e823a6c96812871b55ce8b2b9ea3dd555af3dcb9756ff000ed70d4b1cba4d04ae7639b0d6edf564faacace86cd82b5207487344cc6930eeee38ef9f6ba959cf5e81a6e6dabe38d9329abf7f99de43d6bcf9a96dd0b3369cba5849ab97e4eba68efd9fb3cf489b6cee359467555dda73517d80f5f9db30aefc166f30a86d435377e87e6dd3268cc84a60883040300852424261c8242ac9513598cc486ae61a653a412b99466dcd6cfcdc8dd68de5af9eb20dd43b4a34a90023002300201902a008064000100c020c24cf3129c578bd2dca6ce2c1cae96af80035255285a40b349a6129b5d92f57994b42fa46c19a36870945ad3eb38eba25be6ecbe7faa6c40ee2e6f31b1e77d6d849aab4d6988aa5ef332e642795a7aeb9d2461e5f5ec8d99bbeaebfe5d1ba2e9afeb3cbf3bd479de3b4fbbcdcee1d7716d87b6bc072eea2c7a39e5956b51cbb596af9f5c66ed65cb83d394ec76a2d19c9d6dcf3df4653caec20fb3cad280ebcdd694d50e8586f481a196473660083047408c044680d01982a976bf796d95a6c6d0f2d1b96edc4b12c1e7250e12d4c8014695a296daa966830c2406089144428020182214126182308c001a4cf359a8787d2b90976569898d214cae0598624346a4845192961f39ea38cedc6814957a393ec498c8da5d654f6f8bbff003f5d85d6564f83d5af2e6fa3d27e7f659fb9ced75ec7daaf7f8fbecd7ac32365cf7abb5e753f8ef6d77cf57cda3b9c65a75c68e7d05974cd7f0ef47f34e8c4dc5b35c7741a088c63aea168d65e51f1575596d0b94975cfd1d0e5e32c73cb78ba88bedf3dd71beb99aebcfcf0f211ecf3241158445add363d9234c9a3321283020c24064940b425b155e703594b065a8835ac44855941cc27653709428c189232a529062d4831612050224304030428023002018230000309314088f39a6437e0f49ca889a9ad4671130a438ad4f623972ba6b287cd26d2a0cd0cf316b5f8ef5f9e44dae9dbcc68d7752b1a5c32c5d0c5a63ceb7db8e3dd37c9e8994454bcfae9843672b2ae659d48b36b06d35e8e58e961229adb1bd6478771e5977477798edcf54de6b51cb6dd24fbce98e6a7d2f17d2e73a3733e959d52cd8b6d3161536c3bf3e728850bcfeae80ee26c7a71d5e5f5794edcb97c3b0aaf7794921ce9973d0b97ea59b2551d534f86c0e06c8592102d2840b8488d6134635941b8e521e5ce82941d9a0e12c351290002888d21a90a0d4850a0902888228245281014440304603498000034986646705adb789e1f4d736d33642915daad612e3b1f1d100c22540c95369d5357018783c86bcb59e54f5ee73d5e7ba5d42f598a8b3832c70b4ad95de4873d6b9796bfe3d6fab570b9f498f393b15fa39f371d32a8bda6eb9af98e4db9d55e5447f9fe9da63d394f4f399a9cc697975ddd431a2c72ade5dd239bf4d5c48ad5e3a5c5c656cef3d3aaba4fa787288baac07696d2f148d67a364ea1bedc1c642ba64fa5c7ec92bae34269f38e64838c648260c7492d0e434b1ac9a01d814b7443ea9704f85cd1ac9741695228c8e810480110a3418b342833200251203214640835240a0930c001903094930c03384128783d39aa9d465ba73b1d0c2b3c6e0a5f29a8e4fa11b333129742a2536d968aac9a398dda16a729774b96f4f9dd9f23a274e5817fa4b578735ace8f519b816aeeaf3dda9f54bcf5d9eb7996c7cdd944d2787a583873f59d9ded4db79eaf21bbcb74ce06d1f8eeb2b594b73cf3a6a8b05f7e585cc5a65ddad4a8ac566cbadb0cdd6cdcee4fd1e3dcf18bdcff00a7820196a100e685d15feb12a9c4ab3a046049998933028478c9223b6561835ea138161c9393293e4e669198a3512a8d493b0c100022011a451a4c502500c8066460232b0c8c806400646032028100cc8c300ce12695783d2c6436992d67493ab6e9aaf6a423163224376304a3553a8932b297c119b96c21cda96b52f28ed24951a2abca7a3cb6d9aab575ccf657746693a88d966d3791edacb38a31d2cdfa6463ae82e3056dcb7b9da61355f3bdbade49d2f997b3c95d698ed85b22c6be7f9fae92c71c5bc5163f5993f5f1605c43bd2c97922ebe4b68d111acb8d90d0c1de155d4341743d3604ece9e710e4a4a348a265947e320b5124e1a36b518935ca5665b8eca970d4198086647414462810a34820c1106080608c33230292a01a4c30429440000080c8c0000180199186693384ad0bf07a8a96de3d94fafe75d0f598a1d671b38b6095ad6e7446496c0262aaeb3534d1692c204754f5396c36d5908130a4cff00406b7cb234ba2cbf7e096c2f642c144c7ea932efa2e817e1fd2e506ba76f8642e2e20f1af64368adf2e677dd4d5ebf91cd676da1f1f666e54c678fbd10a5b1c7e9b784dbf3fefe0a7207f43f3a9352843fafebf1cfba84f44d5631298b929d096b34a29c3a923a49acec6cdc020dd90459129c959756a950a30006740c8d0cc8c300a8c0208c8008106010a000a34986a49864600015281184602034986010a20619900292a384290bf07a8d2a2ac9eb685cd6347167c2ced6eb4ecaa61f4dce744aab4632b3e177e33b4a7378f5438e22742000414949126bd2b66c9bd265335d393d39f2a3dde6fb73a9049de2df4f82da71fa1b0b48aff83f452ebeca7f5f151dee6775ae4eb12237abe4c0a4bca6f1fdaa9cde92279bebe12cb1a8fa5f9690c13fdfe7b2363d29398f55bc39661420486d0748270ec654e98852ce106e295b121f223f25c197166a933004a8e10a324300518042811d03202920804602008332301918608c33201991860106640060d080000628c810b0000288e0eb21e0f52cc8ea2e5f5d92b8de3312734cbacbb2b8851246ca6c32d7398b2897bd79dcbaa7387a23a5e48c9ba43695a44b4f15372d94c599d74c164a22353df8b9c40db234afb981138fd3d3de7334ea753b7e225be1dddae269e9c7aed47373e7e8d663a64fae7f71b79deaf939fd53d36c298242938a7210b5aa9b0e98d9b8a1b37dd58ae4c5c4579f0a8519840c8046400090cd261820032140c184646000008001020c100c030288c06461800064618230c118608d0c0000006460060c25119c292eb5e1f4a8c8d4a86fe36a516cf9a74ad6632c231b78c8c6eaade2d98b9b543a71e806f972ed09125ace9a438d89498a518934c1b8328edc8611e935a76d8934ed242930495a69295823c2b322915611ae5d955f37b729b21bb1e9813d53ee5b94b914879d795975e708ca98ecb01c9ea961bb20c654b02418822515111a6803201024320000000028c100d4850612618004832080011801991860940300300000019918608c064680c80a20603230c00030670b43523c3e94991a84a856236d9b95be7a562545c74756d3b0965e6acc56776b8befc7ae8afb2e3d996640cea2c79ac447271aa39709552c443492c3ece6a23bf0ec6a5d69eb3a111a4cd82510906424190843c4b09bb0659917d93b2ebcf63634fa6ebc83f3e5db5b227911d6e14a90a024288225958906901048081502320800808000000000002800030000c806080000023208cc014000001991864461806006000c00001991a00603320198019928f3e4fadb1f0fa90600002a8593dae337cfa3478f333b65d65ccd710a2aa9c174dc374e56db0c1ef33a8ca059dad0e2d6142ba8e94c84b7657e700edc6e2fb18e66edabccf9f54d914aa36568956f460b2025709251040c094b89569b7ca45ec710379ecb69c9b69d796b175d2f71d4a8c6c2d3494a8a42224d191268c800100020709005840008c0800151800001d000008c80000020281186094023000461990140106646032309446000c0640330603230c1186601e7d5a51e2f55836eb42800233fa285735dace75d16c8ab058d3a0954c6535943663faaf20e97d39d936f31cbb3ab439606d646773daec86b158e4a574e7134316ef9ed87d7371b4032548515209452a14864b215d34708c94254424945094a8ac4ca8c46df5bc72efaf3eb8fe3341d79da88ae0a41958440a81180880088c823002002103200000008000a000019000230000008c06474609500001183a001800301928001846000c94004a01830c11c030000da3812547e3f5495449a36a42836dc4a62b69445ae7a96de631d5c5a4d198d2daae7d7d5ec76e5d2624b8dc7b29d65db0d2a223633758eb9ae8b5a5db96b2e6bad7cfd9f3763cd0325010e37494990869e2183700ec882713924ab5200124a244928848322469b20ab9ead6dc9759db96d9ca6b0e9994485892595248c044640002110002320000323010020002800000000000000c000060323005100c0300000a23a0604000c300c001c03074000199185556b9c8e4440bc9e962dab6453a0d32b846441cb6c319ae5d1d9624e7a1299700c3cd2e5e8f638cebc7a69d55d72e91dc65c57003a465f4f4c9ce566efa786c2f739abf2f738b610ed8e1452a50a40493441ad32a994bc6476e43711de0c938574ca700024944249442419293ec1a69357cc66ef1d6a5e034ddb8df2a0c8d1d499d201891200a48320118080300230118080000470011d00000c001820cc0000403231464700c8e818018003000660060180000300334989cf5ac438b003c7e9085b6964c3ccab86855379bd357233a6c1ef2c65493c694db88a87cffa263b7cdce83c8fad5b18c173db8b6d74885359398adf5f6e1337382ddf2eb3624d852b6d4b666a3a1e6d5925b6826413b994aaa88681871bce92cbd192320d9d49b619e9896e404d9118120c84928948002ee28c33d1afb92687bf2e8ef66adfa62c4987ac04b21246048000008001d10002000000000c206624c180c8850000959095928060c06006094118308c94118018230cd2706400a0456e76ff0035a88f3f834793d0a4a820975b6834b697688f263c633a262adb7cf408759c74582511a9eee159ce3a9f39d8f4e77c87d8e5d5c349d0438dc63e8f5589edc4ba672fddaeb62c96f9f465d657346dbe08902ea010183a962032a2ebce468730e66eb62368c746d0a4eb22e23d82a9949cd2c20e0c8c9489450906152951211924b5d4609ede3acd8f2fd575e5ad76a66ef3292972924a2126641032000020620818a0640306022310646541446030700c00183a4a81c0067440ca0c11da00100c8ec060a1440288f2680468a24c3cfc807e4f41800667452251a9038d3892aa9f4f8bdf3e94c12b1d096db90d34f37583767e5fbf0ec115f6b8f70a42e14dacaa9b07d2707d39c0d0d3cfd67a18664f1ed0dd696ae991d8197512e733ba5a4d738ab92d6b2519b76c9968b3e5d22be2c95e4ad032a595210e2443919135392dba1118540308825244928829b0535b5d3729b5df2ead2f0fa1ebcaed709fa752a3a40310400a206208cc510050a005006000c046040066030605100cc8298010000000948c0a0646182301a4c195d2674d42d2a8f3a49812fcbdccd0a511df6ecb1433225008d1198d3d758bbcc46e519536b9b2438dc56e03a3e17b72ded865f57cf719d69734e24152309bdca5cd0cb62b7b72eab3e92ef8f682a0534ea90ab021c6d2ae834f86b1718d3be65a0cfecb1a6d2e1636b98cbed04289126b6ec4249236c3ed293ad2527aa0491d2326892a484959082510806449becbaae7a85d724d3f5e5d01fcedaef1621876812c524180818081989330000c00cc2335420d4709301403000000000000003a00000000000c10291da6d6c38eb675e5897492386f54468e7d1493009d5766216dad49a75098cdfe36fb79b525b39dba85261ac6ed735acd7f42e43d6359419963a28c188a2be809ce1a793e8f3eef4b88da70ee86a4c595d5b6ab4d87d10c6137d88d6612547bc27678ed9e34d93abe7d0d7263536b48654904aca549a6d2f10c264b28d93a81726006a7934e812a2a4a569092a21295012f3492ff0055cde55c75eb0e67aaebc752ed54cdc944970485a688c0800c046600a0a82500a46641050088c51007040c04010660500040000000042eaca1d9e73462aa2e31d5e7b0e238dd04ca1d0f3ea904a950f340981480d0e3657d65fe3778e8f1dc4e7a90200872c99e67bcca59f6e5b36a446e5d9c52170962420e7f0ee20f5e52f77cf37b8dcd873e0e69b8cbd74a6dd24671bb3cbb342eb89de55acc2ee73a54d8b638d370e6c7184ad0a6934a36dba56875a7ec4b4e1c454ca49112fa5632de8b64e5574847c944d249691295a424a89124b4aaacaa45ceff004bc8aef78ead2b17a0df2ba54293a380d420d6624d425405129825200600460206020690c800000206000008c180c850c96af1b1ac90463bcd7a3e3359e0edbe9e1d99d2e72c32b9013cfa04293ab3c429d2121442337a5acd49b6791d80cadb5cd111919281a3c2f5e1d86334ff003ec971b542d06828331b0c3f4e717a8730de26aa14b631d9975b705991a314979589928c0faf24ecb1fabc6e7d8d758e36f45931109898d350d0fb70da1c651482afd65e97987759d5954d86364da92adb2f32371dc6b597ac694cbd28f226c88c849289124a2128590932227e9b12ed9d6eeb906b3a72e82fe7edb59b0365ea24ba91b25128325001920000000000804a2080000628802830474608440a745e13d495aa214e4f5e3fffc40035100001040102050303040202030101010102000103040511120610131421202231233032152433413450404216253543604544ffda0008010100010502775bb9b236f6c3f1af267fb1abad50c8eb55bc9755d71013c94bd42adb6b5e9fe2de81ff001b07ecccc3ab65322ce37dfdf8e6f0ba8cc84d94663291eb1974b78fc278da562f6bebab31addb93bad53f374c9cd0bafed1206d56df2481b4630dee313ea7aad13fa1b97f6ab788393ff27397cdfb1f23f82bbe6de8993fc8f2d168b6a614c08474e5aa72e62c996ba27913c8b7a6743f209bd2c9fe23e4da22165afa9f9fc1a76e597072a49bd22a66d63a2fed6f443e6b527e9675b6b65f2ba359adefc5bad1078221147b64767684da37223038cac692004a008a60d7aecbae0ecd30adece9b9b12f0eb4d10f95aaf97d7443e5172777d773af3e876d3d1fdbfe317f1f2fff004e61e6dc9e666fc5be66f75865a2764dcb45a2dbcb55b96bc99969cb72de9cf55b96baa66e4cdaa66e5f3e864ebf13f5f95aa7e6fe0fca7e57477d34de91f9254bc3b727e55bf84fe966e6d472f98d77e3bdd8a30f713781253e9d32f0a421d026717ee35442c51cbe49dd3968eb4f7c4688bdae4eb574dc8138ad79c65c999968ceb4d16a5b533736f43a0fc7937f2727f8ade6666d6d26f97f24dcb4420b6f275aaddcd9b96e4e688d31275a274cfa26d5d7c347f1fd2ea32eaaeab2ea2dec9899112dcb55afa5d785af2f84eee9b9968625e09bd2df2ea2f6d864c9f954fc727ecca5bd1afe61bdb87f38c98d9a4235f2e67a83978e4cdaaae7b0ad8b0cee8fe453ff002c6dee0f875a784ea32f77a236d53a6644de56abc2645cdb9e9e5be3907e7ca5f1153650b6b697f4c29856de7aad56bcb4e6e688d6ed56d74cc9b97c27d1d0336bae89cb543f1fd2e8bb3f6abb565dafbbb675dba6a8e48ab4a29a3375b2465b245b6465efd19cd3912f72f2b524e64b7bbaeb3aeb92ea2dead0ecb3ea75f1745327e54fe738db6edb275986fa181f38f95bea90f8f438b2d76a193c593f7bbf92f2e09c7df1be869d37c7211f733216440b62863442853ba24dc99f9fc7a07f3e71fcf2b5e2bd36f1543ebb3799bc43fd2fe9d6ab54daad13232d16f5d45bd36a499b939f966e67e10968b7eab5406b54cfaaea3aea3ade98b47ea3aeaa7374d2aeaaea6ab7a793c09f8eab27901d7596f64f2327315bc57b1df644bd8ebe9acc0b3643d4ea7f6de0f864fca9ff002f10b696252d71b9567ed3870b75691dc09cb93b26f72714faa33275d4244ee49f968bdcbdcbdebdc9b5d8cfc9dd31baeae8eda93a02714eefcdfecb28bf9b9c4b45a2bbfe3551d02a37bd95a7d2bbbad57f5a2d3ce8bfeae69cd148b7ad533f9ea2eaa27d7909a72f1d476447b93264df22b55af865aad56ab55aad745b97cad56a98dd39ba22fb3aadcb36dfbbf5ddf16a3fc5b9d5fe6e231f3aefe1ebdb4e870c3abde2667f0ce893168ee69cb54df2e9bf197e47e1fe7fef1fe25f87f63f86a84993e8edfd337bb946cdd32e4e4bfad16d764fc9bd35dbebad13fc46de39641fe841fc54be195f7d2bf3dcb7a734f278de99db4775aa6f4372775af2643e530b2606dcc3c9fe07e3d6cb55af37f46a9fd59c1f5ff591fe48bf16e4cabff37120fd2a9efe1c3773c5f0c3fd5c80fd75fd3bfa3fec49be24e4ff002df98a7fc7fb12d1b442c9fc265a796e429f9689d7cf27e4de13b2d16dd5346ab87d7e45f01f8f2c9bfb23f15e97f132c87e09dd6a8c7c39e8b7277f4688593274dc9cbd20859d0fc8a7523a0f8fb2e99d31274ce9dd6e5aad797c2d7c72cd0fedfd4df1926f641f8b738bf938887f698ad0f015dba98ae1a7fdce4dbeb7274c8b91f82d39e8bfb60775d325b1d38bad13327f916d537b53792d10b270714ebe53a765a2d16d5b568b4e4dcab7f3f23fc43e3964bf2fc60abfc4b225eedde5dd6f4f2ba91b4510b3a2e4fcdb9eab54efe35e7aa174c6ec81fc32752205aadec9cd6f5b96e5bd6f5b96e5aad531ad56ab72d56e5bd6f5b96f5d4592f7d4f50fc645bf6f5bf06e63e1f3c3ba8e01f762f1aec78de1f7d2f653f9631f730368fc9f96ddd276e2ba02ba02a489987fed17e09d91b7b1bcb6df60b79664ccbfeca16dc529bbf3dab62605b537a754df357f9b91fe23f1cb22ff005e57fa5078899640bf73fdbad3739874d9dddd07c3b784da689dd6ab54efe39b7864e99933726e727e403b8bb4175d90aed13525d90aecc176b1a7aa86aaed875ed19766da76da2781976e5a9555d024d59b4edc13c31ae902e883ae806b76b83d64de91579b5ad51fd8de8cab6fa1c34fac7842d69e23d992cafe7bf45bd3f2d35664dfcbaf397f17f98bf064ebfeaf6238d4994ae23faa032b778acadc4bdc999d636f15123c893b35d9346bd221c8126c86a82ec48668cd3e9a2f9e4fce97993949f0df1caefbae58fc43f8d95cf36fca24de51b68ccde56bf684568b45b50b79d10a6f94e893265aad5d33bad5f96bf69fe754fcb5e4cfe4db703f876f48ab2dba1a2fec6f45a6df4b85bfc8c1ff00153f66572cdcb4e4ec99689ff974e4eca5f87fc86508a39735002933139b9d89a55b508f921d5fa69a34d1a6042da3f3d56e5d45d543648505f9106441d41281a9393aa3f28242dee9be16be1a55396aedf88a9bf9d1fcf3d79bf274ff000dc87932775bbc6f40fe75740fe453122f837f1cbca7d7d1a27e4ff1cb55af27f56a8fe59581db3b7a47e4fe28fc37a1db754e19f6e4f0fed95bd995cafe2b4e62c8853f997fa4eade4a089497e434fb8dd813449a24d126065b569cfc2f1cbcad7d0cb4e5b9349a20bf20a8b23113ee635541e36774cde50fc291f48a3f893ccc993f9277d11727f43f26e4ff00641fcea8107c293f13e43c89b969ea165a69e8774fcbc27e5b93a657c74b6de91f92557c4ade88fcd6c37d3cde3bdb92b5ecc9e43cc7b16d4e29c53226774c3f534f6dacb430ab1767b4ec09a34d1a605a2f1e8ea2deb7adeb732fa4e2ccb69af72f6ad396acb72725bd6f5d77515978cab710102ad720b424faba1f87563f8a3fcdff00c84efa0ecfa65c9dbcad3c727e4c3ebd1d3f86e4df25f209be1488d9321e6debd9b1f9ea9f93a775af2271424b5593ff0027d2c9d07b6db7a20fe0abf4f3f07b337916fdf9b34b5ba00ba00bb705dbc6bb68d76b1acad9af4a6b7919adad10c6b688a65e57b5785bdd9758d93cf2adf2bad645f5501db0192690d7b5308ba68d9061e49696f765bd6e15e539bb277174fb996e674fcc642151cdb4aa67648957b90da01f8752c4f20c755d8ad3f4acb5a1456c1e37903a4fa2d8c9d856c14e0ba6ba4ba4ba2eb612e9ba78dd74dd6c75b174dd6cf071a6075b108221f0c2ecdc8fe7779ffccf46c371045937deb7b27f0b5f4e8b692d5d7b9109b218cc93c26ba249e175d124d0270042002eed1eae3192ccc6c27ea746da5d14cb4e55bf8e46d99b76db9bca37eea2ff0003d0720c4193e23234eee6ec0b5665f92deccbaab53dbbcd57c65ab6a7c376e12c20ca2a4529fe82d1473c10c6f1c321a0a5920194a463dc3ac6f40d8a9424c16ec52386e422f11e2275fa463e55370f3e93d5b9553b892d0c56e675b13adbcb442ee0a29b6151cfed41284a2cea36d4885b5dacba6cba02bb615da027a71a7ab12ed215d8c2bb0817e9f02fd3a15fa6c2bf4c897e980bf4c15fa632fd357e9cebf4f34f8f35d84abb0957673aed2c2edac2edec2e8d84f5e7d7b5979539caacf572f05885b255d97ead5d7ea9553656b2fd52a2fd52aa1ca5325dfd374f94ac2a1bf5a63eaba33726694b4ea927375bdd6f74ee99132f2c9965c3e9faec78b61f1ceaac8fb32767c65b2cdefacfae2d9d795e55ec8c58f8b23979b206cb5d175056f275b1dd44f4e21ee819f74f6517501e16b961ed56b159db72af5ed9a92a5c5f56b145c433448b8a1f6770e450e2ac5c4dc37a358c36c52416215bdb5829d1b51cf89b755754c1e09ee9ab352e2f7038480eed4e19da48a589346c49d69cc6571552fc958b1d9886e28597f6c2981346b62d8c883c1b79ff008fb93121bb30377d6577565d75ac2eb584d3585d59d75665a112684562348eef26e4eb5e5a26e6de164db5abeafeae37d68fe1b9d4fcf39edb77bfcbccb7d3c77bf14cfcb2d998b1a162ccd76660dadaf9d10a1ab3c8a5af140d5e994c9e386a88ddb33a869471293341134f624b72e3e8c2114f94ab51166ecda21c3debaf1606a4023520bb6a5c13692d43aee196b91a1ce3bafd5c159bb0ce020ce157256e9a6cbd4b836abd455f2966b34792a96c63c2c17558e1c9e198aed8aa53f4cd75755b793f2d54763558be223acd0481308b2665d61771b1192de2e23b49591667f53ad7ecebcb5e4eb5fb6c9932a05b6d727f9e5a7aeefbaafa9be2ff00c44fed6e757f978847ea5b7d6a66835ad866df43b5259bcb8e3449cec49ab0a7751d7925082b94e7055a34a3bb906378e518dfbe98d185891f7c828285c9467a962b0311adf7366c94141c433d768b8ac1d64b88a2b35aadabd30be22fd851f0dc287014c5a6c455269f02e9e2b54de8d90af661b352d0dac356b0ace3e7a640d11bb619e4103bd88960e20095ecf6b940b9879aaaf06e55e6856a32292b4b1369ce39481637292d22c76460c847316c8e36d1100897b487b86d4a5799689f55e57b97b96aeb575b96e5b96e5b96bcf5e5aad56a9df9ebcf55aad7d0c993280b6c83e453fcad56ab565ab2decb7b2eaa73d548c440fea1f8c837d183f06e75ff00978887db27bb07936dd4302ff433bc40d8e8cdca5372474a48e0ab5c365ab6f65fb89582861ec64159c2c18f8aae3a6c9c92638313146d772e54b869ebac958831cafcf6256e1ec143252931f5200b99da30bfe9592ccbd7e0d805b398b8f1d903e1ab91095ac9e3d41c4ca1cd539466ccd264f9e8197ebb5dd4e51d9b726914b57372c486fc5694b8b86d292adcc59d2e2086c35dc1c338ca13552832d6a11d69ceaadf9681458ec6e6e0961b7839660a97049b4776e424e2f52e1c72e3f361908a16d4b679dbb45c10bb8bbbeaeb5f5ebcbc2f09f45e168cb45a275aad53736fb0c9932050cbac2dbdd686b648ba522ed8d74574c1346cb48d933c6cba829e5f133692fa455d6d6bd57f63738bf938887f6f0fbf85ecb6fc3066471556599c8f739aa95a1c6c16eec9767c7606c5f1b70e3b071e33112644f279783111d1c4cf95972599af888a19e2bd60389b1b5a3c8f14cd61b1f72b543cbe55f293c3c5a75a93de2c8cf8ec961aa34dc4352182ff00135fbc6e46f35ab10f54ac11206127e62e409cc8cac915494e6634c5a20b24cbbfb80d2ccd2bd2cacf490e462bf1dfaa355ebd8ae4d26188c00a6a5351cec7908b25897aeeff00b85f8a76e70d8dcf8accee303d475d513f97ddaf95aad56e5b96ab72d56e5aad56ab49651e8d905be465d425d54f38ea76057720bb904d38ba2b022c9bd6c9932642b1f28bd2eaaeaaeaba79497516e5e7d57076d9f48ab0dac349fe9b731fcb3edad2c549d4e1896fc50f0ecd61ccd049d32d92590c1e17ac598ce478c8b1d48376438a6108c249ca73bd7eec90f0a5991afe2296323c46024ba87018f15929713456deadb0c0e3d80b8771e4aee06856194058c5c81df575a2d3d1aad56aacce56645af213707f648881c184dc1ca41b4dd8f52ac16ace364932bdd8740277c7655e02b7848ee849193118144fa738a6f182cd36bb0530b3270675d215d115db8aed8576a2bb415d9327a4cbb24f494f606331b42a0c8c7137ea513aefe05df42e9ecc24b5ae68e1a649e95674f42baeca3117aa2fc9bd6dc993215897dd4bec6ab5e7926fdc7a47e64fc687e2dcd9661b763f117e2ab87b1765b29e3d8ba4661141f43130e4a18a5ce5f8a49ac3cb3d4a3672b2d2e1b8eb0deb9ba4c5e2071c394cdf68f430c4f24b75a00b398b5922a18f8692dfd4cb4b95081a6ce59b4ef8dfa7b16c5b7c6c4e0bcaf09d6e5b96ab55b996df40cbe1e1f0865dcc72ca23ae8eced2bc60d920ab76c62e6ebd3ce8dca72519a7a875c7e79c52e8b059ed8fca791c57706bba35de12ef5d77abbd65de0aee813cd1929295695ff4baeebf4905fa427c39a7c44c9f15617e9b6853d2b8c9e0b8cbf76284e4dbd62fb8c8560df5aaff0061969cf28deff48fc92abe246f465ad47151f32b9b0d758ca4590b991b515d9e3b114962e672cdb6c370f3580cd9d3a55e870db3d6961906fc3959314af712f561c6dda341a5e27227b7909ae143939e00fd5eda194864ee1c8a1cab46d26522962dc2eb4f43a715b5db969e8675e093b69cb5426e0fedb08db63c533c6a4899d954b5b24b3105a0f7573fd4242a812bb33608e4a041ce1974580cee8eacbfdcd5d6f75d425d735dcc8bba917786bbd25de2ee85d75e174df6993265802f6bfa355bd6f5aeab5d16aeb425d335948dda3f4b2741edb8dced591ac10c367336ef3d5c3088948761ca88031cca1c0853ad86c5fea5632b918f17570d41e42cd6783a746e4f594c76ed4cdc3fa076fdb490d60d5e68853da4723c8a3fe57d1d6c8d3d7074f5974cc1756414d3b26262e5a274edcf4f431271f40c832b490946f1c851bb80cccaa5c7895ddc51c27240a58b6b6372936326c9843745db7f3865583cf6e1967127ea32decb72d56bff0025b9b264cb005f593b3adaeeba44ba48a0d16d15f8adcb5dabaae9e47590f757f53a3f17c794f30c11dab256a56cafe994d63678e90d5824bd6ab626b6202529389b2521c18ead7efbdfb9725b93be2b8723e9652f458d0a359a90d9bfe489cdd6ab732de283f93936ab62e927851d6674559d96e304d28ba74e9f932f9f433ad18d3b689b9453e8d2c5b179178c42dbd8aa719c3314055a3a19882cd2970b62d615a582b582ab2586dd317d46e504baaa573b80f72f7a73957712b26b66bbd34d70977aebbc5de0aef017740bb905d615d465bd96e5b96ab55afadb9326e4c9932c21ecb9bd6f4e4b73a634e5ea7565b743eafead78b83f0efb5b2375ed4bf834903c50a66d5f0d4ca8cfc5b94de6d98830d5621b59cbbfa7d1c256c4533c95aca64869415f683cf928493dc4562791ba523a6aeebb65da3a60d4fb095746c02eb4e086f9320bd1126302e4ec9c19d1d6174e0713f51891327e5aad569cd96baadba276e514bd34d5b51daecab5869943446f1d9ad3626c55cac591844ec70e5ecfc744e3c75dec2c6571e0c26dbb9d6b05ba9cc16a171164f1b2e9b2e83292bee5dbba28c96c34f19ae99268d1d67d403dbb17b996f25bcd34c6bae4bb825dcbfa9bd0c9932658e2d96b93fd9747e47e3d5fd5ff00e58ff1cbdd4ded5b55bb15cb1a60e0b86e8b58bb9ab4d52d56a56b2b3dea15f0957038bfd3eadcb1fae64edf10d4a91cb3dac94cd8c365d2064cccdcd8530a643fe4eee6518123a91ba2aa629a6963416c5d6f6767448c59d7905e0d3b69e8f95a69cd8b6ad1689d433140f38238ce12e1eba2576fd08efc36ea498f963c8b3d784c3a993c0c16aae3afbd0932747b490c790938bd1b9d1272eab0316e9f5db1939086aeb6adaeb4e5a32f09f440fe3fa764e9a46ddb56c5b16df437a993264cab3e86df1cbfbf53f2752b6927a5be324dedb169aad6d773fca758c8a19a4d4ad59b76c30b6a2693256d9abe3b198a88b3191cef1042d0d4c6dab8c7405ad300c11db9779f264c3e81fe7deb7adcb5e6edaa3ae2e9e238d34eb5d59d3a74c4b66be9d168b45f83fcb33276d54523c252c9098491f49f87f37dd0e431d1e42bcadd136018df019a7a32e7f0836a3a16999add63a731369ca097a278bb5d22fb3a2189856d65a68da2d8cbb765d2364c26bdcb42f43736e4dc9932651fcd72df072765aa775aad5795e5689c568cad3693fa47e320dfb7b53bd893e5327f0d50fb2b7966862bf6291d78e3c7761578932dd4af25fb362af0f62c273cb5decab632af461bd63a20c2e21bc197730322baeebad6097d775b275b264c4625d595935a264d6c10cb197a8c0493c4e09a54ec8be133af06b4d132d133ed5f3c8dd0ea0bf26443aa8e4e9a8eabc96731c3fd9a2e2494e850e1c92e5318ba8f344709f0ce677b711e11412364eb18b8172a532a367ad1fa34ff0084de964c9932640b1ba953daeba4eb6ada288596802ce49cd3ba74fcaeb7d5f48acddbd81f8b2f9500752533790e957ee543296472bc47928a07c46026cbacdb001430053adafeaf93b5663ae36afb4b3175ec21aa861065b59bd2dfccceb4174f083a7a6cba32c69ad48082c81f274fc88755e457834e2e29b909adab45a6abc83b9f8015a2f31137bdb61220dcd8ab4156ee4f27154a22132c3e523bf0710e23b80881b3559f7d7970b941c955cee2cb1f3db01bd07e4dca95d4f637c10587dfab68c5a7d9f8fb4dcdb937264c990ac34afda393ad79bf27f43f2bcdea391a209a67b1372775fc55705418a4c9b3e273194bf5618e388e6b34ac4753058084eccd9fbbdbd48b2724304956c6f8e8c75c26f965f09dfd3ffedc9b9bb33a2ae2eb64b0a1b2cfc9d3a77e4c7e36265a6abc826f7368a4f0c81f732dbaa6728081b7b1b7b8e3dcd4ff007a51d0806958866c15ec7df0bf0e6f1e78eb390ac196a742e1e3ed31c393a5281e1af5facd01937267715c3961a55342509c45be3fb0ff0071b937a593215833f6fd87f45d6fa7e9ce59d04fc2fe968a30798eb0342d9eb7dce431cd11498aa44f4b2168ec57bb97af8782bd7b59eb10d0ad8e8ea33dbb133e8cfef27f6b3d88d3da8993d9375d499d6e9d7d65bc85fb834d6990598dd0931b7a0e3125b0e2719d891f84eebfa64ded42cd22dab44ecf1bf559d99b7974db47678885f732f06111956924f90de6d7b1f2d27e1dcbf7b0e4a805faf46c4d8cb825164ea55d70595e22c4767370fe53b5972b49af414cba832c6509bf282528a4771cb5161601fbdb108736e4de864c993264cb0a5a4ff61fd165b587d044c032cef34eededf97f95fd6161ead9c9e43b401c697e9cfb406a5f0b78609ec1dc9b11d853c4d5ed6966ec7b6389abc17ae4429ee1bae9492a6ac2c9a3165f1e8fff0065b053c00e9eabb2df3c486d03af965aa7744cce99dc138b1afe932d8824deb4d17f4ff306d7666d51c1b85d8a03176365206f6af268f8ba5d369406c0692e17215ecc7720e20c57731606c91c798a0391a989b7fa856bf4ce959c2d96c8d0ced1d1e5fde57e4cb85b24d5ecd98ba527dc6e6dcdb9326e4dc993264c9962cb6da5a27e6fcb45a3274fca46d43d19bb1d2ae23bca42dc64db455a8da0550c71b8c773b33642061c4e2a90db1ea133708d08e059067c8e6c9fc4b910efe49ee64deb5112440c0febff00f66f43a28c5d749c1dac3afcb9127e4c6c49c1d93326451ee432e8a53d54517830788a293a8d19a96b8ca3eeaf237965345ab61f23a894ac2f6620b70f0fdf7c6dd2657e23c264a1941966aa150b99aaa196c7632f9e32e598a39a39a22c6ddb70f4657e405a3d1b6d96c67dc6f95fd0fd86e4c993264ca9bed9d8355b5993ed5e1397d8744da173c8cfdc5c859c634efabd28bad6643eeed9eec9dcab10cb96cc4fd2c4c0739c4758b770ce5422870ba057c9e78ecaa382f6e40c6bd608ba50cbf9689e58d91588d97704bab33add3ad665b8849ad3a1b23a8cb092714e9df93adbb5c66d549e1b5e5a6ac07b16d6d1329f6a8f6ee5a6a885e0388d8c40d58aed60232788dbca88753bb5fb595cfb8082c942f7a26b51f0e653f50a972a8dc830f2f6f338775061277a17f3d8dec6df0c643ad1e72875e08bf715f9f0ee4bb0bb6a2e9c9cf5f3ea6f866f29d37c7d96e4c99328fe613df1737fb33b692f2bf3f6f514ff004e066f7269481f4667a75db1f4b0517d1cedd69970e9041370d57ead79637a76211b5974d8e883224a7fdd64addb8a1525a233e94b2a6aa2ba62cb4f417f330f878c1156074d4a5dbdc1eac43222d596a9dd6a849c16d1913b26fc59b54dac4e2ec6c45b5859e5338588619763a71dcde6b4804c4c04aed5ea8d695465b4a5faaa193b59a40d8f04bb104e78cbd1cc1661e21a0e6156ef7d53886af501dc78870d1cb253b0d305fa99185f1f7eec4c26fc85612db65318fe3edb3f3febd2c993726e4c9932058f2df57d0fc9fd56db497967a6d4a30ea9c85d69c5fda25b1a481c1f0d53af3e6e4d94a4b1fa6e37015faf72532825c5580c6e349a7cb58e1bc83443866ee25bd762a60135898df18f146d1b00f2d354fed5bc175235d404edbe5d1f4e40668714051c98199495ad5466609510b8bede6c6c69c36b3266f071944e44f2bc41b594d0ef6825e5247d41824e89b28c95fadd22864ea8a9e3de34a4eac7f083eb070be45e29a40dcd09be072f2c7d33c6cef87cb712e3fb6b5c2d7b64d9ca5d6af11756b3f3e1a67ee1fed7f7af37f437264de86e4c990ac39eb5fd7a2d3d175bcf2bb375ed8fb16bb2b3a7f73df7faf8a068e8e6cd9ec7bb236385e3d29d9016cb69266af70b8b0dbe23c7fe99931cd053a32d5b06a0aa1561befbe6b0db5158065dc4a49c2634d5576e2bb705db823066368a404d24e086c82fa722a32bcb1cd721a8cf6ef64d7fe2bba29a09f1c74f158cca04dc1f2b29386afc6a2c1de90ddcaac9b7c329a4d574885a191a56e5620dcabcdbf9588778d39b542ebdb2848054e767d53a959e290dda58c0b695c0258ebcd92a39da3ddd4c5597c863b3157b8ad01b67307ef8648e71c852bd0bd0bd662d87f1cb1b71e95a999bed7f7f6d937264dc990ac21f3dbcbc2d53faaeb7b15c97a155b91f28bf95f590e20e9c7962eadf9a16a188c2074e95ff00dd64e481b11570f1f6c5c53936c95ac29451e42dfeeb33268cd62fe961c27b082b88a6f09fd32ff3f2716741442768ecd8a6546c5392680808055ebf4628e7e9bda0e21bce0039cb0cf4f322880e45a1d472961edf1b8d3baef879595bc6cf5145234a3a72b10b83c32f581598ba651ca33c624ad43dd4358f47461b9a949d294c3615426923c15bfd2f273368c66f84cc4b188c9425fd23339fa7da5ee1ab5d39f886aef843eb557f865d3f660ecbd8c7faf5fb8dc9937a193265883db67565b96bf6adb7d259d976d55187524ca3005cfeb555037d89a66af0e2607b56b2f19ccd90c87635a8d39824cdb77b3666e8f57058d921c9711d0edece3af4512b776ce4963f1f18c373f2e5fd14b1b2ee235dc46bb8044ec7208ee6d34e72558ce952a75f231915ac24ff00aa4f943adc35523682db625eeda2bb62b5d92bb95c9a516b11ab12c6513787c54d0c955d1e84d7e9bd196bccfb4650958c434919eacc24c62edb9809ea4e80f6be420da519f503e5ac87803ee6bd53da79383a90e2af7ea58ccb55eeab616d7758fce56ead79cbf58c109902976dfa83ad5b5347d2948763b978e1eb2cf0b8f97fb6cb5f537264dcd93264cabcbd130e200419aaa686e426ba8ceb5fb1336b1ace9eb674d22c506ebd65fa96aa60eddc5d268ac569c18f2366735460b275a692c456040ed221368b2d0851b3571526cc757c85c832562ec11c1b0a6bc75c29b47b2291d8ed4b6419f7cd2a6a86ebb5065d105d205d20523331f6e99e78d35942e06a9587ad3484d159c7622189b371d0638f2560613a5d1a0be5472140998498febca38294626ee313620ca84a3b989a60190098f1b65f69339bba901a41ae6f048ea78fa814e5ea46874905b5ad3b7c90aae7dad921e94b0692061e7fd2f2f286c3227c365e488562a4ec7272d7edef70f58778f3d074ed49f520907742b153f42e445d48cbed327f5b7264de864c990a9695c1373b5126bba28f2ae2a2ce4cca3cf9a0cec4e87275cd0cc07e82f2cff3923df76c47b4b150edb386da05678a2628f0b5465af8d618ee48e568e806ca595772bf66bf6588ca47d2a74d9f2992cc7d38eadf8f15c392c162d479bc53455691cc4e79a28c63827bafd90c49b93fa27fe56f8d13b322aece9a49625058ad3d71b370e3c7f0e460a7c7c16a0ca62a6c41146ce22820394678fb79387aac26eeacc216229233c758023890dbded6c0678eb4af09f2b516f1ad2f5014ecf0c9bda515762eb4301ef01f2d6a2d4603ebd6a67e3330ee8e8dc6c8d0ccd5ee6ae16d7734b3d038965cfaf1757b2c8e7a1ead4c5ec90e06f24db49bc2c659eb42e9ff00e1b7a993215d73176b3aa7e8488b1f52447838c91616704f56f42bb8b008722cca2cbb8a8f372a1ceba1cf5724e6d227d6c58ad5baf9fcbe52b85130d959d6347663c66e9d6962e86299da0ad8c0ef6fe70bf6fc41637cd861dab893c50c4e365cccb9d8d9ce78c0e237eda76c634745a94c113c8e4b54530b27b42bba275dc48bb89111ee209a375f3c9dd3ba2167556dc9565ab9ea72d7b9c5160cef64a3cc61848a321619557cbf634aa74a49e436a166a5d0b913babf5c6d454ec15690c599d5b8778d59ba81ca617af2b131898ef1ac7d295577f3203d4b22fe499427dada87e9c85a4b1f0fccf5af9b2a85fa6e62ec1d7af4bead1d3b8c65193bec5899579eee8172f86922c1d9d1327fb6de964c9937ad9329133a674c9931baea3ad5891d5af223c45634782458bb31a28adc6abcaffa76262eae46a8f5a622d295c6da1fdc3f4f1910f54f30cb393ec8302de7384aad63963c547ffa9cf647bdb187ac15f117dd9f3d97ca49909a3c6bcb520b64754db64776e075beb4e86ab2688193332f8e53fe7d1175d0dabad282ad356352c6e06a395e23d484a9dcaf33b43d590bc3f96422f33b217514c74a50be44ddc6aafc5d55567ea0f2945ebca24c62a40ea0553d86adc6a193ab17c2c845d682b9ee107d5aec5b86a4bd58816501e098241b50e7eaeb1d1b1ddd3b4dd865ab47d2bd8595e0b5968ba5789fad8f9beb515424e9d8824df1fdb7f08fe7d2c9bd0c9b9326533fb06442699d37d8daceae7b2953b45527a3edc6bbac8ff3297c6268bf4e5bd2b49664ff00d8e5b08de7347d5b190aa35f101686af0e0d178a9e2df763b88e723cb62f1238cabc3d1fec72957f4dbc525ccc9b571889f937274eac7e63f8bf228449982cc11b6d9910bb226f63039162aec55ec64763dcfc9fc83f894597e635e5e89b3e89bcab713d7923369054b1f502a9bc5272b91e8a293ab1bb6ad0bf6f3a85f5121edac83f926dcd50ba366275762ebd3e1cb3ba1b5175e0c04dd3933f0752b34cafb76993cfc7efa1f347df1bf8717da58d97a90fdb7f5326f537264ca57f60921242499d37a755af2ca3e94216fa5175228983a8792ff315d2d98aaf0fed6e9ec9b0312c41b08d691e7c964db7636bc525d9728ff4cf2ed8cc3f0c43d5c95f7db52ae4031b8568ec656ce3ee9d56652b0c109594c539aeda425da2ed5d10944ed3c8c867035b7c30aabf196c50ec6954a0e0d4db49ac57ac78f3dec981c10b3a96acb513b338b2923ea0d5977b322fa830976b3e89d5c8d4127563443b86bbf4a656e3d46093ab109685910dc35cf703796b81b4aac9d5005564fd3b2cae7ec33138358820fc3263d7c74a5dce204ba33c6ddbe52d074e758293dbe8d3d7f3ea64c9b93736e4cb5521786742e81d0ba6f5e8b2ff00e146ff00b26f185d3ccc469c1f4c8da90eb63eacf250cb46519e322e95269ba35ebc3d19b2d63a389e1b8d9a1c89ea34ab967f2d8d011ce66650871b87c61e5262618f3b903696df58cde4c74b1b1d6187d36bf38ff07844d742589c2daa52313642e746b9033a63281ccbc759f460d5a22dc9836915863804bb690876bb3a985c1e391a4056e1ea0529fa91bb6a8875681fb7b0fcae028cfa91bb6ad03f4674ff0052380ba7203a9c77c78a9546b391ecb18db3dcd3e248bdb889fb8a5783b5cac117571b40b7d370fd8d93d5f28dad95859764fafdbd56a98b5f43264dc9bd4e4a4242e85d03a174c9b937a733fe237f85ff00f8c23ecc9ff9a2c713d8b2538d2c9494ab64af95e91b373826dd625b82c17b393bcb270ffe39b360afc175fa1151f19dcc5d3cbdcc38086333c7a647dd33e36c7656f27e4ec448e40077b629edbaee8919b48f118e8dc8e319174e5aaed6fba73449b507d1c93271d5a23ea8fc22f7b573d57c26f2d0976f37c3a2fdad9675f2af45ed864eac48c778d52d922b60a33df18bab63b258cb70b3212edee42fab6681a4af81ba30c595cb56b75f177e4ad0dcbd35d727b53aaf1c91d98ebc933bbeea7280cb8b544f6580fc7ecebca68fa6499f5f4b7addd3929090a1740e81d0ba64deaccff8bafedbff00f1bfff009ec139cfbc85e47de40640c03d59870c6483409ecdb825942d6b77052075ed177593c1bedb39cb6746fd2c5f67828ae8d0c1cf29599a1c6b55c465686b4bf50f639dcc9bb52d0da201e4ea74d03188f5a1416c4932d14d537a095f590344fee267e9910326744c99da60d148298baf18785623de15e4eac4ca70eac74a5dc0ce9d98c607e8cdcad36c919f73483bc6a168ead0ef8aa9f867f171b5513cd622931b63a740986d4b81ac15f1e6d15dc8571929600fce687a37b1cdff00b271da4360820513ed92a16e83ee8bf9f437ab54ee89d1721740810a64deacc7f8bafd31ff00e2ff00d657d65243b5e53860db0563b73437efe24ab42362171766ab5fa834dda91d089f662fdb72b8067b8a725187e9f9194d878769858c866ebb8633239318e89573a565b6c91306eb52c7b59f95851fe208ebc6eccf25521b5d56ebba9764ec4662d1577dae085fa4441b5d909740c856880fb7989b47d50976d63949fb7b099d5e0f319ef05386f8ea1ea0a5fa53af968fe9cf183697a3f6e125d08c77c2fed280fb8a85ec92b1f71571dfb7caf1006eaedd5018e4739ffae58b937d5e7afd96f2ff000fcd937addd3ba7e43f0c86476413a1945d33fab2de6a7fd01ff00f4f2c5b6a4bfca7f09cbdbc3e43dee6bff0096d4246a724c4638fc7bd98ed3b80c2d5db1792b5d8d4c11498f9b2f9d92d85289efdcdd56be77896f435719c2b85691b8c6b6e585bacf1bdf8ebdb3bf34c863b52b14738b96e64133288c5dbb2f1f4414f5f5786cef5699a2660dcd5a7da9db7228b73445a3ed4e1ab5725a2922de158fa9129837c75a4ea44ac06f8ea49be2528ef8e8fba3e4df46cab41ac758f7c4cae0ed92a16f8ae37b6b3f6f7a3f2c50eaf8097a94ec45f5f0d681a8dbb11fea5742c58545d89b3513436dff0037f95823d6b7de6f8e4df61d1730f84c99321d53484c9a774d33263174ceb25e69ff00d627ff00d69fbb1170042c4a3e39446511dbcc9dba75375c59711027a96292397af215583a3906ead8937c4574b68d2e8d5ad63a2521f5323631b95b75aa65332565ad4c33cf8da51c9625a86215885a2989b7cdf15601922b18d1881adc82a3fa8dd256a16da2cf29c6d1f4ecd3d1a19b7b2b116f188faa1a29c1d90bb4808bf6f39379641fb7b29d47f42d72aefd1c8481d3915c05096f8c8751aafb651157c3c624f50b8df4ae86c548fa90c71eecb60ac0d69accb5639b1a3d60bf48a8cb51da7a157d9638887c1ff217cae1e3f67dad1452f4dfd2dc9b96bcdd3a7e717e5b1d68e9933a14de8dc4cacca4f5ff00a88ff6c0fbb1164b71c8aa07526aaccd3306b5ee471853a7f4ee658f5b558b7d69a0ebdfd2cd02af36eba3ee28c1ac65238a139f315e1a95aae1a73af115b8639ec4b78e7edde286cf485efcda75496e24c7a282dec7394a420ae0412d73aa55ae04aaccdd790a2d1a39778c761580e9945233ad3445fb79d38ead03f4a5d14c1bc2b1ef89591d4213eac6ad8788cfa91b2b91bb0ca5d68d83c4f16b1517d56c537d2b01e46d0eab185b2d5bfe0b51efc6e33250c1527c9697291bc96e1add6ca62bf6d94e24fe6c149ba898f4f29c403ad5347f2b87cbea7a3c69e861e4edc85bd0dc9bd2e9fd00fa108ae9ae92e92e9ad1d6a8048d1d593656b22525806e97f41f15bdd5489483eea1fcee5b2d423ad2b25bb1cfec92f3752fe34f754aafbb252b8b0455dec28e69aa962085e7f89f224f62e55b04d0646630942b450e2ee5d038f5e4c2eeba322f8e412146a1b0a1219d64461196a306a7f2fec2d509ee60f69407d58e68fa91d49370ab41e00fa8099fa368be59b56a85b0d106f1a1f327b4e58ba90d43d6b463f4e51f641f4aded5745503ea57b3f9486d05d9b2d1b84b6e79c68547ba55a884597cb44d532703eee219fe8677893f93870f58f24dd3cbe69b763cbf17e5807fdd7a745a2d3ed3264de974fcb54d1c84a0a44e84345b16d5b56d5b543133a0d34759b89850cbd483e1c3e691b02745b5d56f659924d6cd3905a273d71f67fc227dd95c6bed54dff7331ee0c40ead7f4ed62a32cb141909223c6b75ed432b04141fb8c8656e6c655eb4964ea60628d470c50a6352430cc56b055e556a84f49d34e4a957ebcd76bf48f76e5e0d87daede1e56dc304db0cdbccbf42c379621dcd55f69ab43ec03ea0329fe958e463db642d7f3087826e85f847e94b1bbc7687a723e461169ed89a86e4b046fdc4af35592ba1a317678f843b6c67d0ca8f9e22e250f38b7df98ceb74f239f7df370e96db19ff006dec8fbf18c1babbfc2c13fefbfe137a5dd39a662251d23351501643088adab6ad16d5a2d168a2742fe48d658fa91c701ec93d9337e2de13a8cf48b77d72f98d3ff1ef278065db66bcec36a8bfd630fa389f0191ff001314ff00b5c84319411c733095e228621e85090de43af0159969d48e945e926636c961fa49fca824562e486a32d1d1f942fb9032d361c07be1b31ef8aa1ef8d596e94c88378d575aab2dba2ae7be200732cc07b241dee597ac0f7eec76277cb584562f4ac5527e952c6f761531d1485441a3bf65bf75988f5ad5cf5c5d0ff1ac7edf3157ea710f1186b4b003beef13079b8fd6bb8cfa597e227fdec9efc3d61dd8f7f8583ff3beceab54e243eb6e7d54c321a8f1b248a3c4e882908268f45b16d5b56d5a2d16d5b56c5d25a1a2152cd08a39cc94edf53fe82df53fa07d05d1833847f948da289b50ff00b7873a3fe44bfc18cfe2befad4c63fd0bdfe262ffc5cb4600f2c52d66583abd283ec65f1bd37d76bbbeace1be38cb70e9e47da63f3643db4cb55a287e85a56e3df0d53dd16ed19dfa769e40173b51ed86c3c2dde4e68a3b2630c525a70c4b2bd5a381b11d2ed6f18f6bd1df8dc21e838c6d5ad376f9693df91c847be9d593f6d5074833d09456b86a26b596cdd18df17c191eb3f1847ae3b1cdde6664ac31714f13074f2703eec2d2ff01ff1584ff3f965e578e951908eaad7d4503123c74668f1848a9cc09c0856ab54ceca3a51c83fa639cd0e1005474a38d74d96c5b16c5b16c5b16d5b56d5b568b447300292d13a3dc6b62d8ad8e8cde485d1fe51b6a2ff00100ef8216d26b21eda9e639fdb2c6a06d2ebb6a18cf8b3eea98d7fa173fc7c69e95b2264725e908e5883ab2003002d537a9f426c854ecec03e8a27f2efb65d8a5640ebf2869169232bedb646bb130c9900768e77893cd31a2636430ef60ac2823db6637921525cd63c2946c5a406ad40f627c1b3c81911daba1a475cdebd9a0ef1c19a7fdc5291a6bd36d386bb7d5a15d9718c1f4383235926dd4782bc3f15f9c570b06fcae47d9c55c452f572d09ede1faa5b683fe2b05e6fe9cb3fe29d40db5d68b45a72d396c5d35d25dbaec9897e931126c2d74189aa0ade3a11b15e318df45a2d168b6adab6adab62d8b62d889c4115844646b62d8b62704e0ae47ac20fef0f07fd42fa11816cc79291b6dc943746133c43f215e162ad07b6e1bec2a2fb2c6d738f14fab4c1ba1c57f1e51b6cb6bf9f121bf21cdbd0dcf275bb9ace864da9e84835a23dd19edd23936b77ba309b896b6254f52661af53b861a11b296318ac9bb29bc845fc710b995b8ce1986dca0a4ba52850fa77b5834a516f0c3cb2416a49cac643bb8895cda392af57f6d9e80803141ba321f155bf7d503645c5a1bb19c2516cc4e5a4e963b829feb7128eb88e0e8b593880fa59f313b0e726ce1d1934affd2e1e6ffd86de56238ec9c43a47a2d169e8d174d6c4fb45a7cd5585ff005e98d7eb3797eb76597fe422a4cc559de1cbd6d06eb1a3bad1b1f1043abe52f1a6ca5d050666aca84c0db6ad88b6823b60c8ec11f2d3968b45b5689c54d16e8ffa3fcbc9330ea52eaaa1f4ec5f6d8f3d9e98045d6296974a9e36601ab9038de51808e31d22cb3b7ba87d3bdfde3fe9dacb8fd3b1e65c27ff0043edde87a16be11dcb12b0891bf6922e9692b568844c555f7c3306b1d02d095e7f7112d7c41f8e2e9b806763fdbd18c27a6718d8bb3562a57e466dc514c0d048515aaf65e236bf192bc60f74199d65fabda61ecbc54fbcaeeab945facd79e336e2c9d8317c287bb0dc57374b13c145fbae21ff00e4f078b363f8abff00ad143b787ae1e989ff00a7f4b027d3b926486167cfc2a9de7b1926f0debf7bab529568c6a5acb1c381af0a6a00cbb5d176cebb64742224785a46d7eac1590626fdc82b63f2541bbccb02fd4b24ac3cd9139e0b356b0e606b46379eec6466e4c99969e8d168b6ada9d94f1ec9c96be18b64930fb5fc2b72b495caa4961dc7b0b04335a0c3c232cd9babfb5c5977147281d1b05e5a67e8e494bfb7ca6523dd5a4f2d8a3e9dff00b3aad56743ea3fcd31df0b8f4aef4b55703a7317f1943fb5c617ed0c941ecb65f8dcfc75f0ceb120325d665990dd42b5de86270b536c7c401b258e93df9a48ad639ccfab7471b13c726336359fc982561b7219458eba5042f930318b4ef06ac6eb30720c9c3b92b356a710e58f225c2b6a2ab7b89f230be2f843ff009bc53e72d7e1edb854cc24abe3a7fd2a733c08ec91befdcfc3b1eb330be8e0edeb3f63442590b020c03a2d168b45a29ec475d8e5b3902ab8b86ab38326f08495bbec20d96017bf90b371bcc4f4aced7b1135bc7b26fb0e9d5d3d6ce9a21f311c7fb776ea169ab81944a8ef90b278e08696365ebd2ff033d620ee2b70acdb1f882afd1a1275a96503d95e5eac3978fc6eeea9ff00f9c67d39009887ed66db5acff9633f8aeb6db43e1b245b9db531962d28e3a5d212916bb6e496373cc7b9a316345a31549bb7b55e46b11e4ffc1c653ee9c36e9c4928ac737eccb46198865c9756d639ec6406cc196addbd6a8dbaa481dcb626b0588eed46aca784a2b2f1da89485b950ca494236bfd6bf8a287bacc1c3d7c2059edb2053cf92ce652496916bb1ff07e4de23d50fe586b4d4e01e2087754bf159b055a564e2ede9cccdbd5487a30ad56ab7292c0443365ca5782a11383b00f513ca9e7066b590da366e1da3d54308bbc90e3fa61ef3e1e2ee714c9937d891f60396f7642fa1d5f7c38f088d6566ac6d0587ef1cbb3c958942c57e1e9fc71043eda365acd6924fd2f3d72ed720a3746a2b19019821bd3400e76ed34504b311d728e75889fab53ed66bfc47fcb17f195d3b89277915b1fa548370da2fa349fda5308a33729402595cf116420ad8f2b18fd537f2637245464c85d97272f0c7f15fb315382dd391e96277163f2f64b4bf5c6a5a76038c29bdc9b22f38085d1fd2c6b74317c3df0fa5cca645b4cb644fa14daa0861aa5788f1f4f145669d780e55b5dc63b325700b27dde4328778257745f1c9ff040ca37db543cbe37e9cedf1a6a9e08c91528dd150454e46589ae5766e9ae9ae923db1b5cce03157c659ba55e8470b74453c42a7923850d7b369a7c2c528cbc3b4a677e1456386ee448eb9c0ee6ab06c6e1546db49bec3ac99ecaac5a1fe0881ddbaa2085faa6e2ec3b0895a319600ca00c416ba36a4bf66e856eea5563156a1af4b14d6e1bd4daa9055afb66fd9dc12d5af03d6b251436c6fc1d19b176fb5b3cf5f5e6cfe97fdab13b358d4a7e90c6af16a34c7e84d06b16163136eceb3abd10064e317757e8c858ee17a0d3e3388787a489bfefaac7e47b78f87ecc75ebd5864cd5ae226ffd763ed854c2e22a9cc7c41ffd0cb4ed1c54e9f6b071133f6f52bc938964668a2c4d96af0e1ebec8327ffd7c9bf79772ccc18e195dea840d5ea57b1d01287a387add20c4e3a06b36b2345a94f7aa9c08fe7931827685d7b593ca1d3a1582dbd6a635ecbf119c1245c4b58d4796a72a69e327e557a0303ed65632752ab59e28dee342fe50a9e261aaccc22ae65aa5162e2d0d28e4327983fd961d59bf6eecad5e5db3c126924b244f0676dc0a3e2319c5e9e3ef3cd83b112c153fd36895869084d933a6f5e6e4e5ab219b48f7b30fbb6ef9e5520b81d68c25928c60f672550060c6cdd7ab6fff005d947619e2c713d2bd7abf5e1c5cba8dc83ab16367dc1346d3c54657824b50f7113f87c45eebc7eb7e5959ba96b6393416a4aa9e5ee6d302be5a955bc00d3cf0bd3e1c898a0e832ba1bb390dc3807319577c6e033b4f1b8dcd711965a36fcf962e08ac4b180c61c49ffcec552972099985b888b4c862a03b73ae2536687172d7a94adf42e52a51cb21d7cb9d757ad09e47060e72668d9e8612b75acd97db5eb44f624cee91d5b72eda1820dd66f9f5f279a95ce7b40c12727f9e624e2e3c4364a20e26dc2192c6d85d2c74abf48314dfabc09b3d7a05ff008bdf8d0f0de489161aa524194ab0a09b39695bad908c6bd0bf70aaf0ac2a2c2d18d420100354ae05a08a8e67d620dc3731d5ac058e0fa161a5e098fa566bd9a3370ad4b36073593af7ca4826a642cce877b269744c6cfeacacbd4b487c8b06e2901e19a9e8eabb6e09dba8025b0adfb250db6a0c548f56e652af7353056fad5b3d59d9413b5aaf781ea59dcd285907ab38134a190abbc69d9ee23c855d5472146742f8dd0e7aad56e5aab765aac264e4f5a2d5a681a41188cda1b871a67eeae9558a5594a035ebd0efa3adfaae4a35de4f25ff00d472d2ab8373a74e8452c5d1001f68deb00314c84b6c70648a68addc3b035ec4a1135b9d599cacda0b5380bd9995b3294a10fa52cc55a0e190f659a50db1b75ba17a866fb71cd5baf3d1c242cd4b23b829e0625c4126aa00eb9e24fb7af48f75c964eb4ee6e4febc7d17b519e1e414742705f5634172505067ad42d0f1496b7789a9d55bb3599553852b44a2ad05667364185afd7180976e686be8a1ac26e7130bb6c4c98bc1bbe8ceda4bec92d53ad901b55e59299f02e91d3c565231b583b954faa51384ec69801d74c996e214c6ceb544fa34e7be451fe4edb1ee7d78024daf75b64a7ee3d347adfb9ab879d65eb144f4ec35980fff005394900678a993e3eed984678f1f33c12cb134a14e67a73e8add72a534128d88efd618648e4288e965c27e7af39a60af1dcb856e4883a870d1201c93941152aa410cd8d8e6118a5d2a670c165af858831efb2a3cda3634b7dd29165e4f6452c70c05916771dd34b000c95e40d89ff167d1e7900e28fc0c923cab4d2ca90baa773f2887685b91e7582b0f5c27b41056c79959cbdcc7d7bad30b0498ccc470479cc881c3811d29674f75c9a06a9882934aa3e19b9e3aa8db9e5c00a2c1d86536366ae0189b0430e15f58e2188371727002474203478802478936552963b1cc5914574dd0db3d427224d292eec935d9135ef105e0176b3148ce119268974d6d4f1a9c1d93212d1349aabb72c573932563695c0953d5a72bf6b20af70a634ec249e35708a2acff002ab8ee93270f4ca93b13336c283f7152077386c8b3b412f465b6ddadbd42e54c4ca552d64aa779570773ab066a9f562a16bb987255b78d2b5dd4576af711e36e7558818c658e4c5cd101e42d5cc5a76707ab929eaa873709a6c95424592aa2a7cd0b29ac4960be563e8f418e468c43764ae6ba2c95cd95f171742b5bc445614b1141256bacac910d5a412f48dacba9d8baddb832f700d4d56e7ad3db2052369cdcca5600e98c7eeb266ecf1c7d369fdd6ed1ea5703a55a83e909ca56e6c2c6dfaa66aef6f5ef55ed02d636b1532ded1e1e78fb52d2e6633f27b2b43ed6fc3fae58389f6fb96e5953fd9c3fe3fdb654e11288ab3b314642bcadeeba9a26990da76417cd90e4490e4990de8c9390488eab3a78a404cc4b4de37f1bb80a9bb3bd464d5f6a629453b89278b5562c76ad6af9da1e58e0dd3598baf0893c4578189579fa735b17ad6b633be9b4ab7eeea61acf9cc567d285a6b75f231163eec7285886cc658bbcc6320d88ca8cf14a33477aabeb46f0da0bd65edcc746c50557211d96b5506562a05ac90c912d56a8448de1c6486aed2edd63ae34d5ed593bf3415c6bc44ec0c1fbfbacd2034d73a51d38baaa6c38c812c72d77a576368f6ee508f5eebc0ead3884303904655e5959ff0029a2134ec87f2af3f44c9bdb113b1d688049abc5acdfe7578ba4d952f691f4abc7176f0612c057971e0592bb957eae5b2b31599b30030abf4bb27c20eeb9973eadebc1d9e34dba5449bdbcb1d1f4aa2d55dae576111d23d1d795bd6e6f4f85e13a165149b54136f6959387968d9d76ecbb665d9aec97686cbb535d0913048c9bacc8669d90d9910d9d50983a3d84a6af1490902204e2eaee423a6d6ae4b6cffe89962fd8ba8ceb270b45629fd78c99c4a2fddd3ae4e71da06318a578a4ba3d392bca16ebc04f88c84d1059871f39636d5faad6a0a561eac860320fbf193c46ced938e28a7c4745a4656f131ce86c5ac7bf5e1b2aa5de9bd8603caf6508ad8ccce2ad4b08c6a9441044c4b216baa552ab57885bc652779e492b0d685a97b7a277afcd809d9756cd27a03bdff48691f255a3aea1abb227aea67db74e46dc713e83ca39c802847ab6c524e35468fd49b6ac87f354aeecad9b8d7ad09d82a713d78ec59d32387aae01789a6cad837bc70f5618f1acf6afe62c75accf2bd89672f72ad1f5676f8e562c3fea4c7d4f4ed65a3ad5d6f4daf265aa625058dae536e679134be7abe064f032be8332ea2deb7adeba8ba8ba8e98ddda33dcf23bb3d5908ce4a8cea5a9b5b299b18dc88a52c7e11d5d3df650fcec3d06ccc0a59c6c44065115e1191559ba135d8bb69c7435f0f8e90651c6cc54ad6429b5d830d75cc72b43bc87157fae196a5b950b7e65842c47be6c69d0aef6e7b98c19d57c8c958e390641301369b0d11a3a17204e724761f3960d7ea37654f0646ca8b0c2b23407a18bb1aabb7b6ac7d1e8b68adcfda45880d24b7284ab23686ad1c1d1e9d6e92e207dcf6387678c2be4e7a651ce37f273652ac2a4bb7261c6d2ef5a800f5aed586bd6edff0067ca8da18559b41023ace15f151e914a630845adcbb1d22759b28e18b1159a2ab39f4a2c656eeecbc9b47dd66ce44069d19ec7469634e4843572212dafcb0d16b2f29e4e9c5bb71d33dd0fd86f46a99d0c9edde85fc89f8074284931a676d39ee5aa17f00da39aa2df5b2590ad8c8b33c493e51e9d29efcd8ce178e885badd184bcba81b53185da3681c98e9ab503c45148ec2fe1e13ee2bc05e4d98d7907b2e390af8cbddcc394aaec542e8dc872f4ca2929db0bf05ca2fba9e419c6590f256beb6324ab602c858ad1da12a96b1c55b3114a85d8d95ff00fe9b84954a39864432baf0ea490231988067c5558ba6a4942201df95b503b44b2db00a2aa396c93636dc6d2864e08e8c573276bb5cb92c9e2a66863c5da3ad8fc88d5932791864a38aafd1a59b83a325fc9779157c282cae33a2be49dfce2e58bad9ad4218ab761421a87905c3d0efb592bc14219c2639e28f64599c8755f0716dab939c6bd5c241edcb1efb92c64ca2b0d5eb7c0f3c7c5d0adb96ab2d36cae1f347f8b55aad56ab5f46ab5f4784da2d596e65bd93489a474c6eb72deeb712deeb7badceb73adce988913e8d91e2e8eaab36e6bb2e1385ece51e862eb6361705c4e5d0c372c65779ec954714f1278958a9d68dc5c1e58da5aedec294356825675381eac45099efa924538c812b1e32cc5623b70d9864c6da8e68f2305e2139b173c709491348d2d196a9d4cb04a99d59c743617616ea10e5e785ecd909eefea7509a5b3550e546367ca4f328f1b62d14d8a8fb6c6d8ede79250840ce5cacf0d7ede3ddb564edbca58d85aac2c64b3374cdea19d1802eef6cada3bb62b8b4116431d4ad04f10c53459d99e1a7848ae0d0ae039718a3590bb42801b3486e994b6e49952c5d8cbc99f71ab8cc74d1e2f138fc74b76506ef73b95be4cf91aa34a38582951bd68ee494a26af4aac5df5db67d6b73ea0efe5dfe55387af3ad56e5959b7cf1fcd4f11ee5b96e5aad56ab55afa75e4c9932604c0b6a61e4dc9b9326665a2c9e5ebe2c3299cb3932a7467bf361382e0a62c3a372e3893662932e0fabd4b67033a9290ba928ba3ae4cb3749c5529da196dd57ad3523127900ab4bfcb17876a12f5e2827ed24771902298a84d24f0da88f7553c743d47b1502e0d7bf2533121986c508acafde63156cb413af94ecceb231005efd26ae8d8aaac8685704f5b45ef0432bac9b47d78426c89c0010832c8df6ae34a91013d356a79690528a6332eee47b276aac78eaf609de95e955ac3d5a95b86e936dbd80af754dde615a0d0d57b395c9b5cc356c563f86b181fa5647866dd7b11357c4bf0c52fd4ae68b8bec6e970dc3e723e40dab54a370a02c561bb40b1a5bcdcae79ab562219b2798bfb469fed3194f6d78a96c927e788afb635a23f68ca7be487f383f0d56e5aadcb72dcb55afa744cdcc19372675af364ccb45a3afc5b31c5431a92539cf13c3335d58aa50d11feb9f1e97d043f3c151e94dc53c68a345033a9f1e1286468163ad56ff00d9d42d45f6fea55009e229b4dde409c4721131cb0939ee08a62acf183d990ebbb2ad75a629210b31943631e55b231d95aa9f1904ebb4bb51db2f2c6f72c0d8b417eb9377503a7b70322c9d6152e6456976e28b0f1b3039e3ed8b6f1b790e82a74884ca5179a4b31c51c60796b5b19859b695995f297238800166ed775683278fa107ebb3d97b4f7f217a7e1088a18eddee1fb37f32f9c92ce529622beb94e23598a75b078be1fa5d96332dc4630970fc1264731a2e2ac946d16030614e2bd2b56ab4e9cf92b2d561c4e3e0b26125aaaf04d7acf5de53735233044ff2abc4f3cc11b460b459393a55541f946fa4711fd266f1a72f2b55b96ee5abadceb7a6916f4c499d0a64c9c7cb0a614d1f8e9b26015b015cbf571d0e638867c9955ab35d970dc2d152441a2a81abff004fc88971e46ed121f9e0dffe673714f1ae21c37ea5522964ad364e00b95ebca7427c9d21d9196c761d1e09ceacd3d58afc101331cafd69598eb2826207b3523b4a0ba7564de04ad63a39505ab149ebe4219d6a8844d64a208ed7e8f03b7e8d126c3c287155990411469968b2f086c8ad5828e9634605a3b29e4009440b256068f4dba56995fb764153a36ab8742fbabd14f562c3e11ad435b114ebab96468d5e19a85348b8b64a53458cc3dac9aee6de2e7c6711d3bed9bbf0dbcd3dabfc44aed4adc3f8ae15a5db63f259c92ccd4b1c53665f401e21ceb5b585a034a8715dbe955c3e2069406656ed53ac56a5b1d3ebebaf3e1dc77d33ae8a0764e2ecb392fbd957fc87f8621d81d425d465af2f95a2d1f9785e169cc50a14cce9989685a3316ac24b6badab62cbe761c58dcbb35e9b13849f2878dc6d7c644ceb6aade1392774e5b90f85c6f0eec6ba15c1136b5fd5c5d85e89e2723d84f731e3527c3dcece7cb628f1d643dedb3a8a85d7a92e68e072c64b1c13d9a8f0a7a53541a92c60afe999927a17b06505e86ca9235363e3343ded551e6595f9c2c58865130e5ae88adc20a4cbc209f216ed28712523dcaef46cd721b1159b9da37befcd03431031abf911aa18ba2ee4c88da310dd99bf18300c96a1816732817a7af98b870b61327916cc636ad79aabc9c379abed4e4ad941a816aa4c15a7c5e7295e0e2abe362fc677788464af5b87f17c2f10c3059b76b8926a18e8ec66f31988b15163825cd65f89f2a11c57063c6e3bbc0ab45fc33fcaa150af5a8ab8c113822891c4cb212f5adaadf358758caa83a2a8e9e09196d365bdd00ad168b6adab45b568862725db3469cdd754d0cc698cd0ef744ef1b0ca64fb667738ac6994cf146eee52160f865ec286ab4623112685300b2dcc28ac32eaef711e5c475fb8c41b684cb83adb4391f54b104d1e7312788b98eb31d9aef54ef0e26c459ba53d097aa3f5c667194319d1ef735c3a36e0c2e77b029d831161b11632478bc9c98cb6251da872f806070b566a28adc3616d451048b2100433361f50fd2a715fa6594d86374d868d9454ebc499bc74d6423ea57af765acd571a739442cd65ebc64af4b1555531b2ccb6dc04cf754f66d5d92b632dc49b052c8b318fa78e8b87b0fdbd7016157ae851ab88bd5a2b599bb26747018f8b32d7a38f2594b58da53d6ca435aa5aaf374e7c7f13e3e50e2dca0d82c5e26e6622cbcb0e1b138bc90632ad8c7951a742eb636931b91b114a718ea4de1be1970d633b5accdb9382765989bb5a0efabaaca8c3bab9429e375a2d16d5b568b4f4044e4861114f3b32d75e628754f23a60d50130a9edb568b31c4536414309d89303c2814d3368bc322b11822c8022be44846795055422c2dca406923ca557ab6d53b0f5e6a7686ed6f56531b1e52a5ca9252b11582c804d1feab009871451b10f7d1913ca6e0d2070df10f687c41163e5b55c0eb354b818f2b78ca3c415fa592e18969e5aae4c6ee39e27971b0586e9dda88729a2bd38d892b9b143f2b45a3b21d1d1bc62d2e46bc2a4ccc9220a166ebe471cd5471e5dcc424412d9cb91b50af0b10cb1baf0eb2177aa74297663017bade4a2ab0d0960b57cf8aaa0b96632b65395fcd5fabc3b42b3e8db6f75787b2586cac78f61c5e4f34f93ad015b7c5d26a5998e84762a62ee5987f57cc63daee5ece5955c89d190ee5cce4f93c6cf41ecd52ae16ab76b03b277dceb018bfd46dbb2067ddaf2e2fb3a072aca80fecdc138278d3c49c16d5a2d147bcd308aea460bb85aebcd81d34448213434cc90504348196532b4f0d1e4f2b6329353a52dd9711529e1a33cb68bf529654d1db99063a57418f8c504401ebe34c7693217f3c2596e997af88b06d96ae4250c957272d7b366bf8cd64a1cb4d5f0a3771d1ee6967c686de1dc8d7a17f218d78cbf4b1ba38acc4b8ab705886f419ee18daf4f3976a03dca77dda4134411cab295a380c315be3ec2d8aedf24cba1925d8dd34d88750636a82008985e0f32348e114e542cc51cf9292a508aa33c2068e957d2c38cd357c1b00fe90a5c4d7863a18ff00d4edc788a20d143142dc4195eda2c0e37f4ead673d42aa9b89ad58090ae6487867a058fcbe45b1d4f15948681b63f279d2cc470c7234d53018fcce56de520e18c6470d4ce6721987176e1c1d40baf25982c0814d39ca7f8b128a37964c5510a14d3a74eb3f6bb9c8b26555576db0274e9d938a714e2b6ad252475ed12ec6cb2ededb26eb826b72826c99326cb21cce89b3cebf5e34f9b95d6438a251524a731e1b86ece5155e1e6af18e1a04142bc698047ede4a90dfa776b15699559747c1665aec7ebe28e1eeec7fba196b18d7a742f56ac794ae56a4ad67886cb4a5d6b357c61f3f6310524905a52dac567ea4172de067878afba574ff00727157b487b98547967157ed05a550c5ebbadfa2eb2ddaa774efa27be1123cde89fbebea7c48475b126333f6f3829edcd4dac5bb1925465ab441b2b593e5ea035abcf929eb65f1d4a2ff00c92156789e689aa637219130e1c9665570542a2ce5e2bb3c74eae3b1988cd1e28212b5c4f768622a63d64ef8e3ea50b171eed2e1cdc799c805dbd1c7778806cc514d72e542826f065af54b54fe16ab86f14b778735b93babf67b7ab216f343f348371b7e2e9f93a74e9d68a3859c836f506a0a6ae2ba42ba00bb485d7615d7e9d59363eb29c29d28737c4857d00148581e10d108b00fdfe2cc2f5e321dae2fa3d1b7a16333ec7f638a387355f2f0646686be470658faf1e4c22973566a6602bda285e6aad6041dd8dac104bdc6f1976990cb28b349b8865d539ab411b28e83946d1dd05bb20ba9756fbaebf7a69a8c9226a110208c234c6429e6770959eace79d91dabd03b524011461b15e9aad40af4a5cc4f0632b4431d68c15cb71e3e0a3566cfdb006019b2552b2c9f1345d2c762b2dbe1e17033c956edf2d8dab060e95be2a1dd5fbbe21bf057ad8e8335c4a12063b87a0ad065f88ded30dbaf81a84e6645f2fee447aa77737c4d02b572311899e5d1c489df54eeb89aceca9c83e70e1bed7a1f968b4530b23341e46b5a6ae00fbc74e5a73cb66ab6222cae62ce5a5a3427c84f84e1c83123ff0005fcb712f0ebd7276d133e8abdf2158ececb586b710559904a1237396d41035ce2bab02c938589dbdea29dc1491e8a3976bcac26d0c870b90477d84d91c52d576e9d841b84e4a9d427e1ec9451bc9d257cb1e75685486c633ad255412848c75a39538cd020ed6c23c58ba944a137714766304f70cd742491557663ea98a1b5327ce588908cb34b1e6e6010cbdf26b39fbd507b7c97101458dce6c6e1a9a5590c762f0d0f0ee137199844d96e23ad5e283aef721e18799f3b761a1150cad6c4d6bd05eb306366829cd90ef6f40024020c883b78fc82745ee7af5ca793158f1a10a667dcefc8971258eadee51ae1e8f5974fb12879d239911bc640644346779e2f467b8aa3a2a7b12da970dc3f632e78fc6d7c643ff0c998db883855c13b79f851c9b5477cc1459366419eb009f88ede93672c4ac770891c9aa63d19fca67deb73b27074123813331a3ac7abced2a694eb341471392aa3264702459ca9948e3b3631a3d78af4797a50d78a28260161c930efbd13fea96c10e72ca972562751dfc90a93bd98fb43741563678ebb9348071ab42cce7601c3ea4ee30f4d3148c9a69197ead2574072dd9eae7a900967b1a0d678b68c61fbec85a00e21b6d92c4474a1e1cc17707969a38f3d7b8c45c71dc392e41b4c5e0239e6b1c4f77b7c6e0184ec712dcc9da8a52dfd3562092b0fe29f46600732c3e2069c3d1b31aeb4c0bb9893d9612eab6b24a2016a579a7e50fce063db5b93fa8c77b374e7433f9370e9e329944dca490620cf7169585f2f81e142b2a38c210ff8a7e427fe4f4313adceb5e5a2614cca2c5dab49f5079683c55fb1c7e46a101c1243941bb05aafb18a392078a478ce96542c2bbc33d46ad56c31caf668cd7726d76a61abf571d2e18e32ef4abbb6c9464a2da975a141381a9e3937f51c50b6aaa64a1a0f6f8a2aed0c7dccc9dba0f8cbb2d29e215aa73d53369c99c5756306a8cdd6a9c4d112b3c49420864b3672b77b4ce5d182482bc94a5a7dd3e5329971b916db34ae5928260faef9090a0f023110545219949f83336af82c3f41b9bf94f561454dd66ca5ab51d37283e71c1d2a9b96be8d168b45b5142c9cfe93c8db71c5f49d5ebf063e0cdf10cf9738613b1260785429ff00c895f6c523ea7cb1bc396b27567e1cc9408b1f6817673a0c5dc9145c377cd43c311b20c36322519d7ae8ae93ac9d00be824b18d9dabb5b71b515e56b1c750e39e7c722a216209616766dcb179e9b1e5b31bc47111dfc2ace438cb18da781b566857b7938a692c66c05cec4320672404f9f8dd4d928664d6a64562e1a08e69d418b89455a869fa540eafe12dcd16333366bd6b3960b89e859777ab23271e4e4cbe1755d3928db52a1c47d886478b86c4189c1cd954d8ec46196478864beaa70d4304792cab5a53c7d23d1805cb617e2fb1c152a72dd9abf0e56af2faf8aac6e9932655037ca3600184c4f9e8b45b56d5b5689e47311aa26a691e35532431064788fb21bf91b1929b1f8d9f253e1b055f111ff00c3d796ab55aabd3876aff3cb854c61c29df8d91e534479424790224f6c9d754dd331920ad2120a06e831ecad61ab5c8b2786b38695ad56cb3752e619579581abd286e9599f7cc6024fb9c1c6bbaabc5b7ea3e4eee36ec380e200c7d73831d9d85f1592c4a8388e1ea0f4e71b782a7691e16fd467b96627acf1cb3cb522951e2c352ab7225fa9c9013f1059d0c9ccb136f194611ce63dd7eb341714d882d5d65a2d8cbdadc9cddd0bb0a883a875f29919e2bf0c50cb43235f1616afdac9185a6af1336c4e5e47e75dad8cc1cf6a3a38f871f1fd8cb4fdc5ee43f3838bab751d286422a92327ef235fa808286e579969cffec169a3732095865d1653343414929cc78ec54b78b0410558fefeab55aad56ab727959915b16477dd4b7494f291a2f05cb1f6ba551ec112d49d344648291920c7a0a718a18805373d5188c8198e157155b2335513a413a7b04e75f391db86de02408c6c3b260f3dc048d340c038f828cad1f0e5f8d4b92e21c60cbc56d681efc50154e2f306ff00cb71fa5ccdc372d5ac8e22c3473d8622fd664026948eb57c6a8c6166b350678a9bb0c93c7521632094a51784ba8e99c9d6fea3355c4c75bb7737fc537cc7a044f291aab4a156ee426df92f00ce5b969e238e4b058ae1e0adf6afcbdbd337dc5ca3f9e198569cb4e5b54d8dad6116176226cbd75fae5885ebe62bd87aafb440faab299c106f97c5618ad28a2261ab39452bfddd56ab55aade9e566456515874522234722744ca5a00f20e399478a7751e31d05106435e314c0cc99b9785aadcb72dcb55aadcb2786ad936bf8ab58b90ad0d9470bc4a9e42c503ee31d9c6bd82b3450c334c24fa283a6e104b668153e2fda8f1d87cd22c3652837ead0d77c99d0bd2cbc1a3a747318d4dc4d1c4f16631f616c8a719f0b525567034a26b3d0aefa4d22ad48adb0d1b5134b527d0bdaef0caed56853718bf48a8392e213b0d5eacd3c76b1b631ec726f433ec623734cdb96f666e58fc1d8bef4b1f0500fb5c513f4a8f38be7050f4e82d3d65109a6c7c225a7b32f9bee97cac5e1c10c7ab384ae2f3193d497a95b96ab55aad56ab72dcb7adeb7ade9e54f3b22b29e6774e6b72724e69df96d5b19388eace98893392dceb792de6b79ade6b79aea1aea1aea1aea92eb92ee1d7729aca794241c870ec7229a0969c9bb6a0e89aa7264a931dac6641eec53bd7ad50ad31472d77eacf188d9203a5c5f6abab7c63058a54e4c3cb5decc551abf185b893717d1942e65b0b328d8e69a1a39f9067e1bc993d7c7dda4a4b979c6339685a3cc913c90ddb0a2ad6e36782eba949f58e1650e429d5527144fa48535cb17a3ad14a99b45f3ca9632cdf7c7f0f57a9f778b2c6fb69b9560df2578fa50fa745a2d130adab29937b46cdabe3714f5d6f204f203bef09cdb78363ba9b372dcb72dcb72deb7adeba89e664f3a79dd3c8eeb73ad56ab55af3d16d5a2da9816c65e16ab72deb7aea2eaaeb2eb2eb2eb2eb3aeb2eb3aebbaee175d975c575454a11580b580daa584ab904b2c063968ee09e24265b9d43933001ec6569689ebdb84236268c845a0255fa513d7b587558b032a97058cb68b852a6af83c8d65672193a0c3c557515fcddd093199090a9d8931b315aca181652cea356f5e4d87d14d053ac9a33b086486929a539cd8398839ac7d28424061dbf71fc365a7ee2f72658283ad7fd1a2d168b6adab6ad108b93d0c7f66827688627dc9a84d3106341043146fb96e5b96f5bd3cacbac9e574e6eb5fb1aad7d1a2dab4e4fcb45a2d13f86932156252e7ea022e25645c473ba7cedc25facddd62cc16b26564dcd9ab4873f68507119a1e20890656a9a0b304abc2d549f5067c506b3549624c83e91b8e3ac21af0f4628209663c75e0669648ca28a7b6a7ab3564d2b0a69a5743767849efda2396ccd32ad2c313d6e21af557fe5e9f8b834cae5872adefdb5e51ac32672d12792dda5fb7ae8a59654c22cb768a2826b09b033f41466aacab1763a91fdcc94fdbd137dc5c8570ac1ef5a2d168b45b568b4f46270528055c7cb13b52837b682b72dcb7aea2eaaea3adcff007b45b5302dab4f468b6badaea596385a7cfd58559e20b32a92cc92ad7d757071bc36300ebf43b6a7ad2d62e5aa8ee4f128f373328b2f01a094245b9d4d5a19d4b88652529a36f60beb21a6328ddb2444ce75894592b55d7eadd45ae2a55622ae09cb45bc16ac4b61bae99ae993313a6dceb66c404faf42695478eb0ebf46b449b1022829c31a8bc2889662a76b6c5f45049e69d878a412631fb7c5763a747982e1dafd2c7e8b45b568b4f5ee5bd3c89e45bdd6efbfa2d8981346b6372f09f45af2f0b54e6c2d6f3b0d7573396ec233737e5a2d393797a78796c3c9c3e62d3d39ebaa98e3d61919c7de98895aae16ab7682c725514d04a4be39b13b28b276225165e2340432b6ba2300958f175cd7e8f2b23a37234fa8384b0b269a83b1f62e9da35ed5d54c4ba8e9cc9083c8f0e22f4af1f0bdb9141c2f5625150af5d689d18a90110e885444b2f57baa6e80f47ab2f8c458de1f6f8b2c752ef380379d387a5559969f6b5fb9b56d5b793bb2d79b37ab5e5aade9e4d1ae66e2aaaee6e7b28a4727e5a2d56bc86b4c4d4cbb7b31cfee7937b194a8a4f2d274d34ee827445d40ec984e3a30bb8cc225771b1df8ec573ad2fa18dc5e0cc4a0a1bb5ec2da4299d04aeb731b3d1a9227c25134fc3759d7fe330aff00c5e343c2d121e15a8a3e1bc7020c4518d0c600dcdd3a74e8d91b2f851128dd656a76b6d9d569342a563a6606c63f65fdad92b1dc5de782afdc6419bee68b45a2d3968b45a7a355b9d6ae9c96bcd99372d79eab54da2f6ad4558c845134d78acab03bc67afd15a72d79d5ac56a4af4e1acc46cebda48abc46ba1b059f6ab67b4baa271f59c5e97bc3daef241eff007c244232287dad9b1196621717f4eaab64a6aeabe4e0b0b6a1742485d312674c99d33a67f53a74e9d12364680bcc26b3d57af51d464a9cbab626c6e1fb3989bb6c697cf215c1b5b74ff7345a7a35f46ab55b9393adcb5e4de9d168e9d332d8b632b1662aed66fc92a9ac93a8e4daee3ee9818da5078dfd18a3600791b538c901bb3b1b3a94dba2202c02c0e4cad550964089e1091d336f1b7aec69b6a0936c7db4f78ede3258c0876bfaeae425aaf53230da4cc85d0ba64c99d3264cfe974e9d3a7523235f0a034da18642abd5b2cea9c9a1549ba6604c63e8d168b45a2e32b1d2a9cc170b56e8637fe2eab72775af365ab2dcb55b9d6e75b9d6aeeb6badae88ba6d672aa6924273fe19018546e809f6bab6feee505539d478f8458228e3639d4570a22ea04ad109486db456edcf186d4cde08b6bccdaa0d1d98b6a26ea876908c708ed163f3a2b58baf75b238a9687d862d150ccbc6a33194193264c9937267f43a744893a346c89467e6135c45577c4a177dd4e76758b9b51e7a2d168b4e5c5b73b8c973ab13cb35485abd7fb9e16e5bbd5aa72e7a2dab4e5e1785ab2dcc9cf9368b72b1782056ee4b3a937a80b7c72991b4ade1bc28fc83ab23a96d750d7794e2d91015ad1778a521958633371dc4e04ec8755bbc017927f699ee529f913f6c6baa8bde23ab1fc147e462b1b4b3665db4d878c317f62864a4a4752d456e364de86f53a7449d3a3646cbe1eb9a28c6c436607af303e8f5e4d8f46c6d7026305a2d3d17ecb52a73caf34bc9970b52ee321f77565b96e5abaf2b4e4febdaeb6ad8b6a7d197cadab6a2d05ade4914bbb949b18e1b031ad7c485e13b8c6c44e6bd8cedb50cbb0f7a7251c4ddb4750a52f1001933befdcb69ebd4432e8e13fb637dd2096f702dce4fb6312dce73ee9027dce45b8c49f60d49cd4ae51bd6f7c391c2c7d22026fb14eec94a5a1763bd0b26f433fa9d1224e8d1b22509e8f5cb56e27a7a1209163a4727c69bb2d3d5c6992f1cc1970a52ede97ddf6adc2b7adee9c9d3bfa7565b96ab7adeb7badceb575a72dcea7b235c2e644ac2791d6ba279372766516ac446896f4cfb9c693122a52b1458e4f8e84c65aa401db9c8a08fa63b84175d949104ac3be397f96278da413af2468642d0e76862197e9c004a48bab149be28826e91108938889b75063433b9bcb0b4f0d0344e2ef762eced3b09a785749d749d7497496c1d163ef9d19eb4e16a1fb4e9d1274e8d48c85f47a726aad556bd4e6078cc3e68cba157b285f737a2f5b0a356eda3b967932c5d37b76a189a18beeed65ed5b853c89cd6be9dab6b2d19785e1392f94dcbc2b7682a85fc814c71591110904d9fe479bada7317e91ec86a144874051cbb8b4def24bb59e5777193d90bea8d48da219763158ea3c3676260676e809b163c54d86dc82bcb5dc0dd432e8e3a12c8d5018faa8246dbb44d0088263d5bb628e6b47b23ce1b4922dceb73adceb55f2b63ad8cba4da60325dacedf6dd1224e8d1b22f0f565da75df56e2ba1d0b6aa179a963458bb1d6afe8e2accf7b32d3900eafc278de987df74fe9d796ab55aad56abcf2f2b5e576e0530b770e57d5396d4c4e2ef39ba86023716615b96ed4e168a10de2b7b329fe2088f529b46734e5e425d144c42d29e89e4676b32fb630266667559ccc58f4722dd18469e3f1661684a37d5425a3e62e3c4d567de8257668645b9f6d727744e4eee7a2cdc4f15ce5b1d6c4cccb72725bc97509313eb80bfded3fb1a7276448912252329e508d35f117adc46108e4f2f4f2941e2751098a84f458abfdb4c2ec4dcb897889805fcf366589a0576cc108d78bef6ab5fb8298996e64fb53abb7029c76ac199ba7f0dca388a45ae8bc9237106e996bbb48da47751bf92353d9762095cd7b93c8ccaa45acaceeea401368a8032fa51334829e76467e23f7bc1ed188cb6b3ea36a5796782b6d5d36591a8f7465a135220ba40a3b30cadd6671859911e924a3d47ceef19c31974c22c24275efe226a29dc45393bfab0173b5bfcb45a2d168b44eec0ddc42ca4cb5304193a9331480891bb0a92fc22a6c97558f572f6ad596fd16abfa82491ce43ed2c6373835da4e25a110e5b8b25b6cefaba664cca18b7960717d857ff982c98196c65b595bb50d386cda39647f29dd3f9e753575a222daaac7b8a73fa9bf70eef00688fc1d539ca3d0134723b58abb25ae7a09cbb5849dc88f73ff007f9a962901be5aac6fbb6e8abcbb94d2340358bcb48a3910ed75910ea55830e3b4b171ed31713822e9c4d3a23671f66d63ea20f0a7ae36abdaae5567f547aeea369ac533bd5a3459ba208f88eb323e262527105b34597b248ee94ae577726b31ea33576456c7695d778caceafd465d5764e6eeb727e6cca38431e53d83b13ef2f43326151c5b970f61367fc1d7eeb6ab524f2bb2927d06edd7b73197282181aaf3a733467310469ddc9c47e84c5eeae6cee5ed4c681f73c7ba670d05dcc814ae130157e993d69a46d928bb6a03103d89c220800a71d23a43d2b32155432d8318ec6856e2efa9c51471268e14c3132728d986c39a85f5657bd96c646289a4d1e1fac671128e3f000864d1b897ff00a2b474d112edb55db2e80a68d997bb4d1689f45a2d19682ba629a2675d365d35a2764ebcadcb7b2dc9dd3791a7899ee93f0e49569cef23c9e810420a381cdf0bc3fa266d3fe089ea99fee31e8c52a7598bbabbafedb4dc7239fa194313c8d0c7144d7a7eb3b0393f6b3b2ea3b8ea8779943ac50c7226b0c87eb2188badab69f0ad1f9c6b6c4fef47a6e72600958258aae8f14b4e391c2b9834f8adefb1c087e259761e9d31a92eabfbcec2c74f1f7fd9336af549811cbe4655d75bd5f946dda6896d4f20827b229ed27b049a62d787a941690e36a32fd36aa7c45474f81a64a4e17a868f847c1f0ada079387ee888e02e1bd7e1598945c2f5c1bf46ab1a3c3d4d6c60ab9ab183919150b02418bb7228f0ae2a2af5a27a0edd3175c650c310eaeb72d75402a30d551c44d70b1d838697fc30934412ea98beeddb1db40e7bc9fe1fc37260725d37e400a3b00ca1e9cccd559415c624f26e4f17510d688041b552d53d9dbcc232c8ec58e9745247aa2d45149e25935509ed8c6c212da8e673779745427d11133b6fd1a33f771031d737bb32ea11b8c8d620afbd9c253778c3d97b170122a6e2cd48dd880c5ca578d77accad650a518fca92db0a298cbd2cb8424732d1332d169f62515232346c9fe48c91f942de71aff004c171b7c72da877213265c165a8ffc367425a209509ea99fede62d75664fe48dd03ec764da224cdaf264c4a39885466723c704ac2fe134446c2ce2b728771bdaae1b4c7628ad1c6cf642453b7893550d8d42afb8ce66d5cd11ee3abaed6b2e2a19b552e8e59a0dedd884a2789767add5af3447a30c9d49366e6b1ec89899d460ceadc3ac991db10175250767891cae7f6384ebf4e5665a7da2f8951a3449d10a66f38efc4171a06b1721e7c10fff00199d09a095312d7ec5a97a10116f3e45f97f42ba8da1a1fc5ac6d8c908b9153a410307bdb6ed52edd46cb2ee134e864560b72b4c314012223433e8533ac563355252038bf4a8d438918def638abbd6918876f987daa1f795991dce20776b32b6a72284be9d1fe767d0ec0bcb5bdd1b8d8dae536f45d150ca2ad5686c2cbe10a87ac7e786a0d90fdb252a346893a25fdd1f118caccb8acc4e8b9721e7c131bffc867412219355aad7d59b9b4165fd421d47f97e7f2bc3339f858a16df1bef23976b159447b98d9d4733aebaab21c89c95f95e54d210a091d000cce1561ae153e64f0d18adaba233d732188a395c86277750db8858e785db51753528251b119d53ac5ac754f49e63e99c33eaadc6c709c46a49344c6a23daeccd3472ed38aed7ed6d732f8546129ec626bf6d43ed97c4a8d1a24e893be8ff00a90c433656c1a949e55206de43cf83434a3ff219312195316ab55afa32f26fb2c8be05f68fa0798b393c15bb6087c0cc5e531f9ea3ebd294d451319c3d3822b1035873c3818dac3cb0b44cfbe0f64a6faa82550c8cedd3175d32d01f62cae18e4971d86eda2931f19b4f4caa482ca5f6034eeeb267ac35f207027ca920b8191ad138c49ad368fd322c8d51ae6c7a3c7ee6a93f4cef17464cd18cb7397f67f2b84716727dc7523f894912245c891a364ec9d9106a8c3638a6f2a8e1addd3c6511c754ff00962684d6ab5e4ead16f9191275a7a1b9538e39086500473287f19224f1a8ebef28e20898c903e92c92a8e4472682536aaf08e824fa437b626b11286d6ac17f6a7c8b269d8c2b3ef77f62f26a5a8d62378fa473796b12346ad6f9e1870d6cdc387a51922fa4db0671044ce12e5075aad0bbadcd10d7999cb339789e133732d355f1c9d00ee2a500d0c77db7531a91d12244b44ec881d146e9e125db126a2649b0672aabc2d1eb570d5aba0061ff008a12ed4cfafd8674269896a9dfc4df93274fcdf907c9c7b56ba285d13a0b6c2bbd1452ef403b077a33f14d98a5b60a37d148fb81cbccbe4423455c758e21d1e892920b40c126e7afa08c12ed511b48c242cc32fbad30ac8641e29abd73bc71c30d685ec3a8cf578df562ae5193fd47721594c8f58bac1d3b37ca492ccefda726449f970ad5097280de3ed93a9091274ec9c56c5b174976faa6a4a3a2ca2a0a3aa2299b4e4dff001849c504ac5f659d31ad55a1db3b72febd1137990f738011b8d7b2c9c65055aa959778e20689a212ea312796214671928cf6a199a702f6b89f8919911332849e4306dc9a124123820b7edbf0e850cfaa8657d6b4da3b481203368f396a36ddcadd1f6811f9e9b9285f455df545e15a0d608efc3614f8f86463c489ac8633d8e4fa265b1b44e9bcbf0d631a08fedba94d1ba74e9d689a3430a1890d777435590c4cde86ff008ecdc82574cfafd9d564876da6e5ff005e6ea27d0a287ba9e98470c7e16e652558e46971b332237178cddc9d392eb748a39f472d24023e9a3b6eeef8fbae357f10f0f0ba9584c5fdaefef168f69464a295413af0c134c62725033b15fda266aa59e9bc35e1b0ef09553fc9cbf0fd22489427b46ccaa79b623f24996be1f970b633b9b15e21822fb665a2324e9f968985006a82043133266ff9acb45a267d109ebf672d17b790fca6f462eb938c0fe0e6d5c7de9c0995cb0f1014babc5bc4c9d1aab464bc71e2eb571eda589daa9d9382a4755eb4de2fe226ef4e9ccd252c6cce6d4a014d5c5646800c4fa6e142e82668d77a2e23699d4b48257968cb131326f6aad63a673375608cb6b03754ba4f12c9074cf257ca00b3764b49993fa2bc253cb86a4d5abfd9d791123344fe8665147ab80266ff0040c8196d4ede464d1379f5d88bad0bf8e67e793f266dcf01f669ae09b07e224c0ddf46b2154ac4631435d4f2ea849f426750b0d4addc6a4d6370c169a35dcf5580980e69a3e9bd85116d8c65dc5bfc64a4e9d79e5dcf5bb8521491c70994c718b21afb99b7c4f5656759c80aa58136918563721a8b90b9c422021637bd880661e28a135789996ba7a7867125b44760fd9d53ba90d117a34401aa004cdfe83442daad393f2dfb104ac7ebbf5fa73bfb5d47ee6fec9b9467d3906769ce3d0515f189a5bc72ac440f21d92f0422a4a4d2a0a411236d1e7937031798cbc492e8abd8f6f73a22b1b945b8dc2c11263d830cc32374d9d5dc3c55ee3c24b5daf2036ad6363d3b0268c23b116bd22cdd8ead61d59c19d412749058f785819231974392d369999e3fd39fd383c6f7b6208ba41f635e4ee8cd1127e6cc8435401a266ff443e1f93a744ea304d2689bcfa6d40d621935d5b9491f5626f70bf2ac7d3924b5e223ea1421182a8fb6b4a5b94d26d5ae9188022084d4bed8f5509f899425a3197883591cc9a186aeaef336b5da4285e0b244aef938f47592adb136a6f729bc71513d855774836e39c2586b4668611d724c6c0f26d412bb94426cde7512f3c4f5b6c3b3c1738a3732c0e37b2adf635e4ee8cd13f3d133261d500266ff0042e3cdcd757443231222d50449fc72137170918bd392a5bf90baaf3bd73b359a2791bd0cabda2628a5d94fb8d5a693dc67ed6996fd249cf56109748b7c721f95bb44522c648ce645a9561f32bfb263d5c2cf45c81ae451bb83b74a60af8fad11714dd00586079ed4f64604f314e61ec51cbe6f33143396d4c4eced68d412b9944c20b3965aca9cf44fc84757e1dc2ece5aad56ab5f46bc9df44469df9e899908ea841337fa271f07e1f5445a29e7daa089d00272f484a99f5f46468e8e99d54b5dbbda84099dbd14983a935feaa197c46dd490df4012464a2f796d621b1190a6951cba279b5552c74a57f9aa4ca5fc67958135beaac5e45e039220b0da9465dd3805b177b353f6c0f239bc25e58d46ac1eb0d8def334da2ee145746379b36f284b69116bc85b5580c2759dbc36ab55aadcb55aad56bc9df44449f9e8b44c2845337fa49456ba3cc5e2b075e70044feb127070918b9fcac850d9c9bca632073db2310fa46726542567232f24fa2c78754a48f6203f3f2a5840d1c1a20a064ed4199463ba1ee3a053658764cf25b7ad8f08d45404956ead42770995c7dad664ea4fbd6f412e8a39d4726a89f51ca57708643795ba8eb55bd3bf266582c1bd9711606e5aad7d4469cbd0cdc84130ad3fd2936aac36c29cfdb8d0fa2cda33ad3d5a72095372f957f1fb1d33af8700ebb4586b12a9306428b11b44a89469e2d17e2baa4864d471963a73d80642cc288f4452a81f74956163434c5d7e9eced6f1173592acd118b30301f9a86b51db62bbc8362acd10bfcefd575175f4514faaac7e1e56d72b2ecc7b978f4332c1e05ec388b037d8d51489cb9e8b44c84533266ff004f6e3d409b72aa1b6176f1b569cb4f4b0a7f0809d909b3f3bd8de54a8496deb5182b3271653f4d94b344633944cee429d096d55e4f21737c7d61744ca458e89dce3b2c2a29889114acaf648e243295973f90a919c54e0d138ed663f195b72359ea3a795d9c0da4160dca1aa4ef2fed60fd4e4753da32677d5f9b0ac2e07738b3337d8234e5e8d39332104cc9bfd44a3a869a1551fa44de8d39b36ab672dacb6f209745f3cad63c26782cbc09ac830dccd16f3bb60dde6695183f276e6cfb5c2c2eaa1b6429ac89935b55c953256a4db05e95e72ad67a124a6ca398f509a5d639cc863917111f4aef768ac6f51d828de0c9b0a2cb1b296e9caef2f87277f447114a78bc1b5751ba6f5b9a73f5882114cdfeaee0ec3c6beeae49d3ad13b7a1bf165a7974e8934ae0a399a4e524432b5dab3072d5455a4b0831128b150ae29ea564f5013d3911c06082b99b6c315e56aea89fd489d542f360be8dad19c9d8ed6d6761d1068a5b810286eb13e75decb8d23741415cadd16d796ab5e7a2a18c9ef950c5434050264dcf54e69cb9e8b4e6c3aa104c2b4ff56eaf86e8f152ed34ec9938275b79b3f9dcb54e8919266d5461a263e76b1a1320afdb9c9967d0ec1c8ff2b45aba63764d60d0da7d7b6dc254857e9ace87144cfd29e155ec4a2ac5898c66af3c89b1739a8aa5a111ab3a86998b9d0090e3a622a5819dba20cb4059633ee3d1a28e3294b15c2ae486b8400e9d07cb2dcb7adeb5f5b0ea8634c2b4ff005a4fa29877c6df427152326e4e09c118e899f93929ed7494392675d6636d37380689df90938a13ddc8c18dace259d4911c2fcf45a72abf56a74fcf4d00329e0de020bf251c0e5295164346301781918332d549b9931e889d11888e4acb59b0b45a72c770e59baa8622b63c517c17265afd9614d1a615a7fb1be1b64a7234b0c9f09b9986ac6db4b5f1665e9839b93d6aef33b0a11dbea09399c432358c433a96bcb07a6b5e92b350b45725185c5e3115244c6ba4d1b9108b51848453a93c299d3912ca4c50c3165cd93e5e3713908df9379547876ddc7c7e06ad15e196f4f22ddcf45a7ab45b534698569fecef86e6c4c89f937a2c878dfe2e1ea718ef28e268c003ec31b8b89b173716253e322954b8c9a344241cf87a21790bdcf1a3fc1c06509a2e99c7f82246a664ea584278cc361f28a09267a9c3d2ccf4b17529331e8b7bad7d1a72d169cb45a2d130268d6dff006d28ef0865edac33a36d1d937331ded3fb1e56772c745acaccbe3d3a7a465f49c4122971709a931120aacf66810e6c10642224d744ca3b22e9ba65234c2b732736472329668d4d661152e5ccd9ab4f2bc58690d57c3400a2844180537265a7ab45a2d130a68d302d3fdbebcaf8ed2a52f56b97e2de87576376270d563c3461f871e7a7a76adab6a1271427bbd6510122a5092ec0576d302d6d82ee6e0a1c95f14562e9adb64d766e48684482b80a1040084108a114cc99968b45a2d168b45a2604d1a605a7fbcc847b9b1336c9087737f7c9d3ab61b99c845509b7900a25a7dadbc864fb441aa28d38a642990b21142080108a614c299930ad168b45b530268d6c5a7fba7f4cc3ba302782717d58fe5bd128ea16c36163e6d96053b276d39bf365a73da9db90938a1363fb2e88138a6f0809079402801082614c298530adab6268d346b6ad3fdeb27f43ab83a4b48b7d73e4dc9d7cb5f8fc83ec38bdc26b45a276774ecb4e62fab727f8e44b728ec26f3f65c53826f0a29144faa04028634d12189346b62d3ffe0617f6bfa6f47eec54de5fe137226d53b68b221e0ff2c6cbd5a8699689d93b27e6c7a27910ce2e5af84e8df9336af10ec6fb4e0be1433e8f5e562510ea8059332d169fff00071f83f4d80de15e4e8596f82f9e65f16a3dc130fbb092f82f8e4e9c538236d16a9d5bb1d21dc4ef0648e3416a337324e987728e3d13f262fb4ecb4514e513d4c833a8a76242499fecebfeec90beacfe87f2ad86c9294bd6ae7c9b9bb6ad663d25a0ed158fe9fd320f87f0e44ccd3caf2c82dc845c8bce9a28c3d3ae899f5fb5a267717ab7dc157bac6c12ea98bffe120f09fd37c356c44ba3bfc26e6eaf8a1376901f7097a5fe2c7b0ad9fd3605a2daabc1d31d10026f5b49f7229ca37ab9150d96242699ff00fe09bda7e9b03ecae7d2b2de59fd0eae86a27e1f1b2752a13726f45c0d425f2eccb63aad1b11a10d56dd1bd4e9d0938a12ddf6d8b455ee903d7bcc4826674c6b77fcbd7fd1c85b011b6ad1bee17f4136ad662703a52f56b97a1d4c1bc2db36b8397c3fc726e738ee8f67929638dcac912c78fd2640c89fd6fe8193ee472903d6bea1b4c4864d5312d7fde5f93641ca22f73fa6e02c44a9fe1879ba7f8be2dbb185d2b6df0fe976d5adfeddf9501fda8a16f0fc9bd5a2d168b44c5b5316bf6d9f450da2055ef33a8e7674c699ff00dddcfab6793f836f87f44e3b86b9f42dff004fcdf9640507cc07be33f94de8c947b87fb658ff00f180354429dbec332d16d5fdbb2feda4fb81238aaf79d9416d89825d5312d7fdc3bf8abf56e722f880b7017a0bcab43b25a72f56b9737e560751399c5f1526faa5c9b9ff0077c35093c18ac61ea317c3b226f5b266f1cb4e4e89931ed432317dc8ac382af7945618909a62ff006f6a4e9c38d071afcc3db2fa7211f9c4cbaa76e4dc9d483a8da0da5843769dfe3d0eacff0014edef16f141f6d887e3e5938a7f50978f4ba75aa8ec267d7ed89e8a0b8e2a0b8ce826d5312ddfed7246e4e03b4799217d589373b21b831e7d1b7e8745f19089553e9581f22ff3cdd48decb23a4a20a3718e585fdc8be5bcb132d393afedd3168a49d81457b5425b993a24ee9f941b99fee04ce0abde50da624326a9896bfecc3f7190f43aae48bd07e5a61e9cd0c8d2c65cdd3b79b83a8ff74a5ead62f9e6fcad86934961d6be602dccdf07f2dcb6eab6b278d1f8777465b4643732514e70bc76825746e9d3a11d5e21f0ff001f719d43688157bdaa8ec6a84d33ff00b19cf6458b0f6fa47db37a6f87bb132eb1bfa6c0ee8dc3df89959c0bd5901dc8fe56325df5c549cdbe394ede15b3f772d100f9826dec5cbe5431ad3467fbe3238a82eb8a82e31209754c499ffd7e4e4d22ad1f4e1f498ea80b70926e4ead47bc31f2746c27e6e895c6702c44bb2d7f5c9b93abe3ac520a6058bf061f04dc9bd127e26fb1dcb7be8b62d18588f55599f574ea20d5c474449dbca74eb77dcd5473b83d7bca2b3aa19354c4b5ff005b27ee321c81fc3fa212d09d3733fc66f64d0c9d48cb9bf2bf1a88fa52816e02f43a9c774443e5527d2c44fe0bf1f4baba1e76a614726d4eea28fa84c3a3261d5c5b4667f4ba75bb4427afdc12d1436c8157bbaa8e7d509a625aff00aa94b68631ba922643f3e87f61fcb7a2fc6b152ee84bd36c19c241d0b1d2752a97a4bc8d81db2336aa3768e485fcff004ff2de8feee8ea24e20c72b973ad1ed0e403e7d0fcdf9b1a67d7ee04ae2abded1436d8904baa624cff00ea7272f4e0c745d2ac87903eacfcc9b5680f70bfa2d86e0c6c9d3b3c9b93a97f19c7ea618f445f1e9bc1ef9758c75558b5047f97a0958fe33fcb9b368dc8537a1f9bfa19f4427afdc6751587055ef28ac6a8644c4b5ff4f7dfaf685b46465b233b0a9cbabbfa21f69bfa0db5176e9cf19f501d37274ff17076cb8eb3b6dfcb26f46443db293b92a27bab37c1f26e66e4cf27f1c9e0d68bfbfe9326645e87fb2c699f5fb827a286e38aaf77551cfaa634cffe949f41a5f5ef372cacbd2a6a23d927cb737f0ecfab264fcaf47eec61eeac5cdf95e8933f4ce13ea445f3e8b43be19dbdc2b165e22fc64e4c9dd7cb69a317e365bea2d3937c3a115a6c67f4bfa1db969cdbc213fb9aa8e67155efa86d6e412ea98933fda6ff00937a4e9c1898b640996724dcfcaa9ee0e6ea17f0fe8b4decc64bb6c7a6c06b1c81a3e224df54fd3236a3307bdc36be3bc4f0ba3f84dcbfafed5e6d254cdaa776066f85187934fe874e9932dab6a215a72d3989e899f5fb8c4a1b4e0abded5456354322625aff00a1ca1ef3843646995f3ea59d39563da7e80f06fe836dc25f4278cb78137a0be2e06c2c349b647f84dcdd5c1d9369bca391a09a17f73fc3a67f47f7910f70468a4d3907e287e0bdcee3a7d822f6b3f376e7268fcb5d10cbf7354323b282eb8a82e33a8e6d509a62e7a7fcc7f0d17ee321c8bc04f5772d397c3c27bc39ba17d5bd1762d0b1d2b1c05e9c887baace314ffd3a6e6eaeb36f92c6c37772284b917ca64c9d7f77be64937b72ae5ba151fe2e9d38a76d3d3aa72d19ad020904d0a2e4fcdd3a095c509b17dc67d1473b83d7bea1b5aa09354ce99ffe6db93a70e263f6a6527c1073d1553da5cdd573f2fe8b81ba3c649b267f4dd0d43e1ea4bd7ae5f3e8ba1ba3b01a132a27beb8fc1fcfa0be6e8eb1f3ae3b21517e24fe1b938a715a274fcac9e8c87daa19c97505f93f274fcd9dc54526f6fb827a282db83d6bfaa8ac312134c499ff00e5e565f1563e9c29917ce8bfffc4002d110002010304020202020104030000000000011102213110122041033040500413225171053261912352b1ffda0008010301013f01f5acfa7ae39e51a6747f48b8ad3ae51ac7d6f42d569d6b6d5f35a2cfd3ac705a3e6bd14dbe34fc1a71c171ef9cf0475ee9d3af8f46af977c990d9041046962111f167df4e747a2e3df18d208d6749e36f74f3baf6539d1e887a77cb1e89d24b7aa0836904104104172e41041b59b0d86c67ea67ea6574ed7c96747c7be781678aa6518f9eb4f365725cde7d182ef5b0e45325871d174ccfa55caa97f010b4f375cfaf816f65b8e0dcdfb21359e7e5c7358f5458c162c5b4b1617b31f116be5bd3cd6396745765a4c9936a2c895ac1b5975ecdb382eb55766c66d6432e5fdb5de97cd73c979d2ccbb2ecb9123491b510ffb25a37265bd54e46a3f9523a931424549a7a50e5696211b4da4244236a36a36ae0b5cae6b9e0c332429d2c4a370dc9b894cceb3e9cb276a1d2f2535156345662baf6ae1559bf776614924364245b47a4265c968c8fd3862fe45d381d10537503ce9b9a2873f03c96a9f37e8cb3b1b44b2ec8305cbad33e8d8dad6852c74ed62fe68571cab8e1a9d7c6d7b170f3679bf44c221b212d2dacfa234829a9a6554aa908bab9bd33fdac7ff00b157f689daca943d30ccaf7f9bae7d7a10d9766d4422c32d04221a2fc590619929a8ae99b9946199450fa17748d75fd0bf928d7c731c5e8fd1e5bd3cd7a558921b21103d2e6f2131a48b32211836b660c98660a5c952dac89421d9a65584c77b98656a1e9459f07ebad4a7cd0f3a43e36832591b91765c726092c5d127649765350d2621dc5730cb35060766537453fd0ad2878ff03baff1a60575ea59e2fc77363443e582ef875a60bb2c89489437222c6050c70f5a58d489951943b31dd14bb15f5519451663b32ab432b17ff75a31ea5c115d9f0b108c1d7358324c17642d2a20bad73ac89ca2ab5cc987a61986517b1863b3328574651d0f274519f52e3e4cf27c3ad7b169837490d9b50d248bc6966b4dd0b44946b91598d488a8ca28b15e64ca28ba159b30cede9942b35ce60ce8b832abbe5d73ec56d3260df25c73049931c10c42b31dd09ca1d9991599863ba15c5663991cc90e55c88661e9d73a7442d58f45c3ae19d164ef4c2d32c49a6c55383a15cdba332441064c31dc574618ee8581d98f02ba1598eccaef055748e9155d8ecf4a70b9d3c9f0ceaf9658acca61b333a7644a36248e8b4174388d306508c31dd1d0acca8ca30c7742ba2930c64a85a6db332915e74a31c2493698d513c6359e183bd3b29c116138d6ec5e267ea5fd8e8685534675a1c32ab3328574618ec65087a2b12a46e4bb2d03b31f62ff0069575a518d6755c77a46f932589249247e8a6e8e8e8ba5a514c2e15d1a40f477474618cb41ba11bae4b667bd2c919452370c7548dc9361f5a518199e526e373279493e9a30650ae8e8577cab50f8276278411a224937412748e8eb4e96945969d13ac92493ce78499e38138653d94f674ca72b9577429153260c73b68c8d7a3a3a3b5ae1132fd102f5ad70f852d266e49932cc332b8bc14e4c3676678f42d58bd4b2554d8dccdc4ad20c7c5b34651668a1f5c6bb215992a4cb2c441d9debdeab8f5ce5be528965d973049bd499d63d6ac6198d29ad3e15b9308831ac282d1c2c90ae327dff00b5b37365e0dcd1be0fda8df4bec94fb1a25a1569fb55cc93a449b9a3f6325b3bd524c86c49365542503a1221b4468ae53765743a7d71c6c40ac382c4266c4cfd68fd71d90d766055df8dfd19464c709327460a72534d0dbff828fc655297d95781aa9c5e0ffc6d4440ff005a5fdff83f5b70f1257e2743305110436caa1164b5efd7b91b91bd12996251b91bd1bd1bd1b9329a25fb70674c12282c4e92619bd3783f6a5fdffd9479a94bbffb2aabc553c329f3ba13a515f9e97e3d9053e5a666b52796aa6a734a813698fc8e4bbf4b16748208d2085adb8d3449b9233ed464c122d24ceb8d304698d3a3277a6173918b2493c25162c58b162c287d1b522aae454dfdf62e89116e0b5c98e18302c99677e8cf0c6906d6d9b36ffb995d6de2c26e4b976cfd1bbb678fc6bc4a11551b9dcfd691097c1b1d91ac887cb0b8597b6493f5a445ad63f537d9fa0fd507eb46d4be323b2082384fa33f02ccc7d0cfcbc2fbb475f5d65c57a1fc2820b7d02c7cabfd8ce91eed8e305d7d2493eeeb8e59fa9242f124c82bba363655e2697d1c7b3251e34ddc54530e883cfe2fd6ff008e35a28506d4cbad25a32c5763b21a7f5b0d9441e3a2cdb43ab07e44bf190d94f89246109c97641936d883a1e0ae882ebdabe6af0b81a82996cdf08dc931d73a5cbb2234982c8eb4b1925a892ba25bfaaa3cee989b95f9554ec8a6c4c97d2c5a7475c23749921345308a92626a4da88945caaedfd550941962b68e51742bb20da8b22c651d9722e4a1c245cfd6db2aa12f4d8c9063e0e3d9455626e4922b90765cb8aecbc8ab49e0b2647fc908ad43264bb2f031abeb6e36f8909911ebc14c18d304b36b7a4a92ccb21d12cdb0cbc64a664bb6659747ec2badb27e73a4c7a16945328d84246d4cc337c33749b5b14a45d68d32e960b1d336b84c94cd89b2ba122ba61fba07f021336c7a29a5b15892e8bc1b59b245fc4a21a1d126c6394ca6b68754b2b8829aaa261166ca70599e4a9447ba49f8306d1ae2a0a6c6e2fa3ba28c182d22845c9945744ad25a2251682e9976894915d4d7d02e0ecf851766cb9b523052e51554cdd236d974cb40ab82969a32554cb1ff00ca1433648ae8bd258aea4dfd256b878e133a2d0525db12921336266c946d92042982ed12e9661ff9158694b8332558f9f25b4c6b91a87ae19bd9b9548c69642773b37d8564cf1b725709a1a699bee56e46e109b4d690ff00b1c47cfe857e4d498e0aa837cb3713244a2e90b7366514a68dd2bf913b5ff659891552cc33f69fb8dcdfcf722b2e75529974555247ec6d9bea14b44c145c94659b58a7fb1590da68c1308de8fda915569bfa2a8eb48e509a2bf15cda9744a46f44a653336373478ebb95dd14da4a2a925221346dadbb22bf07968a77b267e8ddd14e35649304a667574266c8eb5c328a7c75d0a51e5f078d611e1a1574b3c9e14a96294cf1f8dd7d947e2a9c9e2f02a4ff00538a7c6a1e5e3e970f860776251ac6991d099b5ad3f1bcde6dca8a5c95fe3ca96ca67c2cfccaa695b7b15373f1684da3cde36fc2f6598bfd43f2294d4c8db6eee7e96ab7078167821f0da9944f8daaa971053f9de559523fcb552c1579697fd9be8451f994f8fa3cbfea5e6ad4536fa59d1dd14635830c5c9f374c911f52acdea8aacf94e8cef9d54fd455633ad6538d6464cb3735ea74c98fa6774538d5e0a383204b47e9c8e8fa562b3e187c19322c7b5a4c69afa09e155b85566675775a2c7a6745ae474175f44ee8a6eb5af05175c3b29c089d6495a3d279598e9fa2567abc14db85566519170c692d19e13cb6a6435f40ecf83b3e155c567c598d31ecd863e5bd5dd0b1ad62c6acc32754318bd13cacc74c7c853c95b5ab05175af476742d5e8b57ed74a634d7c6c1910c820767ae514d9f08453816bd68b45e99e591d263e1e34c3234431dd0aeb5766648115d8a3875a52742d598278cf384c74c7c2793ffc4002b1100020104010401040203010100000000000111021021312003123041401322505104613271812342ffda0008010201013f01f1bd7357891a498aa5260d232c523e5b565e47f1fd735be0e99676293b514eeef8fab2e6fc5169b2e79f048f7c96ef99b49b3b62fb1e2dae3a22eb8a1f1578f8556f92df18e3ecab83f2bb6c823e357be1ebc923cab6edeef3e4593dfc7af87af02e724f817266c4a08239c79ebd735ce63c31c17e06bd73f5c64df08238c10411ca4924c7937ca08e5569f35ab7bbab6caa52e104e4c3b6111c170d5f7f0559f2f5cd6b8418b648215a0d0a118816cc230d11168bc5e0ab0ca2b489f1cf1567cdef92bae39199b6c5c170d72ae8929e9c1da41041922f04106679d5ae6f7ca9e136c99336964bf87933e557ab5ceadf2d5b4b877196645693b9187642f0c9bbbc1dc4a24c13e57ae7571449a368c232ad844c1dcc4db3b992bf442676b46559729b3d1b3326f26d5aa5169e52c964dd70dae757059becc34689c5b24323fb1283b4876ca3765c50ef13a30c72afb469f9171f7c9f0d5fd9e86412912ddd5a5a25330cd59705766d1fe26b36ff00162b426558f1ae08ab7c9dd6efeefa324364230893660c3239cdbbaf54213ee42c1a66cd0ad578d70457be6eda5757db308cbb4320d10efb205c646a509b4ed8783b1a368da29fd1bbecd7895d5abe6cdbbe85766cc225996644649661d959f0d9a2a452fd1a66d1a63c31fa76d3bd5bf12e08af5cd8aecd70d90611dc4b14db0412ccb336d9291b346cd952813946862ca829fd1a3685956795e25c10f2b9b3d5b0cdd95b268d90cc23028317c3b7ab6115213863160d1b469d9651a67f63b69df4fc2b82b34d3344a317668d984aeaccd9846590ced6294eda3668cabb160684685934c653fa34559453942ca29e156fc2b82b5787c24966cf7676d23d599ab6119b2d9261de22cecd414e4d336adb46d0f0e4791651a6699a67b3d5abd7895d5ba9be4aecf66edeb84184773136d98920d1b21b766da76d9a1e509c3188d32ac94e50b0cab0c7947a3d5debc4aead5e47c7df0d18b7ae1b3b60c0a248526513cb46d0b0350c59567946d0b0c78368f4620f46d19f1ae0d9be5ef86accf449b76d21c348edc9a63c126ed946eda3684699b42c31ec5942c3343ca168a45b3f6691b567bf0ae0ecf8add95a4f4691b2ac23506cf56d9eccc986299b6cd319b42c334c794526adecd32a3684665dbd8bd94eacf7e77cfd9b1dbd0f64cb1a93464c23ea23eaff0042ad31d299ac1ab54a50b28d31e19b56d3b7ab3c90da220c2327a3f47b29b3df89727c33c62d5618ff00c89fb8db345754bbc945661d95b4c7b368464ed9676e08347a32cf63d9128ed220ed877ab7cb266f99e7dad9d876a56d72ac7b3d9ec785ca8aa51a16ed1931062d9b6cf63bc11c1ddecd79b6638be391a9455e8abd1ed15e9f2e9e18e10ea8b6d72f466d99249170f77cb66979b5c9db48dae15a9476b69118368d3e346d1568cb48ff00e51ead045dda2dec8f0bd14bc90411e0c926c5c5ef86aef0699a66533a94fbe34658f288708d214dbb5fefc11e2830b966d8317edb64927c4f23ca368d88ae86ad16a29846d9b6411697266457ccf9e493b8ed3168476c9d8cec643426619526b97ae0aef069dbd12d1d899f4d0a948f4695a592912d215727749304d98f08a2b5518279be722188c92cee67733bff00a30fd1076608e18f0699a364d9cb20c232dd9e168aaaea24bfb6757f9ae8a9aa7d147f26874275389d1ffaa72dca4bd147d6a9cb51fef07d5a54adc6ca3ad4f514ff00cb552993085932df3767c7b59dac8664c90c8676b3b4ed206f1c7289e6d49ab6190393241b5670d1d952a367d0ea37969ffc3a9d0aea784b1a95251475a8a1653cfeb1057fc5a6bad56fd1d2fe2f529eb3ea37b2be857dbdbd27074a8ae8a62b72349a174d41095e392d956bceea821be38642f0e518641932433439b6edb26d866571dbe0ecf56a4ab5cb2649664c92cc995ec96c54c0de3cf0d18640e609664876cb34659a37e684ced343e116948ee9d229a522118308fa91e91556eb62aa0ef6cdf9f64221a348964b32cd5b668cbf3c936d9da45fbddbea47a3eaa3ea49ded92fe0e6f28d993304924b32c433231797641ae50657cc820c1064c99f81b20d78346dfcd649249b208f91b14a7f3a0834499178f2f8bf0297f0260ee3b8933e3cde1104470df91fc6dda248460c7966d9b63c31cfdfcffab437124a7eed066cbcbb35f226d3e36c7d6aa47d5703c9d3c33eaa453d74dc4470d137864321904222fa366be0c924924f39246ccc94552af5d6e60968c362c18356cb68a6a5a9f80be54da6ccf64146c948abaadbc196caa94611dd69c9dd04b7052dcb3a5d59134d79b46edaf873ca6de88cdb07723077a44cb344267695282134441a7261b3a75ba52cf1d7cb8f06cd0e84ced8b555769ded9b4659183d8a893b5194cef698fee44b4c86d12d1dd0ff00d98cff0065184bf033c95decd15e4882948c0f5832896ccbf67a3deca66070515b81c10db168faa92474faadef96094492c968ee32c823cfbf025c2a5921418820ab0649c128c243706074268cc192a4e0e93959f443591c2477292969313844993243208be4cf05e69826792cbe2caa60cb668d9830edd928868893bfb0aab953fa134bd15c3461225a462b3e94b28e92a59da6bcabe07713c16b9752b83bd997ec8a97b32d0a89476c0fa89281e5930cad342894286f6529b3557fd3ea2974b3b1d3a3bdc1d3a9b9ce4e9d7dcbcaccfc1d1375ae0caab86579160c23ba475b1751a1bee475686535d54bc8faaa7453ff00a22ba1342a141d3a5a68ad74a46954ca9ba52f66086a1a3a5434e7cf9f8524f17b2aca1a50611b160ab2c46522a6d9de93d15aee583a75be9382a7a284aa6555e472aa30d1af676c94529c7e128cae1d59499ded23bdbf5251f77a1a8624869492a942ad56b034db3b24ed74b3a942674ab85928aa27b58e647534bf655817de8a65e0e9d2e95f84e9be1d59665b3b1a346122a6d2328fb914d6d378d8ab87feca6a49ecd0f730386f42a156b183a72d455e8ad40ab6d24cc28828c3fc2e8a5ca9bbca83b124554b4cd99932cc3444a3b3057f73475684d49d39743cc9456aa50c5d36ceded6d9465c8e1a6764984b45332859f9db2ac724da6273c1d12c74348ed2ac130c50caaaa5232aa1fdc5509fda3a17557e9944ac154b297028685460fa298a84be7d23cbe6aa698aa4cd90af099d4441a477a309e872ced69a36c86761f4a4a7a6d25f82a7c394ca2b933c1c33b532ba141955236caa94a069b14a66121554b702497823e5ac31f1893b5a35755b42a93bec72994d4d95a49e8a21b1a4d0e17a1d6d9554d9fc796f5f85f5c3653845554be3a156d0ab4edd4a524d9f5618fef474943b751e0a2a4aa527d1a1fa30ad9fc1acf05b2a70bc32d1df2b23e9d2cec4bd911ecc8fa4eaf653d0a57f7f87d32addf444af34c09fe276b8539435e6ca29ac9fc3acf0a0ab7c52843a5789550269fe1b4c7bbd3b2be14ec92a7e3d0abfc37ae1b5c1109156fca9b42a93fc2539e14e51abac3b3df9d5704a7f8258655877a30caf7c3d156f9478b2855cfe09e55f4caf2b8539457ae3bb427e355342a93fc02cae1b5c281e57062c1b346fc8ab267e72c32ac3bd03dde9d9b5c55abd79a5a1553f39e55e8d95eeeb76d31d98ad5fc04e04e7e3bc3e2b2b85595c6ad8eeb76ab9c78fb8dfc359b3cf15b1e1dd6570a4af87bb5567c6382f0684e49f3bb2c23fffc4004c10000102030406060803060602020201050100020311210412223110133241516120233042527105143362728191a14050b124438292c1d134536063a2e173f0158325b2063564c2d2f1ffda0008010100063f025c7a125c7b1cfa0469cd37dd7f6113e1e904d1cdc15a85d0d05b39299129c941f8468d9d171fbd495f6e8c3b4aba65dbcba15ec99e5d3779a60e7a5fcbf21afe06272af60e1cba4533ff003274c937a1a8577c2a1296904668712883915453142135f91dea4f587457359acff12537a6ff00350c680a29e7f87a29fe2681461ee9ec48e1d17a07fde695065265e87fdd4134c937ff0077a3353d0c7b15e9a0468c750af42131bc2a742aa46ba33fc40d27494e29886879e7f9067db0e8381e088ec220f7ba3114fe12ac6ea99a8265c514ed21bd1e4a991d034b82703f881e7d03a5fe49c74b8f2fc60a2cd66a4b22b7acf452bd0d99ad85b2b2968c965a36565a28d5147bc7b089d17f9207dd5e8d897836b9fd133164f4f09ca73ec0742689289fc433cfa074bfc914e3a227c3d953a74fc0565d3c964b2592d90b20b666b25592ca6b2d116ee46bd8798e8fc9433c97a39f299c3fa2382527a8c162cfa34d39aad7a19ada5b4b3ec69db3073e81d2e453ce87fe680f167610cfbbd10a09f3566aec9c91227b8a8ade5d8390450e81d03a2345344fb6674fe7a0e8f33d899fe5705de63b0827a2d4c3efaca775dfd5662b08278e5d81d05351d2ed03a23f04de9b473e8431cfa13fcc18783bb0867dfe8b7cd7f1051c1dc4ff004430fee911cbf0b5fc18f2e9c31a068863a121a2b4fcb9fcabd87911d109ff0022adacff00dc9345e391406971e8d564b2d0eed330b062976ff2e9b0681a00e0de871fc20e84b25b6b6eab6955cb6d6dadb59cd62325b6b696dadb5472cd6174f455caae59e8ce4b3516ed30f6113c90e8c4f815b59eeff752a51e426fc5da3ba25637b47cd51d7bc94f56e54c0d599d3130df6441278582fb5bf253be554fd964d5567d0aacc2a381ec1de5d8008687f4295fc39ecf3ed9c3b0883dd43a27e051dbc58a336593d7ff0067f543b37689c4706f9aeac188b006c31f558e238fcf457b6c2e705b9eb182c585c0f41fd39dd0536834c43f9ac41ef7612e8fc939bc5855b193efa3f1a6f97664037ddc1ab0600a6f249e7d966b30b72d95c3b0a50f259eb073527f5679ac0668dedfd277926a086879e7f93e7db45f3ec220f7ba4d1ef382b6b79a3f250fcbb12d85d6bf964b1ba4de0de8ee59adeb656cad90b6564b656f5b4f0ef25b4a85626aca4a87a7c54e13cc32a56b64c789aa705e1dc90e8143c90411f253e3f93f1eda7c47611473e8b937ff002ab47bcdfec8790504bb82c964b2592d95926ef7784291c10fc2dd39ac2d9acc35664aa43256c00a9756dfdd6d4fe6b3d146103e0528ab7859afecbd660b83fc4c19859aa85c16133589aa8e92e4b87428af35c61bf88405a86b1be20af42783a6416272c8ac8fd1385420d9e4b35b4b682cc2cfa7968cbb6ff0bff34e616eaa28dd3cfb1cf4e5d0ae8dcb19968e2a7764a824a1dde1d83b9f45e9a7fdc6af898a19f75403cba25f1086b46f28c3b0611fe6299a92ab4541f559acc05bca98653c9672530d21bc5caf46b4436aeade5ff24d643c4e2af5a2d2c86a50a36b7c82eac38f929b44503cd3845dadf3588293cc586ee39abd02d70cf9992ea62907dd28fac59c449efbd258af417732babb47fcc2fd9e30779a945692d55c2b0e4b18580cd620a95d3457a1b8c27f24196d12f7c2bd0dc1cde864b25b216c85b016c05b016c05b016c2d9592deb372da72db72f68e5ed0af6a57b5fb2f683e8b6c7d16d3566d5dc59316cb56c05ecfeebd97df4322b285a535d75d3df25b0f5ecdeb61e164e5de5dffa2da7ff0022a13fcab6c29417b5cfe0b2d39f4a8aba1879f60de6de8bd35df095667716a825433d0bf1cf9377958cdd87b9834e732b0058dd2f35d607c67f2a05d54068f3aaa327f252384f92931f15dfc487ac4e679e89c0113cc29c463dde75579f087f1354b550a5c8494841baee379122ede3bcabce8d0bf994e25a07c82ea62de58d85626c93443b4dc8dbc3d4da358df7556fc33c8abb67b4dee4e77f757a359cf986ade175ec98f768a7658a6f785ca5198b01f92c41534f11c14eccff00361575dd5c5f0944fe41b0d5b2149b45b6b6d7b45ed57b72bdbbd7b789f558a23cff0012acd4396fa76a791ec211e89f24c3c9581e29928473c486996dc73b2c46247717bca9b952ab11f92c2daaca4d589f79fc0299c2d42f7dd18562058ddeafda8def9ab963863fa29c575e29ae7b439fcd49ef9bbc2daab96081f3cca9db635d1c0957a2ce279a8af86db9666f0de85d71054c456897bd252d7173783aabae67d161617270f56baff1273af546e5d5c4377c254adf6693bc4d57acb188e4e0ae8885cce05016886d6bb9a3a96c8e74283601beee0b536b68881bb9c15e842e293eaa6c33e88d650f896aaddd6433944083e13839a74ca6bda29dfa2db2553f24847deed620e5d8433ef7442847cd7a362fb8d4c34cd39bcf46aa110eb49dde145f11c4b8e64ac1f555aa73f621373272528427cd75b186b38a2db34c33c5bca9dcbe79ac32f90537b5c4f92bb788f9a9dc711ccabf15b7479a989ace2dd579d0c9f308375108379092eba0b87c25183660fc599c90836168686d68bf6ab4ff00ce6bac88f72d827ccaf6577c94eceff91556fda69b1220a70536086ef92bd0fab772595e6a9459c2e615eb2c5645081c4cfd14e3de6c4e2b139ae8bc466afc1c6c52d872bc5a47358f09e2a6e13671192a69e2382bd6737a1f7a1957a0babbdbbc2715790a4e685d155385ba8aa25d3cbf1ad7703d867d0c911239761e4e1d16a867de5e8f7fba83a5c144f35aa832369765eea2f8ce2e7baa5496bad3d5b4ec83995afb51bb046437bfc90120d84dd886372b8deadbc95e146789cafdae34f80e2bf6685ab85c4ad64588d67ea56aec8c2216f2a742fe255d8b1f591bfcb62698cc30e1bb6026478e26e7648be2dd6346f715abb14336a772c9074484cb3c3f864bf6888e79f7689b6784e2416cea9b12139af989e172eb0bc0f7eaa56883f36af6c1bc9ca918bbc98550443f25584f23e4a70c6ae1b91d444240ef20d8bd6355e691e454f65dc5aafc29dde216aadcc039ee5adb0ba4782b91d842eae26b59e17e69d7afc18bcea15da4583bda722af588fabda37b15c7b6fc23c6ad2afd9ba88be039293b3d3319a11203b571c7d1cb5517abb40cdbc53af27497358683b6cbf10cf855068cb46d2abb466b25b2b6743fe2e9bd0e83503c1caca78197dd31dee0516ee28f13d9b7faa7448aebf11d52e5c10b65bc02f3eca178b9a7458a6f38e5c93624576ae16e25559eb1693b2d72f5bf486166e6e534214300c596186372f5bf4a38dd39378ad4d9dad745dcc6e43cd1b47a66d541dc0843b38881a37358b57639c0678bbc56b2d16775a2273344d7ddb8d68900a1c0b3c193dad95e71a29fa56d510b3909a1a82d0ff13db54e8bae644f75a6a575710c087e087fdd34da1c4bb8b93cc37c58933b8c829364d0bac749534e142f496a8c386e038b17b3637c9528b68b0f89abdb188ce7553b8187dd526ba6ce055d8ac611cf720f82fc255cb6c19fbedcc2d6585faf867eaa6dbd0a2356a3d221b7b89deb5d6375f87cb72e0f527741b7dd75e365eb536bc31b29f8b4d02ab7b53aa0aab616c9591d19acd66b3ede09977564b2ece274dfe4874027fc9466cfd9c5299ac352d9379945c6ae5c4a0e122e09f688f10b9d39732b5f6d6dd87dd6f896ae0c9d1cecb7c2bd7fd3714073aa1af28b3d1f8e278a540b5d23162ce7884d5c7478ae71a5d064af478ad64fe6bafb43a2463b30da8448fd5c0fb95ec67e651870aced8f1f80340a4e6dcbcec8203553e735b0e6f9395e7da8c2f34754ebcddc54da6454dd5ec2aafbccf77430af03becb150a9b6884c361c4e237a8770b445ae12644ac336722baf810e3b7e8e089b21af81d9ad55b44dbc782d7fa3c8bdc02d5da05c785554d3722e5b9dc10b2dbc89f72271ed8b2468b7a95746c85b01518b1b56642f68bda2a3c15b5db33b5f31d33d289f02b6322edb9f807c906de25ada0e485e4e881b761b7329f1a21bac146fbc57ac581ac91f18cd165a4b4386e684630043e7399aa3ab3ac89cdcbff00c8cb5a7b935ea3e86662347398af3b14739bb82d459bacb41ff8af5af4a75915d5baefeaa6e218c08c1b0cd8cdee41ef1ad8bc4ee45fc62aeb0c95cb132e7bdbd448f6d8a5efbb3ed6bd1bafc4d57a199b745c8d51b8f041afeba17766a70e614c757178f14e6c4c16b67fc94af16c96aed32816aeebfbae460db01bbb9c84418a1bb65c3a171fb3fa26d96dce98fddc4d3459e9c964b2d39a99799aa452a9155228547b552ead90b60ad87ad97ac9df458a73f259fdbb670e0eed587b088df7ba375c66e7b6402baca052ef263221baccdce3b9ab5567eabd1d67ff00973f341f6b044087b109ab570fa883b98c5afb64ee1d96f15ead020437467e54d941f697be1c635c3b91b358ad0fb419a0db7fa31a376b21e6539b631a971deedcb5b16fda2d27ddc975703f99ca7132dc15c84c6347c2bbbfcab59de9cd5e882f296a643927324e04aa1ec2bd2e07a136d153044e1c548a966de0afc2ab7f4d0c2fcc6f55cf7395c89b28c1b4b7d661771dbda8b1d3b877216ab1c411c77da330b83b4dc7ecfe89b63b6bbff1bfb7cd66b696d2cf4ec8556055863b68a3b2a05968693c7b08a39f42f1cf70572102f7146cd6522d16cefc4dccf2e680189ee46c8c3d61f6c47e89b06ced2797128dafd2ee935bfbb19946d51e1eaeccd385837abe76b26351f49fa48e2755b7bf5460585f79ceda78dc9c2c10e4f777a579cae5a1f12244f09538b180770922d8b0c3fe6afc495de0b0b1bf4540ab968ab42d854a2a1545555a2a19f675586bd0bb1fe4e5c54daaf42a3b7b745c7ec7e8a729b38ac40dc72becc508ef57e09c2769bb8af5bb10ba4edb57bda6e3f2dc782f56b69c6dd9771543f923c716e8cba13dcb2d38749ec1dcc0d25efd0eb2d824233fda451fd3445b4c4ac694a0b79f14c86daba2390d5817aee2795ab8648b1c1ffd9ac4442850c2319e2fcb61bb804cf5c73e4ed9190fa26c5b6825e6b717abd818d6c777846cad6c6ac777d949b5579d9e9cc2da1d864b0aad570e8d3a5c0f42e45ab3f453da61c9c15e69f9a91c113f54199ab9185e6f02b527ab8b2a0feca5106b203beebd6fd1a75b07bcdded5cb7845f01b261c97bda409c9c364a93a8f6e6346d159acfa19743359859fe19bcc4bb57f97610cf16e899c949bb0325ef286f3fbc9aaae6a1ba2d223a5f2099e8fb29c6ef6a7fa2f56f46811e377e2ee9a6b62c42f71fa353a3bdb7dcddeede53bd236e186781aa6dac43b211b55b620d63aa26551ce7f905820b7e6a5468f75b259acd66b357550fdd6f5ff4b1b1570ac2e074d5528a8b150f4a9d0c7d093aac39857e11bcd53c94a27b4e3c53613a849cd6ae24e598705ea7e9494ddb1178a96d407663710a1da6c6f17a277020f7b0446645a50b6587159dff0065319e90f67b56fdd0737e7d1a53453a155850d39acff0508f3ed4f6105da3530fe6aaa655920b2b68692e7142f6d3aa9af8c3036a39957c9c52a04e2c05e5c66e7941bededb168df779abd13db44abb9725a96baed8e0d5cefea841b08d6dda61c917dd24f2dcaf45706ae2a9d2fe2e862685868b0158aab153a345c0aaf438742b50a9969f74e6107b0cd8562a1505b1cc8f1e28b22013dc51831c60e28d93d253890e5d544de10645ac2bc9b1fd1806ce43bc9d06d40bacefa3da844826fc08956394c680450ad6b360d220e0839950a6ea058335948ac54d392cb4d3a32fc134f3ed9de7d361e0e53ef1c917bd4fe9a1e23cc994da02ad0c477d13596493dcc852f9abf6971713b4531ed021c26326544f48dac754c38014fb358df7e2ba8e73772eadb721f3c90b3c176b1fde76e418cc82b8de8d34fcfa755c16158c2a57a15a853674317466dd35ab37858b61c83a13c38710859ed2eeb5bb27c49cc7ed774a7d9a2ee39a7438adaee72f56b51ea5dbfc28da6c831e640de9d62b6fb17653ee14e86fd33cc6f08422e9c375619ecaaa9a29a70d16d7e09879699f64ee99e4a5b82e415e53fa28111dc89511d63702c7e2a777928712d15891ead6eff3567bfed5f57ab3d8219c2007453fd17abd95a61d961b6b2fd494e8f1c5f86ca37995836dd462d6bfda445ef1c94dd99589c02c9eff00b2eaa0b5be755c3e4b32b69df5599faaceabfe9626cd5410a8f1d39b0ac6a95d34a2e0ee872e84d4dba4b5f56150a1b2bac70010b47a3e775bbb822c68fda327393ad111c5af755838af53b5757106c38fe88c38cdbaf6af54b49cb60a36ab2b7e3017ab46ff00110fd91e3c9163e8469d4bcc81d83c0a93e911b477e450fa34d1976ba961c4ecd4b79525c963d8655c8bdd57394568998e2ac6f150a2466f5708b5a0264361bf1c6ee08daad2eb90279f8940f447a39b76f106249320c3d96045e7d842538af0d5798dbfc2f2c64cbe81622b2541d3c964a864b015d6366bc3e6a9d1c2b8155d327e4a951d0a7426dd305d681818f9a3168fbe300e28da43304f8510024d88dcdabd62ce3ac6e6b56fa5ba08c27c616f6bda54a27b56d1c17acd9690c99f915eb50a91052237a0d8bdf651fcc26c485563b7a93cae2a9d8f1fc2dde07b569e939efd9689a7c67f4037bd16bf24cb44613ae10a1daa0d03ccd359e8ddb7bf5ae7787920c7cf58ece69d11f46416a8fe92b4d5f10c98b56d327c5a7c9081626c9ceda7ef29beb13befe39ad99bf89edeb554a2c0575824552a3a32755aa6da8e853a73eea9b344c287668ef9564d712859437ab929b09d59c8a9d2f778216cb1d04e7e4bd7eca3ae6fb5684d8acf985e2871022d75619fb842242ac27d469a513ec318d1f8a1f9a2d750840fe3e237b5f9f49b676e6ea9573c39a9e899d94ddee71bad0a1b5b9353c0d987842707fb49757e6a3db6d158915d49ab37a2ecfb515f79c9b64b2ca2c56094b70f34e7c68946e6e3b91731b568abce6a25aa265ddd135c955ff4585af779d161600bfe97fd68dd35568556159cbcd6133e94d8549f84f466d5868ee1a66173d12e85c7291d92a7b96a99599c935c7ea16a629eb99f7458edadc56a5f85cd387fb23e17508e0b571ffc3c5a2d7411d4c4fb2d4453d544fb14477c55a9f61b4d3c1c8a731fbb4b1ec327b4cc2856b87b5293c290fc791c476aee8973a802891dd5f0a6f172f7468e48c42290c2bb08f5cefb2896c8d99d8feea03d948bdefad13b26b983127becb3319f417518d6dac77d18ce1e69b3a3df89c9b6787b711361f0cd5d0fbc7dd5284c0dfba9c4713e6ab55974f20b82c0556a39ac60b54da66397478b560fa7426149f4771d155454cfa13d1cd6aa2506e5ae899f751645130532233207ea1323c03363c2d7c21d6b539edf690e9199c47894d9b604da53fd1b6eabda30929d09f9b57fbf068f1c79af59854f12d6fef594773e81b3453d547fd511f8f676ae1d110db9c4fd135811232c869870bbf76f3fcd088fda7d64af3eaf8856adbdd87256b8b1762142a79a3098f375df751223c5e8f2cf826d9f385036b43ed1105f96c35196c70140898950149a25dbcd864bad13e616037ba1cd4a250f1e8dd8bf55742aabcc5cf4c9da6f0cd6a229a8c955c02b8ef914eb25a8ca1443f42a4532d9671d53b687f44c7c333b3c7ab0f03c143b7d9b8cd43b6d976804c8adcb27b78857998e0c51445aed8fd42c356baa34d334c8bfbe8747fe3e19e7db1e83dd9b1b40a245f97d7457726039667c939d96b1e9b0e15213683c91b83aa81409c77bb085ea76799110cdc06f4f6c304eac4dead0e8a6b0e113e6a3dbad243758f26f1460d8a6d678b7b908b6cf3b8b570c06dea00101bf4d5ff458439df658581507fc57fd68dc4ac50dab13485b7f554a8e3d19b0c94a2d39a9e638f424eab54db56e9e6b1e9bcd531a3de571fa1a108b069fd108c2be2e4bdde0b590f682d5453fb441a7984f84fdea2fa2ad946b8f564ee728967b46db687fba8be8eb4fb38a70f9a377d9bf24ef47c635ce17f645c07590d3a13b6e1d5aa5a4079ea62e17aa6c9fc704c3cbb576988fdf9052e2a0b37bb1af2d13612df2587e49f11fed2ede728919d9bdca0d96162b95779ab53a266c8455ae34513d76151219d8cbe4a1d9e08bb02109721e6a159614dd76b15dc745ccd90949ce9bb805d5b64b19faaacd65d3ab42a515e80e9aeb993581df22ab4e861fa2c147787a136e4a6d55d14cd5c89a2457253151a2fb3682b8e5346fa93bd9bb35cb7292876a81b3bc26478266c8826136d5029161f050edacf6d0b0c76a6daa06d377857ff7f0e8ef34d88cc3121b943b543c9e310e055f66ce61088cd88951d0b8f3d7c0a1fc7b3f010e00f3283477a814489dc6e5fd11e6af669b3d9709b56b5db10ff54478dc0284c1ed5cda27457d756d9fcd5ad8ca5f377eea29b452e6ee7c1447426ccc8baef24fb3c5a0da0ad36b766e3244c5749db9bc539b67bd37ed4b32afda1d8bc210909742a405b616d85b614db55969b8c74af29171bfc575775ff35fb441261f35d5991f0b948d3a176353dee85e67427bd6adff002d12571fb3a75b0f25cf4735a87edb7634184ef927fa3ed268ef67e68b5d9221ff00e1a351c9f677d586acf2460c5f611a87fa2d6b765e9f628a7046d8f893bc70ea9f05fb4dab3a111d0e2986ebb971fc791c0f6ad3a62bf74e411dc40577c466a48041a3b8c0d50b9d559e19d9152a2457fb28627f251e21cdee5289466b2f3fc944d5e0835719f742bfc4c8271862506262628706c42717bc4ee4c8d6b9ce29a4f329ac60038f350e105c171581b258dc7eaaa7a1756077dd57179aeb1a5be487abbabc162db1b4a715d5f08cd1658e1eae1f1ffb53747ebbca8ae5ba0eb21ffeef5fb3c68b0a278499aea2d2d77c4d92a31aff0027ab86039bcdd927418d500c94db56e8ba15f0b83b4de6e6aebb6b44c66b56fda19682c7e454b7298d0223289b199decf9140a65a60d1cdde1438e36f278e69c40c6ca8570ff0089b27dda84587b4d575d5b441c27fa2bcda3e19506d23bc24ff3465b339a98d875469644ddde41ecab1e263f1cf6f6a34457ef0da213d002257c2af6f714d60ee892786d7ba1399df89b498cf766a2360d6f3ee856b840cdc61817b892acb7b338932cd631ac10ce6379e49a2d4c9ee17b7150a1f76109a24d0288f8588ee57e2cc0e6ab5ecaa1756fb8e1c5110df7829db6f5e3c7243552b9cb43996c7b1dee6654fd14d8cde5bd6a9d11b0e20dee6abdae6b47c414cdabfe69d7e6e712b2c051702ed69c822ed968de551cc2b5a1b4e4b83b78d37e1a9efdfa044620f6fcc68f7dab56ed1228c189b0ff00d5169458fc8a3678a7a88d4f9ee4426c76fb176d0e48b456144179be4b56ff00611b0945ddc88a2d8a29c316acf8908833650a733bd0ea3cb4de5ab7ed41387cbf1c27bfb53a1ac19bdc8fd135a3bc649ed84d0d6b2429a1cacccf793e23f2684fb4c5c9a67f3502131a4cdd55aa807ac882425b828118b642f077c937d5dc0b4caf2106c4e9e10d9b7f45d737d9b27342d30b62267c8a8d6ab53e6f94a5bca7100b60b770c9362bc5e79e29add3c96d85bfe8bbcb7abd301619155a696c4b3e6dda461bfab8edef0de15d87143870053610b40b28398c94e2931de779c945871c02d6d66d4e8b12533c14afb80f10dca71a2ba2355268deaaca89a2cf496634169c96b60fb32afc234ef0595555a15e66ca0e6e4a457b8735cb408d0f22a7a2f20fefb28ed022b369a9af3ed61e17a7789b50b52f338d65cb9b508cccda9b13f7d028e50ad10f6e1941e36633149d94e4539ba5cc39c33ff13f8e0f1b9638642dbbbe6b0c40567d8bb4436785b34de2eaa823e6a29e2e253756c90f7a88c38b89b0dd8a4bf64805d13cd083145cdf76f4d375061b59cd6a6246029325a1468ef386189d7f45677c489125179a0c80f7bb00388ef4c8d15c61b9f56a7c6b3c7a35d7716f4eb3fa42a1de45304724439e292641b1dd2c2eeea6b7805109d96a37712c34f258dcab32b2592c94950aa3895d6b3e8b03fe4563a31db49eeb23c81b8a6c58dd7c43599c97ecc651f7866cad4458b1355b8828da45a191358e95d6e9e30ce615e8666d41b084d77493b95e916ff5435825cc29b4cc2735f5057b850890b2d1228c389b274735aa7edb7674186fc9c8b1d96993b61d43a2ebaa0a3022520c6c27fa220a6461ec5fb5e453e1e6c3fa28b648b4871b0fcf728f66764ed951acaf356626abe051f54c78cdb42af70d0dbc64d7e1281df91fc739d0ead2b1c327e4b1b085862bdaa9143bcd63682b1b485b616170e8145473ce4a14219dc6fdebfd55a620d882c226a35aa2b9b287b9c9f0a03043077a8ce8adbc1f855a48d864d47b41c82823dd5140a9a0461f79d2bde6ac32a498108968d8bc263fa2bc2975854188fc51a2bdc5ade29f6fb564e7c87bca05a210d9606c4feeaed9e65fc38a2d8b0c188891b3c55711ece94523d633814f82e1aa766d3cd36c70a7c2e8cca0fb6f58ef06e0b5316182cddc94c7596672bf08cdbc38686dd1445b3f34e8d39bc64de1a1d0e289b4a30e27b3283d86877ac5472939184fcb4cc6615d3b4dd0d8ac4223323a0456ed3735cc689ef0878e1d0e86c6666d50a37ef1b86279a246d32a9ad3ed20e03e5b943b4c3cc2b27a421e6edaf3506d2df66fafc95f6f76aa240883da370f9a7c2779223434f884ff00bfe3b3589a0ac70c2ca4bab8925d5bd644ac70d55ae6f92a4770f35b6c7ac70e7e45620e6fc95e6e4561a988f421c4900c7ccccee0a341b0303e781d13203c940e31093a20f92b44b38cf9285e28b12f140bb26313e3c5eee250dbc5ea15961feec09f9a2fdcd8ad08914dc818b3f558143fd9582cb0c49a5fb29ec89b04553c59e2cc0320e0bd663baf39db213224333989c949f9e8ab95012b616c05b014de0ace5e6b0d7cba2c7cb58185188e75c2dcdbbd4ac4cd5338baa4a79d88f08873d8a6ca1579943de6ad5c38435c7beaf5b6f166f92116c0f261f341cdcf78d175db5b8a30236cac3a2f3768291da1a444664839b91441461bf27682c764e447774e2d8750a2d45877a896389b3172f345a51864ca145c2a2432ad7627e6dc6c5ef4074be4a4eceedc29ae1b4c72111946c4a841e32709e8d59dc7f1c3a39e8c4d0b1430a930b03d6074fe6aa0a2e76618559da28739ab6c57d6eb1c5436f89e4ab18ff6e7a1878429a850f895658632bc9b0466ff00d146f92b3f992a25b221efeffba73fff00ee136cf08f550fee5319084b8f32ac4ce0c9af53f476266448ef7fd28f11957c13f55eac7c730ab40d08eaf1ae0d588cd65d2c0e92eb05f08b5f36dee288cf9e8bcd9791c8abecc27926b6d709b4e1bd3ee0d5cb7689b6854f449caf31c6484dd43bf45f6ed0575db43487b3241cdd042309ff002d17c20edf91534220da6a96f1a2f704c76f6e13a21da6150cd438ecd988269b19b9b5428bde949de698fee38d55a2cced98828a359ddbd451b8d543777a11ba9afdec3a1bce881fcaa3fc2b58ccee90adafe344ce41411e182dd0effc1fd13a29a88615869291aa0dfddb7f40ad27de50a0b2ae4d84cee3106fef2244325678f128f8f129f0a28b2ce66fb821e14e8912b682d9b8f0e49e4f79eb06c9c4d526d218fa04678ccf3e98434f02af5dd6415830bbc25568b8a0def20cf4a432f671514c16dd86e74daa4af315f667de1a2456ae26c9d222c3c90737416ad53f4888d41df552574ecbb45d722ddda248c3393a9a1eddf98512ceecd86f04f6710a3595fe61088336ab1dab8617a8719bb24cd418a378928f00f79b3568827c3a01fc71ed637cbf556a277340fbabd2260ba87823ab09fc98d1f64d4ff8004cff00722fd8282ede2aa2c639ec856973b206a9914f7a227fc0990736430bd1ad1c7fb2887f7cf376184e8b1f13c30b84d5a0ff00b6efd14373ab11d7ae35174438de090a2c2caf7d8e8eb080f3b9610b0d16272da5b4b69626823c9570298a8e5a02d7d99923de0d572d1f27212331c429bf826df7b35cefab56a9d592ae7a1b1c0c2507b323f6d1ef2b8fdb6e82d72b8fd93a758dcd03f5d041461bb23a2f0dc81de287436205e5a1af09afe3a24766f48e86c51404cd3dbb9c15a201cc620a046de0284f754b0c8a8315b9296e2e4f6f03a25f2fca9de6147e6f6a3ff93439b1dbd67129aedc9ac2ec277287ab6b9cce5e6a1df6914dea18de6aad8cef39f75580ef79bc89deec215a5fdf21587e23fd1361d7d5e1d4fc2bd201a2574487d95a0c4329b2e857e34c59e1ff00ec94a8d64383f4a27c6842eb5c535b01a6f20fb49c4e396f585b2e8b505929c0729476dd3c509381571871bff458952ace0afc3ab7f459a9ad5c4a784a91a2b8ec5ba6a46b0dcb96ed022c3a20f1a263682baeda6e820a30ddb2ed21e135df55228b1d93b439a55d3a1c13a19dd5d0d89e20a13cd4caaa0c5f92864e62883bb8f51a17866ad700f09ac54735eacf1b880af8ef09e897e543e309dff907e857ff00628678c451fe242e6f50dae005d4c85b329d532fb89ba801729c901be23d5800c85141b33726d4a880657540967893c918e209af49230ecf3f5783ff00b35670ccaea8f74f7403f454c8217f2c8ab301de3a2ae54056c2d958b0a003869c426afc075162f69a66d57b769b8fdb1973d155a97ff0e891571db0ed21e364aa65a2f8dc83b7efd0414e867407841da2f040e80774f4308da05466c5d96d51850ef5e9ce725184391df541d140a70099ea97cde6d4353a0c505af752aa20656e099406f6393220db6191d0d40f69b41c3f1a3e30a5efa77288acdc6fb8fe89ce7664a15a4d55716f041ac9327e22a6dbf17ff1b1619b6ee4acf12f1261d6813ed0e6dfe4539b081660d99a10ff0076d7c916af48361d1d1b0fc95a5f1475d1a1ccf20a0bf37dd931bcd3893399992a34578eb2201f213567b4c2156b007a817eae84b843fa04e6bccc8e0b674853c8ac266d5278b8571d179985cb571e8ee3a24152a37abccd9d179b9abe28778d1319857fbd93b44f785ef3687473571d9b741694e86723a5af0811bd109cc3a3c94b45e4dd5de29d11f201b5cd069326c4c25447b6f9786cc4ca877b649914f0d68149e48b7828519446ee7b4ab4434e6095d76869e699f948f8c2fe2513ff002285e6a66abe6b1bae8e2a70e2b9ce1eec95c85b4b54f2f0df09568717f5cdab5be2e2a655e2e92891af6cc372f583fe64b43de6b05aebde602b4ce43ab29905ee24b28028706289822f2b41e007eaa0d9acd8e23d98b9260b5c2e7229ae87b04514653d2d43475d4fd57566f3160cf868ae7c56ac9a299d15ab0aa5468bddd39aa55a72d1ee3b3d3ee3b4878c8e96c4081d0422de1a03868929697432a2378b4a0e1b9077898a7c0a61cef353a1a63b814cb4c1cc365344c5ade4e1a5bf90d567d3fe20be6a2ffe456589c505f3d35ccb68a25faddd99eeaa6db1af129ca4a4fcd4d91983f545a4ccce49ad63fac05a64a2963a6e8a001f350a34b144693f25aad984dabb9abf19d26ceae5e8df542dd56aee1fba881c439f170b021e90b4d7fca1fd5599ed18a4efe89d0233a52ab49519edeb27c11d5b0007809a9b453e8a4e27eab1d5621f45d519b95e8ce541795f8181dc15c8b472e654cad5bfe5a24b52ff0096892305f9f7744b7ab87699a0f10abb4da682a5bdba1cd511bbdb5d3c8e89f05e5a26814d4de1a2d2ddec577c264ad03c2e4358e02ed13624076f4ebae7c46373e0a0b1f5eb2524c2c12984ed32fc9f3d113e5faa3e6ad23df6a83eec550ee7798d28d7487b0c9c11831182f7882876688ebb0d8261416b04a8845824919cda99acc3e228c4b3bc10a0c2654b80faa6b4bab0db747241bbdc836d0d333598501f022619d792218e2f6431bf82842136f421b959df1597354f9a89121b354c73b678293e4f176754435b865b91bc40aaa19a0aa26af31f27f0576d1370536bb45e34284cd55c92bcca85276d0d179bb414fbdbf407b73083c6fd0d78c8e9f75da65b9da5bb98fa145bc34072694422c3a5cde0be6a0c41c131dc95b21f89ae519915d20ad0f0e739d114463597ca6de2092269b4da62bbc220fd5417741e3b49ca7f8d88d3949395a59c6e9fba883c2f9ab31ff6daaaa47256d69f03939dbc3931cc6004c940f7a126726a847dd4f86c936abddfb14d8ae376550b15669ad7558d35f928cd8830e610305d89cec93234375d2faa7081410dc6fac668d5a810ae39bb2510eaa907103cd66b39aab42c06ef9a9bd6201c15f8270a93f0b9499b215335ef0522b590be610dcd39689f75da2453a1bb23968215d3b4dd17b820ed01dc135da03f82871877db5d0e45ba03902a5c95de29c98ef0940463509f68b38938ae25ebd5ed42604d3a16ea850be140784c93c7bc987814dd2f1d1e7f891d85029b73e08c28edb8f4f1eea727f362b43794d41e5a3f8546f7a17f451d40f35607fba022de5fd1379514577328dfa84eb865257620a702a239ee01db97c41086dadd50ee38c80928d058e9eb8cdd24f8377ad2265dcd31909b8c0939fc74d16c3be9a78853874e4b81e0a5068eef224e7a2f0579b92ba5161f92f7da88deae9cdba03c66135c347baed124f847416a7423a1cde49f0cf71c9be48a9689a6a6abeda89cd5d0c2e5704ee700b560dd92659e2f58dffa50dd0db7450a3f3fd103c5ca0fc2a2b39a0789453749f2fc6515029be9d3995412d0c8cddac935c7784f0bf8545bd91626f24c32f352f92f910a231fde4c1bdaf56578eec937e5fa28d0fc2e511dcd3cf24f9a7cc4e428b5b0ab5c906da0175de39a8b14ff00ecd38ba97335ad8b2cd6a619a9dad172109941d693ac770dcbab635be434074584c7c84aa14e0f527964bac6e1f10c94db9a98a3963cb35ac854e2af05cd161cb45e1984d89f22a9920edc741053e11d17b826bb4322696ee6bb4bd9b9c99e49d744e89aede84ccca780dcd1643deab7aa86b466b5d994308aa2ccb30bff0078282f4d7f16cfeca13d59c0f028ac3c1423c93fe14f3e13a4792a7e269a312a0ecee36a66804414cf34748729f3d0e1c0ab93c2a1bf3c9447641c269ea29f70afe25114b9a7bdcdc4d142b5d081ba378511a769f9950e333683af14e73b329b0e1d495721e7bcf1e95d7898462d92addede0b9a9b68f0a4180052349f4248b0a1c5a8f10a5bc686c41a084f670d1e49bf443828711bb9438ce735ac7341a952993e49b1208225c54a1c84b929973eead73c61e2af97cab24f0e9992b8e1c9426841dc0afe292869a72c4a21e1341dc1c9a78432a03d58471635399e69bc9abffad5ab94b4b7b4c425d9610a8b258965d9d34758f5805e2a944d29dc8af9e8a14d53f9a723e48267d149be48a89f094ef893d3545f25fc498580073b35722527a35ceda89979763eb167187bc15e0a617355e8078dc8f3d059bb41e4bcb44cef557045b528c950fd1173daf2d4197b65637fd13754134960bdc64886ef2ae7b8a3b7c35510a07de4c0a2a743f7e6a1fc2a0c5225356a8872ba7f551f8813515c7bac97dd34cb27ab00228037ec1086da07393dbc24bffad5b7e5a59a5e5a645422fa9bbd8542ca4b0396ccd55a7a0c76b98d6a2d806fb3c4b1d5616aa76d80496233d20a78f1351f853bea9d3e08207e4ae940af9e871ba70e65103229c3928a3c944f25e4e516bb9506f50e6b13af482633c4649ad664da76375d9145bfbb76caba741965a26814e1c94b431ed4266a880d251bab32a6f9a993a1a374d616897c29e22c269a7928cd8b4df458230f9d146643c571bb9446784a86cde55de52519bc885f1150df24621ca49e27dd45bcd027219283139c95ae27c215a07b855afe49df1282ef04372b39f7daad32dce9273bdc56be7774b7cb4cb8b93076592c96c855605b017b20a8d90e0a4c12177b5aac2157a4543280f921e5255c814f1dd6394467cd37de4427b46fd000ef8aa857a867229aa2b53dbc4288de09e0704fe45313941e55ecdde26d5aa6bcd18f128782f246655548355e6d152fb917bdb201137a4ab32809615c3405745535cf1259d15ca220e4414e735c44b728aebd57514510cd530c413d5ee5898e1e453ae541299221ce96414371045539fa2efbc9be4a7c1c83f7c4792ad2ff0070ab50e41465162f85977eea03f85d2ad11cf8ea99ef1927b78bb48f84e930e2b6f6af126f65375149a758ef75753643f35fe1163b13be4b1c188cf9205c4b4f926c9e0ac026af3da405284c7c43eeaeaac240e6baeb09972527130ddc1cb0b81d388ac18970ec5c392f84a29dc734e1c934ce8f6a864e46898e142161da29c19b5984edef15250beed929b12053795ad7b856b208707688acf3d1161f150cf3929f14cf23da4566ecc68ba5e48575b9aaab8e4693d0c3c939bc93dba18ed05382d6be8e76498ee05422e6ce8b57028d9ca6a1071041de886d0ac20cb922450a73cd4b962626b999510b9102c6e25b7b8a0dd5b5e27bc2c704b7e129a672857f32bab8ad77915777bdea1f2714e1bdee0147f815a3c93cf17a87e415a63657e32b143e333d0bd29e158e9f35898e51cc33386e6f6346abeff90e2bae7eae08dc152be7a2856d2c9a563b3c33f258a05df84abb618b175bc1a50d6c797baf2ba964188b1589aef22bff00e9df75d6d9d902ee6ede839b08ea7c5bd437428fad69a5c76617ec8435fe128eb673e7da45620a19f92639386f63f4433de75531d084c3854a84677b8c95d870aeb0f89448715b78b6a026c40d96aca66f2da150e220e1914c7f8a5a01dce44f03350cfbaa09e72ed2144e34d1e4be7a1abcd3dfc10e5a1c14d0434359132d0fe48341eb1c4808c67e6ed9567785149eada38715e2671dca7295e4d9d5c89064026b90201575eaee6d9a75f860ba4997a82f21ab8c01e68427c52f0d1c516c2687c30ee0a0402cb976aa2eb5d75a5b29ab9062b5e623b714effc89bf0ab3b38e2faa6089dc8726ae7a5ee1e4b119a0de2a3bbe5a2a3a649a00b5aed8ee721c506b4480e94e21f92b9046aa1fdd6579fc74d539d7ee42f171f2579b066774d5d7c43778058936b23dd2996b6fb46d1fda5fe0e922de724f1c312110714cff007992f9a03e4bd5e3c2996939e6d4605e23920f86dab4e2505deec8af7221ff00f6ff00b5161789b256ab3bb6b357c6e4ce2dc29aff00094c7f10a1c51ba8be26af2298ff00099a04647b369e0fd0f1cd30aaa6c9313c724e1cf44cf155d02664a82483f3926c484e982a35f94a49b3a301c48064a4a1431b62aa111de1346f64a709a18d73a814a20c1cf257213487bb35671bf7a84481b0ad316585b92897f714d91ab95c39ac9e0724e73b352654391b4da5a1cd02524f31a6219e0836cce2e680af59a25caf8a4aeda1c5f13250ecd12088724ee1208748c4709de889a356e037ab4321d5a1a24b60aa89745964867144dae4d4d1bfa3388e0d0aed907f1157ed24972930068d332648be31bb07b8ddef57a265dd68c868eb1ed685ed9d11df0a75cdcad30dfc3b3738ee4fe755f135723451609cc2743b4cc06ba698cb28ab4ce724d8914cef66535fba7351619ef364a2c1767b41428ecda69ba5428be2155ad8664c89fd5398f8cd33e15511afab4f0458199ad5c397d14887b8792d5b2846e256a9f9e86b7bd0e9d9ff0018d0ff00350a5c161a26f9a613c13c7ba9cbc455e39a942639fe413e2c59300dd3aa3160fb569cb8855d15ac23984e64169d532b2feaa37c48c47c8bbba38af5c8f3bd11f40a011238536cb0c7591382b3b5b9d26b1c8b79a8c6c80358dc93615a278729a6c3873d64a49ed3b45b32a32bbdc8699e6d4f32133409cf7b71bb128d162ca6cc918b5155118ccc273b8513756e2108c4cdedaa635dbb923cfa0341f25047199d0eb8f9de6e8aaab02a4c2c0efaaca6a25b236f3d09bcc82d5d886b9fc772112dce3f0ac225a3258c80a70a1ea99e288a56ab79f85824a67d2112f7bcbaab6437fd94ee6b07ba54a2c32d3cc2905ccab43111d93bdea2051f70abcc1457fbce09d2a6b3f545a68587eca4054284e9f58dcc265f0e73e48c784253dc8c3bb369dcd6ad4598bccab743a48c68d2a739942298b2f7404cbb37379a6b990c48a6c51b055324db433229b11cd9d28a6dd97550bc7ab7d1dd9c267133d06e94c9cfe6b1999e09bb826792793e1516fb438730bd8c3fe5509b0d81a26da0581bf451dce1745d5783eebaf94eb5c16fc72fd74c584f136bdaad3122993415eb36812b33361bc57f128715fbb21c53add69db7ec281f24d830875b13826b01c5de50ef4b6975036427c1b4349a4aaad2eef4a88c57ed444cf36a816487bb693da320249967879bdf357052eb15a48da70ba838b714474d17c518a54571d914c6b3bc985f93ba004407e45607b8798464ff00b284d06ac4042b40d6f80850dee98bd428b22c10e037ce4bac63e1ac36867cca01af699e55d2d6d9ded734702b30bae8cc1ca6ae7a3e0ba23b8b95eb745219e1585b5e3a3ae8a2f784668910096eeaa736cf0db099e2f0a9c57fac5afc4e2a70e2ba1c1f25d5c279f92eb213ff0095754f7b7e6bda5ef3572db043c7d54ecef10cabd07ad67baa25a6d5866268bb2999f650d9f3d0d27222455c74d5d7367234579b0ee8159abf7a41c6535271aef570cc5288c38ed9eef9a0f84d0dbb9c930ef142991dbb0eaff7441ab1ed516cb17bc689cddfb93a03f69b9223bdb96addb4dc9398ede8d9e2d2b445bbf7291cd6a621eb1b9731d94864ca224296ee0535cab550da1359104946735edd9511c7c7a20b79b549b76ef928cd2c1512cd5cb4b8dfbc4c809af56b3412d8539d733d0632d112e43bdf541b0c06b46402fe250db1662cb054850283c8275b6d3fc1a2136759a64df8dd52a2beece437e614ace0972d55a5bb344233313448a8b6c8f9ba80a7c8a0f3b30eaa21f753618ef3d4263729ab3401bf114e3c020d6e4d324c877a77026cb874c1699109a6219bd942659abb1a1b1e3e8baeb3ddf87fe97576ad593e2ffb40d92d0d77d96088f701cef2fda2183f136eaeaa24be725d647a7c654edf696cf82bbe8fb23e33b8ca4ba980db3b7c95eb6fa4c42e40ac31235cf1b9e54ed4e7c63f454b243fe2aab9098d6378355ed4b2677c9518dfa68aaeb6cf0dfe6d44c2bf00f2334ed45a4eb774f2461c6696bdab5d6973841dc0a7d82147d586d26379528f566e7aa192e2b153a6ef769a1c3e685def293f728b677fc945b33f6bba9b1779a3be209af6e6143b442c9f5f9ae2d784fb3c4c9d4f9a75d18e1d42d53b6e1fe8996a85b4da393620f9f9a6da21e4734d7b365c9b1e1e5bd35ecd92b5b0f6daabb6dcd6b59fc483d864e0b8451b4dec0bce7dd449a929a3e6575a3e68986099293ea1420cca616367cc274464432cae941d64d82b1c19f9b17ac5deb86e92c2cbbffd6afdae212385e4d891493c94a100d58c609d539ac75e6e81faa91796c46f3cd5dbee733994d0c88e68e457b67ff326de797f9a0d644735a37058e33ff995f74d33c944f7849467ef9c94a3327cf7a74285389234420da61dd0380c90d4b9aebce4d70982e518de0689d14b672a0505aa2c57ecc262b4c63b907bfe229ef359ac55ec1e6b7792c2e9f985b13f25df6ac2e979514b58e239e2fd575ec63c794916c19da227062c03d4e0157ad44da1fbe6a50a1b59e41714e8ef86e88f719e3dca8d0155cb33a24e62d90b2d1c4292a202d50c388c9dbd7ab7a3dcd83312bdc138fad75bb8496aed3075907839ca766845f0bc3c15d8ac2c77352d185d3589ba669c789d0116ef699850ad03c9ca1c519b70b9323b37a3704db1b137e24428903bcdc4c460bbcc2876b87e453228df9a0f1ec9ff00a22d7558e09f658bb2e39a731dbd3acb1a95a2731f914eb3c7d9269a04781b0afb3e610b876b720f866eb86f4196894389c771e95f886414cd1a36420aa711576757a1baf5512fa1f1273e08710cde3720db4636f1dea1b213af4ccca86d5bc28b17430734c111ed6d14a030c42a24e8e4f1771376bcb40d10ae0bbc42016aa17f139003768b8dd919a635a84e89ce1b0da271cd85d54e8e4e197d53223aa4ba6bae6e2f10cd3d90dd7981d9a6c18e2407793614075ebd5325e6e4c6f00b16dc4aa6416e6e379c9c8e9baf9dd92eaa291e6a85a55f8830a6b801275575eea70083582402da55682b22164dfa2c131e4b0bfea17530efbfc4e581ba3359acf46e2b135566b6868cfa15e848c2a6e2af497ed1054e1bb56e580878589a468a8585df55109e1a426451964544b3bf27649cc7d27429d05db6c4e863da43c6c422b327553220dc9b1e01c1131355dcd8f09f658d499fba207b46d5ab50fdb87fa2d7336e1fe8b17b46d0ad6b36daabed1bb4a6df6adcb9ad545a446fdd16b84c157e1e284e53765bf92bd67a7baa4e125263af33c2e5d7b1d0cfbb55edc7cc15eda7e40a959d84f372bd15d3d01f136ff445ce32015f7fb36e8b8cda7a1c5d5536756fe49cc74896f05762bdd0f9b517b2d17c22e84f0c9ac569fa26b1d10c4f3594cf346544f70cd07cb09cc2931d343cb404d10280e678293745c6d5e7eca49ad42042abbbc830714021670f3a8699b93aee4d9ad543f6b128a0433ed1d5720f8bd5b98cdb6a19dc2689b0af636ee5c5b350a1fcd468cfd986dfba3f5e84489f25b8aa828c8ef507e01d867d1da9154774b35b5a312ce4b715828b29ad92aec465e6f0281b389b47777ac54d181c42da0ef358e1ff002aea9df22a71e6dfea9f3a3370d237a730a0eef30a64666cc4cd35e723472119991aa731b56bfac87fd422dfa27d95db6cc5093a03fe49b6a85b4dda4d7f7bbde6996bb3ecb8d7cd36232ad7057d9ec9c8399569423c1d839a111992f58b3d1e2a64a4ea4519a10e0d5a32e6846806f78a4aebf0445392eaebc9758c737e5a64c05de4a717ab0839866c5d61c4ccd6a6cfb1faa0c6fcd4ce4af1a436aeacde1c11744616c93e2bfbc50740c0efb2d5c5984213b09d0e9641649d89b3e1343570efb8aeb5f2e0026b0e6b6aba679b4ed0579a66c39144b44ddb975b52eccaff00b4e30b764a6eac4766a180543632b11c11e32aa8b122d1b2cd3ed91b61a7004c679050ec503f8d59ecf0f26850e2437ed7777abdc95d1dda2642ef3cd5367b510fd90d30c6fcf498501cd3127b33aa635d421aa8e5b8aa82167d3a7654d392c8aa5e594d561aab0ae0b148a88035a0ca94e85713f7355e8ae9f0e4a5a4b956ab58da322289657679b516be87228b0fb4868c21ed61e3869b161d03aa99159982a15b6cdece257c8a0e94dae1508c37fb0889d0df56b93ac969a309a145a73dc8c08db3fa22d78982ab8a0b90734cda575264e3984ebe7adeecf45e85d5bfecae5a5b7d8a709d75fe12ae45a8e0516b1a2e3a20a2f62cfa2c225a1cd8cecf72a1a21abacfbdc747abc0af141b9bb7e865961673aa86c6a05b15cd4e6075f0dde54e1169e53461baf33914e023ea5e7eea71a33dea1c3842a531bc068738774aea1b7bcf20af39d37a27439bdd28bb47179c8273ce803805ad8bb4724e420c3ef66833260c9448a3369a23688ded227e8aa70b335163e50a18935363c3a36f4a6b5912b2aa10c64c4d032146a93765b4d0c6713d0bec3b2e57b8f4b6964b7fe1495559cbe6887198d13dc9d0ac7273b7bf72999b9c508b6c1e4c5148caf696dca2ad5163e87720f6d1ec4db43327ed20e3964e422c2384d4290d88d899c9dbc2f74a7d8e3ec44d9e4e4eb347c8a97ef1b5695ead1fda3329abccf6ccd95a88ded59f75ac6fcd6a6351c32459104c274370bcd392d646ab7f557e075717f55aab6834deaf30873549c010baa2619583ac1c95f7b6511a6725ec1bf75d5c1ff8ac64b079c94e3bef1e015e82d91670e0b52efe15aab3d5fc42d645f687eda2fdeaee08daa3b4ba79265c585c0b9c2416b5db513f4d10acec137941f6776b0ef6ab96869206e29af38218ae22a41fac3eea73acf67d5c31de728ce8a4f9a7d96d2daee4f706d508d780ae5a7571760efe0a4cc710e413e3da6b10e438273bc455f7d0214df92c544d82d38ca6be58de9eeca41173f61b52bc93ee66f72876766fcd43b3b33389ea2ba132f1ba8b8d4a9e97453dda697bb8053287e38e82b596b881bc06f722c87d4d9fc237f9a10accc2f72bf1bac8fc7828b13735a4e90b666b1b65a03e543429d04d5a74182f389bb28c17194ead3e172bcec21e64ff007222e0f694c8ac23d65a31b4293bda33342d966a3dbb5fdd0764f1b410b5d9a87bd258a57fbed5836c6c7bcaeda0dd7b77941add9ddc82f1c22af432aec56f91e08becc4bd8a51bab77d94da66343be4a632539dc7a93c689c520379a71b3121b3a211b6dffa682f79900a6ea416a6dcc9bb931cc01b3132aed9e6d80dde6aa506d94e0539e63c221bff00bc13ed2dba5ecde72558f09bff00be49d1adb6a0f2dca885a20b66de59aebe0349f14aaba87ccbd43e2eaa876a87476454386c69077a6bed18a9b3b96bace3abef0e080d128a05eeeb931b222f2644b4b8304be653ad56a9b2cccd91e251a26e6d14cd621d909baff6912a9ad1b8230209c0368f157bc453a7b4ea04f8a73c820ddcd4d2fcdf551389a0e8b46f353a6ef8b40fc366b359acd67d0cd173dd21c4a733d1a04489fe61d908c5b4c474479de508916702cde2399f25aab2c30de2779d168395ec3a58c1bcacb4b9877a2d347b108f0c65478d17b3e6bacd976189fd1c89755cda14d7c33222a0a876a86d935e26420e619b5dc508f67f64ecc2a6263b72bf04d331cc29b28f1f62a8d944147cb79461c4171e77a22531c16b6c44f92bb68eadfc7768996dd778829d9625e0aedaa0ff0045ae6cc368ab13fe2a70a2fd96f7a959e1cbeea76b8921f545909b8b3056adf46b917c4320aec3c3082b90b258810841846f2bb3c67696d142cb09c493b483187cd09bdcc3f550ec90dd7b8c9321b3268929da2e417f8e724f64289ae6b7bc16a6f08672bf756bad76975a1c781c9321c570b8d7e6b607d11f590d738f700aa8d1a1432c853cb869b3b23e2d4f142d5e94c307b909383693c202d745db8a496b78af5ef480ceac62e4d74fe88592c98a33e865b942839c5755e537598435b55ac7519dd09be5329ee76ce653ae6428d4216f19f41addd99e85df0fe41d73af3f7431995279b907731a842b2c3311e78211bd2328f1b737ba148506986df145d2e884521b74d16485a61ff1293fd8c4a1459bb3615a98bb2f443b767ef0443714468a736ffd29f74fd93ac916ae1ecffb22c35844fd15d7558578e1395dbf74e6c255f82eb8fc9cd4e89305edc9aafb70c4e2b536b048e2af4320aa8b8ff1054eb217d949fd5bb9a98527804735758d0d6d2816c9fe65b04fcd52135757455d17e1b85e3b41637e06ab90c5d1a2e43ac53f64d7c618dcb0baeaf68e9ee5afa179f1296ae1b95f890d8d0b5d0886bdd9172eb6db2f853e35aa2c48ae952a9f6878ce8d45d0c6a62f88648b0d58ea31edc91717dd8b39d508365020b4093e2a891ad1fb4da4f79d927fac30385a330782736cb08c783dd705388d6daed9b9b9b21ff72a35aed8dd65de3e2d106cedf32996af494ccbd9c32a344caeb54430197ad31a8de4b5b68c5697e7c9489ead87ec16a604c5961e678a659e109436615ead07f8cff4512364e7e49d698b9e4cf34f8b69346b49aefe8188eef65a49e09ce43f1b3710073460fa34df76f89bbe48be2b8bdeede5089699c183f72ae5958183f5e8d91bcdda63bf8be5d1735e261c9f6789b39b0a36677f8983587cd7023357995b442cc7890ba6559b56b40eae26d37c250f10ab4a319b48bfbd1fd55c264464ae456fcd5d78bd0f822ebb846efe8bd62c5fcbbdab2bb1378e2b1898fd15f806f4352382270d130356ee2d5fb3bef3792bb6a835fa2111930da66bdab57b687fccbdb33eabda4fc94a1422ef896cdc6fd175aebce5276efb8408ab4ab96775e7fe8b5f6a05c739269dc8bdce1742bf12909a800dc94e723cd360b290da98d6d037443b2c3700c6ed14d86d8b7ee8c9b552f47d8df179bb250ecb6b38a7b2dc9abf668ae6c5f7b22b551b72b34196a9b7aa98c73c616e163735807a9d88efe2b55666ce345a179cca840d1cfc6e5eade8d1afb4711dd4635a26ed5e274f8e8f5484e9c43b72dc9b688a2f4770fe551629a5d6a2c83dfdb77009dabc98d993c4a8916189c68946f24c8514f586afe499060fb1874080eeb68d4c6f7dd53a5ac6ef41adc869773a7405d717177155afe1f3d062da9f746e1bca2c675566dcc1bfcd085666188f3c1362db3ad8fc370d07a12152ac8e27c5fd34bfff00274bab1fb443ab39f24d88cc316194cf4a591b81d86d0cf094c7b6ad397bc10b659eb678bb52ee94e645ab5db5fdd184f3f0b95f1b4369bc42112053c3c96a6d424e1bca10e0098cbcd35cd3386ede16b59881db1c7fed08b65a3dd5e456aad8d2d3cd030ccc157a1f56e57620bec52bd75dc1da31b43bcd010db7411b966f1f35b6f5b4f5505de65756c68f9690fbc03c7dd36cf09d457e26389fa682e8b46ac02e420a5062b98b0c707cd6a0bc39cecee8538458d73b39af6ed6f9057e2db1c49c9ab5d6abd8f2aac101a4f17624f89412c944b7c7a9751ba1972335d6966e15a277aa0187325d24c6fa42ced8973fcc6cd065e1022784a608ce9d9a09acb7ad5581a6c962df10ef517d5c4e344a5f766518d136a362f92f51f428d645347441b932cf11dadbae9bcaad005eab64f653c4ee2a1b6eca2384de84069c713f45ebb6c189ad9b5a7728d18ef5266fdfc1110ab0a1d3cd39eff96975a5e33a37a0d87c3494ce202a8ec3359e8cbb1cc2cd6d2da571a75b68f070f34625a5e5eefd1611720ef79572ccd91ef3b795915bd3b4e1faac1f5509f9dd89a6d30b810ee9fafd99b81ded40dc78a3ad17ecb1b0c66725eaef783658f8ecd1b828960f490ea2261703dd2b52eab0d60bf88e0ae3e8e192bb9441b278f2527fb33b61335758929de1c116c7175c727704e8ad87ac80ef6acfff00c97add93aeb271e1e69b6bb010f67efe038d5bcc21060409cb23bd5f128d0788c95303bc2744d980f25264ded1f3528f088f24d7c233124dbae069a6b458a2b7eababbcf2a56765d1c95fb5449f2083a1ec1ab5362433778aeb0877257e29b90d06c170015549958a72e4bd66d1579ca7a0b9e6402ff0065a835b905d6c5633cdc9b0a0ba7019991bd320fa27d1e6eb44839cbff00c9db756c3dc628361b030be338e2713329b0a29ea5e33e211ffe435660fbe9dffc639e61734d75a606b99e176f4d6407084e1fbb3450ecf7baa87b724d816261b1fa3db42ee2a2980daddda39b8ab47a46d6e0c0ea5e28d9ec1383626fb48877a1060560c235279296dc776c3135d6837eb79fe4bd4a099c476df24cb3b6b6a8d589ee8e0b5167f6d13da3bfa20c199cd4b7374320b37e7e49b0d824d6897422bb9f43292c2f2b715b27b2a29b9e66a8b72dcb7689970d14fd51c41a3cd185638c5eedef9fe8a6e25c4a11ade0b616e66f720c850c318320b705571d1c1515312c7f4d11c0a96e2d3ab71a456dde9ba1c51798e12213995301f58651f465bdf284ead9e29fddbbfb2759230bbe94b2d1b3fdeb46ef347d176f376337d8bce69f6788dbb6d83bbfcc6ae115b9abe70c619fbca19b66c0392f5bb0627e6e03bc3fba102dedd659fc5bda9b69f47448712c968abe0ce8a35a7d190431a0e590f20888a0b6f522b0abf08df63918d64c3c40dca519bac87c560749dc1da3ac60726884240841cc8c419785618e17b61f52b1c7fb2c4f73952109f3d184c9111642593939b0bbcb5b6c77c9168126855605760b9dade13c96ba33a4edd35862b57b486bd58383be157215a1b08725fb45be2bfc949ae7c4b43b29b96b6d0d1ad895a8c9513e33cca428a2fa43d2517ac3b0ccca06c96289ab815d6f24e7dbe3c489aaa6aaf524a17a3ec10db0ecf0ce2bab576984c10da240e57516fa3ad062b06fe09916d10f5edde1dbd3619fd9bdd95143b359de1ccda74941f5c73a05821ec3052f2736ced10e9758027ea5a635be39a0e0a25bfd2a7596c8bb0c3b944307fc4c5ef785a9d15e67e69d162124a739d935179da392968d7c5128913ec3a119fbe521d09f6b8ca9420ab5d392ca4b6be8a6f2b089a3123910d8379461419c381f7726c384d2f7bb201363dbc0891f733735528ab45b4b0a9356cc8735d63af2c234b98ec9c24a2c27775d2d0c88ca39a661438f0f2789f4dd022e7dc7784a7c0b4093d854317aefa46cfec9ff00e634777cd7ff0027e8feaedd06b6886dff00f7083e1910bd2b661fcca2da617516fb3ff888594fde0a79792bf0a8e6ed37faaf57b61ea4e4782d65962075ef697329ff00742d173d66c61f8db3fd78236cf451312c0ff6f67ef424230da230c56e614e5afb21ce597fd2eadd722781d9a745b30a77988ba0756ee01499d633eaa51e190e4c742e099220e11a78e8eb1c079ac316ff0020aed9a148fd55fb544ba1362419ddef2c2f2d88dcd39c2448cd5cb3371715acb4be71381547b7eab8af57b2d4ef214e5379cd09d139ee7b47013a94eb67a4e25d6b6ad6e735760438b18f20bf62b06ac78a22164b446bd238a5b21076ab5cf1be2555d961e0a38b351b1060f84a7eae03ed56f8bc135fe968deaf03fc9666a0fa33d170c0c58ddbd320da21b3550db9b95df45b9ef68da3b96bacd05cf68398527eb1a078da99eb24499c16b60b1b7f89098c885d13834287af736f44ee039284c7d1eeac94363fda3f26a109be6e2af775b9689bc7530eaffec83022e34e1a61401e67a10fcbb19dc20735577d16e0b0aad7a55552ab55d649d14ecc319957ed0ea7758326a0c823ccee0b00d6da0ed442a8d01603fca16cbbf8a8bac780b14deb0340e9b6d4c185f4779e9f548cec1136393bb0bf0bfc4c3d93c79293a6c7b4fd136d904cad0df6a3744099e9cfff008f990158b087738fc9418964b3ba1da1ec945f78ad7fa36239f6b85eda09fe885c9874f24e88e88d85cb720eb6b26d340ff09e2bff0092f42dd881e271608d988d46dbff00f1e7987147b4b3f0f24e6bd971a4f5908d02bf0887b1d9a36af46096f7431bbc975c3d660f3ddf35acb344102d1e17d26b1617aeb181de699aa6ddbc98f6c594c4f25823ff00c8aa45ff009af6bff358e3ff00c8aeb62cfc9620621f795d635a070929c3375399159ac61e08966297dd196166f582aff115898d3f2537325f35a9b0073902e8843f92ff00111118968b4450d0a4cbc2ccdde50959da7e2aaea61b61fc2d92f5781eda22bf1a91a255f3dcb1c70e7706553cfa36c6ed5b7f78f516d71cba2b61667826be1426b6264f2054a7c4ef9a3545b44563a3db226c342bfe93886c966dd09b9a85e8bf45c300938f8950d919e1b7465bdc56b35660d8a787de4fb5db1adc595fdc13ecde8e86d10f273eee69d1dd2896b8a3033804eb6dba7148d91c4a7fa42dfd64577b261de53a3c7338af5706d3b3521926b1b994c870ebbdcee3d1887bada0e830700abd856f4f985ed243905dd2bd94fc8aac17fc96cc41fc2bfbc359b3f957ee97ee82da86bda7d1aae59625e7f8b822f8ae2f79cc957c8d540f13b7f920c6c5badf75ab1988ff00372c305bf458401d9c482edfb3e69ec789169d220da0cad0dff97606d7636f5eddb68ef2e054536774b58dbae6ee50fd316668221bf2cfe6a0fa43d1ce366b51ff00110a58547b458e1b7590eafb9857ed57af0fb2d641f37347ea1498759673b50ddfd17ff2be818ad87696fb58069795fb534c2b4b686e8c4113657eba07950ac17613bc253a3d99c1b14edb7739173018313bcd0baa75f0a51e1c8f250f57bb350c7baa9a69a2ab1bc15280c24fbcb19d5b3e88b98f2e88daf9ad53c90eeec97551a7f129c70c21498d2d85c94aebefef710b688f929979fe540447187670508506fc87babaa811a22c36430e795f5eb80b58e71987394fd236e8917dd6a9b2007bbc4fc499e8eb056b5923668cf6318e649e5dbd4764387ae9a688e6509b9dddc14e043c7e3755c9f15db5dd4e8b6485aeb53f7ca7757ad7a6a2fac46ceecf0852cac906926a6dff00d8fd1b0fee16aac10e70a1d1bbcb908511c0c6357cbbab84362bcfd86ad63bf842f78e8f588c3e5d18afe0d449dfa5838943b174dce3ceea02bf4d392d80bd9b7e8bd937e8bd8b3e8bd8b3e89d163b61c386dde42741b1375166fbbd06b0124ee4d8fe951e507fba0d60000ddf8036cb3b710f683fae8a26e2baedcee0841b7c9913744dceec1f6eb0b6b9c560fd54b7a7d9d911ed638cdcd9d0a836eb3c7856861a9ba85bbd1d2b3dab28d67030bb98fec9b6bb3c2d4da3f79cd00ed95adb354ef68debab375eaf7b38dbfde579a247bcd536612ab37347d902c757eeab81ff0062aec51f229a618920f64494d608b7bf896c93f25ecfecb665f25574be6bad8cb192e581a02a1922da26bd9e6aec06cde7795acf48bc8e5bd0641906f0d13b43585db85dcd5fb820d9fdd6a0d101865c5b35861b07935189129c0715eb36ba59da6838a01a24d0baeb4436f29a30ac179d11dde922fb38f572fce23d6b3d2769896a7f0c828b67b164e749a07e8baf7b184d5ee28c2f45c175a6278a544d65a1e4b46d70014a106c1863328d97d1f37b9d42f42d3e952295ba721e6bd53d1a2ec234bdc55d84045b7bc623e055338b12a56aa1e5bcab8dd86abc7646c8d10da597db3c414a1b6eb7829233a0dda44319bcfdba10fb1132e1f0957499347751d55e2e77357224e279041d2227c7a538eebd10ecc319957ad0e9306cb064d42159585ee3f641ef945b4f8f8797e0ab54eb4d91b382731e1d3762636a1aa882233fcb7a022ce03bdec94e1bdaf1ee9e84e2c56b7e6aec0698aefa04e8f018215ecd8148d0ee571c64af314c67bc7895f665bf929c3a8de15e844323f0e2b536d69a64fded40ed37bae0a60eae2f0dc5609de09a0c3f578ceeebb087792bd75910786f82b556a84f6f23b941f50d66ba78c3d4033b914038879abb686de678daa6c74d784f10b134466295d0d77d1756f2df34e61dcaa24b6e6a509aa715c9cc70c5b96db951ff0065761104ad75a9a63722506b2c2001c14d9e8d71faa063d88429e5796bf57366eac826c3168850218dcdff00fe2fdb3d23162720a6f618f1cec87b97aeda992df0d9fd54e23830734e659226b639f0ee4dcc477e45c844f4bda9f687f841a2f50f46b1b0cbb6cb56aac4c36bb63f6a4289d69f4d46f5783dd8417ac5a1862387b3868dafd28ff57b3feee17145e28ee3c15f77c954ced1137705ab866a732ae37646d15c93590c4c95ef9cce824952d37064c12e83dfc07637fc23258c5c7f8dff00d95d74dffa29ba7778315411769e7d1740b0ca2da37bb7313a2da1e623dd992a7ece00da8850856564b89de7f084384c1dc9d68f47366ccdd0f82969ce6b32d3c8ac16989f372f6ee58e3443fc6b3d34a293f3576265b8e89ef538585e377f6426c3678f9804483fc96aedad93864fde15c7ca2c07705fb387c18fc6fcd75644581e545aab7b2e79ff0075b5eb363dce19b57762b3984d8905970974936207986c77794e1c4d737e29a9ea0cf93563832f9154820fd57f8613e21a54a13481f0a2629912bac7aca7e6baa67d14a34320fbc1088ca20eefef0bc2d587f55bd55a5754e75ff34d8de907188d1b8a6b1c04003e8ab6a61f2aa3a8bf11fbb0a16a3657da7786dd37554c2b13118de96b745b4c53b2c085aed4deafb8d3de4e8afd882d6cd16d821124f7debd66df10c3112b2ef154b90ddf579572cedbb676715acb49169b66e1c15e8dd5d9a1d4f20bd5ec42e5961e67c4535f2c5dc6f04c745338d16b2de15c655e7357420d689957e2fb677d9755680f6f088c5d6409f363a6aaebbf153448a7c49ec84f79de7a0e7788f6322bac328bfaad4c46cf9aea1d1620e2b585f9f774b9f11c1ac6d4929d67f4692c85de89bdda1b68f4802c839866f726b2134318dc80fc33bc93bcfb4fd9ecd15fceed11871db952bb9363d9e20b4c0efddcd8a7e8e73e1da9a313623b345ae0439b9b50b37a4a71183622779880b4e361d88e3faa966d3bb8abf04dc72d55abab7fd8ad6d86467dc9fe88b2c91b57186709f84a06340759dfc4090726c32c9440f9a664739857ec4fd4bbc3dd2833d2108c23e31b254d84387253846e15d632f8e2d54722e654293dab08a9576d708870de0abb06018ff1e4b590e0b2cf08fc82d4da713773907b98eb87276ed1b82c1f5d350a90c1726c48b2201d9e28362c2b83dd45ec8c223f7342d6ea5d6833a43028bae8acb0400326a2fb5f5cdad0f793ad36f1268ab60b1b9abbe8c81eab03fcd727335faf236de8d97d0b07563f791ca734c4d678de8592cdd541ef4bbde686f6ee1e25ae8dd65a0ec33879a2e79bf1ddf6521576f3a05a2d0319d91c3a15aad8bbf0d1618a7f8827074b1d287a30c72eca97a23b920db4913dcd6ad974e746b15daf1d0635a9f71bfaaba3abb30c99fdd08709a5ef764026c7b781123ee66e6fe21e78353b498f6674394e527158acae77c18962b3461fc057b08bfc8560b2c6fe458dac83f1bd7ed56b9f286d5ecdf17e37aea204187e4c59abe30c7f171f352ab4ef1c56bbd1bd5c71530bfb2d4fa4fa98c28d8b2cbcd016bc2d76c47655ae52b4c311eccff9b5c8c5f449f58819beceedb67922e6198fb8f352cf92b8f9987e1721237630c88a3c2bb6f67afd8bfcc02adf35eb7e8f6b044be27769f642d7617cccce0c8ad48b439b13c318ff00feca568b108cdffc77bf457d9638b67e4d9c975d6727ecab00ff0032ff000b5e37975509ff00aa23572fe158a306799538af313e1577521bcd4ecf1e2c13c8a9fad7aceaea03a73460b2e1bbdd88ae9b042314f7a1cc29c58117f90af67107f02de3f856ff00a2c2b305528b14caaa6b1f74c31ddde9f0acb05cdbc2579c56b9eed5c1f17157ed043e27fb988fd17a9fa321901d49ef5acf49c5a665b39042c1e8664a1e46e094d6a1841777a4a59ff55c62fe8a98a29fb2c1576f726c384316fe49912f39f7771ec21c21dd1d06378941af0e87f1356070779763d66c6520a70e27c8a01d05cf3c415eca47802a710f59dd84dfeab5b697de3b870421599933bcf0587ac8e76a27e263b6f804b0f4215e32bce71fbacd51672599e864aaaaae466f9386615fce1cf0c56ff5421fa4ba8b5776d0323f12f57b53047b244adc7558fe6138fa30eba0bbda58e2d4ff00dad7fa06d06cd6a6d7d5deefd0abbe93826c56d1fbe6b76be26ff5575d75ae3911b0e421daa1eb1bba7b43c96b6c110cdb5ce442b96b0238e0fa395fb2c08964b493568d829b67b4432e8539df66e53c11c0ef0cdaa7e8b8feb3047ee6266b53e9184fb1c6e0ec95e864446f1089742b8ff1328bf62b408adf03d5cb5d95d0dfb8ee475b11b7dbb89ccaeb218278a9c17ba19582335e3de527dd9fbae5282d039a2e799939a86ec30e2386d1cd7f8a87f55fe320ff003a63eccf63c6aea5bc5700b36accfd16f256755524ac94de996680f6d9608a5e5721c736a8ddf7ee53b343f58b59ef1c9aa51a2177e81183621d63b6e2a90ab8fdd49989fe2e0babcf7bd5d67d55f8ef3021f778957600a9cdc733d8c6773e833ddae8bce862f78850aea6d311bf162556428ff09ba57ed306340f89931f65d546638f09f40a2d05af53ba61ab90e2ba7e48c38461da2d1c654622f88e2e71dea722d82337493acf676cb7d47e1aa7461a2da4511a60c31b9ba72d18b451bd12c8803da73053a37a331377c2fec9d02d0cd7d9fbd062eefecb5be897b9d2a984edb6ff00741d10911077c66859fd390bd620e4233769abd67d1313d72cb9e1cc7c95d8a26387057ecafafdd5db533e6af4374d9cd5db5c68901e765cd130b5be8ab7438a38875d2bf6a8222b3c5767fa2b96ff0047418edf357fd1e6d3633e1bd79a80b5b045e628554461fc2afc4be210c80190582c2f0ee2d3757ec6cb44b86d29ea1ed1f0557edcf8b0fcda5562df3efd1755725c939b291dc53acf696ceb49ee2bac6342bb66832e6a4edad1c1361b64d1e22a516dae31ff00db64c23a86458a39314ae89ae25124c89c95c8483adb10c383be59ad47a361883037bf7b95d8546ef3c549bf55e16f1e2ab859c3794d8501849e0108b6c9448be1dcdeca33f83513d08b10f974bad82d3f25fb25aa341e57a8a8e87686f30a56ab191f0952687b4f36aa8aae0d199c9181e8ea0ef45dfa046b46183faab967c2c6fd1094ae779c47e128b3e913756cad9553255aac953b39bc6ae36e88d57a20377bb15992fdb9b37ff9cdcfe7c55e63af33c6d5ac80f30f9b722a56d60b25abfce8791f30affb581ba2c3a85d54ad1e5b49cdab38b5064493aaafd8e3ba1fbaecbea833d2904b7df0afc1ba1e7bd08dd28fa8da21dae1ff009719a837d31e86104f884212505960b34303c572eccf04d7d9ad1ab8b2a8732617f85b3dae1f16344d5db6d923598f92c169603c1d454bb107d562b3b27c8495e2f307f8d7ecd6b8af3c918b271977d12d8827ef29362300f25d6c461f30a4c75f3c82bc5a5dc9375e1cf76f1795e30a1365e2c4518762ea20f1e28b6cf6374571efd531d6a0d60770284f0b5606fcca9c424aad1aa4d58aab8957dfd542f13b7abb0192e2ede7b30cdef3d167bd5ec71341579ac915adb43a1399c16a6ccc10a10f0efd0235b8ddf0b24af6b5a19ce93579e25047746f42f34c3670dc987853f014ecb666a8dfc096be4e69cc14e89e8e76a9dfe59d928b62b5d01ff62abd5f3191435c0c2ff721ff00657ec1105ae06f0cafd5aa71e1bbd1b69f1c3d9fa27b9fa9b742dd1d866e6f9ef5d5165ff0974a6ae3cba13fc2f1258802cf29841f0a709dee1528fd737de4f64384e6c675315404e6fa463446be786e83453f467a6dff0004461576d0d831fde14576d301fe52bc161f46927960fd17ff008cb3c71c9ae2e52bef843df88a712518ff00e455f45438a7c44cd16c4f44ba59484d4df0dd0bdd7705760c299538ac79e52582ced1ccac4f6302bbae314f2c94ed110347042e43d63be1576042683f55fb5bc989cf72bb63798f4a93b9712ab53a7a8661f11c95f8dd7c4e790ed5b0bc0de835bc4a63380eccb619eaf8f152154d8d681289dd691920e8e04f73089ad65ae14bc2d695b461f2390581e1e9fad6ddfc9f2592c964b2d19ab918362379abd617ff0003d5d8ac759dff00657d9307c70cab9e9282cb47be30bd177a2ed17ffda7e177fda9168a2b8feb61f8228bc175711d6389fccc41d7614761efc17afda9e220e0735d559dad6f8ae2a992ac181686fbcbf69f45986788c41754cb283c1cc97eaa7a860e708ddfd17ecf698f05dc9ca703d2c65efcd63b7d962f2a12b286f3f02eaa03a1b7dd6494e2d9e3c477129cc8b0c31defb55f1668573c53a7eaa44b67c1a14e34dacfa2c5165e4154988ee13581821b392c22fc445d13bdb82ad069a263e38d6c8e5b90b920de5db467fbdd0843857b4936a50891a1de8bb870579f8dfe1e0af39a629dcc6aeb00039a1ad717494d8c00f1dff90568b14767caab0df89e4160b39f9b961850c2da68f262f69ff14dd7c58fceedd47551dd77de94d7b4fa80b363be4bac863e4b1356d80b03da7c8e8a395c8a03dbc1caf599c60bb86e475b06f0f13175517e455e8ac9d7e454e0c47591fe17e26a3adb8f3e2622cd7ea0789f54750ef5987c613af2f0bbca4b0406453ca535fb4591f0f9905616cbf8951a5df75d5f5479515fd7baff0019d575b19eff003729c6b3ebbcdf25d47a3190cf1057f8377f3aad9a5fc69b72cb71cdefcd0115eeb9e10af58e0c18878bb3552d6f26ac4f2c6732bfcd7aff002dbc068a05d530b93e239cd0e027734c8ad59cdb976b19feea27a1122f0a769ad73088bba7492bd16357909abef6eb1fe2729344bf20eb6235aa4c76b0f25d59d4b792eb1ee7fc47b00eb4b9d7cee1b94ecb103b93d6cb7f995d8cc2d3d0c115c3e6bac0d89f658e70caeade1da31c313e21751125c9cb1c1be38b5612f82ee6aae6c4f3530d7433ee9929463ad1fee30394c0309dee12bf67b71bbc1ebf6ab258e3f395d2b1418b663ee450efd57ecb6d73c707364b6d87f855403e41608456c06aa87395214bccac407d5756c5d63fe417550d63bc7905d5599fe6ea2c7759f358de4f92a307cf49b83ab7e26e96bc20e191ed1b0c66f774413deafe579299c94a10d6bbe811022ea99c21ac4e2ef3e94823ad3a91cd75719a7cc4975b0c81c7726458b26b7391cca915c554109e228caa150cdbc0aeaccb915861b8f905c34d28a57af0e6bad6161e214e0bc44f25c14a2343bcd619b0f25d4c507ecb141bdf29a94484079ac5670ef9ac763783eec45d5ebd9e722b0bc9f362a1ff008ae3fc0b6095b0df9ada68f20a81f10f25d55908e6e5fb4476b390aaeb5ce8a7e8baa84d1d81236e1e21a735aa7662a3b410b7431d068e2a133837f2a99a054c454af49aab5e9cdb09e47c28188c33f2d19a94a6149c2bd02ddc688df331b94e5f22ae8a2bcd93237891871449c3a33692d2a51a5187bd9a175dab77072ae993c0239ac56787f45ec8b7e1715862451f354b4440bfc4bfe8ab698ab1c58cef985ec8bfcdeb0d9617d26a4c686f90ed5edee9ab7cb404d7841cdc8f6449c828d10ef77420b73139fe499acfa26ed54e7445bbcac2663a575b41bcac0c04f88e8c82ae13eea98713e7a015221514e2052216dac750a628743464e0ccd48f4e41d36f02a4fea9ff006586a3f11ad68c70bf4e8184ef31d95a1f91bb21d18b18f744bf28c466ee0a946f0459f555c9c9ca5d277328622a6c3782aaaa72deb29e8d64e454cb935da19bc68bcf9a7453801e2a6e17dbe26ee523d861387c254b61fc0fe1cb4d41a28908eecbcb4b5eddc838647b1850466f74fa21e738867f935e799045b0af0e7254a93939d92330b0e5a04f3d00699e4ce2b635879a9eac0545872e0b839706859cd5d1a65984dd25a5b458db3e7bd06cf44dabac65c7f89aaf1c70ce4e1d8865a31338ef083a190e69de3f0cdb43455b47796812524619f31d89634cdb0b0f418c1bca870c775b2fc965b4e5b4b11a6f9213aa200bade3a5ba2739e803208068cb4f02b031ce9700850828ac4a94d2135bc3a1544683e4a4f40305e638d539ed1d73714ffa76386acef355f82ef31c3f0ae86fd970927c27e6d32d00cd35c3726b9b91e9c58cea5d6a7bdf9b8cfa0d711861d7b7cba39fe0264c82bb06838e9bcecd48d39491e667a6abc2d5c51a29e9bf2992bc0106431268578e6a4c58e92e897ee5cb47242ee4d533a1d72a6545d6365f3575d3441aa7c68184b6b25c7b00f847cc715ac85fc4de1f8565a9828ec2fd00201d428c17f9b7a6cb1c33ef3fa3ad70c513f23bf11d2feabdce1a26744c89c94f8e99054c6fe2b1c4c5c94809aebdd2e416005a78aac8cb82c2135b3ae9c26eb939aedca7bd48a98c4343bc4e4d9554f257669d30429e683c64b292a6893b3dc8b4a2c78a1cd3e16eeef968a15985b966b696de81121e5bc714d8b08cdaefc244827bc29e68b5db4d32d2c76f6a04647a3123c5c9a1448d10ccb8f421c36ef298c664d12edb3ecabd1a746b579d96f14714f9ff00652783346ee63481bf4dc842657b513f246fc82a23a243448649da6654c220e4a73581e41589c47929c28b33c1ca511a5ab355d062c3a4b690e1a66d6a08b9b926bdd9a847968cd66b3d355b4a8efb2d5c53d53f3e47f063408ec12646ff00f6d19d745ddece8705eaf00f530fee7a2eb4bc6746fe033fc0e6bc511db2d466e993b474712a60d56d20e76caa09686b272bdbd5d6092c9502a0579f8429374c91bcd234dc6efd19153765a04aba2aaf3364eed2e82d15785ab7e6a5a28a6a4a4eaa23b86add392c464a826b3fa2a059ada2a6aebcf5b0e87f038cc95038a01d0dc544832708831368b31a06e4d2eab0e6816d41d2eb2589d8bbee1d164368f34d86ca35a25f90ccd5e765bc538c474e23b6b972d1cf4e155a2e0164b2210dfd02d2a8095b257341eeeee893d1315c5dc02931802cba0562d061b7ba64b1b94c14cb9743dbc535d107939ab64140ca455d6534cdae92861c2787341e2010d3c535af9eb77bc29bdd7e1f882a0e9b27b11309ec26f320ab11bf5558b3f20b0461f3a2db6fd7454c951d78f2576190daa992b39a323246aa4b341b0ce3264014f83168e6191572299c3fd14cc43e49d0ac83550f8ef2a67a000aabcf1d6bf3e5f909891776ee28c68bed5db23c03a4e12a69bf13655225ee8b4e4de2aec26aab15f949141054555260254dcc701e5a39298575c89750009cf76d3b4d55c86dbc49537bf12c04cd16071e0a79e8e683e280f73729ee55d0e85104daf09f09f9b4cba7868455418ce70179b558e3c31fc4bdadef842c0c7bbecbab800799547361f9293ed0e44be312862a344a4156607257b5b3df56270e2673418d796858de5ca8b0b64abd211e3999156313e2c4389c66567d36da6d0df81a7f2125c6402be7d93360299cd7eaa2c7b5ccf7613789e3d093f65cab9e86979105db9a77a397c948e9aa90c95d67d7449cb39841cd6e15b056208307cd49a11064a60d5559f357f54eb9c64b9a2d6d1f98528aa8e59ac2e55d37b2c8aa680d9a97409f7468cba192a48294e8b3599599d3bd6f5bd6d69a69aad9590d050b8c374ef4e8966944b48f1276be77f9f4e8846b5b7c99f8faaa68f5787fc4b92f258f2deab90cba3c1658b8b906024dd526d54ee2944127689431358a854f41bab1893748e09efde7400a49cd7e48494cb05ee3a2fb1c4395d7508d145cf44c6f45fde6566831c55e62a742653de05372cb46602de551ab72cd45368877f22dbdf354b3b3e8bd8b3e8bd837e8bd90fa2a615d546faa9c32d721d4cf8c97b3979a1ac710b1c9c552189f92f6411b93615384e0e52d538f92a4123cd4ed31030705d5b2f9e2e42e8968831190c08d10999e94a137e6839fd644e3c3f2273f7ee45c733a3efa6834cd36f022ef0de9db33952f22d7ccbf8b4abcfa9e0b8ac955b3f35761364a8412b657040bb7aa741ba2f3f3e949ca1458593a8ab45cd35e36b7aa34aba4482c7926be14368e32540a722149f9e8a94590a8d55a0582a567d28cdf0b07ea7f03b5d1b27f1747356adf97e4771b9369a00d13d1b2570d14e851ae7792d92344c8a2a3481a32a2bc5a2f2c392e216212587448e614f70d23448e86c941909c8ac6c335d53e5c8ab8fc20e80101c14fe4aaa886e4e995821baef101758083c170ec2d5f0b3f0d657f323a56a1e5f913de89d0e28e8af42e31a3cf400d132af4601eff00d17842a3d620b359f41ce7e993b22a8b591dbe40a22e869e2150cca9b85ff9ad6c26f57fa742f144c94dda5aaba1cc0aebc48e89ef46f31ae9f152140ae5a181ed2b5b0a6fb39fb7611e278a2487cbf08166995a87f4ad4ff21f91359f3d2d6f1e9d29a1ef3981d19ac5a30349579f455c9515506caa5483013c4aaf41ec709cc297041cc330745d3559059d151ee6b949e66371d0d5559af7b72aa90769696e69d0a209b5d42a242f09e9318c1339a82c750ca67f0926cdcb09b8392c6e2ef3e94677189f913f95349f83a274c9a2a8e29b9d9f4766f725ec4b50619872bacc2151c5ab14574d5e847583eea498ee0747058aa160d1b4b5b63ade356a00c8bb345af129ef6ab86addc744f40f357769ab03649b7b0c5d150a6da20e66cbf4cb720eee395e6f0e946b5b8499ecda7f5fb7ebf8ba5500c845acf13932030ce599e3f913cf179ecbaeddb949800e95068bc8743580621a2ec5d9539a259492ad155e15e63e7d02d76d66d28b5e3169bb09a5e67b90bd0ae03bca13735ece4802d92a51eae957530efbda6fb8dd6a6c1846f91bd5e774401bd59ec8369ad9bfe2fc4e2a29bef3d521852025f85aaa76a7cfb304e9a9587a0dbca9d092e1a25257a03e5c94dec25574d741422118804e032579e640a0d60aa968ad55f8151e157851e3729b9a269ac8156b55e9c94b26a01a733d36458c26c822ff009bb7055a9fc2e5a329aca5f8aa2e1da451ef9d23a274498d2ef20bfc3c5fe458e1bdbe6d57b65837a95c054dad034d160392aed746f77468c2b12905ae87f3e8734482a49f7bc4a6a655e6d74d118b0c758caf9ac424e57a0b31725275139a36db9291e9b5e73153f17e1b255aaa0fc6d6bd9bfdeaf6154d19041b0da1a34542c183c91939a468cf4f241cd41c345d6024abee80f92b87a323d12519b4809ef78c33e2a444b472539dd3c948d46e3a0b78abd0dc222e057bc8bdc7244f48da630eae0e40f79fb826b18252fc257f2c644e14ec4c607949005534511dda01734ddd326e160cdca557bb894e2c6f55c1498c710a6615d7f1214918b67b818eac9066acde3c17ed02eb16ccd616008c482db8e6e63a1542ba2f423754f31c42ae86c9039c95554a98a8422c2c9cafb817ce8ab46f01d26438626e7192635b56336799de7f39af60f6710aba43b8f4001bd3432bc55d632a74dd066b3b8b0b6bc4f41ad19e892a5148a124d27358502fcd65a223b31755155b879a2590ef153255561527291aa63a0fb3769d545f914e6e7353d058e980985b8a04f3e9eba2b714414e4d400fcef9f4e7dd89f62a5a0b0fcba01dc10bba389588d3805ad8828dcb464b05162379ca814fa59aa294d4d55710afb361d50de0a8d55579b455545c1da21b7bd3d02f8214c29e4a4e32d0028cd8f598a0e903144e1b4e5e2e4b9fe79355e916efdc8876db69a75ccacb6f9296999584a913254d344162aaca4a5a0f41ad0ae4355d213279681119f3520af3c68c2149ec9378a05ec0e77340dc6cfc97bba24d55785b4a42aa045693c0f464134c5f6a77787f3ba29954ec35b0b6867a6f66d34737884d8900de8312ade5c94fa201aac5a41e8700b1647a0ee3d1050890f355576280429b02659e16d66500ed815286ad6333d2ef2525359aa94094d84d22eb6aa5d06daad2daf71bfd7f3bbefda53e96254e818b047c43496bc5e84ecc2bf00896f1d1bcfeeab8dc8692344d5468c9574b5ca7a49345855d7d58afc2cd48d14c54a7be2d5e54fbc54ddd07290aa93a9a264c95c854f7948741b68b48eafba3c5f9d971c9bd8d3a262c114de34d0a9b69c474dc8ccd1513e75974325455a0d0388d120a5b95492551664b55ea2a514fa524634218989d11e7174c47b40941190f1293683f3b9f13d9e2e818b0461de3a1836fc3c54c8d5b79a1ab7cf8cd6dcdcb1e8a2cf45765d43d2c96cac3446e1638202332ef44ea9c61bb885d65a0c477355e94945237d14ba4235a84a16e6f8949b97e753d0c97e00c4b38fe15c0a9ecc3f121ab657c5bf4d5ed1f3527b9b45433f2e81403b30a5a66f140a415345d449acb44d864e553a5ed34d331a382712fc52a054a2aba6a67a223db4487758a43f3b2a49bdb6254d179b477eab56f12537384916d9767c4a6e8ae5d6e7c550de1d1a69e282baca2ae825792b8f320e53583259ac674074a8e6ac964a992d825529e4b119f48361b4b9c508b69c513870fcf894dede8b81d188298717334f54c2e538915b0d63b489ac369fb2c11da56193bc8ac4d2a6d55d26f1d03414c9e5d094eaaa5430c1396f55d0d76eec3aa6c99bdc561137ef71ff4018677e5d0a76b5d336607a9da9b842bb676886163713d1a3955ad2b1ca7a66c72e2aad5262a90a7252322b1515e73cabcea95412d392b8fa0194ba41b0da5c4ee0844f485078020d84d0d68e1fe816bb81ece9b4a5154db51d849c2614e0191e0a511b2e9c174bbb25c3482292d1926dc132b10c3c961aad93f55bd526862faacc68a99298c8097443a2f530f9e6ba9662f11cffd08d23b19a99533468521d3ae993da0a9c032e4bac6f4642ade0ae5ddd3553a043c8395d8b43faa9ca88bde245dbba39a0e63a4e9aeb1a0a37419ac4e3a688178d4b38b903775913c4eff0042cd3d9f3e9cf400834665068ed6ab0e03c961c616304698915fdcc82cf471215d882616abf9509f48b2289b4a737396994261721af75c1c02ead82f788e6a9fe86704294ec24a68b8f747698ba38da0ac385607028e03239a01ed2151c9adbd4cd6d041e6448a747138238c22d6342a3095d63835621ac3cd61681fe8b69cc855ec1fdad3b0ab42d992c0e70f9ac11dca918af6abda05edc858ed0e58e2bcfcd544d51a07fa3a68c3393bb0aa78976994f4e2ff004f9083bc27a651401c9d4ff5799267974ca078207f0327aa7fa5abbba5793d9bbb187c453b3bb391ff005194d3956bd81927c33e7d961da2a6499a0d7e26fdd0baefc257fd0f4e9d135dd228a6ce97a9d8ccd022e3f2d22ee685ecff00082f7fa1eef4dd0cf98e9cc669ae3b8a07b0ba37aae99efecabda66abfe851d30e3c7a655543e54ecf8ddfc4d567fe8127b12987974f25121fcfa65152ccaa6144f3edabdad7fd0079e923a6f87f3e9c90bddea760e3f455d0dfc6e7f9f4285ce7a43ba6df3974e7c1029aee3d39e91c8fe06bdad7f3d8b137369d914c76f9749d3520136b3ec0e8733e7f9057f3a7153766eaf4391e90727c31e7d23a1cd9d2ef6439d11fc1c9ea9dae7f9c32137bc501d9c8e469d39a86ee07b096864cd67da4cac7454fc2d7f379ee6748b7874dae6efe93b430ef974eaa4ca37431dc474b2e813a70e5c14850f0fc2e6b3fcd094f8a7bc7a439f4af2743f0f48a29cc1ddec80f0997614d173a246f1f86afe677066e4c6f6a2f6fa74dc14bc5d332cf4bdbc4762513a6ab8053c87429f84afe62c6ee6d7b02de895e49aee3d2714d7784a07a4e47437b4932aaaa4a9f8acff2e25458c78cbb007a53459e1ec19ca9d221386864cefecb1296434cf8f6d5edabf969e25346fec7cba254b73a9d3334f67cfa7e6a94d0c3cbb133e80fc757f2b850471406873b80585169e891d298dd54d70dfd229a373a9d30e553a21f2a74f88453bf0b5fcdca8910e4dd2ef7b434f441e94c202756f4a68386734d7711d2234bdbf3e8f1d251e9f1eca9f84afe4ee578e6ed2d87a65c3a32e8cc668b4f7ba4745df0d3a453868f31d2a683d0f7bfd12c8437a6b74bce9f3ec8a98dc5070dfd2f34f61dfd33a1b3e3d8cd5725267d740f2fc357f32277374944f401ecaf2bbe1e94d43971e989a370299a94d3d1ae913c948506967976bbd52bd8f10a9db57f21714e887bda65d1bbbba25bd22d3dee9574437f2e9f9e8867853b03e5d067697468a293aaaecebd853f019fe3c431bd34747fffc400291001000202010304020301010101000000010011213141516171108191a1b1c120d1f0e1f13040ffda0008010100013f211690a62ad1c3c4bbab6bee5d347de225d67ad54b1ac59ce25ac39789670f1c6e5f260f8966a3832dfdccbbc401db72d35fb997a4d6f2f6975afc7f52a6968f3fdcbde1bfbfc453ae9ff6e0faabfee928686bddfea55fd2a5b9905d3c8fa1e9c7ae572bbddf45c563c4cbd133e86d7a2c427cfd27fa808143a5518ade7980854bc145563f1158ff0055501b43504cc42ba91562061ef02aba7e622a326c82b2b7072aab9205c148e67009463996ed92a51c243a22b9765711dc1988804175b97b779779e91704d399d6ee04c3508b3963066a0ec3a8935a91e23101431b495352dc4a6a6d798a83e20a3d07a8b12a57a2c4d465d4086878206a3f101f509497705c1955571cb332a8e7de2fa1d0625862612cd4b599733ab006e547e201de5b72cdcb0ae9a8ae14d266f5f713aefb1529f1f713e7ccc3ff0020149bf3fdcc2cc11ce25deb1f7172fea0291cf1c7e26454bf799e31f12d3de60ffd660ab2fde2bd633d981cafc5c03869ff0075816e6fc59f897d3eff00ec5bdd78ff008cae3f37fd47e7370507091dff0027475277a9fe25c33c4c2711d9e8a83c2ce802c7ca9fb8b0d6d3559afc62a14939177d6db8bc303e14882d175ccab49888c85c0eb87ee0650a331b2b38993cc04d604c4644b31d8c4badccbf74e3128d3f517723c26899f7c4c4a39d6624ccbbb62a6b729c31e465b5ccd57b94304bd903890991000b5996a19cc1c5191abe2222d972ae52d12c4a3981a9789ca52c7a43406a895e957e3fc15eef83c84140f105f4ac8ec39704f080b92246a569adea5af33b894801284af119cb11b8576cb0c4a93ab823598beb380980940f6f372fa36ee532e5f979d4129cfc32a9b31e48dbacf61b83c1f532e6fde029c0cbbef366ea1745955da5f5ccbaed3755994f8f69429fd32c6dabf3005dbf70ae0fa3f533a5a3dc94042efc42dc215de0396fe1992bf07f4c7479c56f4657f05c27e086f0f240b3b49f0fa49c3cfa3b0e8fea3b2d1f68627f2ae8595d5d6be654a5170aaba1ff00bcc7d552fed283e0bf99a0c1d257b324c294bb23b9ad3571e6dbde1acd0456decc7f6c723cc02d2b1cc43cb2a0ddc1b3cb30a8bb25363434f481a7b41ffd43ad15ed96dee88952f25451b3de67823d65f328ba896378b87de899b5b94bdef89665819b941292d96adadc47330b89757296002baa415e13d73ec4af4c5ba0bf50f7b5944e92a31b749e68bf3050d407a4bb1d59400df7941104e715c45580e27525019893528db2cc4b30988af07ccbf5b829cc314170d178263b130cf9650c554a75f3a947b782e59cd7d4a6d6e0ceebde3b2f84074dd3e270bfa9d932b25dd673d3d06a5f2fe232b9f896bfccff003337fe196687d4bd4ebcff00d8f95fa977ad7759666ff50e8251aea7986c385fe226b8613a3bfccd49a4d3d1d876206a359ff1f111e2bd218cab59f7854908855dd845e3afe065859cb0004e4d45b788837111a3925d99d40e6e75782585e5199d2031f12965f58b54ce8ef348f585cc2b51762d788e16112aa0babe929aba20b9655beae1e845656825954c40534f58f2b9a8a79c749c2b732bb8aca254a658d102ccc43885ace463de1a1d83d2a0b8d7a2b1d1fe25cf7264fa0cac9da253385f88e8bd595103b941b975af4e51f74dcc2556e584a2746668b02e9807178895fc40af796e7b222cc662dd4ea352d01301e260c1bebe988b0795b996c1dc97d8d520b65a71ab9566db94374799a6abc4ee95d221b53744402e9d625066c1ed11da63b5c2a158623a3bb05847dc2f77f13149973ef1b309b947353c4a48de35b94ef2f6609868761fee5dd8e78b8079be25a384fb987f13679863ef51f909904d269e8b175fda54db4fd3295411452cbb2e33cc05cb5946749bf7afa8bb52fe08eb19c98f694ed3d2232de7d05715079e65df99c0c30957347ea6c717360d12b79eb2e05e65d4a125f6c75e8542e39e7512e832cc45dca37a8374ca1c4bed808f04d819ae624c5cbb72817799472b2cb6577de3de54ae52bd459753f981e95065ef2bd159872767444fa100be6d5000d9319970a5ef11c2586713680e5a8182b8c3dd14f306cd4a304ba32e2594ebdc47c12aa61c3053de2eb2d933242eb3884d5f130dca9de59a860a6a65b37d621571cc13bfb4bba598ed6a21be200ba2afa12fc265b2c8a6059d183b14f12b691f136177c409c7e18be5f89fee21a003a5451481e0819dbe625e20943ad3affeccd6f8562a57715d1afd4ab3540f721fc7a41008f47f7fd45878f4e90cc548e153a2cbfa7fec32e8a9ce3b3e48a6420bc385bc78fea5138c1f87fa89c5985cb2ead96a64884c155a94d68901df1156dc0f49460ac5b3c20796a637788ae1ab8701dccb94ba5ae8961cdefac2c2e7da75085155106c8d05ce25c2cb8ef46ef7024e640b5d65a5d91cdccf981700352e7129602d4d4b60582fb6caf4ac305fbbd435dca868eb09ee22cb3e3d29af4adc6996a5a3065966f528d32baa65da8a6e13659971c153851715e60255620502d308f64b189915139b8b1a99020ce259db72c2adc69b98ff00e4a3bfa98ccf528f1982d9dccb52f0ea4c373b484d67b311bc4453bf6838ccb7acbe9157ff0062bd6be197d5fa9eff007047dbc4a1cca9ff00ac0aa60be4521bfe4ea0ee48f87fec563c7a370d115776e57de88341abcbb97d38893d945677ff00b3df07e7fec1678fdb00d2d9694931a99eb9931ef1451cc1793866de515f6595682ac832f330f6436ae900dbc6a2e8e66fc30257b4c1ccd2788c152cc04b2ef597588dee15273c414dee5e339869888146ad978d5bc5c179d40b8078b8e304aed2bac1ad1897d7d5fc4af40cbc4a93d5952a000bd898361caf2c5b6501d1fee22fb12aea60220bb983ab8aaceb265a89459e225cc16b312b880dc4eb026d2e0711ef977134dc26da58d6ae5053c43e225454e643c7a6bd6a50cf68ab1a997794963a655f1f534cf0c267aee37e234dbf710f79554f0c1be6bdd8fcc73a3ea0bc15ed32a6e93ea1e95ea4dc0aee53f11d9f1ebd22a5ef3c147d8ff50a89467738ff00bb895738759a0c639fea2e46dfe495af2fe65012ea11db379972fbc5f8189c3de269f1323c206077870f105062aa56e5dec95f044a1966ea0de588a04565350a0beb114d906e2ad67ac7cc5a1a30cdae612d58c12eeadbaeb0748107096372c6e64a399d484762e54a983f1318b971437309f20c18af2b0f58fdc18a0c0226a18437644c0965c44d332ea5c5b9967d014e62b8bacb0f42f1bccdfa6a0cfb46ad621f8cd3cc7c4a00eac5f097e8b5ccb9752c36cb1972d2764a60b733bf1293d0b748dfff0067945d5e7da5c65dde66f1359fd4047ddf87faf40f5a95e8623c0fb18acbda1952abe62a4e825c9e89fef985b91ac5778b09ba36ba37f529d4b5fafea5093ab2d2e6f705c1bbd414e1c4abd4b254ca526a2ad5f1a9cb12dda04218e26cc4a7880ab28f12805466cd40984cd84f74b58bcc2d3281132b4c15e653d841c7a02353282614e263bf4075847015de60e60bec2972e2a534fa54cbc88a015c4c38ca8341536cd0e26482714c14751d4d89b6376445b5037307b4beb0098dcabe25516c6172e2f49a317501da17c041b9529390c4e6ae2d2f98a80f43c9155c0f5947300e67630bd2b11d653ae7ccff00333bd9547313c350a73528c5d89d673e223ad444aff9943130ff00c9dcd4ed6c84618a8eb751a7465435e95ea329627aafbffb1589bca9515a384961e87d844c062d6eb2231f518a94280bcb46fbfdccd5bbfc3fd434fcfe886e45e2591d31368b58807704e218237e8ab23b3989819351a8d7702ea15c65571060234b1b96e500e2a01843de551ac67acb28c1ee45b69b10471d62070562b98f3de55e0c4bf9964b65d31808d4aeb2e79661a89728edf6f59ca0a3e254d4b7a02543c1307d88ac967444a74b8d19c86ae640c1d4a91d414addc0db735024bbe25d6a59b94399794774332e05b29425ac22ef3a85ca205c3f84a132d41eb15aed0c9b94e05261b704e7566f12d0a3b9316693ac674bf19931dacc25ac2ef2ac2c768bdd571ccc0a27b4a8e49c457031a238bcdc5385dd089725f4b8a0d2f2152ad9db10297147fefa2ae096adcb3983aae50f4d257a63d346781fe199778bd7cc30cf387f44ba0bb345f350e9434161c86efcc740c0321a0f87e99d1699962e28b362ea60c7f7f46ccce60c10636f30e1309b4b295e19c1a750314e41d0e7df52b517cd1fb8b814740e57acff00d760acaaf962a0660f729a3237c4aa11181557ba2cc2adee0fbea6f0be7fee06ad7c29f9842aaea8334179061ff1cc02c37da5d42f84a5d409bc4df8993242ade04af4e1ef157b25cb890a30044d236930f0105c4d7306be250c917680df10aad9b6e2397137bc546ded165d188b98b2ab2f30ddc4d5ce194b116607a32e27c0990e3505d11624b1c10545b3304a7513d60f4b12e7705cfdcbb6fdcdcb1896f59765dc6dad522a69b8364cf32fee5de264bfee2459fb97eb12e5650b6f1a98ccbac4615b2c0c889f24160ec73e9a95ebd3da77457e25de09d5e8ee12aee6d9f518bf016bb35fb95b56bef356518fa8f118ace373b1f97fb9430112510d952e6c828719984a9d083e080a5f58243f704b91aec51f2ff51a58358b7cbfd446edf658fa312eee6170bccb96f1da16d4eaced6201c430b214ade0a952abd1425cd3f72eec1fa8ffdad9f105575726995428f52c887018cdc775d8dc3330df484b3c4b8aa39cb15ef312c5c509e025b6d4b8b2199054e20a078832457bf4b06e7011b25d1de5d7bc6b822c50dc57a816c19a95a53af405ee0399418e22a9498860987116cf5942a698818edb9c0c409ed3e6b0196a6270ac40b337cfa0ca3930c15a99f1071df580a673351ab0bee5fa1ab6e2749551437896b5530dc4d1225cbcc4e82bf3eb7d7f1416879262970bf5e9a952a1077447618a1dac65b08ac0f92f1880c9c16fb182d9e7f681d3d0e255a4b2e20c54566994a25455b6a7c86c7dea3780dd32fccb96ae55b2ce223c4eaa106b960b8fb80e0813ff251d615fe21fe09846ce2def136cbee3d63e52ef988f5bf794f307a40208c5e3a3010d8b4a983af43680369dc7cc29205d23771a055b1e8882baee3a839f594f32cbcda0b1ef176e24e8985bd08fbc2fcc0c88af3d65c58c454ccb732d9c2e2c57285ce602b100aae65d4ab2e5cba957e99dcac5d23da345c7cc57da0a4fa2a51b8f4026655d62539352bd15d65748eb328e9286cd424a85f2b946260971353f2dcaac91794abcc1abb9566549989e59ab6109ee4de1fc30106e784bfcb349b95e9a3d162eebf4dfea16b804bb3abfdc0a9ab558aad1d21bcf2abea5c5aeb2eef514d17138214752d2b4c532ddc2b6700656568a7ab07cff51a76cc47fdf79d88ad59504dca743e747dc49b7e772ba8f82a51d17bc03fc65d6e877b9c83e27fb88781f32ceafe2e34dd25fb07860b2f80289f37705d57e4875cf0dcb1827c94c05b4bb66035f2e2226cb3b4abb4470ca771ee8beb529de3d1fee183d74b8889da77eb4ceeafda9f8dc1a256771d3e21c26b88e88e60c1d206de15839805f45300f930d4aadf314ec95b8f2408953288c64ce26471159de55d40adc7b6e59989ee415dcbd4d090d5bac157d661e7296b105d0e258e22b0ef14b7acd8dc52c7731c4c12e5dca141e6236519bba998a99b9e51eea7bc54713acfa2facc04cb59288289aed1266e13070c370f4a953048710f72bfc97060811254365d183a5a75ee57ee0068ed3f6cc416aadbfdf1064b115ee4ece7672d91bd799018f6f9ff0092f57261ab1dde617d115debaf11d9b78cc561e65ebea5e626edff0026d9f10fee09fba7fa27ed2bfdb32307b113d276047217e45fdce8a7c33b8b3c5c24f58d2bf13185d7141fa94f67c0cdf57c95122add68577022f06cebed34f87133d0f8c4b397d972cfe233948e71529b21e18f2efe5399701d8dcb65cb1b61d8e7ea0009387499f7f5bffecd4d392f3f1061e2161a6aa7996ab2de2691a8345cc651f74b42898c3182abd92deff1156d31157f2451b3cd700357de64b93e65f6a57999ea97cca3387de51c40f645ebe92fe2bda75b4ed2cd57e267d41199f51a84dbbc40d5dcb2c42a8ba8886b3cc2164a71d27399926f4731cc6cb8540bd1b7fe652dc58ec0f38f880966089783733d512de25f56586e5de388d1c59f329cad8f69d194f563ad4032541b044e03e255bd0ce0bf2cab980fd2806854eac06b83b2a228a3c6e6d4eac113792bf67fecaf4a952a05412ff5a1f8afd4188236950d8bda70966f9495a9af9f1dbc4a69ec7d2c57d10fc4e7d2bd0a4ae528a9e4328cbe0e3cee2555d956f3d6e559c4f5e7fb9b161d71fa968ca433d0f967548dd0aff510ece8e6a5c86172d9af7660c7b4d42860e643ef7ed32c4e96dfc6d94371cb73f399874390353885f2ebdf99424bab07cb1ea57802fe2608a6867d41a54ba7372a179e1a873b080fd533005f177e18813785d9fdc587d5a12cfbd4ab03387af9c928deed524b47a5983f24bf0dea5912e5f164dd56b91b26ad2f5312cdfb6d7d44ea87b116f1fca526e169b461d8e628f581619d0eb19bfded05a0691b971382c112ac16f9259c7e22dc7e259fd12ddfc72fdfc3065bf0cb59f8e5dfd72ddfc52e8f17de2fccf765bc1f767483de37e0fde2faf9fd2b1d7c64af5ee13a304c9dee28d2fb4ab5f1cb3778a62e3ccaf9fde53ce798858e633bca2bb454111195cc41a907e7536cbec7f729ab73c1fdc5eebbaa3fb81e3ee87f716ca17c7fd89e569d9b14d27457f50cd1f751fa82da61ed1f50190de262c0af1320330e29a966e3976fb4ee4ea315dc1cc47a7da2d069e22baccb39e317c9ff002540952a54a8964367fc0cc84254a8ee9d49d194fc0ffc9db5fadeb29ec53ee5019aafcc44b098712fa22caabab6f4afdcd38dcec1dfbf98572e0efcce8fd67fdef29cafa267edc7c4cdc3dd2ff3368fcd6fc6e652cf0bddcbf52ebb6dd53a2670243db50572be007ea0773d9e3ef11d50d3777f32de5ceb3301966d4fb8b54fca55f2cb0598f6fe3985598ffbd442b48e56a7ad54ca1ae72aaf75a80082f6a878212081bb5fcb16da9a12ae5fd80e6acf997e5786be2614f1428be4b833dcb909e2580c3cb1f53284f4b6fb6d15623cd63eb1332b070e208cb6d56fc54af353453f26e23790d295f72c1cc72c4158cdd635bd8972e5e8d2ed6a5d30726c84080194acfee1a7004ab4f796cb388103cc03884aa952812a54afe1571ac57ff3bb8be9707d2f688555fe214501a02a2faa7b1399f5259bafb1fd43a93da748fb40f357bc1f6def272b9ea98877fbb1a86aebb784829154c6e25bb324b8bacc9a08bd629868a653c4ab1bcfbc1696ce83fc2bd2a5589475767e2646691d4b88abaa8313bfc5ff00b081544a756ddfdc400e0b19e91d0dd2fe65152cdca568b81e3abd0fccf8820874ae083b87a713381bf08686602eace179fa9b669d707c4a07593c7cc428eebcfb73162a2e916bed0551650e6bcf12cefcca697e76c05766a8a0f8db324ce01c7d71101a32e41eda85270d15bc5183de58997a425ec60fb81181ab5f4609786a32ba0f63fb9ac2539d306f9582babbb2c89af4c355f1770418dc9fb4ab2dac5bfd315286f20bed00b6eaac159e813070c5572df4f89418bee9f0ea65983227cffae02eeda78fc989ddc0ca57ea16dfc91bf78d1513c3f0dcbf71ab53f3ed2e1c11b55d73bfb994f0e6aec3df64b530cd3d22e9a83a6e28ef0f58925cb1a6981928383b3fb81b03e727f67dc1701846ee5b008346957ef1868d8b871305f20ce1f60bfa82dc3193d2e5f48acd6e5c462a61a972fd2e5d4b972fd17ea5e8b81e95021021097732f56cad07f32d482de226f64a897bb88039655e5804aae25d6bd13ac0019e3ed9f4b832e5fa2b9b83e3f323222f5545d46505e4132d6ec7d87f5000051d19c8c61f76af8f4e943316b03cbdfa116f2dbad59a02faafee03b7818884a06550783bbdb7302836b057565a128ca429e81fe677694ff01f72d5cbc2f1e6b997aaae8592d3772da5b46764285fb40c55d62bf966f51ad37f3194a3384eb348be685aa820a33cb982d0387fc65565f7427dd435176830e4e622c6c81bf2e267b66ed53d8c4253d7000fee6c4fbbfaa880701b6c0ec7669f98f96ae568660aa5ba58def0ca9d13252fe1ccdfee7013e22115d4323ed0eab5e8b0f6987198a69fbc7dc085c1ada3a7461211b82d97f982db65d07c772cd9e64e9e219e6e7d97f52b473a2613ce99ff0085bfe4057431997b933fd26bd34b976f23feeb00eaf7ee8ea7f643f8ddcd278fdca51d18994b7593a4ab2b229d236ac133c51291ad5adbbf7815dc388b39838328cbe88bcbf30e4232784b9b3ebd3595eb33c8cb96cb4bfe20b9708183ea117060c51748a676d2fc31509c842a3db896129cb11c42bcb4f897f02538c3dea21acca0ea3529fc415b5afc414a723fc0f4c94c17fc1ffb330f68254a8a9bbcf035f67fc9b7e81e28afd4b1b83fc4c38e83f5ff002205170d83abdfa112763636abccb5067a06bfec2c9da6f09fbd4bc7bb06ee9fb3a22f82b9207f6bcb1be6fe0d5fbed97386ddd4f6ef135e70e17d2b735e973a83cf3e09a7a30adaf4099619d1c777f47dca661bbff5c4b265fb2d3cba3f3da26f85430f7b772c0bdaa68889859201eec447ba70bf972fb1ef0606b62921f96697bd0a1f36bf50011eef22de3ea0d280b4392e2c54354a7cc5a2d3cafe9fee2d5c5c8227d45d14ff004b4260853a12fe599824d89fda5d3a4c2057571018c98022c1c342674ffd9bb74ca827b30f49618c85f88c58875349e20556958daf6751c89452f63ef2c483578af79a61990b079dfbc037bb23bbce4cfd472573ca2f7d418d033374f8e9e23406f828f8e228340cada7b3fdc543a3d651bf404f41c76970998cd762baf6e62e0ab91c5393fa889595b3a54c93152865c95b667c42c800e2b16c47668c0c445dbd25d4d196739972e3de5f6967a0a7640e45fb4c2a3b04a5c4b389588986a61a665b8bbcb7ac2c997a6a10842104104b0dc4682d8fc7a196283372d69fbcb9a70310dfd3531d4f865436dfbc539c66a16f79d419eb34502b51700fa947d52fcca87f0e53bec2fe1962753f855277259d0bf62440ed5fee19300b7f1507f5040e31dccdaec7dc5eeb519cff00bfe4b95a2e55dc2f4b9d2d708e08849183a3c01da5082c64d9d8e905507ccbaee86bf704828d9983828d13a74fa03ab5afcb0a1b99b08e0ae080840ceaeea35e36ca39a60154e954810119e281f691fab769c1d31a3c67bc6b70e2b03d6ab2f98a365bd12a732928b75a37049a37c0ec05040de5ce5f7b4a3da0848181a9c151e1c0d11f7d9fa3b4b6242d15abef989b58260c5d72fe260ca1aabfb55990591685e39ff77942de05e2e0d6f3007b315b47941fc9191a50aa03e809405452058825a53a98c333653f2b15dab454aeac27d11b9b3e93f22e32eb4ca9f662195edacff91e216ec0fca1df55a075f115d4ae1abf527b41a6d0387f702b21dc604bb140e3bef89464bb10f878940894f17bff007488a4307d4a7264f4b4d4c8866179e07fb9d05a9c7fea05dd1cd71d2570ab96534ce599e634d9f514713bc984ca1d31eafe174cca836e0891beb9b953150dcbf4da1c852a6c3c9114d57681f08ffe0f46459625996c37289b4254254370f40826fe9115d08f9263aa4cc7945737988e7f52cedfb9674cb8cd4a5c929e65d45bb95034b7f27a1fc3a6537abfc4b7c2452e5c54bd13f32d9d2df71080fb80c3fb8ead44afdaf118cbdcbc78ff009af3296d727116d8025965f8e669cb02aafe83fe47060b936baf8fcca325d1050e143e8e60eee31957629f825f7b60753eb4ede9c4adb34bb3d69dc00a0a2b2e94510123d8551f1317930415ebbc1dfe22a26fdba7b7f70d388e56e606e6196776fe8cc1116a59205baa62aee02d3dfccd6abb9fb89e8660aabec65f680280b614a75ae20057023513390ed79994b1de54b973c208c9881c5299964503b0183da2d4ca5cba2aea6c7da56132f7ff0008c2b931dce65d3b1d20e0dd851edd11554ad8401c39dfe664a7e4d04f0c54026c0f3af372e4699babdae9f6821018b16f62724befd2d6c3fd3da284eb295fef329070fc46f9f7fa9a11aeadbfea06d4566c0e8bfb96535e2a6909b2229c116e259c7d45b88b7116d455d4e031ae9fb88698015be589d8639666eea59cb674aa97f2be494a95f7208147b8cbcd99e934369e6e648a915a9c37be666d867707d17061061b87a0d7aaa522f4a7dc712e5d6bea39ff00b2877288d3a9f10a4ccd4dcbadb286f421065cb9717ca0b0ea4554762914bf454fbcff0015d2650854b4ab93e0acb2c2029db82e838fcbf52a581d41cb0c2d2b4a2dd17cbda1b6c994b7a27832bc458960037c8bfd24533ad80a7a50d44802d6b5f5cc2f6632e67dd6124ad08d07b6ff001169c25703dc1fcb2f106f71b0fee3daeb56ecfe7c44cd7322f3d7fa7fe45679cae0ae9ff25d5dba1a53cf1f9948e3a2b1763f6c5b5d4fb96ca8982f3f11038bb45d3f07dc244d551b56b05bdfa4632e66786ea59e221acc41b2e0ae87989327ccb759e5328574d32cd7dea3d059d65103bcb7925607a1d4f796616df53c92ab9865853b9fd8ed1550cead1d9d92a4ca3817f70f605b0342fd40640ef54eb5d7acc86d79c78e7c444079bb2719fd332e3711a3adfea20875ec7b76f110ccc3c9350958cadc56df5ff91eef717ece05fdcbe92e60dd32b8036ca779872c7748bb917654eb6261ae5c465ae8ce20f725bfbc8df67c93977e61f65ef05a4f0ccaab3b33a5277b9b1f7063c94f7ff881b31cae3a02c79a309a87a10ed0dc187d7a1328a1dce5bec83a4af4abe6556a54a4ff00c949700ee3d3f9949b893c844972e5cb84543d1dfc3fcc52e732ea641942f1597b79961fee62402c9ae8f5ede2583cce555b7b609d80c4334c34e568f3e6069fd8b4345f17b5772ec06522b1c17b8169f644f57b7e654a963568e2ef77d0984da8755ac10e6905db57c9b4c72ea53ca142aea6723f30de71c51473ae7bc4b752ae9ef52def3855c393e03f70769e9b03fbf3028a196d6be6f317dc2823a8ef771cfabbb594f8ef7fb23b82e2cbe61a2fbb52be651c4a94404163a0cb1d29eb3accf89af41a8e69a9b2ff004313049752eef3ed2e8da5558f270ff3a4541a4ddcb045fb7a7fa62976ec9cae9ff60a7696ea9f1dba498bcc704cc3bb7f9b88fd5e47eefd32f08d9b607aca565ea5e952cc551b264f411b5b84e7d62013805e4e05fc4bba992bd16ff95fa5cb4e655cca74be607a7f300d2f99440500edbf69d507da5dda7b4e71f68ec7f626d39876842108420ff0767474fe65b895e99e261772c4ff00732fa12eb254bb93da5ae254c365c5daebf23f85c22a6673a4ac3f24d671398ee95f27df820a7296d603f55d2062c755b9073dda25edbf1cdabf995793c8bf9fe66c24d0b50a5feba129d32c5cbc17d5e929e30128a68ee1cbcc4002caf8b6bf0732c16edf03f43b1074114fb0720f3e788851b05e074e87c4c9e0ab1c3d2b445b88344d3d2e52e234a813ae22691e21dbd3b4c212b546070fc4c561d01280b2e98b7bf6966c1e1a972941dee7fd89bcdf666a9b3b91782fda68ab7788fa07a15591a963848d7593d2a5ca302cfc4b4bc1d3a4d625f482fbca579f87cf5212128e9ed2c753c8e4ae91d617ff0043b4aac38494d95b879ee8464598bee03afe4aac75f31bb01069e9da64ef62e1f1fb8578b1e1e59b0606fbc4ac253e95d2207ccfea50512cce9d1efde386c3ccb3996732bd65651967598972e5cbf4b97e97e972fd2e5fa7108421389a42117a7094ff00b83ff655e72ca5885dd3cccb577e195d6fad40ad2d6e5d832946a4a384f2d47b03c4a2725976add23f7e87a909a41e62fccc8271190a0d755e913ab62e3a07078fcee6098d32d0762fabe0ef16ad5b5dc1883e7a96fc43ee2b0e5d5b5572df3d66106b1b3acb7c410e2cba12f3e4e8edef0761a82d60e3bdcae8d16dd4d15b5e5d458a867d1ac0c0439b5a5aa8e2f9f6943f358043cdf2bc1ef1ea7255babc5fe58cb813a5ae66b4ca1bfcca765ee4ab97dc98f6deee6f980ba20a256197712dd633ba7c93a23c4cb29c3d3bcc4b9f47507264ea6a08399a8ab2a51b61889bf4b8864c4e07f6c56894cda30282fd7eff00f2605ffc0300da4e030021cb58ff00962c8b062b821aaaa3b01eb2e2d96b3ed4cb3cce307f4c016d3b9f254b325b73e93981701b037537928efbcaac32e6477777f3d276495df716ad595de789ef05a6cda524d75bbed00dee615904ff00a85764f6209cd7997f13de0bfdd04c813cc1f9fb96732b29d653acf294f4350841b9717a61e83307a784f3a32eff00f9159ac7b4b385884aaeb9885d62e5b8bfb9e3d2e98b17fd530bb9523abf89e8e43da0e32cfa6663c4157a065ed103a2a0aac75ff78eb2c2acad7f7177b561c815fdcd06dd0884b95a200369226ed1fdc4b5cca1aa1a4b77dbdbcc1fbb50a7cfbb5c711306e55c1cb460252397152f001a159671194614d61e0fb628a2c8cedebe09998efe6abf04c505e23e5fea05f5985afe10fa9547601f60b9c857dd89dfda5a06ff009981b4dd5b29d1ed49c6f8b739590eb15a03dcc4c15d773fa80e23b310966a6ad7ed32eed2dcacf921a4fc514ee70f1394b8754298724792b3d532b8fb18f36474fa15170b9cfe7b32d2da3c7d45f56c3e19c375c3e071e657a531d32d00bda5784788116955742e33c3192b6fe45e61c3e77f3768c92045c23bf0f788a6ca1cf93b40a95723d2eb5b844287274ff7163e30e46601c5c6e8dcb70e21831e884d736712ddedcfa400369b94eb3d65f75b5eb13968e6e381c84b16e7e6572328d32525e53a888f7816cb9d425c1a83a87a88426d145147d2637ef89739940ccc3935e952e3995162f5f49a6de4625b3c30254a81e866457749f5158f12917f3be7a7b7e7c400b16ba3acb65f367cc02dabbc02145f9987e8003c0e9f7965236c301feb89caa2eeb4d622f7be92d6d563b2836260734fa1797b41afa32c3278fd9ef2a33ca1031b5e744a428d0c0877e7da1d50280d03a5ba843d586d831a3b2e6915ede952cf4c0474bcbf32914752ce49b73ed52d6cfda2376d74c4c3e03a931e6f33c36310e9a986f32c28a60ee58ec74cdd5e374c47411f4f1053528d72fccb60e254abdcd0167d46d4e4b533d418c6637bc8e5764b7a57ae1e9e6500d1a7af7b86045693b563ee63f2ebc8c4976541f9253c1b097870773ec8f75516d642f2fc4148408981fdccf342f1dfda61a754ce1e2076ddce6237438ecca5c4e752ebef2845e148c2d1c1826e0bbe25814064653536bc4517599d88b3715bba7b4a33552f3e2a3aae501ce50e19806e02269cf587221a5e63a4b9e8670fa6906e10dc21a8bf83a7b83f98ac2721e9b863b2512e5c5b96f59c452c76d446ae537a295095095e9783bf72917051fdcb3ab576cb55b6e9c1183d435dde580e95ab4a997e4288a4804a340701f18f68799caad83daf7e6a3c4cdaf4e9d0ed2c33e8ec6ef959588e8909a3d8cbdd88af3230792f95d6224b15cb61ff007f72958618a0f3f131967d2adeb1f821cd3b7a47b4a82e75e587541be6586e2a6f16fccabcced977985b72d66e0602fda644cbb4b35a9da398a3fdd206e74ed32b80836eaa70fee46ab2c36727b4d7a55f983c6470cedd4140bb82f587646b603bea41365bc13912806e4e8f9f30065c0a283e4d3090cb84c8fea61a832ba74f30b003ecb02988e05ba7fa94065496ce9ecc2965285cbfa800d252fce6d8bcf93cf85dcd71de1dd9c31579f45c0b4a6d241aa9d9fc7925deb3e955999977dbd2b6fa246d60dc4deaeb98d1921d2094764bf729b723cc34aded0186bb4ae825dcd7a0cbb8a10e3d07a0f50454125079b3f89412c235d261bf45bf172cea37d129768d30b01516a25de633a5204a950950652f5e50fdc0a1e308a303bd15658e92d6cdf444cd691bd17facfbc7c781decef0e8fea60dc2e747979bd4c2540ddb16a8f63ed66364e796eb14e6b69e3a4057bc799cf74f1a80b554235ccd7210930314629e5ae81fa8af942f3b0d9eeee05a670ff6f68cbdef612efef276bf800bef9fc470acee5fe43ea3a2d3b1fea5674fdea753e4ff00716dbf951006dc942dc37cbaeb1a8c7653fb9abf1d3941df0fdc33ac9d4f4a8c4969667b46b60e8e659835dcfea62b54ea4d9326a208a51d275bcdc45b470c132dc4c5cc0d30d903acb1a33131c1d9d6145ab9204a598ec5c93f7e66c88b3bb511d0d4a1b59cdc4ca23c6add77997f2335eafea1a64698d4deddba74886174d94b102ca33b94e9fd4e0ee45f7106206dd93f2e906eb0d8c4a5bf406ac8bb7c6fbc76cce8719ebefe9e66a55de3e254a6eef8e91e676d4edbf4ad4c7a5732bd2b4cc4e7d49e25bd484dbd0bac1e8da25c2c0af897e752dca84a9b6c9ceb713b4a076c1bc423ac45e589604cb16d9586b6421fc399728b99761c4af9176270171cb2ccaa868eb0ae540b76329efa3bb32286c3a1c1f188780bc0e1b3aeb5e239c6a674d1ee970c72152dd5317fd41d4476ccabcd1d3bc186fac1d05e7abed300146f59e5f7732dda15ea871f2e65796e85cbedb62e4031a8af065eb167b9d59f441393b13497f30d00f046a5cb9736f96047603e49b1af8c47e7df4df5aeccc07b82a6196dd34f996356be8917a1b81b129724fdcb2ce7d74ff918a14c52af728acdc1e48d7391a9622464956b89677372dcb1094ea5dc323bef0e0ec78e8c48b4f8ccf31c4b1601753bc5d387b6f33712b79ed36727495380018f897b5754c592cd1d214b8ee9063fb3a9259e11effbfbc140d32a4086982ebd7de266309b9a97598e7218779e37dbfdb8c0f26bbcc303941717c32ac8cb4dea2585b259ccc6e337a98c5c71a9d6527698a2d58d4b957352ab5e95bf431ea3302087a02083d1b91d43bfef311ccbf2c5be63a984b89e22b1ef16a65127dd7a12bd08b95217b4d1eae3f44b55572fd132fbefb128bac06bcc41e335ef75707bb9f626304cbd59cca33b0898112fe6efdd9813608d93ec3f12d9682eea0ed6fb663217985dd68f2b47961056367dbe0307bce61a2dd5726febde588e382d1e03803fc4733dc076cbc6367bc098519c998b582f5a946d2dd4b972e30dfcb06a0dcce116604d25fee962d13a6cf898cee46be26cb5dc1b3d0eafd2511b947f628d0bbbb04c149057a8efbc459efebe8450e5e2163ac41c1b3895106921305adf4485c557f8862a2af88aa5a72d4426542aa05c9fd43475a6aedeb0192961d20118432dfbcb46ce572816b81df065a9c30bda4e49656b3a74fe918266bb7a7fdcc24bb78a788264d3e99c6a774d45696d5bd1327b9f64212dc54b9332e6e78cc5a9e25def71ef03112e5ccbbd4dca4c93735de6b700751f4181e83d41087a04da588e1125d465d4b622caa95ea489477892d2f4f51ea8b7295f41c1eefe20b8334f9f3f1a861bc5b83b471876d2f638216a068b6f57a79fee644a5f805f809c39879eafbcd913afb9b7e71ed00bbcd77156eab9baaf7965d48b641cfcb8f699e22f86f07ce5f041141e6cb5951cae68fa98807d015c0133300e7d033e3da02141c1ebc1ec7db092f1466647159b01439d1f300eeeb4b9b4cee3f0b8a6eb465fdce215e04bf94f67f52f92fc4b5b1df2a0c0b7cf09fb85d4f0dfea6c9be83f64b0178b71b8ee5cb9b529ea4b2c3e6bfa9837ba18ff0091345d3a4e676e5da660c6ab29e67fe88c118709c4ab8724e08c2c5c0e235dd77364625b8710c93de57129987387bcb517b0edd60b072829ea440b8633cbc4323082269ff93748ccbc7861bd5f099b10367039fcbf30612c55edf4f313de9aebaa74fb73da731ab2b974f11f7d28571c5ecc0d633b5cf4f7819015bbf07bcc0529dc14d4652989ba23731ff80709b3e7e9863054abfe1cccb2eeae1458fb4be3d3329957017bcca5176ea575f51e8210fe2020979b1b65c525cdc772a27a18dcccf1025409508b2d355780dcbdfcb0e8f07b19f69482e7b7b1ff00bf8975bc18219775ccab57a65eece9b93a5b83eae064818edebfd415b5183d2f30d250170c6327fba113d5d50a39bbf98c8b0b8b41c51d1ac5c0ced816c4ed5cd1c75a95d14bde747b15f7107ad4b3b5e0f77f10d4eb9755db2d330c997b5ea7b8e2adfd7d45dee82cc82f662693f6806857b7f0e7e605ecc4b37f14e16d3214f4e1862f842fee6c17a99ffb2ca831b5fea971f41bc96419364b45e6b2ff00d9955ee810dc7b14e903d90b9f314a92a2196959885531712751b9cc96025cce0c7e6180ca83d01a80d9572e8ff531cdbbcf83af995545fe6392f7078e61f699ac81dba90b121b6b0a111abab95d21d4e626adf0b74803ed8dc43cf27e2609130f53ac136e22e69c7b8df72380d875e1e18ead84ea8e19b29e35e8ab3332200ce0e2fbebe22f13c7883e8a4f1e9a9a95c92efd2a100b2aa5004197bfaaa87a83e81f42f554e89b6bea533be00f4a5d1027129751cf2d4436dc4704571eb3bd832ab70f4a968b367b0dfcb8f98bcb92fcb0b07b53d02201597ff618badba2b89873009d1643d8fcb083b74f25747c106a38deeae3d8887394bba1bf9987d70b548abfab82f46c828678ff0032be50f5d5d87f700dd0b8be7f44a92d005c02fb109ad607b75f2c0a285ce14eef3ef10674e605f30a08068fe17fc1c3f3ea061da2bbb9b93e2223d1acd3018bde27e34cd6e8567ff253ccc2e278605d53427233a27ebf711c987492a826c9848f8575ae8ff9361c72c0cb3be274210ec30364e0733130be3b4a46abc9117191d4a89c43ee26a1677b3a799bf46ad08ab2a9e27acc70385f6df7d3ed3685951782d8749cff009da602d6777be5f9b818d5155abe7e666faca76e4f66247bf70ecfdf920962fd1a4480c5b5b38599474873918793997149481b1e8ce04017367fae2528c4e9e95b977282570cf12c65c0bcb0317e82f78aa2b8966f3e8c37065d4213486fd0bd0fafa2926a8fe628cb424779b80ea59ef3a2545b9c44891227a0b1ee4a8f7610f4109f63d1fdb9802c2157be1f8b7da05fb6a216e1c763a4eb1b9340dbf04461e12b405e3e08b0b1f19dbe5afc43ca87dc3feb7289688f32d7e2e225021ee717d0dc0a14d035d5f6ba94e3ce5d031ef136c616b036fdb10226c698bc707dc0b4b5001e1ce5fd4256cd4551cbfaf78eb6e5be661941369a36e83de5cd0a7197e26d9bbe1fb9762b7755fd4e107b3f64b39af6ff0053bafc7fc978a5dcd82c0948ae96317877646bdb134947b52519c9d06cf922399d08c025392282f0d535079ee93f5cc0d045d0d4605770c97ac4c3bfebbc12dd9c9b815a984e2aca200d38605507b4a844bb87345ff8968fcf6651e26098063fa88b0679e218150b1413b447b45b0e57f52ecd9c07974f10b5376cb710ae62c56d26c788beb7f4ff00d81488318d3d62acb25d5d23df6773bc12625af7d3ddfdc4d2999b838fc9f751162b22ac1da161b973f2fedf33948d31b3922e252fd4e494968a6fee5541aa4985aac3a2e9f67e9994ea0f113bcaeb2f89a239d660def73799af4d64f8995126d440f798420df53708308308450f51c6883a494abb32d62dc60f462c597399512507bc0f4e3867bee0f8dfb4ac030acf88384151d9d7d1f728a39363bf31cb473b6586888aa9a4a4f88e4363d1564c6d248eca143fdcca329cee86fedfa9736cd0339e03bd1f9802524bc95767d54137b1779c55bf6fd4bb86cdbaf0660a001a3e55caff00e455688876da76c71de0ad608a8d064ee6fef1ed2fbdc9bff25a287165fd6a6c217d5fa85334fc10d5f9e614d15edfc0fdc808bce398ad8f6a9c83dd70b87720a3f12a1575a14fd625d1526b0fde996287b8f451de212ab112b7bdac95e21f35a7f0fea52d2526c482bdc4a19d4e587b3848d38767242bb86a5a1ce60805031134670bc32aa13058c3376f676801ec30c41ed2ccb066ba4b78d34fea0ddca68ef12de57f51f7380f6e1f69a56d96b84751829b2f0339975f50e4954ac6f3088502b8346983c0636d396becf720b7d4a94a6c6114517b1feccc6a2993c90271fcf83e6529a6fb4ec9ac9aef3c4ae137cc22e2eba41370b76ce1f83ea0b3d98939ccc3a2504ae2527a5de3d2ebda5033737be26abd5f5d435098620f407a0f5308e58f74547d1332a5388fa2a24d4bb88f4994ea40f4e8d7e6d1342145cc32349ed31f85fcca15cf2f99608b2e2de3ff007f11a8d5eaf8bad4c3394a3af03db7f1287c20fcdbf88180e33a2e57dae36e91de72d3e72bed1d8c875b46d5f551310b2f928bc3994d8289aa194eeca376b7719367c1f52b0658e76da7c51ed09220d59578fdccb2ef74bbbe0cc47904acb97bff00537c0e6a1197d05f6b94f84284ab63eebf89fe9657cbf3fd4545059c928190574970ce16bccc5ca42aeb2e37c4c8d9d0278a992fb6a7d38fb98b939167c9a9d51f655fbc51946c48a3393ce2567287bca1ace4d55caac8e3fbf523d4962e133675865a873700ea207ac7620d5cbb9502a147ee38e94d9fc4aadc045be22b604fc3d62aaa9c2e62805373d9822ae3b26fc90110c3505928153b4e4f6dc6d238484c96cf94a90b2d9d733dff003e6107b423dc9bcaf3f03a7d97e2e1e299f278f68aa53173aeafbf8662ccf6d1cc1c6d2a78aebdcfc130b3223c730bf546e4fdc1bea4183549125222ba3bafafa8b2de5bcc6556e5d554499f3e81b255c372eed3008372f77b8ad3f887d0a1087a420f4bac4b27ff00689e892e337a88f48aeb3ba21c12aae3728eb0673e8e1f2788c1f45c595741dd7fe31c050de79a0a0fb8290be7c448855bd3a6a13c319e0bfdca40a4ad0dabbf88aad5be3533ec12f07259780983cbfdca4941af01fdb16e36d76e5fa3ee7044ab4e57e2150633dd3fefea2d9e7b59d9ecfd24b4e828f0d7a72ea0cad45fbd5c6fee2e700bd6dce798dc85b4f3ff0020e18077aa8ad0dce9af99c0975ab7fa9c1be8afc4a3abd8816ed9e4977594b753332ca7844b5a879a0fdee2b1df9d9f0ff716dda0ca69beb986b57a0959ebef37f7d645edfb665ffc2fa7963e3306b41683e1bdbe6a5d2f02a85761a86303c928fb993de5ebdadbee5cb247392fc34cd00b9c1f2fea6483d03791ca32a8cf693f1da0a97ba7b94dc4cc200367ee054aeb28534764a9c7d2f27f73501831fb89f2874e92848190039e22158be1ea4a43d932c9a626b6112bacc1803138364631d30c3970b8113232acca76c77fd9e605e82a735c936edcabdffe7f826d90de369ff2227a9976bcbdff00b8204afaad88e1fa8298b5dd0e1943ef00748f1f12bf289e362647a049c501d4e7fb89d7061b1126f3e95e9a977293de68975c6580b9609a5bcc7a18974c1bdfa3bf418710e21141709b7a07d3824a1476152e52b8258cad4422f45c41a22b8ac657a24b139184a6708f7383ed9453c9b57a4ca96d5b6d457468afedfb65ddd9e901456816be08989bc3f2b0b5c33ec45d514478c9f2c64ee05dd727802a0d6562bcbffb1b994a877583daf32cd9682ac52f8cca160027cbfd4b2bc1bd7c2761d7985992bad9f0d7d67ac191b0b3beff00a235100cab4541ad3a8dd0687be2669e0e87c4cb0bfd7c4002b07620952a6bd30f84be8fa7267b462f24322badf10788630d892ab14c5eefe76fbc516e98c6abda296464cd6ef634f9a8b0a2d88b0fb5c1180556ded6ebcd4a61130d227b0c332c0cb7fea31428b6aede5948adda26ff00ec3ab25155072ea583e8852fa42319d153f51229972a10f896a307fe9e25b61675a9b8031539ecc2e01d3f72a2e0748bd998c078b87fa9437012b463b9d22b61a717f88723a612734b5f58d5e383fa8d8423321c149168f4df8e4fd4b0b5cf7214eab83af67b6fda52bd97c2b83e7ee2b20376e970fcfee08a56fae1e7fb98e60c9c03f67e08f933e03875f7f994772fe65b3d9fcc161366e0b8805b71f3de52b6ff00ee25fa75f40bc0431b97ae932d12b16c45d335cdd4bbcb3f704f79e3d46189dd08a283060c515450c3a0655a22f8c46db6e5cb22fa31f549676a9f4e1b0bf06feea655050008c6ed33eec008020acd16fdcaaa6f30a619b6bd894797777c5e7f13744973b7a7bb885a5a05f2f3f5fd4bf50a82c2b1edb84c13260d5cf9e0994a1150c1bd5ccf18b16aabcf99a6c27168ff001f88996382c2a140e94be392533a5e3fe6f7f332a28272fce3db7306636d8670af33233b54b0071888a1b72fea556e198949501b543ed9b74ae0b677d78ffa95eefec7f72fd7ccff00b2882630d912c5e145f8dc5601f654a969a684cd3b20a577b6da727b7e2748a3b5b9ae6b5f1341216c09dce26aafdd479b32f8b2311461682f346fdd60af84916b583dfbea12c1da0001c1de15416951fec7660048d3784f062216cbc106ae0d629b8b264dc8c0b3185ba79628446d191e4830337c768dd32b94be95fb99810eca188574e704a4d9baedd266051884b90499167e71d7da384a6d184d544c0d4a274d92b4c021b37d99d2d92d00c9b96fe6aeff0047dcfc4c5ba6747cda6ea0a7b233e5430fb99f99480bca7e65ba17b6d5d7b6be2534bdef697a64bbf61bf733ed094516fb2553173b6add2993d9fc44bc0178ddcd0a8b8ee470bc8967896d05d66e5551bbd691f84fb94aecc09c7a76862bacccbe26e5f1b974799bc712ce7881330a61f465d420c50628a5c18a2f438b962a6878aa6548d9d89f99f9fa21a45f0cabccbb8a4b25cbf467b7bd04a6cbdd957fa887722bc183eee596582bc7217fa8e0e7e12d80ab4ab765f6dfbcdd4013e8e5bd6f98001834d443e3bcbc3563b13d39a8f0e56ab6add2e988ea35a8052f43a7dcbbc6d9cb3a2327d365f00feccc395dd6d456d7c7e6647571db5d77cf128f0dc88aabc21de24756c1530e1b3242d826db07352854162b682f3ce5e58157559f0460a86aee8c63f303b30f18fb9c6a1e8afb995a3dd605d8f3502a339571b974d2e51896e9b34f870b67c30aeabef8fd6a6805f03f7b942e0827c32f665af184c9103066c9bce9df963e7398963f47b4242bd989fdf8951285c6cc5db7e25c2b04b962275a7fa98e2d9df512c96400dac1393329a47a5b88094f79b303a7466302f78f8d9f731d9ba37012a5922dacb63b9128d22fc301a5f35cc465bd3d1985a4c674f0c15861b06ba99cb0b96d393da5d63a45a92e7af0c38dd3ff008c55d8cb8a7224b6d3fb6f3ecc5aba384e91d528a37de2b4b39b43cbe71ef18373cf49bc828f0e24f6dfb455b8984cda31199d368eba9efaf79acd6e5d78fa990a1ecbb3e73ef34e08c3ac566bf3f8d3f128872fa7fefa6a227b6381f673ed2c3c13dc3704a9823a994a975b9772e6e5403126b8835bdcb8fa5c18a114507d07514514778880ac5336d5cb2ac39b457f013e042da989edd01f7546a509dceacfa95144ba16bf332cb1e4608e9b9714982ea30d0745990740fb15fa9ba23e41fb455e6a4cc58eefc0c21498002ab6d83d8df17050a5556d3abd7c60f32d9cc23c865fb7ea63d840f61fe89851431d15a0f63f108bc62be5ff00d9903110deb5f3080a16cea9b7f15ed31c52e79abfcccaee60e28d431f856b060c4efc45ceeafc1596224a6bac537a3a152956840ab6b1f2c7c41688325c533a8388e2aea9ee420a9aaac17fb62b2dd6bfea0ac1c45adc57359e605b99570557c4584ee88d97e664f24041a386c3df6400eadd2da717bcebde3aceec8503c5f4fd43b2334737eff1030e9a80f4d56a286bb45fe2b8f3135236b7ff003de0d416b15ddbcdd443ef4767b44a97e4fb4c652807df599105c3d4e183d1eb0d8c2abf5a28dc69e8c5c6938beb1973ff005b897da6f93afb7a61851df79c2c72747920d64d92bf7078f594c2dee9ca9839fd12cce6bee1c3faf6875b753cb493a758e66cf37473ee67de08cbc44335c92d6dae5f93f27b424a9cb4e1d8c0c4c009d1b3e62301a556ac527fba40db2c1dc650f23f81c9f263de068d141e75f67dc74314b15b18a83c88bf263ec5fbc578ac4c25b89b967128772ab73706a55f99618e67977a8a1a97ea418306283060c1845145d2628b0688b00363bec4d7def46a659971ccc95fd3352e304f0c6866aec92a6e4e57fe4a61be86c3e60aabcfc30e6b75ba631eef6fc4597b6b3c40ad9e83aae3f3191b8a6006ccf82a0ee0610a761e703980930c9ec207e23b5eacac772d776e71813db6dfe6bde6a542f05347c67de2e546bf01ff002202bb34e2d707b7e894730fe87fb961c4167c8c1ec7e7b4b4592ef1cdc560c91785cfd46fc00d9d6c3dddaf7f1027e301451407dcac9ba5f4152fa90b72cd5fc4715295b665daf2d71300668b5579aef2ab007365328658de2becdc0dbd03823a02bbab0e2afc3fdc7a47b302aa7b33658fa6bf1729ad8ef43f8955bdf483c119db33f54c64d712d6cf7324a97fd6bf0370a1c128019f40ff009810a781f259d4ccb47d4e95d2a607a4f0773a9f883640357c82bc571e610dc55dcac4cf1d144ecf5885d57664675e26c03cc3362e792e9fea5d301fa96b87353dc22ba4cd7873dceb35e81464ebf5180b0ff1041612336a6c5f5e1954b704cc15318b84e3c32bec60a3c89304abc5d3cfb399743438f1064405455289db01c9f259f1039a363e22ddc6d7acb63ecfe6010b51af26a3b85e3bb984fdc2abb62c72d43aab2bc8189726093c8c06d4cabbd27dd41238c3cbbf4cdd979e1dfd9f710f301c4aa9772a3e97c4d6e5f4977b2598eb36fe2bd0a2830841830628e5ad113d251746075072b7ed1c247b4fd2b96895f30ba7ed32d50e889b575cd5cd17bce3211d9d0b77142dfd414c8b3b76ad312c32f9e003f3285c562f2ac5c7b47418fd658a4f1fda5bf0404c1480e8628fb83bdf9f0fedfc3283e403e6d8451cd51f010319601e6ae5f0d7bca8bc8a7b01fdc7c8ee53dd7db5f329f8154ed36c45523bbe32e7ea1bb91ea3e7c0fbf1176a2be41cfe2e027b28cf4d27cb704ad4976e808be10ab305f9e65d16bf01ff00602be262610bf5bcc16000ec4c6516d989ac09008a55f2314ad11dea7033e5dfc9026af65af722a7016a9b3ac4a61635576360ec4e6365dcb8147fe440f56514f6d954cb1a04d3b5abc107625a0d43c351658c6fad78986b8808858ee04b0f7ac7f7192e0c025b7c9d657428b3dc99231f3c92ee54c4d375f923a1627c4a8289b31d98d702ddbafa5a1bcdcbe1b3f2f5f783606c60e4639f133e86c764a1067f080d7e76b4fc477531e88c98a471145c1f7727b389c86297f0c021b5e00dff007ef291c784a709f73998fc934cc409903d473f5f894814b5f7cc7532b4f675feed0061a8f875f7e8bc0cd7975f700be4235b972ee678312b997d256d9e654bab956cc94310baeb1f5187a1425c18b517a28a545308c4e732cdc38ae0c197065c3d1dc2e12a633af7c4c0f496cbd9b8113643f8fdc7c1d4add4d9f8bfdcbb71ca4ec88a44158d1dd2820a38c73bcd9715736a71e4f97f31041567f2cd1b0c9dd4a3ebee021402bd5e5f76199aaff4a72fb57d9050413aaa39f77e89806696a2a80a0b36da877cd424c4fa0d5ffd3028ad6bc7001155df3b65ebd922c1b05859debe610e0a0474ed15147bcbaf3e9aacb15f38f31573f7381d21f820a9bc31363a10f149b3657e49cef55bf0f3154186ee51819682040b4e0e904e1c6549e7a915a441ecb88dd0d100eb492f551a787a9da6128ea7a7a4466cd8ecf58c9351869825d273e7a78668613277e92a021ce9e8c51805c5f589e88b05bcf9eb002dbf680c8b13315fa637f4caa521366111f1112c5beb8950ef2f56925ddae775e3faf789a78984ac1ef105f7d45d9ecfe602a5dc1e789ae8dd6f530febe2534cb97b3340dac6ee7fc968684aba3b81b42e7b7fc60bc8dc3c99fc41cd968772050786202d222410af35e657565131d897586575c4ae91c7a5dea1d6ec96955026599f4b8c18a28418421b8a0c515732f0edfc2eba2832e67882f996e494964bc7507c8875d74965e6bfa226162f58ee9fd440d94582975fb8ea8d7d466bc96669ff006d465017763147f6c247228ee892dd949f9198143bf06d9c20b5db3af6313bd6ff00861895250e01b5f771f1110e85071aa57c30b6963bcacb5d0dfc4a2360b36d4ce796d81d37f2251a3fa95b4bf054542dc662830071a99314203e0b89db9dcd5915b66ba54079fbbfd4e4c3c57dee7fd5acb99fc674a0998298839f113f2458129ea59f241bb4f2ae1e2f37009562b558a8eb437138eb5c77a8a60b3a169fd9126f74bb3f52c0ab2abebff914068a2af631cd9c46aa9650f43cc028d28c402d60957bc7b992ba45c6f71cae91540c1a698bc118f1ff0022a800362662a6ef7f8665920a8e560157fa67534c0e8fa06642476d4b479e3d315676f12d3fdc1a6397787b9187f528977b459236074e53a9a608d8a17d9e7ee0b01c8998f414fdb2efee25e4e6371547dc767dc026575f188137dd75c9bfafc4a6720baf1fdc0c183f05cb499a5f72f3f52a1bad7c538fdc57f97f3e965ce856738d7e60dca655cae0c32dcb70b999b9acb3755ef0c5cba32ef5fc08bd1a4bf454b8a0c51a4cab77e9ebccb7d05060c1972e6f89462a01d9fddfea518690dfcbfa8b0f0a3f241361a571e6688941c4d1c77802679a66978ed2918a59d507de627b356b4b32c4ba0ec144e49c3417f2ff00c94e6063c0b7f457bcbd794ec5d1f47dc0e27abbbcfc407555a7a1ff00bf88080c88d9a2edf98194039341cfbae3dfb4a5a4c834140fa94a537714c1055c74e5cf6fcdbe7bc3c0d28c004fe1966b1c1c777cee0eb16a8b57c4a1ef2b7d577292aa6ddbf3065c5f4fa9fb86fc130c91ea6266ab5d1aff00d802555d4fd47e23a8cd1434be9c9f7d7cc27bf8e632de6d7a96fba28b5d252ab2e31111bcc106b7b3da64118f235f50cb5d2c9b2ba54b1ea63b75f69a86d82ba8caaa642039f3d67323bf3c906622c3f244d86cbe4e19ee2562b1331b004a1efc3023e94e9a3995ced30ee6e13641298ca2b176be1ff7595bea3019c59f72e70174f998699e18c7b453aa53c3bff778aea2885539ee7fe44cc927973f88c80d2bfd4d8f3bf931f89641499c629dfe65839b10ad56bf32e1ea9bebfe23d1365438c314dc36bc987f1013417ccffbe94ab029fd4054b19974d4dee6b716f599accbe98957e26aa6f24c37885333c57d37e8b58f42845e86e0c1975e95632dbf3354d32ea8e2831419707d15075fc11577666fd986af98f80fee2bf131ec4505606b9bad93230fa2ad6b3f50e983a56ccbff006510650b7ab9948d80017a3de2d018a1c2bff6634dc1e0422e9870755fd07dc4228ac7c0bfa816e9a4a74597068e225d8707efde0b2d7f9236c855e0a37fa9edd60114d382b6edef2c74d533c52c954b02cf6ef1296971f0f3fb84cf05a7b62bf305bb388f80de86ff001018779c45681e5b9d8fdc34da9dae25e9e993f30d55e25d402bcce636a11b3fe4cd3a2553aa3a408e4cc2c4a4c3b3a932414775c443bc41ef1a85c479741c7999786a1c1ec9d00de4f5e9ef2954949b8460b1324b576cc7e996a0ec96254b14cd93a8ec82839231dc890a8dfba7481c50af23d03911175256afa9ff003d10d4adbf89d5a4cf9372ac4c21435f32a2e4975dca930b2ee3281e123842bc5e693fe444d14385c3bc40498030965f7ef01652897ae8c31fe2d41ef01b8096264ddd77b8240576acf1f7167ce05aa07bcc3d4abf0cc8e271181d77952c7d58ef7ac25c2e5aec957b95589b9adcbe0f89579663405cb0dca2040291b83489c4a167a8c1d45060c1b84197e8912cb8a9f58b3d05141832e5fa7fbdd19bbb19f6ff00b0ce0ff04c14e6c037ba7e26d51adf7940281e3bc40ec744a08dc6567eb88750161a031d60551566e43dd2052c9b6e44d3f39a8f8cad8adbd67462280d969b14947c1122455ab1bddee030dfc28e7e59d3246bc133864be9105be5d7ccc3ab7c460fdbe62b811339b3f8db2d0267f2ae5fbc4a1d0209943f9dfc4c0290071587db532a575a3a9b33ed5314b478bf979fb87cc8749a71675cca0d14788eff00f260d717d21c0fe09d156cbbfa8edae5767f641658d1d236332e216053ed04068d3fc4c81cc5d0099bc8304c274958cefbda3d2713a8e23d1e92a703ab87afbc68c4431f4a081d283bf5f783941a1dbf1109734f70e18aa1a1c35e65ab74fad7fc65b081b1223ba4c79e3d18bd467c90f5a1896af263cc455dcf3ccd6a640dc58b99a8a0acf98e8ad673185e12c1c0f304704abb29ed19358aba3ff65ca8583617a08e0069496578f328795140c93257361f0ebf128830d2d76600bc519d9ccb2b1569ecff00d81124cd97ad4bb9c6f43f311d7c4ae907ac50d4b5ccaadcd649bed306a5ba9758d4fb977e957632fd06117a0c1972ea3e8298ee0e71288ae28a2b8a0c1832e5ccfb7f819c3e5f515ff8ec955e67e636e4d5f78eabb490966b74bfa81c6ad054fbadfd4aa76aeaf045145348d7913f52a53431d33f2cdfb778b8283ae20a525ea1f3271dda2bee2925a9bfb2b104ad05dae02063788754e8f74fb630806f70186a0ac970d0173eeacb0182b390b0f9208795f022a60254baa6ababf52835a7ce39ff00d2123a15028ae9518a174b7f31101adc552d66dee8ea42eab2b33e5d3147f9f31839bd27ea57b8133cfdbaca7657b414cd1d72226dd6eefee16b65d1145b9aef2c950e4187a91d6f530a2d28768587116bb4e86661e90ae1feb730464e2b921699271b4edff22038d70cb981f35a7e483748d8987b7a346cc4b7bf128be4cf9f4ec11679970ede0edffbe85c485bfee589664752ac5c9997bbd698d165c07002ce3a93aacc9014300fa97c6158f2433bbdee4b56dbfb6602381dfb91a962d4ff007cc1e4377661c156173a671325c2de6b292a93c389a8348cb8ee825fccb5dcbd7a2e5d4c72e2518a97537b9a65c181c4e29775eab514b83066a5c5945fa4edf4161634d4efd07854d6521b54dc1832e5cb86d7a7e6afdce5dbf49615e43f92545a68f91febf12cdb6eafe61a4f41f88b97bd4a6872c0231465d7ff00231a063c45a4dd3be60b3b56b494d0df3281e296d55c2c443216f763894851bf03fdcb5dbb7b54cfc2d46204d8e445afc4bc14695b761f65c040e22ee6be3a758af0bdd9aff11c6d120995d9ef69f30de0e6de70afb4026eadb9d34d3ce0f9e90d753b5941c3ee6c812141d49874a42d439ebd3117e7908be62b665bb32faeb285a9c67fb8a8c29d73078a43957f986ab4daecf6853117d772d2af77968547068981b7ab4c30137d20fcc65ba9625131c9fc43d8a60aad3a971c2e6f5e9e23b9a4966b371d1142db75e499b2c7835e658af43aa7fc7f5352e81c847315e578e19b940ac9925cbcbf3d3883018e4c7985e673d8e1fbfcfa25dcd0d37d32a629b7f52a05ce2fea0b6a5392acfb945e6c2e642b963e4d27e99817912612dafc398d65b5bd9c444dcdf986569726b10975b36f45ff00d982ed6eb09838053d2290a680d14748ebb97367a649b1fee32eff008d1bf5abe66b172e5a64dcb5cc585f4f4bebe820c1832e2c58e29b8c63e103d0214dca34d7bce62e11c9717b2a69201d30f84afa4fc0967429f2ff00c95438133babbfee09e953bca4128b3852aaa55dd656a55f6addcb955b13ac0ee4969434f4ff00b15d099072bbfb87168f8ca68ccc579062a12f5fe21baa14a0eae5a8cae22a9bc5c547d01c9ff9328fb0695afb7e650997cf83fefe222f555d4a22b341689c3f52df214ac039cf57f32a8c1d2e9bbfdcceec2ae4c63ea1b3490365b8b8189756a5e31528d7606355536042ad07445a47bae21a5155ba6e004dab58812eda79fb944c5c0de6bf728034edc4c750e9a8e6007bee92b1068ce29f312fe9764e8219eb5d61d763308fed205c70ff00198cb074fb3f33cb38e8f24bb8d157b8ea7241c8c8967866116dc637c3ff0065559d20b8b2318fdb8f865d39f422b92f4a9fe98c9614ca980b66d9dd133e6131a4898e5fe494e65970c952c976fa6585ad09dc6caba8ca3b36259262afc8cf20cfa8d4041ad14016dc5b1f4a1682f6c3b316260cea5180dc562ea595f27e2309ee401872415e8056d537535372a557adf12bacaef2ae67c6623d05323a976dead9d21803a7a5c50629730972e28a29ccb82e8732895712c6e66cc5328032a54e23532e0bf0ff00c9a0e8fee108d80f6ffa85779207b928fda5ee2915daaece4e9043202def55070d3027bfee1702abc3bfcc5107643b3715d7017d8ff5005b0ff373942cdfb15fa8956154d6a8b704b2bb16d325fef794e093638b0c1989b7632aee7d8518dbee665d729d5ffb0226101e29b7fdd6576750b74eb5d4fcc4131c61a68ce7c43b988d1479f796a82edb2eaeefbcab4acd67fdcc6761a2afcc7869e00976d794c2b5ed1f72e82c9ca879e094461fedcba243939ffb03bb1738275f8c7f729dc4f48b638d9dfbc6dbc6dcfb77942559ff001d6e531ea4b74f24c9490547bc401d647501390ccb055f7b8f407286bcccd96b5edc4d40a9b7f52f6dd53e48cb8bb5988de54cd7537175dc13617c414d683e461fb25e1ea4d738c4acfb1c1328283a8ff700469098f4dfed32d7444ee436dd13f3310eef8b652d5da02d481619697a2533250525381581cd081a2c2c829b0a9f6d4193fdcb3bd47f9f305528bd7cdce44e5f6886c19a23b1e3d3b96a73196f4f4c839a715fbfe00ba88400dca27b475b65cb971418a5cb972e28a2fadfbbcb41eb00caca92c6a05de58ddc5a9df6834224c294b2dc5f2f489adb55f137e623b10e4f34dfea340e3f77f52cea015f2c45017bd4556eab730fe6fba7ea5db911f8a7f52d97c3e860a2c5b5f15fdca70d808a5bb6fdbfec0e030fcca1c20e1372fa0ab43cddf3ed0535e878f31041305cb6dbf8fb8ae2ff00c3ff00261886abdb3feed0900102eabff261cc4f6ec76cbf888abf73b07e0aa803012aad1a0f6e62985b11a0af40b95978fcff00a94aa4a7c4a1de3bcd0776e28d996de982d8d1b5c7f7098e0c4717fdc569260fdcb691a3891c910d265afea06e6cc5f4e9128a87ed2c87b9dc95469af313ff001e892ad9b9c40155667c9bf42e96df7ffb0d282eb2266e2613b43b9ff26e1bdc8fcc6f2a367e1851f04c21b55e6321cd81d9dfd92fee094f858b2b02a7ccf197e2696e5817261f682a9e0cfccbab49c1bb398b12272d130a46f1711f0d64af481c00b7661d8c439ca8015a4987e6d8e15807e18ab15dbcfbc2d0507e670d01f7ff00b2fa7090663899efd291acbfda19d95372a54aefea619dc0dd95e957a97d6625cbf5515c52e5cb8b14516b6cb3a5b3277fb454c43e6080388538f4f8cf0223a44a91aeb29a152333123d06c86fa4be3d42e2787fc46d2f4a3ea523617163b89f1290e88a3769fdcc37c5fd2033a0b3edff00624d55417b950997907918932cfe73fb2028d2fda28372d1fef1326dd9fb88c68747b30162f257b1ff00616a6acc2e9bdcc1fa233a71cc1902ec1d4ffd9d84b87aafea1085ad0e2a6401692f568d7c7f534d0b23a3c7bcdc06b7df63adf043fa85903f6c280c3808271f51f9082b71ccb1b57cbe0fea6f95f1957f5ef29e88e3ac252a7a74cc9bb19672caa3a5e0131986f7e62304ae88b9435d98a14b8b74a8b4bfdb28b64b23da0a92b7fee2c86920e909118d5381ebcc4a9681b5f52ccda67c91d4c434a5fe185393232e3a764bf0ee0a2762605ce3a368f39251e0fe25baab55171ddc5f27224134a4b03980581adbacc72c2f7756c42bab60c92ff41994dc30b2a097c2b9202b0436d6f2915960bfd1f8983dae6a0ecb25919b7fd7bca270a0df86725115eecd725d3c4af2287e1ff905aec657bc5f771fa1011da94b4e0c04dcaa9552a78f4d6e5dcb977ac4b97e972e5c18a0cbf4b866da83a3317c37da50a989a55d4e30f6857880ad7f1b628b19486e11b494b941ae225775ddc43d848d79b8c13918bf11b49d1bfdcd5f23f2454ad834d7fbacc74151c4c6eded391d19ec4bf3322b5303c566233907b80a8bf32caebcfd92cef8fe65ccc07e06211ea87e22af01f923038093e60206e061bfdccdd4cae9f1b829d21463179c7586d0e69777c7d1173b555eec0aadfd730005ade6dd7fe4beb332dddcb9744581732258c5aa47bef8753b41b183b8c57ef32f9d4cb76c5d03e8c6ccf48b7309008bb77e6065e4487023af328ae707b4c5baa4ad59c32a2e88efda6104cd986730d910139587d308cff2e5896d0b7b4080ab66dac4051b5535d3880d60931d671bddca23c54a0c72f0e22a9800156c4a888de10972c6f94dbd21622122b27fae508830dd662022645975cfea150560e3bca40fea661575f92e0af13f9828762fccc4335fa95fb8bcd17dc60cbcaf923152b09aef39af26bbbff60ba2ad04c4f462b39b3f8869c5a9d0f784fa4cb7d16b73bcf2caac93de6b5a9759f4764dcabb92e5cb972e0c50971bd96779ab6fa1334d2f960e4f3da5155d2708a8521943d4f6fa3399453954c04a297ace7a3b5d4674dfedce80f42236ad5cf9ff0012930e4dfbafd92ccf4e5e1c7ee3665b0cf918aed1498bea7fc8ad5dbf713ddd53cef70081cebc7f996b8d9fa668bbbbf99b37617f22cbbd5b4b6b94b21295aa1cf5cffd856a77f898aa9e07e27b64fc92ab1dadfcc76867fe895b765f825864302afa448b4ab43635cfa1d07e20fedcfc4bbd3352c963a83ef2fb4b972ea8271981eb0438facef5c144d75fd4b2362392660e9d4584bb748b7b3ff9069340f9944a74cc8b668fd4ab9806f32530b9c66b067ab16c2879bef30015dee27681d12918ab8b274d2f021e085ab09788c5ba3707c9d69504106b2adde60743d6ea5dc3a1922abbdfea2394a9aef2d1c52bf0dfe22d0ed3fdf72822ac3eccc17355f44ac568bf883d653d95ff00253de07e254884a5c3862ae858f735f44ac05a85792166d6679d8fea08796ea99ac3df19bf108cd7d77222edd2bf04a15ca3bf68c6dd07e4c5f6833eabf8972e64e8949b8cd582de5c4b8c5bd25ae65af32d253b268b4f133048dc9d066e28392608bed286f1ed01d61aae20100bb72fb711a03436c372895e130617d6a05a57b4f088e929e9c2589e13c3d1e1e9c378984bb7a6e63e875770a5b2eec7ac883894b629ff007e601fce43c87fc8991cd87c7fe4165d5a784bfcc220c2e9ee67f1368eb06c2e959e3fe47ed08fb7fe4a0fc29ec9fd900dcd2fc105d59ca9ef5fb97114458719abfb8184d95cf173a86bfb27b03fb4353a3facc75f739ed28d56e147788c58aef3e2111aad579806ea14deb9fdc517627dda9832201d8312fd0b146c8bd25fbcbae65de25f496416591e914039fc3a7926568e22d8dd1983d6932053714ae432d3bd106cdbfa968deb508ee020cd669e9322742c0cc12c23b6a0d8f3ac5c57193a1528b998b63e0a3d22f6ac25cb42afbc1cc5763fa95832ef0f098e5141169c307805782afea15344cabc07f6c0b1682fbffe47adbda3f12a01c9f8a5c3a5fb32fc1847fdf1152d1a33e18c1d5c9f057e60161b5cf6960b6d3eea3a8d880e31cc1079451850da2fb665ba6ff04458eb5f199a7e04bc736beabf719a9db982cca9f815284c641eed4a5aec0f97fa9f92107bb7e23e52a2a46ce00450189558994ec9f1955de59dca959971f533ff008994e929e48a7f1e72e5a057c5c1cd8560c197d35dfb466b2be9a4aca74959e13c252771368a66efbe6e9f11f41b6204ec4b0864494fc9f68045c5adecff00ec45b7625e46e097136765a7ea029e10f19d5c44e8813f3f98ad348fbdceadd63c9a854d2ca9791ca3f4f1f333465a932a9fa8929c0bb14dd3358bb1b3a4504bbbfa7fec52317e1ee4443686bcddfe2536caff001158de4df167fc96d35c78bbfdcc0774e2011365fb18fb972ea5dcb7a5e62fcc552efcfa0082cee0e4d9ee4b63a371ac99053de6d93139d75ed28eda7062401a798156a389936ac4bb9b48e21d68e01a892019b4960e07255b36ff003b5055448839c4d00a133b9a8aebe2e121b2e2562cb8f6668d7458c66e9696d6e2d9ed8be2aff5284b07abda2d48b85b4f794d443661d3ff0061c634ba56bc7761bcbd413ee355b84c539208458e41cbb951b116917b407ed8b63a91020ce9ecdca9b9417dde65056ebcf9835590bdb47e2039c11e5c7ee5bd4257bb0703224edd01eeff00c7dc067164f03094ba0be8ab47d4a86bf6a319c4bec3fdc5fbfa5dfecc4b1a2e556f7d25194393b75f99400a02539984a4a4944a25206f52a7105a006d5a08f9e5c1bfbd4b5907167f443b93b2ce8df93fa8163ae5c0199d6681497cd33254de88c4637b5c40aed5b0fbcdad34b7fa942b4eeebf551139ec6a9e970a233d1957264f4d0b103bcbf05ba98261ae9da5ddab772d2a651f49e9f428bdaabccba4567f6c154bcd8f87fa6510f30f71dffbb47176aaf63fe4760b096ba987ecbf7808a917e1ff00d899604b3ac301d91ed67e63045401e5c9f70289895aeab8f19982eb07c5defde15d92a0bbbd97022090870e77e268949f93fb9584c5305c62e81e1fea072d2660c9e03ec8ff004cc0f0897e48ede80fc97fb987f9f0cbede84352e2efd499952b129bec3920b4a691c54bd2a640332b8e5c5d41770f7b8824c296c536e0c5bcc0290a2e0a5e47e206fad7e25c5eded2eb2cb0d8a2bee5b5dc8b41e48b3384a9a1038e43fec7688bd3a699716245c39d7ea22a168a560db1c92141d8e3f71a166cdb883959316b26249bbeb0532fdbbe6e6a23158c4c003b370756def551d34814363e26742afa97d497777b6dfa66d1cf0d519ac10efb1ac02f403c19678a9fbffb33dd0df1bfd4a04da3f310d9d1f980dcaf75d00afcc60d5758bde0d0618780fed657dbb7e2e5d2f31f4b20bc452d6d398b502ad167f107746b911958b4e3be3f10d3e2504a19e255ec9af128e332967503cc5b58f0b6ae0a8996566eaf1de53b75d68b35ab0a34fb4e9fc88aacf9012c7e071d677543f132e363310f723ab034c6ff00dde260e5da5b3a6ee68fdc4047fc7b4afbaf11f086b21ca5c3ad712cbd045f77f72e874c9e5f0c2c55b9c8a7c4572c85332ae54af465b8c3483d2626ab1a3c64fc40a3ea1f8afd10a70517fafcc727873e3fd714b56aac70f3f27dce8629123eb2217a261945d3b1004c39f897c1c7a1ce4f8626ad5170c2568fdc3b79634534e39e23b5664c550f8eff0098b4ca2955eb07d463f0897e46cfa7ea2331013c32afc0ade129845c3b9f653f72a0d97e9fb88eaa6fc8d7ea581caf915fb837eb7d25defd2ea5f7d4bf5291705fb37fb829766659da4b0cbfeb9406847dff00ec6ac12e1ab0fa62aeff00c25f4328a86deec9f7ff0066ca62a6c5a92c598b717cca2865198b6ec25be1835dbb43aa642525054b4d650c1e668b21797ee512c3563475f77f10302a77e1235d40a415d077c6fccb627645c60a5bd5e2d25a6002db4b612f815547040dcd3cf89421a14972c42d3aaa8881937612c962a6ab3588af3b45a74b96259ba57fd8039482da5f3da2180a8b6942f26a035bad4ddc54b9c21a327c6a3f358a26832e235c58b7e0881ba041630b17755fee287dd74ae7f306f1c5f18c245c213956d430722288c583e5864642845d830cdda57695da6e244b957cc02230b16dea899846417ddf7f12b84b07f205758bad95e95cc7ccb739d3cf1e0cc30d391174ce3103ab305e15cc2a02c3bafa1e5ef1852152f0777ab28089e995e399c558f5894aabd17c433828ab9357e9d612a54a955e950430186aefb1ff00b14c9ba42fbe9fa890f683e39fcfd4bf27b7b57f70de6066f6e9f920912974d675134e10064770a910aa30b4d276950c3daed471f9fcc1b1b69e430fe2fde0f633bc7f4fc2591cc3b358fba8f81542270613e6a5dbf72fdbfe3f5028376a3c6bea61fba1f0ff00d25ddb2bf3a7ec89a95abdf4fd4a5a3beef86b3f64aba2e5e8be13fe7dc603623d9b889d9089d1d3372fd352e5be9b9ccb9d953ec65fdc12cf45fa91b5161f988e0620f1829005b50fc41abebf8976f1facb6e22b2c72cd59511159e9c0749647466b103055de75da0a040e2ee54e64c9db99413dc99b85280e5be6f11c8edaddbfec02a80283a4b68b75761d41a0a45bd54cb2f0c08ddf4810400b187170cff004e365ef10ad8a76e73331617ee72c15e94bbc62a590807dd783e084782156d6c83df55a2cd413bf547760347702fe22b45aebcc61995a3497fe258e006bc2073e7da2c511ab6adc44e5055eabad1c463db2cb647d40e0886e9f1adcb4692aacc05698d9e2b615cd415d68b476f4583958c3c1e929cba90c603fec5b554b29abcb511fcadf55f2c65c8753336a791510e652cae254b54b959c1bf9d426770bf1c1ec4bee7a2928731b141956a593a2e873e0fdb2d7c6c5b7c5f07620a29d12f04dc6c3019b7512ccd686abe7b12f601c600f4afdc2cd1f1013d56b19813c082fe20a18f1e236448be6a2a8a2832bd2a54a890f0002bed106e509f267f112b8ceaf26bf1f714bb8ba527fd877b568ff772587145baa79cf1c4a71a90a0de37ce4dcd81e0d9692afdbf5299c30bc3860048b0c62f87e610950407e1fc47d75a3b3a7d93ee33504f6d2613e66d8a6d380e7e1cfb4ab016c5b3ce238475e9c9fd9f88ee40ed75d1846c16d5db72cdceeaa7e2234c9ba1ce6074066139531f7899366b7090725efa6c7e31ed3506fd2baca4dccff0a9a3bc322762501754fc4a302c37f2c72b01b6549587677a8a6f42bc430fcafc4404c5265c4d2fbfa3fb82d2d4149974cfe20767daacbd88ccb6eedc5aecfe65c5e46c771344da328296f8fbc0cb040e43971158bc0fc3014463a8e3da305047b0f3fd4b401d456bbc3dc9cb15b5783dff0011986a36956d971c06b668254424fba9e0bf6b8359b61fdb926522b6068e5bff006e505cbf33c7b4362e72414d9df5ac7fd9d62ecf797ad78c1597fe44cc6334343af18fccdbb3aaa378afb838454945d84508219b68a1ccd8c88b575ffc944ca6694e7b47a74515bc9adc14c2f94a5bf2c301d52e268700477ede98c6a22d38516ce85575cffc82b0e604b6006bb24d5e223409dcb9cf8ec54db1fb3710d2f84e0be0c025bc43c1c1ec45f79e73b960694ccab552c95f4347f7ed012875d1eda253fbee5f7653c5ce040794701caf8e6321a69eaceb467f1156f72217ef770227501ab83454416af8115fb89d5f020fd6fea51aee187ee7094c1457a91e0cc23f64e06a5fa8a0c25fab1f452ae940fcfea5f9a1cf8e6528196f3c5cd30c7e0d4ac028f68f3cfe2289d835c767ca7dce7450eec9f7f9858b16df68a80155d7675fafb840000eab1839e917258d37aecc478da96874d99cc55d38aa0de5ca72cc0bd8a1505abe9f72aa2546cd23ab5e94eb98fc13bb6d38c5712f5e022e77e60a0e5c874e4fdc3b15a309c903da5c875e7e49964458531d31de5c956379e49a0145da3a3ecfd5cbe3d2ebd024dc4b895de712e53c855e03fecb33e088ca0bc0b72996a8556b998ad76846be64688a57c9fc4a0aa8b9ed325d0c1273d6721bd91755b0039e904a440d0d46dc2dbacb1733932f550b82192f8e8e9de5d0ac63f52e6e66a981ac8d633d251fe9def0d1de58bb32743afedf6802ac00aa8a0e89ccada211368d1e8f3fd403e3fca5c3a93a83feb8989145aa1cbbfea1f394aa8a751b58a0b9fabeb2ddc314a4c7dc6d35457bf5fb8c1b2d8bd0d7f733ff006662a2d8c356e7e882ed001d899a0beae7051f3026d428d5a197e622ed27bb97e26b89b79ad1f59f7815a85a0e56898801376d63cc691403947985a8a70522620a25de08efd036303643f0caea678d7f0c0da6caff002e3dd808e3aadfe60d2f040be33966674a359a8924d009a1cd24a42db9413f37f50ec07a51f98fa6e2b5fad44d1493ef16440eab1f7b28afb198163580903db6fd436acd85a03c6be61fa8a6516fcc03147bcf1825bf810567a9847ca688e4aed8b4eb6ed95b54644a7f476213141b0a0bd872f96628276dd57adf307873bb3eea6b43c5bf1123307025f05e501fdcb347c0dfd3983a8172afeb7f172d0591de28087fdaa74b6e3ab982ea2b972e5fa5c6514f45fe086e096a90dd134fc42b928b414e25054d99d6e22ccbc038f76191e5f517c18cd798a1c051f2239dee2e5655accbd352d8f6c0ae07fe4b471d15638bf67f3041c057dce7dccfbc082a7bd74703f7ef321503d113fec4ce8a1ba5323ee7ea571b193d4d4d30551daf27b3f994de467cce22b3f45d4e9ed382361e8f0ccf2ad93a7a7bc1e1397de058683980181e4f1fecfc419b9529969a9772f114b80ed67f3dbfeed1e0e3997e4ef3ff00545431681da11976858061fb7fe4623502c2cc45a4cca1a6d3a399c867e01fdcb754d40168ab0f10b5c06aa7e2a5c219962ad830facbc45c78f79843fb25ab58307dc1a3b0fd4772ea30e4c8316ad76f30568802b11d2ee632d035a16eebdef2f4820683005012ce1743f732c1968f5ebe0d1126e8adaedd653222185b6e8c7422582fd2327ea2aaadc1d08f0b3a8525768e8580d9759a9620baa1f77f5f32aa1b4e7bc6cdc7639747efda17427f89b402bae0e580aa8003b041dccfb3c4b0cb3f6c0d141f239969c06edd2c0014257b33abe8edb07d08bd9c223489a6e5cf6142b8616fc66287265d8f86c896cd7457d87ea6788ac0e8fa67e66d099b16bee2ccc77451fa398f00fd554b98fc1fe1306dd76c4c3f9337b5f63330df6b03f0b36c5d2928f2bfa8bec4715f82999dc6e90aeb4b7039f760a3e76c0eb0f9b7e7112f1a2bf11007dccaaf973368b5d09006cc74a8048c27244955d47f3013dcba97e1fee5c1e0d265d28c915fa67bf7be48a4c77f7def72e50c4940717c830115ce0c95fa948ba7a3641a50fc31700f91350dc1b97e97165078a1f6ff00acb9447754f26fea51d52317d793ebee6c5a8bee4764b12d764dfee086a0af91ff009282d343c607e4cc7c0107e3705fa882f41bff0079940a09d83abd9ecc49a9283d1a7dcfd4b259675f1b3dcfc13345d2676f0febda50fa710e9787d9c7b92bdad31e8367fbac3fe9bc2f93dc9b74163fa98b96e1df93dc8b5d8fdf47bc62d4e40ca1cfb7fb50e854587ee3d8ed3439ef114b447a24a2b47c1f93b7e25b2e5fa286a6132dc49ba43cbc7f73200dbeeb1c932f0706a3fc807621e608b1fd4c0d56ef67bc3df814fdc1b43e07eb7ef1592c51eaf53fa86f111c08db75a7c46d960e54fc4b305568a410ad6e6aa97a57ed8148a85ed9f06221a9307055f5dc681e1a0a7e7982e6c0e9d9dfe6570ac89d1c91d3e260186ec1c4aa7cce603aff0072d811dbb6fbc03902870fa81d19d6ff00dc40a3405dac182184aa2385a26f2fee18542e2dbc12ee2a1f884038ba3cdff50ed0602f6abfdcaa7e8381ef16ee506adec51b60e8be356dd220aa155b3ae3645617551dd38fc475c17e2bf12ddc0e02c5dbf101858e56c48990e05eaea83f70702a95e735f72c560547b0b172a25970581856e5cbdcb86a1b87a2f8362b0ca4b9f941fdcb674f287eb7137d07089f4e221763a8fc8a948da6467e05fb881553567f259f52c98dc6707cebe25afc114f3bf8a8fdfbb2417f2fbc2a6cd504c8a1f64239e05596e2a238ad768170782064a11f5ca333a356401c13e20e80bed09038a30cc2a59ccc40a2251c2d8a2870607bf4ed0109b2f8f341cf7941de8a18af4bbb958ac524b0f7966db761fce5e8b6c291e2d7d9942d5786a6e179619c883e49a46e65a82c9aa1b88ff22fbbe97c7b1d46a2af083fd4fb4001ca5ff8fbfcc5299413938fac7b476f8ae7b9af92131067686cf3fdcb58e364183bcf73dcff007597eb72bd793fdd197085239c269fd7c4c04d70e89b204d675a3059c9ecfea1796635d2a6b975699e1f731340630f47866494ede1e9e199e00cf9e18915653bba7de1466209b93a2ecf0c15c9b363d18c84557acff9144af01a6e0c9a18d5ff005f89e7931de5d4cbccbbd7a20a6ebbbd3bcf31b3747fd8c0ab2f41bedef00b40669d76f6960df01e3996196c87675300d0a8c60fcc52712cdf07ea66c971ff002e07314d555460af79471abbef6b06e500cc475eb4bd6e5b793e6596eed3bb95a98616dd74331b75d690f3d7f10a79037e6f50a197c77c1f98cd1cde9ea4082f48b6184d301b1169281ebef0d31741518da7b55d3c40ebe8df35047445bba4ccd438eaa0a3cb034802edc0044ba4ddee260d13a60ccbf19b09c9d1f332ba6fe23169a6310f7e7de3607011560eea2f4d5059be905f8cfe8347fba4a27967fdf128ecd58f3988294c27ce8f8965f2ba15c1f57163b4b8f6bff9150a5f3d65c5150a5469e87e622fb406fec9f9134fc916800e51d4a1aa02a6463c358dedf99466d8ac4a349f398b7f54533717fa37322a3cad1f92057e53bfa658fb051f88030dc16dfbea7001d2e7295d8821784130b3de6456019cc01c355aa60eee87a92efc161cc1daa622a3c2cd394ba4609ab54b1acc187465bd99a8fbc6188b4a66a38788c1c25cb84f309606dc16d54bfc97b6c7f32c338b8fad40d86737572f0b1e3d0d137db128dd062d6408d998ed3e95939650dc83ce18fab8ca6373ebfecfb4b15b3a62387e7f709da85efb7f51f2a7c1bb367fc9a556bd9e4f67ea29bdb20ece48baa07e0bca7fbac506fb9d3d7d9fc451f819c57f49fa959efddd367b9f752d9ba37b6ffad7c47abb2c95be5f1b9b70d23cbd1f7fcc7a9a3cd6d0fd9032b000ebd19d386fb1d253bd0c2e1071ed2a04b23a49b00baece9e7a31b2d26d9c0e3f505370da7116311b12a515138acfecf698eebfa1f8693ee6401f19fc42eebd8e7f13209f1fd7fd9714f81c51d2b8994072e219ab660fcbcfe252696565c5d7e3b1c1ef2f542eb896983023bae63d8c679db83e222d4bc9dbe3fa8e427955971158314cd1edfd46b0bcdec715b60930b365dd7b336e01d15fd442a8ab52d5fbb062e467665aca80b4608128ab4b84387758ecf78dd4ad98d09880c67037e2574dcbb4f7859a0cee3b23b631daf2f596679b6067e8cc221f55cbd586ab767e63a7b3838ae9fdce0ea2defcb2ece5610875c17cbfa22364e8df1afdc604e11c872fea0e4857f778f6d4026aac32d1d39ccc82ccb262cdfe63c40badb5b6efbc490c79f837080bb547d4246ba677582056abdda744bf4ca356871775bfccb3ff0084b9a5e0b848ec3da20338fc12e5cbf4b9b946f4cb4d7b1cc565b2d8ae00ab2e7171320fb4b8b2e59e251c307c2299d4d1a3c3308d8ef05b6fb546695371777806c1e8cccab74e22d4d5d483dfc2c4a5e36188d499cd3e5de500dba2547ecb8aed3eca4c03d89b9c54f2a8376df6182f85ba12fc22a61a06fbdf771eae90c1bc76816614c62a93502c5645f9ff001ef34a80b74787f5ed17a68ff7fee90142dc0d5f27fbacd014e4edf83f046f1ced08c3733f67fbac713a456fbb38fafa80169cb1ba1c3ecffb1052e051e837f3bf78195634d751e13eee323a61fb3f5010dae3a22e4f68cd5111ed37f7e1d1767bf1328ab674791ef17929a705ae7fb96342e1ab3accf74a272eb3452301aea572778614e6170bd9fd474ae9d30c2abe3c9a7ef13e5f1a1f32de8bc13a05947e05cbf1c4a6f234f51f331843a6b5670c0418bbece6710b955b796206a065e8417645f468f783903d2fd4478863cf1313da987377965d331aca9fd45842babc3de6292369639ebc448b01b372d02d1af06a18b70e57041019e2817ea1d3a1573474bffd966c41a58bff00798148a0d2d677050054c5e220a25305e5c116e703aa43a57abd8e9ed2f947c1bdc343e16d67a5f4eb28a9bf32bbadc3393539ec66f07480596d5a081771bc83129eeef5cd44668cc719fdd410f9c6acd7c7e6515907e662a7952c687a780cb3fe86ebbf7896304b4d0433e480eb08d0eab514f3d007785a1b15eb59fea0d45631d9fdb284717af043d2ff00c22de597e800542a3805ea285461a6a9a2e51fb0b9676781a987c855fe25da8b972e5caea890334ae50971eb4c4a9e202328c324c098966e0c68bb80724b45acc4c13302dce94bc47c6786515af227521e12680fc666169b752a1c42aec32c8f0a00885f4955e26ca849c8a9b33e7b462e45d2f03a54ba2b16dce665096b08633d66853ca000a59ae1e7fb86c36872ff00bcfcc15285eda7fbf33693acebd3eb1ec4c102d9e329efb810d2a9d1e4f67f51f3abd47d9ee40e203af74ff7231c0121f26a918b02a14f14b87db4fbc11e8f1c747da734e5e0b74f84f87de12d8e7cfa46629b85c5bafbf3d2500164eb292593f27f64af50c2732c55fb3c05f7efd25ca85a0c5739eb18d4b9a7b264f8e3c92d27815bc767f4c691e9ce17fa62555bb0bfa987802b465d7dc1f80aed66080762bd20cd41c72fc41a6904e5d626cc88bcbfe3b4076461ca52e3b7a4c504cbeac30b592ea64718c395d4153208a1b79fcc552682f43137c3c2eaa3fecb5f3e87f13399a6c2fdf333e20d70f364c80f9577f3731f6d6daabd37014a28b807104709757188ace69652adfcd44f78a8a03a4c4eb6238b48396c7239a7af984b55ad1e276fe25e92864fcc084b43ed659fee2dbba2735063d0eb281d56e5dae5752e8399a7af0c58ff00b713264fb831f0e6659f5dec59f9652ea62cba0cfe08dbd15df83f705e4161758b889773f3c7dfe212fc74e79e6682f09e035011a9a77eafbbe8a566b1f1b7ea50018a25cb835590aa6b04c279a17f12e5cb883bcf927431e1a94eade4b94ec276661b0793fa8bae02ed8021495e98dba003799930e25761c710bd9e25e91d447712ebcc2df32e1896c712fee4e54e65fe239208b09192da1e62f45b754b8a87335e5315ad40cdb5445444d6c1e3abdf512abf9bb558a2a0dfef7fa94202c0028a1c7d1e86c12844d0e1a984c676cfcc24aedb81e3311cb39f17fe3e25ecb30ec787f4f88a951b59baebedfa991ac91f67dfc3da524eaccb81fc9fd4bb2b08f1592285855bfe335f244629e8e83c3ee44240c88e793dff00a8a1aaf2eca1c793f1e2510606d7b393faef1d950b17c0febfdcc0c3ab7c07afbf3de3a1dc34f6e3fa978034f47acd902bbabe1eddc8baf16d7aba4b5a836183faca47e973279ebe7f30424691b1960eb625cb958fb9f1b25bb83d57f5bf880680a4564aac7b4e437a845caa9ecdfccdf2f841f820b279b01f3b8215ce41be5e6a1df69957f24cdcc61c95dbcce5b2c0f07f733ab25f80ac3f2ffc8a915ef5cf2cca9743765545081ab6f3596255e7b31ae1f3b9e1040565e325e895a4430537cf99678193a7e627a60a8307fd8b5e3d06fef51c8115e8fbd1f1729879a0757986c42b76cc9c7bca24d28b5dcb88b0e9b4a6afbe62471ae629af45329fd408a355c9e71f88b3d3c9d5fbfc4c0b9d9d88cd68d1caf496fceed42f041071747fa96137142b0788f9c115edc1fb963b4777da0e4e953cb7821329407ea5562d815dd8825aefbde5f980984fc179096b695ab5559b3fa8e620b7de221de69e972efcfa39cc0a3dddfd7e65cb82eb567ccb5b6563b56e839972e5cb972e5cb8bac197eaaddc6614f329599902ca34ee2ad30073a60ddf1145bdcb314cb3c4be932c3146bee158316cc4391e2e1e88e1e2a5961c44e151af2dd039974fd7b27aae7c6bcc407f74603adf04148399a63b4fee3b8e5af8235176adc2533bc1c9656a2ee5e0de203908cab7bcff008fc4e8722fa75fdfb42b0e530d74e1ff00769accf2ea71f9af0c4299769aa34f6ce182bcbc15473e1dfbbd25b057e2918396fb05a1b6befe6647c006f29c3fdf78b8591276d7f686c700e93d7c330ad25383c3effedc554a0ae0cf3ef0cc58ad6a871e4e23cab7382c3f7da0635c0eb91fdcaeb87174ff004ffb332f69b391e9532c49d87dd3920ba2f1dcfd9301f7b69fd7bc1867308d9f32a0d1cbf884b30bd64441f88c0d52784e65e41dc675566db968cabea014dabefe9e7bcd7173901ffea0ced25f62f5ef12aaa9a18a0e21244c80179dc5144e7503fb603ae4c0201d2ad8286955e8798b9242ab03c1ae371d37ea67f10453b46abd2f132c99ab6873529565ca21f794215d569aee430383bfbebea2a2a106e96b4fea1249a5df3d2bfdb99c6e0a3a7f7f899755693e7e3f10283de589bdb0046653f0f4ff00b13b23b144b0e9069af41ca39aaf79570357c61fecb29128a9eeff0047dcd322f7debe08c17b4cf79718e3c402d4107b106d85c1cba7825a737cf63ff25a2a04f9b6120da7c1d6563a4bf3b603d30bdd712a0c9dc1d4cc7e49a087a585fba78fd7ab8cb4bfa269f31d783f883172e5ca749478964b1e261d92844704ab8fb874e01a2690d4e1fe2236fd4141a47f30eb7e653cfe61cabe60dcc1f961e084c88f780040652a8f2c472fc47e039fc798d2df2b7edd8ec4152c64e87b1df982045652d7aaf305d4a6f201f741fa8efd0b5b48fee6cfe24a7090de2108c0c79e187edb7e073fdcb16568bc73feef1a159ad572310c347edc3efa7b840d6c153baec7670ffd824f04b192a87be39e48eb91e41050caf3cc9e1fa6528463f23cf1022b4f0decf1d196660515b3a9e672ac53e43bf73de0b4c7b39fea610362159674979f54337d9bd662d03995a66843b394eddced28773b613fa97026474cdb27b3ff0018b9dba34fc386642baa0bfe99900db09d00634967515fd4b388f4bd7e2511a3a257db126bde4167bea01edebb3dba110341d4aa778e8f6291e1e1820ccdbcf6ef2855dcaf075efe253535d89b7acba173b648cb5852f2675030a52a1acf4b3a4ffa9628a9282fb11e08968796e97ea5c13f551fec4a2c04bbb157f44c24187b4238871d7db98241580abf68059e52b5edbd7994a32e2ab3e738f6f11036bb6c34e3e588a050eca830188115dab8203a180b42ad17026f530664a018364bbaf8c4b4e00c556718e0fb61aa63114078839af987d2f6d5dccb15ad1c70d70743de58356ef669f73316ba80f1fed4113f32bc46154f6ef59f7594d1451fa12e1c55ef3b8b9a59f05ea60bb7a83835021297e5151d08ef0d7a58c587d825206351f64c3bf8944320fb82c1de3aaf1413cbf81f3fe02e5c1a82cb4b596839e20ba8cfa61353958958370732ef10041b84e600958b1b53347fabcb16519ca43dde5f31b5c68603adf0459c39e47c73008403005012895291692f805fdc7705d43bc12fbba97f64b1a2a02e2c6fe9111644087dfea6ce1d0e8e2fdbf0cdc17e70f1fefdc4c1b83b3d3df8ef0cab793939f7d7983d56f1cdf75e57d5f48801b78e5fefa838186ebb36fbf6778ab1c9094ad5d75398b301c97b23206d678b2d2fb27e982967d0d53e5c2709182e424e1ebd11bb2542eed337de68efd1cf44fdc0c6bad90eb7cc1855d23632f5e9219f8e65748f4169f9252276b57dff00ba9822d8ea9bb87bc94013ee0c4a2c35bde0970435e8a7ec06725bb96fdc0babc7886ad3ac17fc951c72709ce2123125b7a3c7ee16a67cdf5be625968a8f1c7acd011a1d83cc24b647176460d4eeab76ff009979d8b48ea65960d46f34bf64536f814de783700bfda0fbba7afe66168bba3faa8095e0416bdb2fdc00d6d520d1b5b75d2fb33bd09853dce7da12544a1fd2006448a61f7e33023ed6efdf2f1c11e34b4692f21fb6d96c675171d1feea44b15b4050f0db8aeba8c094eb5395d17c1de502165030a775ac06bb91e9312c1dd157775045a07461a53a568f9895d8af3513632fabc9ce39b75e25a3d1b6b7578bfcb2c8c64ab8033ed899641aeb0e7df825c30803a1961b3f000ff9e601fd82dcf49b00d412ef93e08c92e62daa83eefda2d5bd5c4af4a1d4bf81ff006246d28de00afb4b31dac37d0b8a8788af56d2fe92fe8125cdca482e59d495de05e201b8b54e3ccb5aa7ee53b9e7cc0045cf4a963a83e7c447ff00208aa38e9336aa610cccaab1d6e52d6414b0f673e75e631ccca2ab3378eaca3ec71e6272b32867baf986466f112547529072df007efd061069721ed0ff00b0182ea7549c04a12a471b199794d9308e9fd3059312cec1b2febe1e20be8aa8d553d7b6be650313f0393dff003165a961e1367e9802a2ed0e794fd9dbde220628eacbb3fdd60c5451d17fbf3dfccb07f68494d902d74ab988ac0b6b87f1fdcc5e67ceafa453ba16d8290d95cf89a62ac6d1de1c7895cb230e95fa8bda6e68b2bb9fb95cfd64e1f7fd43ab373788ec1ee6a67989c0bf4e262446e85f9a652183456bb40146d696bf3389f07fb9977e1bf896ff004962f68d5abe8b96ec4fedafcb135ec71807af78835aa43939f8ccb061044764bcdc5a5ab17ee1a7968b28f57bcc99056caa958c1d47da362b5ae03a7965192568d5103440e0d2fbff00b71f0bf96f15cbfd41468941e21da5d6817200f5bec425f5005f77497eff008269ec63e599dacea6cdb8e84a30632ab4f06a2e2c7072270df2442e206b8b5a5f6fd45e64065a031ad79608cce6dd89fcbf444dc4369f39e0ec74844e964c65c87b18f6882cf6236756b75f04d8326cfb0cf7cfb4632df70ca9d2faf6940a74b354d7f6c687229ef5886a22952eaecaff005cc1100c4eeadbef2de357ab52e5afa3ccb6490d7767fa37070c005c5b5b97d345576e583bce8b838265438f4dbb3cbdb97e210d4007b448c620d2c1fb9b6e0b35d65b297464ed12dbe29b357ae2e284560a5aab7ac62934cb1bccefc4a4f299e194bbb94c19b207240c19673118cf31de6f9e9160cebb406c3b0e25b95e6073c5dc256789455b76f585aee79946dba3ac2ce3cb6bd039fc7589324b634ea8df8d45327807ef894841715b7f1ccc20c15802a395c2ee5050d0451494e0b3412de4adce0877e9210362bf83d687705e259acc1570ab07bbfa778b1b6d9338d95f49d267acd0f0dfbf5eb4f3146a569d2ecfd764883b06dc9e6b8ce13adf5269120e56703b9b3e2610eb3c59d3e1ff006a033ac2def1510cb2365cae47fdde24bd286af6bfc3372c5397bbfaed326ab1c49b29d274771c17093539ec3ee5b4a8042be1d3feef1a0255d29f3ff6691ef6ff00b2f333c8617c71ed2e889e6dc79e2520f603f3a603ac3282ec13ee0c4314145dca4462703fa99f8fc9fd40edcf21fa9c1b757f5501aa7e82fe60947718fc242e90f15da50992d5631d2f820450dcecff003acd81b3bca591ddf8d4a65ebaad1efcb1cce86aaff093f1f1ff00197a5cc0141e343729ce4b117c6983a913c81f822177515e5f988309741aebd7302f0d6df2dd46e8271002f8c4ca2355e9797f5eccd16d01b63aacd5f93d8a60a75ef36ea442a74ef9a8db99c076f7e628a87680fbebda5239b15d0d9efaf78b21382553a59bf07bb3170af52ef7e3c12c952d9718ebfbf78913774474e78aebf130b423b443797e3de5ab41655d04b54b1e44fd4a5409ab36e6bdb507372583c25455c335abbf2fd4c8a5d4f1ff009f9947aac96d0e5be812cc39a3d9b7dd815632253af12aaaf6efd11e4534e0dbf38f682da4d04bcb25a3702d3bbe9165ef02d25e1fc4a109587cca393bee0b85a9474c659b665f8653a6e586983ca932d17ccb719f129de529e60bf881dd5fbc0e28fb85d18beb1460decb9669a3960b04e399ef8ce607789677dcb7c0c7e670dcbe9c4597f3035d2ae3c6e2641ace0740e25baa1c6c1dbbc017c0b695eb7fa88aaed944c94ae584687e7d1a72c57581cf0213a8bb90272a97b27fc982c5980c3910ec89fafe544b7a4e50f1783f9865a7f3455e6bb5e3dc944b79365aa9b3e1f6788393479f317e1ebe18991b88ff0044fcf6613755cb08f278bf87cb1595e5dd3f91c7c4600dba74f5aed36290934b47779f12894413e9dafacc759c66ce8ee6e50db92c669d01adee5bdb4ae15c66ab1ea7fc8af60dd604eb7c1da0922ec9475b36798382b76dcf679250ad58ec4bb985ebe34f8fea24b34c695e36436526efaf67fb958248d954db34413023588b71b88e83aad4d1d7a167ea62003a147cb9fa9ee033fb7105db3b5b5f7662c12ddd753da3134980d83c91335260397fa9ca13b0b03a77809770b56f5cc634f7324b0d570fca6c19b3b17cf98ab52bb8ed5e080cb6398be2ff002c236800a34102b3fb47d4b40aef9cb002c978941be0fb8117dc7ba3a6281f9813af6f62d0743d8eb2c5601050bcd751fb26640368f9194547a6b3db9af300f3a2a253cf3f88333802281c1c3120ad2d96f78eb506818c7431566dec63ab295c68f8a37fe08ab85184a1b5f771ed2d10f09287fb07cc0b5beccb367ddc7bcd200c3f97a1140d2c3a071faf78c3a30d0e9e6619d8c72661741113a27476eb17701fa10d93ab3e79976db0e4cbcba0dbf12a9c403a109961042a5019f1298d5ebc10d4166150825c7f1ec3501afd99b2afdc8f07f0dc07191f0928ab87a0065257a4043db1fabb2a877107f52dea57506e07ff00046edf846657e116ba3da2051e929c14763735ca2b050804396781e596fc886aaf93fb7c470c2cab76bde26fec909fd04076380a020b9f016cea1f7a2680bfb8ee2407abce258016e8688ad5bd934518231ea21f673f519af863d403417975327e2bdff99bd4945d8ca4292d3674bea7f4c30cd723d32f85a4e2efbcae4c6d53f6a0c8f26382502de3609c67a74e4c7131e59ad2a363cb5aea636668d6dce1b0e7c92e0d90c35e1ecf5eb2d594b74e78f625a0c747c5b0e8e9cf98d7518297dbcecea6cfa8155da372e43357f5a8b537652cdb6eff001f883ee662f23bceaafc43c41f27c95fa8532762dbad74fc41ce89b5fdf1e19d22b389fe9f68f230cc3f9a3f732e3e4b777de1b4a0b76ca7923b53a6525bbf3ffca743f9a6fe52673b16ae60827936fdc1a018e958983763a402ad66eaa4fee3623d2979ea77821cde73b5f2f1e21d2b140603c4c5647261fa99905c2dfe7680e64d82abdf789ac80d587f516631eec0fd41636f3401ef61a21028a5b655f83f33900d813f2b00ea683075aa218e0c1429e0ce9e583d0a99842a7578813446a1c9b68d6305f787d84b4670c9d38ba162f3d82c3061bdd762a08c9348506dbf1f690d1268aa028cf13682ead5ba0f3e60e62854fdf99954800807b5988135023b15e3fdd20e0906429c87dabed2d6dd2b94abefe622d4a316bc79b5baf1358388b1bcf74e9a26319e946afedcfc4408c6ed5abfecce3c0d736f12f9f32f5e845cb8a35f2c4ef1dc0bd4d0778bdffd77f1380de221b20f494834fdc32c572acd4391952cdac52ea0388d7644b12f131d1eb51c40942cd118ef329ae1b8d5cc5bb7679964dc0bab7894e5b3bb0b8cbb1afb98bec1733ec443da595abedddec411c9d97f27f5129450eed9a260ec4fdfe20e83c097911eea96ca5edb80c0bf311e47a1989f2b9c7eb70ca5174304a0001c04b25c25adecec9039a595f66188d651b7719a2cf4e8f27b38fe37e85a52cd1e07c75260db1af87c3b9798133d703b8f0f263a4c6164c236709d793cfb83d1237543f4bf0f6672842958dc870f539d91b201b4155d7ee51dae66b68fc3af49499ae4e7d651905ad17c511c659afee31b100460754cdb874c784a28e57175d3a263865567028dd1eb5d1f68b4ef0b0567e5fd79814bbdb85bf0fb41c2ae3b1eb8fd4bc2e7cd9f1fd4b1625aa3f0724d7bb758fa75f32dc1acaca46e639cb01ba6b27cc30c4b3c4da30e91471a3ea8258b73a6bf7a9eee972f835f70658385b6bc18259743566f3c30ecd7cdd9c30edb5c90c5e5ca4c222d96fe3fb868d7580b4f5be594f7fb02085883a8dc4a9b9ac8b7a46ba0b957d5c154504bb223403494e31c42068b429f18075f99d040d25fcb7f530eefc0e0eb6d1f98820f1349b68a3fc449622937f1afa80d00a550e3a545989a9d7fa1c7b44f69702c0d862d73968e99c450ecd9408f1a3cb6f698e6ca329e55de0cfb464b0150256f3c3cc54606c6cbc03b4892b21ab676df333387816abde561a4d06adeb1906442ea7cea25c4713e60410dab48e2f8f882d53bf3075e2e2b4a310e0797cf1da053f03e5ffc82a30145ff007bc55cbb62864c5da7a7bbf12b304ac9d0389417a055511473645bd9052e552fc426e1d452d2aff27d22e90d85c1148d658e3d0844b738fe609d8f4172ce56f36c6c5543ac5bb569ad6602f113a22351b547d4fedd16b578f412f356cfb4ebd8eec7750adea2e95fe6797ab81eb702b5cc0f90e9fb9c68eab2d5237c23f89c063d40fee677c18afdce7b776be898107b15e832fa7f05b90701c39f73f1129a9506162c96d71c87bfe7cff23d288813c55ddbf5ff006242c9b850ff0072c2e32b5c868ebc9d7273545ca525db8572b93a366347c815e72e003755bdb61c40165a88296d279c629de7c2d7a7c816ef2573e201b00d6c9fcd3d38b9567c80bb9e1cf4bd971696288ab2a1a6f939e33ba9c06f416992d847a387ea260adb40f283af1afc400264083e4496520ebf4cd9fd7c7499f66e54af6d3278675635517e75efccbc31f60621f5d2e831f6a16f3658f7f31ac79d1d54bddce3ed6b07ea7207fceb2dda21d183bff54437dd52fed992eae5fa2a76122010b22fe4825c08ed888251a39aa7497c6f6d2d157d3984e97190cbfd1335e702fccb0290ca228f9872c4d2addfd7db189d32931d885b7f3c0123944f82c62b5ab9aaeba600ccc60c61b7e4b2a43763f09916f134e41fdc05c0ac461c17f9ef2c42ddefd63ee04c13656075e9ed6c08225fa0b8008edf74a583777be63d1c08f7881b2818076df57051c1de1841a7011e38f2dbda1efd58caeb2ed8080c233cc6bbb1650aa16afd6f9aed2be82e22876e7afea381ed103d618c1f98156e95f7de97bae952ce9ad5c701d8370e7b0ef772ba1f6c56ad6af8188da5eff43a44635befbcca8a8129cd2153779fea586bde31e6a2acf11565c128e6d3da3d19305d5452f2899c7132e953c20b83e9747d166e810f57057898531b541f538df130c17c887ea2aa8d755cd87b63378d57fad461cd3d144eebef07af9897687dee58a0c6effea18b936cc7b397ea34f9b5aabe653d45c95788e7ccabb464315eb6dac0e54ee87c1533d74eb6fccc409d8a95e97eb7fc41714e4f034cb7ba095a466a35774de11a6fac37a0c2e0273e7a9eff00fc347c58350dd753efced13a17c660922e82ecf35d4e3fa881a954b01869d335d4de372e0c592a716deb3c9efbd80f91700eea8dab5be798aa22b9532c7a387b92ca864b0bc7d8753643b725abe55c7b61e630e7b34a39c2d5f8c3e60e10d942f9e4ecccb74cdaa7b9b3cfdb28859991bfb70c6b00e003ad831fdca5f260d53d6bfaa83353ea9bc787f5325839c3e98cb6a9689497afdc233682cbd6208b6ec03bccaeccf48b36b0fa981a6e8dbf50b20b4ff420aaf5e35af06583f4ad650392bfeca27c64eafb4cac3e835f98338d69cbe0bb8b54ae42a7ba6e61896a77f38f113bf75886a8356b7b6a6290002e8eb5cb3198bc97adaee2ce438002fed9ae2b3be7e8b872f016bdc297c31db97510f957f046bbc8d8ef4e0f6081c5106bcf4c707e234a524174cb9faf04c80bc16d15ce3fd99baad428fdcbde615af798f77f054723441d599113a545b6f4318b70667228cc9a739ebe35e617629a5458390356ea5104c50628fce0de888168a8b45efbdb010650acec5ec4c2ac2f97fec137b460ae0217bd67c9c7b1139aded7a13cf300ab0a61749c0627d932b94ed97ab5657c454d6a56e105c50bc1f98d01d817175994482083b41b8c5b0b59c82f4bb97556266d1475cffb30c75bd73701c40ab17da2bb5f623b0fec8a6de2fdc02d7c6801b324f8efe25425a8d005dde0edf3100b500bb5e2a066ab96d79febf30243000a00e2bf85ff0017f8dcb99603c06ce3d9a6320948c52762501a095356e1b893c55c1d2f0fd4bbaa6ef552ff009375908f927e4f7eb0e05037fa9451636275afd4a05bb8286f0d2b670e3c90d60d20a79e98f3c364524c60a23afcf47925ada1d5d23d7b7faee629a6855b9a387a9cf1d204c36b342f4ede25138f76c3b13bcbda0cb5ca1cbdc82a1f57fe4414dca3fe1ef2c102e1ba0cb16ece529ff4fd7e62aee9b1bf780d9d5bcaf496ed0e89f6329860744fe623b0f70cb7afdb31b3f6098a97a6c1f894545f395fcc70b27ab57f13e4a433f32d319df27c45c197263ea2d742d1314dea11ab345e7c1b82eecdf5bfa2573e30312ce1cf98cda8d255f1310f3c063a636f782621b24fba5b3e8b53f516f0061c5ba451672c0761fb652500005004bab43a2bf05b194cb5a287b6e06aab3c1a72948bf07bcb5c7bb3f22abec9325c232b842ade5a8376b180bd33b0d11c280e4aa1b68ca1d5a89d9f7c05bc68e9ef10062f117dd5dfbcd5249c63a06df32ad717c6dbcb9f1f98fac81d293a00849dca5b2dc5f6ed1464b6bc0c0a1b1f02f2c6216b73dfac054561ea44886f99420836563cd30ad48a36a86272a60fdc47c1687ee35dc4772fa57d67fd970d41625212c1bf8263895712241122bd290de38b06fda5fa128a267b9cff009aacc0952d95a14babbfe87acb6cc68babb6e018018a527a2a1152898046ddcbfa3bb32b833e8bc72f773176065d03aaf10e0599463b471e77e972ff00fadcb8040513239b3a4b900c59b3faef1d67091d09861876d16d3de0273965af0ec8335bb05dbc9fba96203483f8f4bf4774be13f8dccc8dabff00dbea5dbf2d9a1ea5f0eebe220181f873ee5fc4b6a8e2dc4b36575a8abbbe112902e396df44e9de2e6a2bc7e3a788dc88ca6bff007dfe7ac46274a3ff0063b403bce952ba8fea65010ce22f3d87b69ed2a8071145a76ae4ed15934c11754d0787e78946b664a13c69f662e2d1c1a3e0b93ec977eb769715d6a9cf4cc68658db76c2730799163fc7e60f007d93da5d23fe4d733571761687e4fb26d92e1fd8c307be8c0b3f5143b5d3593ee0b3dea35f4e259576c0bff9f719fb7965e723816f32a44b6e6fa43180aeee20b009dc7e6a58753729f1a60c62a2d41ed86cf0434c400d0fc4a111e8afd4149721cc69945a08fbdcca14501010f6fda07775b14fb57f11797736dbd68a3e48a462b68c17aa7e3e7a4425bb581f2c13e0a28a775ebe224f356646dd39f37739e8751f272fb04a31e28021d2f97bb2e86326cb82eadaec6731db819f95e0a307bdb366da46de15e03ee2a4018ec5f0574eecb8c4314d7af6be26c3ba71797fa2307cc497f17d22316350f5e2fa4039fed582ac51d1da5dcd815038035f5fff0022dc05a075da5881c1bfd1fee92e2c50d5ea5f2d989df99cfa1c92d03061e5ff00c8db5110c46a2c632a54c16d8d54e7adc0154a6da1edd5e1fa6040cf8723ead55be1cf5b3330940c051db57fbecf1155e32c954add4a95eb6eaaa6c6fdbdb473d23a0ab5daff00ba42205d818f01cca09f9f2bd57f5e970ffe7a97e972e6e0d61228bc74980cef61eb4ebe37084b09b82e998a9f0d7984d3451789983a930fd40387c23f98a4653a21fa94052b4aa7dae5fdefbccd35c759603938b6532c9c401a8699b36de1ff00915dfa3787c3025a862eb672272710e39a55bcf55c9db888b4a58097bb69edaf1075160029fa2725ca91a3534f71e1ece6500299c81f0e13e1ef152b9cb97f61f7a9908ba72a7a8324c31f30b2f6dffb53319c6407e9d4ce2060b59174eb5341feba177d4d7bc1c673142df3982a8ed952be9a9d203765019f68532c8f493f987f4106c1f3a899aecda19f6972d5f16fddccf15795fa813ad41433da33ec13f7b821d84ba6f3c398926d984e7adf106909e4a2070af5a37f73502f05c68b3d70ce28e210e530cd5674c688051800441f4fd4b07862be02645e1c685fbe65df39b4d4e05284f794e7a600043c169f2403219b59f755f6a88cc16c376e1f07dc482b1c2f0529f700b450955de8fdb0db62e0b17bb807df1069b1339f9bbfc1022342d407553988034691b78d01d5ccb8bc73079b958facdeba5cdf3da190bd7a80e1494222ab58bac70b701f31fa1d3fb8059436f56598870779422cf3cd7a7997f04ebb1d2c47f331af1c8bead3f9835165e0afeea30b2c451338d0fccaec52f7de2df88e814e99ed7146b5dfb86fd058970e34f825c5b9df1a624a251120a9e1de6a0eeee56f0dff00e6ce95bb30b791a3adf1adff00e1635372305fef7c5b32325b4f8b7eebbc4f40c48a5401b6e581fc0d9d60e43beded33d4566ae9690f7e87db0ca450e80f1ffc2e5cbfe1bfe172fd2e100e95f88071f2fccbaee41bd4ccb482d33bd2eee5acb33a93ab031037945eee2e2440a552946caea45cac30237446ebce48116c033e380f64f73a2ed5c9847aff00d252a06cc9d6f9307ee222b18fb3a7f7df98f8e05a910f0f47cee0e59ba5c3effdcaa1b0ac97ff00088a542d2013abd1e1c788ad5e8fcbd3387dea72f4eaeeab4fb54aa225cd2023bd6e115b2c2a3cbc4449e7dbd8e3da5b9cc0169e482f5a62d64ca4ede47dbfa8b897bd8f138597870ca116569ceba4748275298ec2d6a0e57a4e9a6017e1fee2a9b4d00f8660c45ecc075acac1856184411d35dba4a3cbb22d1e7515367c9294af92d22b4c4e60f6caf2cc725b3032fbb17459a1b6a04334db5d89d21154019e0ed4ff0072a0136ad7f503b3b2069c18d1f1010ce470a03545baea9000cf4bdb834a5f5cfb438746577e95a0fccc701b4ac7971f03191b6e7abe72b6d47ee796837d6f41d0cb15b4c76adbce5df6eb2884aeea9ea573171b439b975ff7f730a1bc647d7f43e62e05e5de5fbfc4a19acffc22546578816c06534eb2e5cb800828ecab23b2157c9cbda3554d9c0d66f654c00181d40555215f715afa0dc18779c0f8afbcc26716e3296672f1c73e86baaee01e98ce3cdf4b312803d8264e2eb1ef65e31c41150794aa0ab75ba7899d4b2b95bf98a0a91d1b5f40e58a19635bbe8aebdb47dc497143b5653b7ceefee7e8f5b972e5cbf4b972e5cb972e5cbf5b972e5c34da11f81962eefa25ee50116583674c54b7ae3945be15fa8957992fd41f48ff008e2340abe6c7da54ca1cf21f82d94af79fbeff005152d87355fb144a02b7550fcd5cc0deb806a59d6462983d073e7644c80edc83f08cbb5a69ab76bfd650029a34b741e7fc6e6010e2d0e1c6fe9f32a79d635bb3a1ed84e48b300b0cbd56df6f7b94665ce297a0fab84e01d0bf5ff3338432cd6bdf64bc50b2c4f9e7c7e250e735961d99af7b3bca36c1b60dd88c7bd4b26a0975b56374f8c44814d552de98512c2399c027ba98a905e44b7c235e20815665bb7be2a700fc7fa9cb3a051f90978c6e8d8fc4b43199bafe621cd694fa312d1d56203e72c11483566fe6f3ef0cba74827d53f719d482a61e4cdfc5c50efb84aae4153e25b6a75adf82efde5110e0aa8f89810c4558563fce6506eff09a175e7389664a39b651b1e017f3b8882eed0ae66bb75bc7129d6180143c9fb80747641a7651fdcd3a9a116d36076eb2acdf5611ec71f5ef1413b8b63a51a81cc8c0c8eeefd8af7998e7252f87e62d506eb17ce7b4c20a3a0bb7fa3fde1ac736833ffbfc42eaeb8efe7fea94a829a0bf696275b7039630160ba697ad57d4d1460972e5cb972e582c5cf97d5924720ba31d73188606e0f9d7dc02c2ea87f1e957fcb151aea3334d0698fdab69d9c9e25ee62abc2f9adfb3fb8fbed6f0ab1cdbbef511b4531643835e25e9446adbd14e4fcc50bc99307a04480de03d578208482c867c1d26e5fadcb972eab996f2cb972e5cb972e5cb97e8bf52bd61503b3374a351aabeb2e5c6e04fdbfe713476816ad7bc76a5782def2c2a75ac6b02fb4d1af79d0041d5e65d907517a8feb5021521590be0e863f85452ec8037e4f78f53e054eaf1d6ca7accad3d5a032d1a270993a733a2710b7cf5ceccbcd9aa077f73a3e1805368ed38cf0ffb1310014160ee38eda846af12be40cfce3bc7e5fb1a0f27ec624386f08f2e349d8372c4a0185b3913ef89af730b5777d9e1969715f41d9d3ed530016c5fb559f8ef105b4c208fbccab3cb7beb8c3ee46c9fd0d29d2f5f897a2872e6fefd965f390500aff5fed4caf6329f93305d035367f7f708b09d14fd8fe618661ce6bf85239283997ff21934ad3195cc1a99b8aaeb9a6bc12b68bb3486efa902d11786ecf4db502f3e477295491d2d5fa265c278b43051c114a3daa5d5adb9de66046e9744ca375d1d6395ed70631d218fda9290eb797e2581c7fa45aaf9b88d256ce8b90e5eee26decba1a3f1fb984434886390e84115732fdd7e3f314742991a15a3a7996b0af9582b9ffd946e5df361a5530ac5d69d459768dcf73f52e5cbf467895356b80dce612e1e097e82c4cb0b02fdb5f72a510fa1fb0a6652a7400fde7ee23c21cb27b367dce9836fd85a261dbcdfc399695dbf7306da8029ba00fdfe7ea571f6929abe73c76cbe08302d338c5f071f55fb980af3b68bd7a54b33266a7fb9ff00768c286d4dab33ba39deddd891281701530e65d7adcb972e5cb972e5cb972ff90ea4e08f798d33382f746ed3daea096708c361845b99e9327110c382fcadbf99a2c13be6e6a53292ca219953685cd41f10068a841202069ba1d89d29948762ae4f377e1cf996249a236ba9ca3b4b3afc62bad5582753dc8d537a77397af9dc09555267eb7bff00731d854ea1f47957f8269f2ec6df91f1f12cb14992c3c7bfe7b4b230e82517e367b63b45f620c02f7c261fa7b4b13fc257d2b0fc3ed2b38bdfe0ac87bb2cc50d81f75e3de59923a84f7451f0cb56aee3e669f9b94c77678bc647ea5c151ea5fdcc928032ecca6769fec4c208608bb6aefdee64d0e9dfd02989e453280f839fa95d1af371f86a029ede9fae0fb9417da657d47c153469e20e602c37d4f98a56b805b7d86624dd4aafdd10367a0db9096ed3e0fea642fcb44b566d0d25f7be25b8632b03d3217e6c853e7a50c756aea5aaa3ccdfdb3466cdc55a125fed949653b4297fe4dac1bcb7cfeae300f331ef2b9f685dbc4b5fe7682fc072b5ff007c440d5ab95bff003a4e2883b04e0efdff00eb30106b6fee7ea5560d7ad4a952a54a828e2caf2e25e19b5bf5162611743f97d157e8a99612cef2cad9e4a3f24d9a9d58fc19a1774c6bdaa6819b57f09fb801bf8fea595b869917f5885b5130bfb6e27fc1c8ec3fbf88aa2b6aede65204dc5e3fdef0b3a3e1c43b3131a081c59c9afdcda5cb972e5cb972fd2e5cbf53bfd283737cc1ee8de8f115dbf328bbdc46eb52ef796f10f79ae6235f49a3afb4255549ba5a6a2fe66a81e080400acc112b528732b3cbf86515330a9be2ce7df3de54983b76e9e1f35ef09bc0604bbdbaf753de63ea6914cf09b3c3f704226ad2cba26a1708182cfd7fbbe480d4b33a7754327e3cce0c8d2b074a697dae2d111765647a711855cab1671c991f921fce0a5b474a61f188f755f74f1a7e60ab156805ea954be48a85dc06eba671f645c02e5cfb1f8588bba5829b06555eff00a89c18505bcd55217e618d5dc153c14fd301f3c6c7d83292d9a45fdd4c936f440c5d42b9bbf55150a3c03e6e5c0638d3e711339c650bf71334b92cfbca639c1ff116938e8b5f245a65aa83fb8217f01d45ca719003c9454568e381f65b062a708291eda898677a07e0f9b966b3a096fa6331c0c1d1cc1c717c56bed1acd342ddcc3d2e3ac7e8b252d390d1c12c1b0ee26bc1c42162d60c8ec73e7532447667dcfd6bf854a952a54a952937967622dc3d03954b7252d7ef2bd15312bd2e55c0288784b8541771820d40392c5a7d51fee929d88cb84d2b19b82383de95eeff005f332f102acf88ae203e1c41b7d2dfcc24089554f2b857d68bd37aff0092e5c61fe07f19e529ea24e601b6a0f9b6707da6f988f317cca67cd1db88bb259e2753f1076b439c7e089e274503e09471fcca92a874e51588729046c80ef10c005017674a62e0219cfd8ede327894d47a6d3f3ffa4c822c9a2fdad7c7c4da7719cf2ff44f78bcfb6b5ee647c1ef120e39054f7c13d81ef064106381a69f21108ae9070367b5e1f17714976d563f0fe263d33a47d3886881e50beb4dd7b41c3a8f2f9c3043edc009db7cf6b088806995eb608af73144642d69d3c5827d4c084ea34f62bea2acb99013e6bf12c06dca3f2444d6bc03a640af7942ba742bf2c68dd765f9a9414aeabf94f82202b2c190e2b0301075c9a64f70bf3360361b5bf6a98cf3ac44a021d517ed8129edda15f040ec7cd92dfb8b424eabfa98261a40bf2c5ddfd5aa3f045148d8e82f6e373a7d8f42e6ba90175dc5d40eb115d9a20568a9c2139c67df9f6b94381aa4e6f1fb65518d7a57f0a952a54aed2a504d816777d46e3945a01f304ec067d7f0a957fc1f62134f80e415f1e3c4420b3aeaccd01590570a71ef32deb9a3d3555e3ff26a03d03e307dc116f1ad474e9fef641d38ee3f7d7e6bcd44168a958da6dff7dfa8c3e9f94f28d220da4041e22753968a6d96eb3e5e8616e22cbbb997ad6711e4807894344a1c7dcf098704c25ba114712d2d2d3b12ff00faf4946e7ba7ae88756bda0faab19249a23efd9ee44b0eb96b3c5ff7f329aa38c2af7fe9600636a87e3fe4087f830fbd9bf1700cfcca61e99c46f42f9c5571c4c1b5321f69727b31da7bbcadece4fb8142128e37e38f7085f2130253df7f1894f4a702931e4bada7d257c245b28d247e460e8e50afe695ddb69fd21f5739b9f901f886c73aa5af6a1fb9734ed1557ca9f516345c147b50c134adac8bf8665d332a27ddcc5ee9b25899695ad1e3a3111b9d5453adb06dcfa2e7ce7ea0b771c707d89a48392b7e5661cbf1be7db53e31a06bced9415578e69fd45d8156884f00e08a1831e8d01f7704c6105be1e39f7843340a0563c7a54a952ba4a952ba4aeb2a54a94b174371ed6c557831399c416930858efed0c1e3d32ea55fa0a4ce0e127a04c957055e66593f0d9fadfe3f0416ed06ef9cee8dff00b2c5368960bae98283e1891bae07a37406b5c99df402595d00a07eeb78aa9811a18da0d65cc66be9e5126d20b98f4138588aeb2ef32d972e5f497de5acb088e19e7f52ee55caed33e0277130e264d4b26e53d65a5a5f98333a1b5689cb6376b7d5cb50a764fca42e19d1fe825f7bddafe49795e19fbb976375e287ea0f4231273d6d3e9f98347d7013f413ee01a31ff2d4c13d45ff00549842bbe3f9626b1dfbfe8fcc1f2be8b4fd5cd8cf657e276b4f725cfee8874ed85dc4beea2ffb1f72d95d9fdd8fd91a705696abdf5120cbd9bcf50ef7e61ab61aac7a5993dee1c0ab4289f0d7c91715c6850bd30622b10f4aaf1b3e2360a072510fd4b61ff559ed76cd3cf443e7537065c22672b756b43dd96659f0954b142d7545badee256dbd77f2ca713d145fb4c98ceadf94b817f5e1f8820a7655fc13289f0aea74700ccd283b1a3db504099976bdf2d1ed104c86817e66df9b5025a6ff15cc7ada7792685aebcfdca614450f6728f97118f6e05ab5b2f5af32dbccaa8bc13b474960b7c8e4e9ecfe7f8d4a952bd2a54a82db48ebcebf72d0dab709c436cb55c01ef2ae1e81378521e957a54b01a1870fbd2fb7fd1e91e3c0f2e07c101d9fcafc68f894a803a153cbd283713e63d04539a8a6d96cbefeb8f5b22cb8b32ea52cce13d881250955a3d29744bf12c8c96201bcc79476367cebee2687d036fcb2dedbbac53bf4be92efd2a55e0db29930b50cbc9960e82738abdcc3f511d2fb659d2d5e44f3a65b2d98eb132871c59fa71346c6d4cbdcc416877d9fb20a3dbc73f1b95613ea5be7bb4fc9145aae85fd9fd40949f2dbf59fa9684668cb3e4a7ea371f632fde657f076bfda06c3f5f72d27b313cb5b017e1bfccaa13d529f0d91d17bb013dc49b3d6867c65f702170e5e8efb47ea5ac153bdfc4eb87443eee687b956612784662dbe780a21b2179a3f700737c27f1161ddb6aa1455072b708aa4ac297ef70a97b38d7f135f2f83f7a86d4b91b7e09bdfe4007ee6e43d72fcc58d501c129a6e1ae8f080ecf67f51f08a04675d4c9d4e630b6023d9952a54a952a731f5b96cab28ec45b86e5c3692ab52df235082450922a54afe14220e7d04e0964b32d7f8d4a952bd2bd2fd3285b72de20724a2506a072621a8e50a772c70b29c4300a0655a9963c4d83eeefd8651e271263cb9fc4b237d53fb95ed2ae67c579943731e60406d5c016dcc397549b57c5cf6e2b7d858ab54752d7b988c4cc86ea0edfdcd881262b40384427e964b23816d221bb890d2391ac7923f2cfa967cf12d306e6d7f112d4961c95927865a4ca2b1d20061f837ff6500db6b67c6cfb9525566f93db64b6d97c4a21fb065867baacf863ec18553fa97570ea1b7b971d815e827e6691bccfc24f2cb39f48ce71b80fe3a96f01e0fdb2ce7c367fb80aad38a04e519e00fc4af41ec8a29f0e5fa3f728edba1ffb0121ba1aaf7608217711ed83ee57257b83e37f70acf9ca5bf2c41aa3c10cb6e59e8153355b0475df4194ac9f19f68a9cca84c4b80f80cb5e453b724a952a732facbf4b975eaa1361bf2e5970d4dc604ca21925557e6bd12b2a556e54a9938b9bc9fc2dd65fa54a952a54af5ab967897e677440db01a8de5aea658901c4d4b6532ba91074977a853730ff00c837206dbc10cac8be2beb9fa8ab927011a294eed9bef297b1286f3106265373bb84b57e22eea8055df5a60b61ab8149478949bd77c902b9ad40ec162dc0b2cdc14141523ab9567374c59e66e3018494028382aa240205137d9eb3a1ac6c4e1be4fe169de1431708a7dc3ff113dcfddca05e768bf3a9c05cd350150b60b8027c33ab0e84fc54cf8bea2fa565937fc513f114af8018700fb7fb89def609bfd40a3f5320f953f84953593a95f77090f3a07e23e8c10efd394df37e26d286021cf68a494defb8f6d7b4a2858bcef788a34eafe48cfd908cb972fd2facbf5a88c0815f0466177d78bc7a710ccb98a0a3b104a2b895e952bf93fc82a764bf497255461de63a9d08f3313ac5cb594cea415a25a68977b4ded25d42086da966e089516e03730219b6f07f72ccb7302a82bb4cd99cab2dde5f88c06d9cb54dfcb0eb955a8d22dfa096a0b5344ee348dbff003da0a5a95bcd1f12b20c9ab062161e7b57d6a618e378ad79882f6310f3025f88e408e4a1dc5ab554551957027132aaa3c62a20ad23a6b894215ba4e63a6676cc616f1f334283ecd1294d27f1ae4823374cfb3567fbc4aaca72b93e78f79732acd2310ab9af33a2fa56ee289c1ef14f4465ff000104e7e837736415ed28806b3042d25be7bf8dfcc14aca34ea505b69d622cc9f0f27efd4dfad6a04a9506e723c8e22b57b59cce20b6510c18f2ffcf4aeb2a57ff1ce61ba941ccb38ccb8af12d798f98a129e67692c71505cc53b659837c417003998e252ea53d259955de22aef15db501cb3b93428e3bff91e4ecc6bfecbc36864e8be9de1bf2f2f47fa658954a97f12d7c17c4a1b91d3d62dff000b27797d88fc40a5f68b2a2e91946c255d2eb52887207cb015a31d5c4058a3a971d6b1506d959c08a7350f5a44b03aca10e770336cd300a0416de08350cac162a02d82eb894ac7e2a98e0aa95226723ee367e22307fe7adfa6e526a0a69a7b4385b7ce43fe7b4a76dfcdb7cf310d310964513e828bd0197e9b821dc30f4994b21ab97694f33545a8791324442c797559bf895699cb7198f91287db92653444f7f4a952bf802d2c45291d83fb970dfa0b6564a62f1c7a55ff00f35ef72c972def33e25f79ef71aff32e53ac47496fa372a00d928e265a25e55af46ae679104e21cb2e403b5671e479adfe8fbf102051582d2392fad456da0c97aea4b0a52d04b0472403ef0d378ac7f7ef05aacbe8ebeefd71ac4e5fe8e65b441b5bf831168f18865942722273c19dd22350798ca0d68cdc590db039daee0194a179357364d64832b880cacdea05908d4e75737a0f5256160c1728419ea42958ce481da0d563fd317b476055764e3f85cdc49751b33e25dd4b5bff0061f70b6858970d47d62b8a2eb17fe41f42e5ff0000413682c7d2352ada5c55c3bfb3fdda7d9fcc70cb83a47168451b69eb05964f8793f7f32a54abf5090102b1028c00a79e67309b808da401dd9c275f4ffeb675994e027f9896bc447a7ccf2d45adb72ce912712cd455e7d0b43be54db283172b94b32be21d09c043395884a906a3d81d7bfea22dd1a6acc1ed13ac68cb13b37b1f9201515015c37c76f71964e14536e378d1aadc45f68f2a9e028af886af896e7c1d2758a885ee3d0941e03179ff0032fd55f88ae9f72c6452645959fc442643384484807263117685d5e6540603a41da217258a39b8141d332941b486cb744c5a250054ae3bc2a714c56b796583bb5f88009878b89a6e18dd1c1f3ccb2c90de5efe00fd4aa73bf5255ca972eb4d4b1e5395c3dfb3de1bb83e47d2a0bf30542a106a2832ea5cb8e6fd1abe8507ad0b4779a665196bc30accf5deb99419961004291fa88af2feb926640446042d0a4a254a8f3e55679ac1f3172b62f2bea264382fe4d7dcaac7f0b972ff0081eb4f3729c45f82a5b139915b881b847198b2e5c2e554a5964bf2fa2bd60dee6767cc062e5206180cab40402d3abaafb7077dc76dbbe3accb95a88c45f05db7ed0015b2258b87a136510503d16158b957cd5a67df70bda8028e5a95aadf8eafc41cc005d297f57102c5b70a688a84b129002280ae425edb3ab09717443556ae54e3c4d6998c55f7eecf96882680be6165c3a1d59ad69ef173b701a2d95019344bab0d6a252156cb393acee50a60730771aeb97acbb85226b100e32e9deb128da27005b84ccf674c41aa03bfc44db915b95cf78aea8eab335e97e9535e9557af00e9503252564cbe9e3a3cc104aa87797e80cb972ee339dc107a05936434cadcc1098690c07269f731ed1c5ca366270a07bc03a0bbb727efe614d92aa54a952a5196e327c116fd37154eb05682e2ce0ffbff00cefd19877f794689da4b3511b8b165cb9700de676953be58d12dc13a24ab72ed4b5da5cb4ed2894042e82ad5d2b99a468380e0fed8c7395657f06586b1135ca4c5d4b2425b96dae089c315e5e236ee19bd1148b23b7f5fb84b658c52cb88734e10ff005443353af6bef3df142fe606b6a65c4ac2edb2ddb032f48594caf2cb70b6465d81ff0090e3806539e92ce8fb62e5a7a98666caf92201a87c3810f7e6087c46b31a082dab73f106f51112baff0053a010baef9fa8a04a7276817d30b0c5c30a41ed287512923141f7dd8cc98ccb8c120791332f25a36baad3faf69b0df53103a3d9274a1df8bf20880c83da209a58749a89e5e8eebc9fd3c4ae72c751e4f6813a7a732ea0cb9772e2cc886086ae1b866c890d67730c3bcf0323f35067a421ea34c542f3d2500b92b1e2541ed1dfc901dd809dc654af54829d4757825801df0707a541033ba87c72cc51187b1fc6fd6e5ff1a77167bc4b44a3454663796f580bacca4dc2dd40f281ed95ca3c4a913aa039b004b2652c9846869a73dab965db6362300741fbdbcc02d8d567110b73235646b9408c52c1a698bd9cfd4aaa806eb885dfe6ae3df896288d6d2c8be667dc9b1bb3fdd60bbe17c4102ea542940db73a36688a05c41061060251b75966ed886c96a95465581607663ac85f987b0585cf6893988dd3cd4fc91db8ee9dfb9fd4115272a62fcea30fef16ac8655c661883d46ab97da37098071018724da7f33703ab01070e6a658d951f318250696b8a845cb71f038fcc1e8caf4be677ff32fdfda59dc0742fc4ab60f2c1f67d858e664eee3b5470e8d43d8e1f688f4af51832e6e544877da0826105dcbb7e932470b9863ca9300a735d1bf9dfcc1471b868ba80ac4d25b39ed0013695ece9fd7b437eaa02b81b5e26d4bb68fbde26fd1514009887764e397f5f33cfaebff008dfa53ca13085de5cb972e58d4b79658f53ca5baca5e2527997d4cb75837ba4b8ad06a76f5ec1d62bf58bbec1c0748aded75dbbce0364be23ca6ce9ed530237cdb4b2caafb3f31eb732bbd80ed4301515669cdf9e65dc3e59c29fb81ee8e0b6e11e7477b73d21f144b76c5709b6c8ea8bcccaa0e2c81db3288c8c8acf899217e2705bc100bd1d756a2dc38ed11b88ab97e521b8acad26e04c2bec7fa87a328cbdcbd6e6a98a7730c3130f5096c1ad4576d31ba8b0335328f68b707a3ccd0f233cd901b800ce0767c9f88405d1705d7e92869fb303b3b9c12861f67f698afc8b967114fa9ff00a904d36bbb949669ef9587e31e466a6e54a80c09503d15d7d209770415732b9653aafb97c0af960644f15298f1d4310783876c09dfc62535012b174e499a0b0dd3a8d9b20e4cc540e078bfeb8ad5211349e975bc04bb0a295c74b8acae6e55c096e09848296ad1cc03e887b7f3aafe37fc2da5cb97eaff00240e67219d5896994e26e1da3dbff6d9ccdb2f4e07422bcb90d77632c729cb2d5cefd2d69836ad10d4303a5e20d48ddbebff0020902bc097ef0a16e7b3077db06ded31c4a55ee60c4482ab4df112af085ccaef1ef0caa0ca701bb8ba0641df89a7fb7114808f328485c0d63fb94abdee82df7e60b67e210c50442c622ba9c11505c5e3b420a55afc71f536932f9603b8e5940723c139dd9dae05b6db5a58f18218245c8b2fa76952ae3adc50f565732fb01dba80a075c5cc206833c4aeb5ace2e1b5a1502ecbd7fbac590185063ad2dd4788d7279f0e2259ce8e8f0f46612c7be66c7e3d371cfaa8dd727d5c3ecfee1a254cbd04102751a00b76807cc745b5aaea0e221d5cfea5db7eaad47a662cb1bc082f237ef2f931dd97e5734f4fbf496c8da0dbae5b81c2c385687e634ea735c4a761d2a71ab622d70cb6d9baf882e94a3aee10a4445dab417c44eb66b172b3780bcff9d23d61ad4cbf7189394db179e236e15ccabf5150165c433aa43d8e0fe177ff00c595eb7ffcf12cc456e033a788ea76725c11d4a1ecaf07763b55f97a4a32eb47622b5b8e87a188d86d8abde5cdcab7b78254f33162e7ae25cd557c05076614f8ac328618806fe657b44219f29ac7880cadd832cc90af69702fe4e2fac0b2e6e5246ace20bae2f3e23a1c22a64b80bb8f40b8bb915b5447af641bb2bae38f83897d13b459ed181b8456f8bccb751f9660b0eb49283cee202146682887c0136d660c3374ac23149360cab6c05a1ba96c4ae2f57a403c0ea1b47ed3a389578983503d9e1f239980f7afd3ee67d48e31de38f428da851f117766e400d527ccd9a1c51fc4e72bbacfbdf085fb72eff5340dda5fcb70ab02f86bf12e74234aa593178248500b93de23c0ab80f98d092bc19c9ef4c401574997b788578aa97b5efd3b44b97adb6c4ed0b7c6a7105d8cc4d55b2ced89773b2e25db715aace4c4c625f35762f4065f11de461d47ccb5ddbeab2c960a2e6b3720df7fea6a6fff00adc665e9affe6c689571f5316c5a952b9d1116d32f2f5fefe23aa969e62508f265f82656cb2a8d16fb2fc6fd6e37c145bd1836568c037f72e4f3c45b2e69b801df5e19585e0b7827c91c382989648be255cc0bf30e3ac3c11b7a10d26baf266492ceb52a6e786aa648bfd33ed28943aa0bed2dadb1c17f895160a66ca8d8d0eddb985c201efe6e370644d400c8bc98ae20c170e838f994722e0be63023419ae8564ab475e2a29ce392e2ba5d9b9ff752f3456f37300b06a5806d312974da6e01694b5bc5bccc89627588b9cdc4e0942c264f3b8862c4778a98ae47710836dd5d6a6e0d549f68be2a5b66a50db7ef02eaf7990090450c1a2daf896787c4c37ed510752f98db6b3af7f307da3bcb30367b4c10aefc4b6eb23b4b719be650d9716cadd98c4b719f69633aae20f915d127503ed3b43da2356fd4162b5ac73028838455414caba16a571c7b45cb6cdf432c989752edc447717821805af42161c14b1f69d3b4014141a3a7ff000af5e7d6e5cb87a4b65dcafe772e5d4281dc627589779630362cb8f3d3dbfda8b41a189769743ef8236785bee7a4ab16ea7417d698357a881ba0722a8404bed0bf1c4a4e9b6af2ff00bee558b33528ad364d27ba9b8336547612e71788a98b557ac42d3959acb08c20a398745036e79e92ea7152c7638e92f0ff0018573680f63ff6236d7482a4bf680db9655c28ff0032898018ed5179eb894fcf31316570f682883be65a05aa48815ea37255c1fa8b3b6d99ed2916e4895c4ca298a507bb25f8fc452c75816659abd9fb811c8732eb5ca79981020b5019b744daf416cd860fa2099a53ac42fbcd1d351847b4b85d59e2a59fb189d03da272f28dd2eadae85c3a3a9a5a78cb30d5e136ff000ffa9c5fe01fa80a0b3a4b3f72866fe9bc7c42d5d4a12ad3bdc0d5a172d89895c175a3fa2597039c57e73f501d4466edbfd7d4b9651d87ea67017b152d96fd1bfa62b4fad38ff9326e3a2ff118c1f81f986f5f036c06513d6cf5a9710b190263271c493b00cd75cee05bccf161c1014b83480ac055a6807994081d230bc7eff9efff0085cbf55e550e96c060cdca95e97c7a5cb972e30587328f7ff9b8c9ad1dee2a51543e5fa96ab7b6238bc4e7aee447632ab1a81b66bb6bccb0510c5721c3292d9e45ca63cfb4350064222218a6bfcca8a29c0d1e7ac6b01ec22daee1bed3109f65c474873450459c6b26bee750d1a118b86d0eb4932ad5515f3894ef96a27a657932ab98243182fcd665354e78839d6b4452ad4e538651a74b03a6166494bdaa2142adc4d004bc5e4d7e5f881c0a78605de8d8c2628144ea6e04283ad40d447a415d8c79e7b4510170019eb8945e0c10eab3a75320113693a303bcced5b7a9d2332c0e56bccc29a1dbc4b51adf1a96bb6e543f5e8aa200a0a7f8ef0f42184040952a554a95736a7328b8772ab98586bbccba47bc0daf292a13107863b23b0ff35e9c4cb58656e12661cfa188b75db9f9f4afe37e95ff00cfa9139472860d29ccb25f59b95e8ff24bae353cf3feed2aa820f219965bd5fa878369a1d416e65992af1b882c057319dba202945ae6a2adfdc51c35308b679802b39a3f981311db85f827757aacb403c66180f665c35f530a206dac4c51f55170089afc65206be1e3de11535ad76442c32ca06a2a7bc598df7629660f0ca0ecbb9427ab89852fb8c6657dca18a798a5548b8bc54d9de282318363a7fb82a191765983770829c54a2b8789b6503506ad967830f29737af665a2a959f99641a0b0e5788ef2439423ef1d3a0108fdcdb61da3e8172a1fa8ee05b30628ea5d297fbf44a6e54a95e9e7f89b50041b8373b20b964120d1cf31e2530e457c112bd05cba972ef138c3d2a77fe3c43d2e5fa5cf12e5f4841a946a390ddc07230bcb1f47d1f4b86934863cba88be733aac35d8a3de140e8b0c61b770053b5e659859eec56b4d9007e52a82bab65b705db7972c5c8ae00cac1e9266f2767fd81e01d51fa8ef4be951a29d8ecc4d13238e60a05ab6e5d92260bbe233157aeecb0c665835119bcdd61163b5894bd66168eb50235182a7eb716a3b8367e18a725d5351edc08a7f9921ca726e65688d9814d41f507f85e3c4b055d08df09669b1eb2daba417d2a6bea135e60ea1614f1632b0d1c75fee55661d2c207e25fa54ba0ebcc55001daa0d46b1664f7d9ed32ea957597d1fefd03d188015c91dc174abb622d9bd3b003ee54a952bd753cfadc587a463716e73f4a8ba4b5da26eb9a9bc851af0af78ff00901d4bb8a7880ba86b341f3dbfafe37eb738f5f32e3e97fc2e5cb824434c52b3039542de8bbf465c5946b9a59f44ea62d4399812af40e65d9dd95410c4b4d40b15b59541cf89600008ab87307991576bff00c994721f99cb4479984eb35ce4ef0162c9145230770267b4a4e26ae5dab0d071362c746282e37300cd43dd826b72c85bf3c4176c0756cb0d1860e31312c35b9baa611d81cb34d4a4cac5992359620c2e66092498a2fa892f46d44bf10591f4e9ff00b3f510af62dab9b350ea1e96bde628a0ad678aff00104a9aae6eea232f3ce789a01bf314975180112994883c8c56f22d5f4e1f87d09c4c01dbd32b16878cc53d491e8bbfccafe772e5cb8e947b8b71475715c7176511a6103c4152fbfdcee6798776b8ef1a8308d4a0d1e98f6b15f83feff07d2e5ff0b6e5cbf5bf5bfe041a9d91c9deb834af4777a388bd6602dd83ec7f73009845f0c36fb4819957e8c6193e26ca25043ee56a8b970508a556bff61a5ebb9638b729a25ca902be84d805d54bf88a3a1d24a0200e9cf5995f76a4f894cb2e403eaa380970154f1cc49655391c422dc17da3e46a0142e1d60c333ac37944a1860e731a9a5748a320f3e95cb7d3b40c88d94bcbf8986ddd27e496c2ed66cfee2b860696ea6eac973735f1c33303275a488cdb1c376dc1a295587539be8c20a232a49dc9882eeeb4fb4c67d983426fda51dc613ab22f2d6c9d1b70f7e48a790df93fe7a102c1d58ed768172c9c4106d5fc054057f1bfe36443298b398e38f716e082ee6df42f951189d9b8f102ab23a2ad8a22392a03ae733752152aceda97fcafd2fd2e5cb9af4ccbf53b7a9e841e1835a8c7682e1651d4c65dc5571d06ecfcaccaa0c4d03b04ce056e3e86ede92937162af0abd5cc27fb012cc39b9440bc4475a8a73391b396550af979652621d934fe62b8603acb90b9cf43b5b1c69b168651eb1b6a8752be0f24494b8eb12ec64d30683b3acc598079b8677192385b98d1438e25163331880ec18b42873ff222b89e36b1117460aa6e11d8b2e51f16c412d96e8af4a7fb81a986ac8dc100c27e23a51a7491106cbc472f4faa3fd4a0be7732ab404a2b076b404184eb4b758d44d9161c529b5c1acc4b976c6cf9400176b0c529e0f77dcb86fd2e5fadcb9716295583896b1b141dbd09d22388fe22344b789a33ea17901e6a3028745a256374e8128840e2a6bd2e5cb972ea5cb972fbff00065c66fd5f0cceb00de57e87f0b972994d416b32d3953e1afcc5aa8ae0d78951dfa85d78e675965620a88d45c8bc4b693895b7865b8a1ef89681dab4544336f3dd8d31398c46c8b6bc86202de1462a3acee618e910a267922ebb31101db889165bf529a83da725ddad32a920d859f514c54ac4406a32c33226494331886d1c6b3377554f681be4b59852fcc06ebaca02636dee269b61a8c1502a204c8973c81354f1fd405072162fdbacdbc26789716ce68c5ca8218645d4a82ecc71ef3097b2ba4b5db6fa3a9c261af4b947038fedbf110cb6e55eae57d2e5cb9752e5cbf4ba8b2a165d3286fd0b253a4abc46fa2596219dea774789d87b251d97dd83a12ae097e9dbd6e5ff001b972ff9d446d54c0397a9fc2ea5f494cea4caeb5304ebf24df32e3b275f44f4b19c51f3995870063a4b90ba22fd4a4c15acbfa87359d50fd4569b59eee929b11b52e5ac018962ae8980732c34f13b95622c30064fdc4e5e25b931d93e631975d624a626bbb2d2bcb3714c31aef2aec2624a6f1efd6532f0c00ce2526669344dc7b8339964de1822ac105f4b8b14abd574225648343b66605c1a63109461f06586aa6c988a8d89fb81aa2739237da0183aaf1508a16fb0efb4a26c0e09505e0c4a2e39239f6d7a03405ab8264047b2a35ec35e57f95dff000dc58a068752f8e65705cbbc4678966e09b2d9a9a10b9c9383200713e3d04d7add7f0b972e5cb97eb75fc6a54b772aa028c1034fe77735a8565a8e01fc3f8987a6d76673ea2e09e826711016ddf503728940d197cbcc69962f6583bc4a6abbd06fc4b216d368b10709bcc40414ccaac9b2edb96aececec832089899172ce438c5dbe237af99a071e06e1a6348351d838cc237121558e081c2e98ed0bb33715fb388255328e675196e5a5d1100298b3133d82401d6272e0608865cc63b6deac9b06757ea18c89839834038a880ad212eaf64be82e814c640c06a0d22b471500516caf68abb957efd154355ee2ad4dc0b758a9627e0dbe3bc148070565cb2ee78dcdff002b971652975c77144bd133e25fb8ba11de826accf58068815e977dbd02043f8df4972c65ceb2fd2e5cbfe17eb5046f0ac47630ab6d32bf95cab9675057875f735389901c0c4a51e203365e26a3184a5abc793bca51a4dbd2525701b8de5321f665fcb86e32f2ac030a3688414beb156989d6c662ebb7796adeda3f821744f57d77a999a194143de798585fcb05232ba882461a532eca0f78d47c822f1e7fb82ec333915edda5355dddbaf987b0ef1538760f49cbe658f34bc41518c0ca95e7a46c56c47a9c8ec664a6ece2e5a657ddf9e915c6512e9d4542aa4e63045962058a808f7d43a0dd438d1bbe08f8a6f0eb2f4454b6bee394fbd3528832ca975e789b94e021ef18ea4e9567e54a3b04d4a9a973c7f0d7a160179976d96c59572ae2b12c48468946a569812bd1972ea0f5f4b972e5ba65c66a5cf78ccbe97fc2e5fad4f103e603be7acc9ce2e5543889433880238955fc895da55f0f1038608d3e65cd524050e19f3ccaa6a612e30ab50077847081b72f59800d8f48862f8b41b8a341762f3323d82e2d4e902b249b2d99646816d398aae57531240cbd5e59b0b322c900a4538950a58958665e1b260228f53cb11a5adff52f92c5e2c9568952e31b5745e5897dca710bac9c174c4cc7c0c50aa37fd44d65082d4c42d12b709c37a80008a83f64d129e4829950990f2f6865ac08f4cc76761b5a9b06fb47292d9d49b52b6763c5933e623ce2de63a8b72af5016052b9cf97cba3b5c3074062a575f4fc4e9ebe25c523ca096b2cb964dcab9570945da50554a204a81fc788352e5cbf4bf5bf4dfa5cbffe350a7685bb3095798ec6541643ed31d75dd2a57aee301743df1fe3f2c0dac2399b84654bf6ff006252512a9ccf81891832efa803cb63c10569b98d3da188d656b54488351ebd7e3f303b2c8b1bb5cbaadba9a9b17e23e2083ad2aa501d26253b4bd3de268c445f5a998562d7a08f910dae8995e03ed291620033e8929228e66f9888b0f75e4fea0b657886260c12ca775349a950ab39392668066120b170c2b2b373c5663259be903833a51268836730dc65b8200d06ee1b1781e39890e5098701ec79e1f6961623bf5dc0a35af5b716fb5e0875517ab6a8e815c0683f8dcb964b8f545b806e5f60cb162b952afd14406a08c4a20409538f47f85ca3d2e5fa5cbe3d75eba97e9cfa5cbf4cf32ab24a5c18989179b96710dc34662badb296cc1eb458566fd78f451e393bc15ba4b1e22ac30c64e22a6e40d6ce9f7fcf983b83505461e92c731b0a4ecc14a69408b7ab08d316b02c0e6062b331e6142fde28bcdd208815c547d656a65accb808bf330372db5c1bc5e7a435b2b2f563f313b3b654ba0d66529771de560d7784f503405e1fb9559d5e22ea1d1e8c40af78b7cc62f040b6e7161bf722a32aaa5d42d98e94d910082dce34c4c3506adabcb0457c6b730b23e65a329db37a0535c3d1fb8d6ce3cc5564dc5bc1a8002d52a8cdf48e0f070d1e3cf56092e5fd4b979c32e5cb8c5dca0b62f1888dd6fac6ddca8744eacd60807100812a542fd5961bd4b972fd2fd2e5d4b972e5dfff000bfe3d426b12e2129bcd3b69b9afee609dc8cc369bdb3027c905e8f47f8a5cf160724bbd611cce1626057b5a6d929592c32ae5773ef7383cee3b9a9712646a36f45c43571431e6163372ddb9961f544bb12c0dee581d751560382f71aae21f7175c056a61cb3a2031e2e2b8f5848c4129c13166862879a4c5c7c6ab8256304732e1a0c8f331bef555fcc3b32d83838983117bd5a3ee222801807372c16af19c0455afb968b9822ed4156e5c30d1d43e3f386b37bcd232b72cd4f646cbe932037515cb8815ef350ab98d1d5fa835821487a8b97de5fa2fbc1db897732c9b9570b4e8c55a804a38810207f0b973b4d4bf4bf4b972fd2e5cb97fc39ff00e16502a0d90e703697a8caea0f2db30743fb95e44630626e54d43191a94e15d73005e43d21e9bc317123a38ef3c7c414a669b9e6e4709d1259a168fcd77e7a3daa20e654af4b0d7a1de0552b8bbf58580c02bd1b83c004cb645b06522a9a83acd26e2cd5895e31483a67c47d08ce359cf86582b37302b31192e2a16fa1b6035ea6146b1c76829411c69980708a5a0c1de6694dabb8c6d073fd450dbd4ea2595715658943818d5c6c1d665660d22537285e61ba43ac5474acdab119c9896559771551f31ea12db9b75f1f986802bb434f47e530f5fcfd1707ca3b6c5372a1686952f94515288103d087a5fa5d7a5fa5cb9d3d1fe3752fd6e73fcee78868a6e594e9292c6cc9affa25e97a80608935e952b989b99c31c93b2bd3d5288e6e2bb0e3f1de5f488f284b103882876ac3c3fd45254a9934d4bac8d4c039ef07569a2a03c9b040af5c1d4815ef05298a8980e22833985379758383bbe25a1fdd37d6c0a79007da0adab2f25c4d857a554e137a3a4a45c6f34426c23c66216c72331c15f102ca9382648e04f88852dc110eb89d4c06b33d94155c933f6338e172ca10833c5cbf0352cedb960c352c9b976be65ced5bf2febf3029500005563d2efd169772fa32fa32e5f5d402eb72fdc559ba81f7e804b32ca2a1a540812a6bd0f47d2e5fadcbfe17fcafa4b98f4273ea7a8dca08cd4e065ceb819425cdf0626f61b5a9873712504aeb2a57a6ab5b886338872367a2529c8c6b8be1f73b41bc9b80e196dc62b49018c099d3c8fea02193cd7d88c55ec6a9f68eb7d28144b4d9e8475da52b2aee4a30b4f32b9788199407b9a6006f23146a50c315b85739083db7ef5e8650059e6e2684eb28a7c54559676a3f884a8cc160b033945acb32fa7acf8e66ba0cd2ae305c8733a1b25872fa16ba4172dc11da0e7c9c7cb9fa9ee9e952e54b7c445e1962bb1f1f9844a8182aabd353f3fc4220db3a12c976cab84020bd12ddfa1d495ea43d6e5cb972e5fadcbf5aff00e372e6e71fc48c061b2360eb9844d2a542e613c25047e12a12a54b1cea1b633de6875c929787d2870964b9f21fb4c8a251b197c6272bfae652954cacaf78b653c4565fb8b721c520c6b823925733b916466bf115ad151fba0b4620aac14dc307b798ae78986089e9f58ab65270ca5de0259424b2b55ea22193af30d01e5815346eef317b3d4a25a494582de2640c551d0a8ec7997ae908245c02e14a2918420b839595da5de5cb2d0cdeacb0d8f496712fa4a88d62ef447aa5a54fb4fd40414060999bf4a9572a54bacb894ea5fb65dca581e82a59a95679f4040f53f8592fd2ff0085cbf43533ff00cefd6fd6e71e8c02f68dc7c32ee4a23b8ac112256c89e84952e55d4c33b2006e5d8732e6a23b30c4c35834bc87552ae56ba5cf48a8a5358a9518ef6a117006c6d96986fae3e2745f4ffa812fc4b9205d89707895e8b62a49619c331cdcc23874884613888941d51172bccca41e92620e128fca1b09562f588689da0b26992ac8a2b5e958868b2ba99806dccda1353dcc329ffb9c8a7896216b730aa3ce25b0cbebfea59d786e2184de665f6f4058d103005dca280eb63fbb282b822832a57bca952c255a8cc5652ca8152a55ea239609c7a012aa5fff001bbf4b97fc8d4e9097fc3cff00f1ba97eb6b2b8723140c5b338ca2932d1a8adc411b60945dcb84311ded9833995cb98035e90bed162d8e6f50bc7707d2b177466192d1d3da5a61c3de774fa28283df5293ae96bfd12af4dc04672f9b4635d99125ad3edb345fda32a50de63842aa29c73116ed122b906b1735d45d90142ec97b1e6083bb97022f24434547048a8cc4bc7db155e4ba75e26b150cca5c610a6a6f98d706279b9435bf45cb59dd05940e1507f736bf3033ff000ed13b54c1858254beb30e65175158db2bd4a951e29e2010a40a9afe17eb72e67d6e5fa73fcb7b97fc73e84bfe37ebaf43acda1021a60a4c656ebccbbb195300ee55702f71134c25638250bb9562c455e253adc575033d74826141b319250e12c975e73fe41b9298387fdd21e886b19ff92ece3cdb2f932e64dcaf798e614f782e5ecea57970eeabec8695ae91fa2bc474d498c94d29068283ad3511fd92a3515ca92c804c52b4d372ed5660bb624555e30dc109f60a256fb376dca3a3d9075e69e23c0af68630ab796ee2e80628b09c3e96fa6e77458cd80559d0f08d97cbfa205fcc02886083944128731046da9676cdcab952a54ab9c09a6e09c4292aa54a950dfa54af5b97eb75eba97ffd2e71ff00cf53f5032752d3b988db2d3f1798ecb336102ece660c1bdc16de7889c6e270964baba8a196625ed6bfb80d34f285dc055b34c175e01cc668312988d9ae9034c3e944c9b2ae5af7d352d99de1ac3ef065a4b19462b8808e188c52c60de4c7eafde5715ece6144bc97b3acc0a25a2c99e89107253d25529d39261054be70efea33152377b18c94d3abfb61cc608b4a1d1d58a6f41df705c2e3e084c86e5d9799655b71b274dda4a17847bca6599437017016ba0e6563579391d8fee548146722f7961a8ad41120aaa9666e54a952aa54ab9511d4eb4a6149528952bd7c4a87a5fadcbfe37e87a7189ccbfe39f5a99f4bf4af43f80dfa5592bb6206230fd4c8760bf26182fb89cc5d7d3701bac461c4cb68751cf0778d9556347b45f57b4028800c01a95a5a7a55ca8634d4e1d7acb1c99951b097a92caefab24532875d9f32e5d4beb2e5b3e5b711380024de7fd980503186ee2b9cbda5b2a06d3a9aff00768e282d3a3baff52b1a833599633b606e8e3de505af30c5ff00112dad3b2e02ea951a47db2a227754c32a355c0c64a45bab650712fa102a85ae8ab65c37d8653c7f70f1abb0b6ff005ed2c28c110733a116c732afd1840952a54af40d704eb4121d12a57a64e65bcf32ff0085cdc25fff0033d3c4b977fcb995eaca9af5a9cc7d053d389a989e6b752ab7ad7f705952a96f19f41e8ea5940e39982b625e6034fe628db402691c32f57ac02d639ccaf4f1e952826259ea335387d484363d484a8fa5f138d974c311a57a254b25910ed02ce5bcf7d4b23a74aa8bae4e22549942792654034c4badaa5f94bfd54b023345cbab23ab3ac137bd215dca961ca993fe932051279975a972cc37a1fb8c776e723f3a218554ce5f93000097699679996532bd153c33e8af46506c4601b80352a54af4af4a2712bff8dcb97ea7ff001bf5baf4bf5bfe47f037e80f313a4c2b76732e2d034d7460a0de1d3331d7d0bd177780eb2f45abd4168dac6eb3d3b12b9740eee25b9ef2a92ae24a95e8aa8b52a0d524ae8cfbcbbc8dfad7582500f52e650afb32c1278b2a3f8bc4c8cdc6778a9aaab8ccc8506deda94e1f26e25f0e96ea32b25f997de6e37bfbc2ddbe3332aa9d92c82b2c06b3be840b251cddfe25cef9ce28fb99fb1e85ca77be67f504041a0251a87501dc108a952a540eb3b3d4b78f440e200952bd2a12ff00f95dfadcb972e5cbf4b975965dd27f2bf4b963ea4bff00e7552e5d7132ed1269cdbb8653401bea4776c2a64c20b37766202f588e13ae22692cef35fb82c152bde25442577288b372a7ca5f88a3647ba393881d8f7f4a952a5441e2e5b8dbed3f29188937e1d4d80d68bb999f209c2f7d4c58c3d48be7c498967acb1ec3841edef559f4fc432a8af69a312a94cec7aa9184fb7a99c2f119d4824c752bf9f887f1e7ff008dfa6fd6fd315ffc09e657f3af4afe490dcaf44ae6d8f44ba2265816793702a727f51111060c556ad1de2bd3702dfb97abf18942d0a13ae1ff00b2bcf302ee28892dd4f78fa1995d25245a31919435ed29bc71aa94e20474d91f5a952a3a9503ca3914e23a7310ee0964b364bf89a2e532aac7a4bea4e32f072d9d58095254a952bf8bbffe77fcdf4bf5e7f81fcabf8dff000abfe7971e86a6a32cadd6204b0e4ee730851b13e60a855373787313a41274898374fc42c03a3bcde3c665ebb4a370b4254acb7883d45c306cafdcabb357cf495c11a658911e2697de6a30f47d6a54a952a54166674094f115b3019d29755c0dcec4edfa7d8f4470b71179806e04e250952a54a952bd597ebcff000f1fcefd2bff009dd4e25cabf5bffe95eb5e951098cd905423e82f1c4c1142c148dd0bf62a01f6845e8e86e5d9cdc42ddde6204d28fa622df615166168d2e650ccab65463535a981e4f519b372ab7104b0d8d4f09c3100721e9eaff0a9509d92ae3112f103030290cb2b12c8ae88bd209b80253a4a952a54a952bd5972ff00fcfc7a557f3bfe37fc8fe35ea7a5c0da0dfa5fa32fa0c54450e1545fcc36931da73154dd4d3750495c406dcb0267897e5b0bfb7fe406c8ab110cab5a966f730dc5971162539659069c67328d59ad4552cc5e638beb1f0451b7706fcfad7f1a9572cd4a56312b867339860b60ab170ab12be8a94cf3eb5eacb972ff00fcacbffed7d3ff00ae65f5f53d160ea7dcd9539fe15a761b88e3429e0ee3bc322414a1b832ee0b8b2535b9510d3a8c69c6b7f728dfa7a0ca3ef05f796982e2ec5542554721743b756662afb5cc0c7575e1e798a819d175f5043115db19609bcf115798b29c32ef27f0af4af4a80c6ba80119402a79b841980ebd0c32a54a952a665c6d2e5fff00a2fd2ebffc3dc9bfe1bf5bfe189b9629e129d1d93097ea28deaa0582af72b2dd67c9860e92e65e8ea559ce2512b0b2e36045f3d3f10069f98016a730cca952cc0b48ad1eb182002b7c130385e1db89616ca0e2100b4e2a6772c19f304e0806e5d698b77e8e3bc169a83a61fe752a5443e61846aa2c1609ba40d6595049432bd6e3b8fadcb97ffe2e3ffa3af4e21ebafe67f3d4af5d9164b34e20863d595c86b9979eaf17e666a5314b86604beb10e21b8fd2a4df86506dd987b414b2e19a483d677bd44ba541631929967c4e516ce90a99636ccb3732fea7ca725658280e6573372a555b2a5a6b12b6b583754d9ffc195326a5a0c25d43a8099b80e99865dc62c5971fe0caf5bfff007b9d61815dfd0fe75fcebd2ea0456343b9b3ac70cdfa24b1d169177432be8ee203a2434eaa0c3d3065a6b7cc0e153ccb52da2de49441e22af45e3d2a1364075125bc6609c4c96a8b6baf12af04b14ce04726252ca951e92c997a14c38ef074c3d3f8beb52a5446262a02b590d2e05299669994bb95fcb8f4afff0005ff00f844af4dff002af5af43d0f5b0f818ee68b8d4515e9982a5d4dfa020e988c3d6731a51f2620dc1e8c196115e6020d62171a51b9625d21f7c305cd530d4582e2fdc4baed289d08e17797a34ec347bcb83176fee09d5acf620b7102e74bd0cca972bee38f424a8632619c7363ac9e95e8ff0a8cc9a9681a9450e9ef05298146fd0ca54affe6ff07ffcb5fcebd2fd6ff99eb8eef03d2e38fd71059e83e8970515386a25b34189f4fea1b8ea29e254e20db05ab2e0a829cde270d01bf16d57e267ec811ccd4b9e63013912514ca8d3bcbbce56cb5d46392d7f307dca12ee595bf4c25c5ce31e97e994f0949735988b0e3a43d5a7d5f57d2a54b8b90c742ece928472e9012984e496ed9772a57f37ff00c9bfe777fc4ffe3533fc2bd5543651783d189d4039f110882a1b9b972d31a2321c193c30cce0dc1bdc1dcc06e39b0772d30b76606894895e49d821325508bace3753884245b1c4acaf64198ec56d4fcdfee6056a28507129bbc4aa9a9718fa55c575995cc7810000f30154dc44c35518a26c723647d6bf857a5f48888d4a117bdc019dc0d1f400cc32a57f37ff00cfd67520557ff5afe1a9bf5a97408167215f3cc3d0dbadca4bc26e0e65c18c1462e456710186d65e4dc10dfa64365cd718824dab1110ace7fe4b0b70a3d46f5f10d9a9af40cb9759404ae602862e1b2ef2404f635f0e22e26a59ac5c43bca955e8fa66e0ce653840dca8adcae20bd18882c4587101c34f4f4af4af4af4af514d44b0b0dab67cc1372cd408232a54d7ad4aff00f4dcbbf4af4af4bf4a87ff001af5b25ac3505152afdf52fd371b55e1fb8972e9971d448883de0e8aa82f7dcbbf8043bfba82f4e5bb2a60115b7b47fecca74cb824b275c029da4711ba820c7199d0617e97fa8b670f117212ad6e57908089d227bfadd40de58ea1e8ee5463a67296358494269eb000e43cff002af47d2e23b30c5cb652905ceee1ba6169632a57f07ffc27f249a83d7ffa5cb972fd6e119b922bf1cc23f001ebe6614f460953630537c45e8e6590f332d55befe25ac71707d6f22af1116a79c4cbb40dbdb4c403da1a50cc25138cb11bc6a28a32acb2b11068a71b772843c91cd54c14e64a745c516a6255ea0a9785c1572815f701531d0e61a4c378e605caecc4dc5528688ee8a8a3340b5c93bbe8ff0007d6bd05351ab1aa8a50e9f300330e9e885f4a95fcafff00b7133fc2a04afe552a57ff003b8b444aec6fcc254c7a0133365b58f105906a5fa018625e633679266880415a972e09b438788e275589486b12db6d0bf26ff10a2bf68769706ee692ac479837e1b88bf2959836d748e1ef3a2c0df923b80dacabe91560dc11dc75310baa1da58285306cc532cc7c4b61aa8a975c1da57497e77c9667187dbfbe65dca37b8bd0954107db157a2cfe15fc1f5534c43181de056fe5029fdc074fa2232a57ff0082bf890f5a95fc2bff00a57f006f8188ee1ebc4089fc12ce3163926b70654adc52cf6eb0d072ac3b3ff60b25f5f565706b1d2200954b1b3b57e61b84b971d7a652e310553a3532521a969396f6711e3a7ee0e49d89683598aece25dca39ccb6d05bed1901c067cfa55ea17cc50709cf48283639ad79fa8ad56329d1945acc98bab2b12ea5f59e3d5f57d2bd2ea305351808c45c11b86fa3632a57f0afe47ff002a95e87ad4affe1b95e97e9afe09639e82010550426cf5a94718470c00cdbcc14e22f4198e959a250956fbfa9b260c333c41505de2c66825df3295b414f735f88e62a9f449a99f403b40c469d3ccc0758ebb0035dc7fec566fa440dcbcc5d3d352c759b9457796d744655b57333dc2da99a75d3ac6c20ba6d3a7302c153bde600fb40b59d44a54e90410a6e0debf857a32a712a304331c752fc2a615730b94b3985a6e57ff000a95ff00c4f5aeb2bffc8e22a0ce740a86e5a2f64108b1cc2e5b7f30dea61e8c1767483218b61ee308fcd08398625fa3980db94d110fe071e6000dd98ef05306e5cbadcf2948e832abb859a88fd0d8fc44c42d20b37bf4083c4f32c301515ee503bca9b273c3c0b5e588b6aef96218d73e2191801109808580a620798ade66e3b977e209c896d181b63d5fe552a788bac6016c815e5d2153301af40b4ab95ffc2bf854a952bd6a54a952bd2bff00a138f4e21bee894b2ee8f07a0b8aad788e60f1e8c5c1f5f1068ad24aa65c639c4410981cd4b832bc7860854dc4f440d66988f8accc75b45aba9887986e1e8ac171c93a9971784c3934c73b803ef12e056b349775372ae2d525024b06dc04368767ace67894c8c8b7f5e8931af52ba4d44bd4a4a5c666d2e2b309b71c7a398ca0647ad47d1f5af4bad442c6a2507f708ddfbc13b97732f9772a57f0af4a95e95e95e952a54a952bff00c94b1a0c477b62df2ca8352e09b05367a6a77cc4c4bb54cc65c752a6026c8a4dc2af3c4d92a98a54b42aa8bae2308295c112d7340fa60dbd065c732aa097e53f1320acb14b6b6f796136a6df6835ef0d5a0c1ad665aeb0cb02dc41d35cb33c0b69a8d6fda2c67bce7530228a22742a05ef5309a4bbf4b8b962b718a3e9556c4c86bb40db0fa31f57d1f4a9a8a698958e25b42a61f380ea772169b952a57a57ff000a952bd2a57f1c7ad7f3dfadce25a0c516ba12bcd042020d093815bd63a5de4825c655ee2e06f505cb9b8e20309b225c528138b0086b3144b821bf282e732e1a35939e3ee59839894d7aaa38966550e71178c86afa4a5cc278e45bc8d4627c4c9bd1c7a61297c7329b738e900816ee1123ee16c75655ce59f68164ea90287895a86e3380ccc31d2733b44c1987075891892ae5335299a8e632822c7d2bd1f57d2a5749751194d4ab160573029984e9f446e57a57f2a952a54a95ff00c2a57f3d7f2ba3a08151784f3e8263984510fc4a87439f12c046c4c4e679f4edd19495cc4a8bafa37b8e01ccda2444ad7499106a5dc5388ed92de58eb3009e46003a27ea0a8187a3a9db2d4a6c105d5cb2d50203e9fc4562f883d15ea20145bbcbc8e2fa3738194eac17cd2974a171e994a444d8ccc3da0838a9406acc76eabd6e3de76cdea54ae580c53a7d09189c8603bc32c654a8ca8ff0a9a852265310a1fdc1a53079c079f46c654a952a54a952aa21ba95350cfa732bff0091eb55372ff8582e948bc9eadc3105c20b416caef35a94e9b7f08906f7e844a6329ecd4108c7712c563565c74d616fc91c92a965c73198a99a88b5c2dca44da9db8dfee0e48308ca9430d9044756210e931e22c5c21f87f52e13a416baf12b882a128002a66d651c401a752315eab13bc5a7799867a3a798685f4957ef1368dc0905caf5534669362571787a4af04b335996624ce5544ad44db241387f8d4af466e54b48c66e5166152d83ce59552c807d6a5372a54a95589758957b9a9c7ad7a54af565caf5b9b9987af1113ee09da0005507a616bc139e01a3c1e84ad4abe91b999e6622af3bdc12e5c6523a9022955230755024a21e88357c416fb90d41ca7e27120896f27fec37e13514bf4e5191c2cc0ae02a582a697e1dcd43a40bdd2c28ca36c3337125d42077b7111ce039615f2b2732edf9c3f135b8c6c62c81c1ad4ea2e648ef12e39f4d67a305bb808473c92fe7316f72af26a01b2e6e6a21b287b7889d25b2203460f5977af4a952bd2bd6bd2c31911a8dd2cadcc1d5c40752c8372bd152a6a55ef72999279ffeaff0bfe0c45e097decc211dbe5265065f425c2ec389d4de669b9772ae05c9b1993257a337b942b975da10185d6f8eb05fab1cca8f09d8647b0ff00ec336ea414fa2ee54104a2f25dc60d54eead9626c73344e109b1820261026d77a8a38f380530197c4c074bf3332a5e6ef13e23a831b800c07982eea59b9c4891dcc463a0ea5b3607370377974aff00b328e9e6239d4355d255cc255c44db144cdbf8203f87f07d2bd5952ea2c638d4aa85508ef7de1c5f2c9b952a54fccbeb2a5f1ffe3bf4b81a6a7579de7a4a82e0b3d5011c4a897a8ae6222696afacbb9d65d622dcb16da71da09712e54cd19a8d815307720b1f5a8ea03d2eb51da611968ed17e79836f4352ea75e658a1939897bc208ca36dbe0e3ea2b30546a1984dc1b5cb039cabccaa9b947995d1bbcbef98ea21cf50b22355be655cc58899b9675c415ccda5c404defc4ae9139aa7ac6b451e4c4e235d0b997515cd4714595141c2264d9e952a54a952a57a54a975129502675029794accfdc379f42c9b892a6b7b961e66f3ff00d2bd6fd2e5465c654cb805e282fd0ccbc3d1ffda000c03010002000300000010c34534134c0822080d220424828b94b14dbee1993628873992431fa9462872cf3410ce101a492c514a34d14514634d30414a18810f27f0400007ce40d205157fc801294734d00e1e708138f200aca0850c63823c3b8aa4eb0b3471402a030e1820013ad79404178d6c80f03adee408182c29528f3491a4089a4f046063b8a30002d2a0a003000092451800872c730724db8520a7c76001ce33f21a140a691870af38334f04590e0432c8b0206b80328a21c08b2c134208f2c82822053ca9c00c760c10305a0cb08505ad2c0897c1283a871ce00710c0411513ae2c21403c914004f10d34f0c10cc3c934aa8815204534d2510cb98829469d1a1cd175860d1c680b342044064bb2a813403021b43c80042ce0082092873cf30e40460916a1912c30d296c5912c379b52a08f1690873cc3c11c400704f1d330a1892c874a04018e00e3c214a4c5706798125286186acf1cc272a021d90b0fe4942009108b6ae7e5944db71251969045b4433554b3bca0842452c65880871aa22e26988ccf0844066df4120b8b24784a34384614f08b1ce1c120304638a1c1049d08e4414e08ee4b34e3c712a30902cb4d3eb2ce805844f35b0a2e8346901066cb894f3033c13c22011ac04b1dae8ab400c804a1553c92430e5002ac73c32a3bac2e580c1cfa0230db4414a007a9a9e9b6fbaf10ebed9df3ce2d714f6c104e14427e1862cc22338b1b3cb2f7f8207982631841c500208200b0000a73a4b0a24b2040851001043fa14378c1c92ce22d28f3800641ebeff7c27646ce51c6468251890c62450c40b79429774be86c3430c80422823483ca94e2440822ae3ce347aa6bace9a48f45e7e211114d5a320208e0671b058922009b27b59b79478e3c910b95a28ea4104728824e0c938920ba354503b959049110f2d0cad1c92829efa9fd36142364c881c104514828508f9593cf3ef0850091c134c32104ab643440883415c579a79866d08216f20b8bf5780dbc86a8500d00914c200240b8918d8e40892841c558eb052a700f46534f75271b593610a82204bc5299419f2b24912334a30000b28d20238ba5e2c68d73823462cae4ba430e720734cdeb71b49a24a923bcfb1f3741fb497f1989dab93b6c8800e34e20d2cdb4a16710110114a045f8b00792f001f803090de72461d3ea3e659d69e469f87f4909bb0f2c704d18c19325610f9c124c87d04304a04ae2810bb2214bdc43820564577875a205c6d810a70ef083163115fac48cc93cf74138d149bde28c86904c346248dec126b8f847e9b20a00251a48601499773c82b94a3740dcd9060bbcd43e00b20c1c52ccb5f38d98df8f0e6286ae9e723649c89163b3eeb49249d34a0e82fcaa1303200f811496e128830328d3080c608ab531cf9d054518be31de116ca21a02ab35459cf45a68c09f2e043886d3806817287f4647a731753cf18b18224d37a04f90ae540cf0c9e40027c680c6290f8d02748349389c39600ec65de804926eab82d28cd4753432863060d2137308a6b26e1ce30bd48345b6902439b5d16cb7d55d91073fe751129d600d87a49cd257b75c0968f0c80081191ab7081d64c05053c7ecc2c4a09931bbb3675d345481d59d65128186e178b801c20493c7334e4250910f10114616f6cc7081262901cb64da478a687d08db612fbb1e7c11fdb85306b0c8ae8a0bc12424c9183f4344110c5512d408089798766f4c33d9609a6edc098471f5fdd02e517954c5228a451c4d832cb3cb54f2491c6e8800621324360414bb5744c798edd714b8b1082af94b0af4a040c1ec97f43e0af38924a2dd45418aa9f136d6008a31a4cf00596208c3d408b20718204220724918221c2ae53218914905444d15b5eb7d06d1d39537c724434b7e490413912c149671738938b326f8b28648d0ce36d8a7ae571718d1421d14477512873ed1b75c64babed34e1d7283db200d28a50009b6c12051441c214a04a226ac928850f67c9851411496e7519bedc404383677b8b4908a2421873697abcf16900c210e2833cdcc608f24338e18604da4b88c9060c93da6c158f5f718724d00a5660c225b18b2041ab8070c72c0019fb36d55840adf4714828308c20815d1037741623dcdbadfe33c2ac0011dc5991022c108c1082c1b69941cfb092421917fdb64f0452c738508db8f1bd4cfb9726461c7d569114e37ed04e13361b0a10220a1e11903c0300d34eabfd4c105fba2e20c1843851c714d0c66d365857f71474011b36edd1a6507d24a26704b0400a21ab0cb380ea433f5d263be97cd71cb2cc9a924108918ae1e59669c7de1567602c4949c55abc30118888830331d76539f75a21764201d2cc1c93f35c90032850c338d28c33049e7f6051519352738c46f710cf0870c91838089d6ce14de20412a8db7d17175fd29c40508020030e04b8271afcd947678e4625dd2156891843580c21841423c5262ae5384561666231b42059a6388c20338a00024a0073001cf11351d4073daf107439891da00e41c04b3c63c62c83e382755cc98dbed306c40cc30a3c724e00000d24c2652c40e26585984ccb26da084d180109140045342262be038104c2efc4030900800200200e0c318e3c80091c30cb0442cea2e8ea9a5dcd24e20700c1c118a08b0048e82011833ce1c8a3704a28600020108000314220230320f30d08f2011c6be2a6da679cb08f10e0c52c814920518908624e34a341c102c90c31cc38c0073c208804e2cc1c62c938f14c38f0078adb67b0734f2c50070083c81882c33cb2c83823c942e3cf3cf3ce34d3cf145303864826cc204d20520618436e1c808ea8d30a1ca2c51841042c03c53071c030a0c52842043823c62042443090cc9ed20f1041471cd1cf10a0cb84038b30138c3c510708420c38630a14a04318c30720920e00839809b20838818e14b1c00c13df84e9a61231c53c904b38d28d2ce04430804610d3c914728110508149d1020453a51e92810c318004c146a1a43181580028cae01813c51cd020141b4c14f0c714200d38d2cc30c00623db6b9691070800ca9a4341e800c998a8ab3e200224600c18d20e14d3440450c130a0c524828310e08000000c2c410818800a2af0e9604f7ea217882ea7da10012e0e014d08e1c23ca08e1c54453c42c318e08c08924000000120928d22a2400c309e3c3c71e8d2ee08567365f5853bb90914c2c034200234024924900220738500d20000908b22634a20e3ca30cab951f9eaaddd0f81c44a59293208eac528c3ca00f04c24f1468c01820c124b00010000138204c02408238402930528d0ec80579d55f7938fbec1d9face10204a3810477e98eea680ce0050c62000082840091c100000038eb4f0420804da279bc10490d81322bab08486f6c96106a922d24a4b14ab800400803cd281289346ac500e1c70c520934dc459e09bf15bd74a768eb8e93ed5fea491c820a1c114000d14084718014124400500304100ee1828b30100124319f977d8622ae021c73d2f767984a86853c930224518f04f3e64640c200008228100004c28a106f0c1cf3c712f04c46e003c5c206a73c7bbeba11f48ac82cc20c00428f3c90a96f420330430934e00500108a20a4a8f0c34d3b859e3f465c72660ed8d3e2dc41737ec24c1c80473473ce28934228d2ca2862040c40c10c91c911b34467800e33132f9743201c3e83807bb333e51a0d514620108014e0ca10d30608004204310800200808114010404a2001ca24bc4b2a099b2a65e5ab84d0521bc97c218f0080013402891cd28420b00120b002304083044359785082115e852a25b700f52ec60852bd0fe3d240fcf262033092493813cf18808e04a2c110130108010b20f068d481460042c10892d3a17a9d284b9d11de8421e7f2d4c2cb18b14004f0c038d0012430883081080c000b10823418210714902b8164945ec531aa92115bc7b304284b00a18810380f1c50cf34538934a10f20400020504d2023e070d70520e24208b714508942ccbd27c85e6384734610b20088800b08c1423c014000508e0c20000003442ca0cd88a0544ce00420c8ae24d95d3fb5b9ab5a200ce30134d20030a04b0cc1452cc2012440c810d08808118128d101a8d14a163a042521979233440e35649857053e820a04124528e30220114000518820014934124c08414104c000a953820df14c3915c128fe78bcfac8a632842481410c104a00000000830a10800114a08420008000118038d4002e134b5525071c61874462c518e3a15ce20e24a00c20300520000a1002030081891c200008008200608520d08c2ea1c351b34728a3da29378024330d48694f00204424104428220200800800000d20300710410000400400e3012e36c313ba00057438582049084204283cfc0091c22cc0820002010000001030021020010002840480073053423efb452ea7443829578d840700304534619a1ba3c300234a28000010404200220604800720034218c08134a0cc1d298524b5823c2a181cf30a18600528e34027ad8930204800004000000000000410000120020210c0442c164e00e8430803320098029d908e14408c29839f00a663ec208a2040000020820000400c92c034514a10d2402c124d2418a02478642420fdb5b48c2d3c0260448000c08ce1a38408200000000600804014b20008038e0001030c51c604d2ac2cab9414911655d2cb06924b20218064028500dafa10120000000100714834904c10100108104c00d2453033ea30829030638c7cb3409a23cb9cf1ca18400a3c93442f910a08000500000338704100008a0000062c05c47c21258c6054ac112c7d63027eb6ae0cf34114725b14428e13662038020c0471000c100110300000000f2062071861078070258483a3de9c0196922518070720d0492003441880a0ece04b00924800810430900000000918370e6d87dda0d0165082832adfc61f11293d704e1caac33447091c704f70ef8b1803453040010000002001c510522c78175997a0007db4d329628703f1a547318e5e4b6f14c9e00c9387187ede8050440030011020000801eb23ffc400231100020202030101010101010100000000000110112031213041514061507181a1ffda0008010301013f10fc5318c5152ba04b210b0782fdc3c4d7cea143e979d97f91641fe009e4b245c5ff008509f5183c9755fef0791bc84bace2e4bf5858be8222a7a454266b3bc53ff010f0242fb12c83791afca57e500a28a284b0379961b2e6a68aead950ac40b9789022e0bb630e5294c7db28a9597fb085e4fc819613c07ccf61f73c5f52f00b0ae850a447b66b23eb54363cd170a94c30596596597929c212142f6e7299ec242fd0be8a8242a47d498654a28a28a2ba5414276b25b42825c8362b662f42a09bc25761c566b60d42e005428574284213b15c2412e045785858306829b0f9432d8186b1ac3e90451c7a2527a29583564893c405050d700fa6c6f0204f442e20c6f34c8a1a839a870d09701e8143e0c4d21f907e4ec505294b25d17b0b645f26e31118bc12bc0f70b81e28a85b07f7a17287906e68bea17011acfa6a14294c9293c92e26562d068242c131b0d67c823f8350dcd23c3b38e850f151a8d0e8b9505085e99e488b72236586c6e08716310960d099625b8570c44bff0099c5d3ff004e1ffd85c27289f209f275210a10bb741cac14f31ca1705496a9212822bd86a06844e09ea2fe670b0e3839e01e6210852bd09e698b0adc9aa25f041783d86b0ad4322617245e18d05a18d6ca169b43239c046e0c553a371741c21314d3bb80e04f510392fd84e0fa1a0fe4b08d0f838d7f18a1c22da8bc31790d03eb12a1bf04c3e6385121611c4a8b2c50fe0bd92c611417a09681e12ca17e07d83c9e33b4f44c17910b024d0503701b9029ea3e64fa74589c160606e6a1548b171411572be882fd0c52c4d3825a18f70dbc5a19b830d73c45e852d6c3f4945428609f41152a85b2b616847b24c25a0bfa380b81862fa84c6a38cfe09ec4d02d03071c2629710c6fa08449c88b871b21e0bc0e17d8263c109058161a95605f8058317921a92470e4fca3f20f980f8a7838599b090c7cc781e01456c2cb0accdc0dc262fc7048326504814382d62c16e0b09a86e090137cc312f075a262658d8f8214562a12281f90e40a26a0f802a02f4132ae47390a0f91ec1410d43e84c1681609f03151dc09f8303ea5012821e0d8c6e486e29f90ca810a0adc8f715e9fd283d87c25315b1b8e1189cc3070f03da0f93ee1c6e1e612da2505f2c19fa826303f02fd6603cae4e8b560b39ac3d109f989130983fa360a00c88286ac40d19b88de1e8c68b059733808b2cb2e7be86d04c5c5b2bc19a6e74a4d0949a1e0ca82c146c6e060b1382cbc42ca9a1e42782becb3c0f02b8b34a3e512b4cde8f03432f485e90384c112e6cd64575d6023941c8a1ea0813e4ce1307d162e2fc8beb0bc6d85809a8542b26b159a1ab0a2a17bf16170445e835e0649870bf0598e0d0b0b1e32e27e5150502e031314575d31f41327e87f51c039b3c45404c371b8513c0285828bcaa1228a287005c014423119f3163652e970bcb17970fc850e65fe8d8d1bc16a1587229d46093891b98a878acd503c2ac59611086b1654b41648f443650ff85fd1383f4584f61bd9f0f85f22b88551d83d240fc48571c18d929c05d613c8a2fa49979a001c8c362e8a84c217f4af1070fd2c04f90762c2d60e5dc858c34d257876f9078bd2398437c8fa12cc0a822a141b8b2cd8669a2e0a6fa57a32bc625bf025143654898d8fc0bc41bf2042850b261145c8a1428540ba02e5b34944484ba54a13d0a90a8372dc5072484fd15e241a0fe1fcc6c6c2942e1c0216f0e178a3ac5114a172a12fc1132c25983798d97f60a3fb8d1508b2f013d44e208902fc82a4b106282c97f46c3caa2c78d8df015fa97365e253717d28b2fa286bf595d7783c9b2cb1749afcdac6a2cb2e143c6cbc2cb06f3d978db287d565c5153d762a2cbeb6fa07859636250f2b2cb8a2a2cb2f2597d5795617d2f0a2a2cb2cb2cbc4517d5b41ac8be8b9b843cd635d4514515956d8a40e223fc89c02358b2b2cb2cb2cbed535d0a28ae94a50d8e765e40406171183f038bbddea1435fa91134829a88d408960679466c114a03f912f42ec6f0d6cfc6a97f939c66b8815c147207bc6362a0944df209ec2637a0fc21f7c608a97fa2bdc5228f242504bd17242d8245f303701ca1c631ec1f306f61ad76a28afd7caa1282b1f40fd0f6417a144986b91096c868bdc2f617843439066931a28a2a141942e6fb5ae83c3418bca470ca50585d826158613812d4e19eb3d0a05fb1a8a85e15f90c8faa4280d845f81ea3610bfa2dc2b441cf217019f20c1ea2b4163fd1a51fce358b9b87dff0021ac0f2f2020b721344f68f89b1117c823cc3540261970116e9cc1c8624b272a0bf8191c8f047202c0d8205b0fa8ba8d40f31f41e948c36983a9e0901837c0f00acdca7232bad62793fb0c17c0825113428340a3657199cc212fa32a2570a2b802560e20e09e0b36ff0041a178304e163f080dfb940838c45728bd916d4263402f85e41ec46e7a5f0a1fa3894acdca457e162787be1b083dccfa63d03dc323d01ee0f421fb43f83f02101f35a12e550af057a6c4c2964dfe65c970d0e3a53e4834620949930e0ee13c11b785e91e48d347185e458f707170964f0afc2c6c2ed9f683fe0a6a88514645b82d70ba2171b416c8f6060c32e025937297e4f216062c45ad902f8411bd81136c22be01ed3cd4a613d90b7044f68b021b94b16cb94bf2fd0b32c7cd1b1824511b822b4de2c08f881534495e329b2e6bf3a8362192d42a5ac1ca5b10e22e40afad8d61f8104e21c369930a2a132cbc2bf4a92c61f231a1ac1c0e1507af8ff8454b4c120a6bb217a9965e3457ebf413c25e90c09641049cd8ecc336b86810be8afdc506d3027de9193c68a2bfc6805d02791a3e051457f8be82724c819102cae98d7f8c506c137995ee25d4a1f235fe29f0560fd8c97fd2663d30d814960709f68c7c86bf78e541a44d86c04878748962cad07cbfc2d495c806c46e089705d0607fe04dce8a9927c8d4120975b0d7e9258941e483e0de612f71aec2576be4f2940d23502ff34d1882c41b92d0270e0f18383fe21f21afc66c50b10283c9ba2e801c8f10d845396c59dfe391c7ffc400231100020202030101010101010100000000000110112031213041514061507181a1ffda0008010201013f10eb50f078fec73d38918be4c48cb960d0a2e85897e561e0f3a17307885c50861c10ba087f8c2cb2fa53994505c120a468286262c6e122bf080d7e70e450e4960a46842884b14f152bfd807042c532e1e09428628581a12c9c7b2fdc90a1e243c87dcb5d6c2bbc79960a66cb2e68a2bac43c90f0529f62072a53086e5972afc603b16597178a870b2cbea03e89c1b9343406b03d45f580d0b2c5f80a096761f6c250b24a2c7b0b07f435c88407d10fe46fc100bf032c6517886cbe91798fa0583d4145601b9142109997ac6e0d8b1ccc59627d4f07fc132c58b2cb2cbe9217707c430bf04a1fc1722d88fd04fb017965f81385db05bec1085ec17d8362c2f003e58984f3404c13ea24f5625b0bd22788965965978d549087d617103f5350595649827e8ff9d0138f729f00bc884fd50d700d758a4850f35ca58090f93fb3c832595867b0a0a0b32e1e116b4898ff00f2932274af021748b85939362c22298a61b150684c4b27f43131b94e39ec7d595c47c0bc493a9494932392590681bd036094d4a134213f580de3cad387b630fb7a2d4c6f4341387e06ba4a4ba5704a46f1294164985436115e2170d9fc09c1f59504b70bcc8f2887d80a4a4991e4d410d0d8fecbd129c5e0c985fa2c6bc0f883f484c3f427a4ae4c29b91bd8bc0c1e0dcec21417a0a8260d607f430e156c8fc8685098985141a131f551cbea1c34187b0fe8fc03dc3f91fd85a25aeb08583170af05b0be8ae042fb887e0360a2140d1617d0d0507fd17d1e1bf8341f41028c6c2721a06a41ca74149490e0d8f05780f6058268bd05e2a547cb166d18e49ec16889f646a0983040c2704e9282149837d25e01c3f87f65e89317b0fe4503b89c33e0682f228c51fc810680e081b83f437b0bb62141b1b2160482f8939687a3947105e707f4430f60f0c7e08dc14114344968204c27c87f1d2b15c6e0f0581620de828ae41c07e025048d6c8436098b186c1c681cd2d41c18dc3ca525a0813e9252421b1e4c659790362c18d011261b8362b61927c133e0b2fb1681c186e0c341fd130c3e850d2a03427a768484cb1b8bc1450d7aa10b91c37c466f21bd11f0583f0c0b8b1b87283f008141ec17c818bc42c217b40d8457ac4aba142cb1e0a94b21ac0aa7c024388c1e2c6b90b928270520c1e022d0b09820a11178982e82820a14945145405f502872529ec6ca2fcbd241a1ee2812098d8b2e051212cfa50b251451451456490ac4b85fc1433d0f42f984ca6e137225fa36084515ec504a0ba88680d748e2e2ba57b2050cd24097b0c1ae0cd6d400825d00bb0b4b1f78d970df6128709f03893a47871515064568160f67e30941454d04a161c3f5098586f350b04bc0fe33955ac1cd1617c1d4483627d8dcaa0ac11f28593ee35225898dc549605d8f6435ea3ffa17118f9725b7e204c7e43dc1dc288b121f999a9ea1636597d80886c0fe460f0a7a0f2679312dc6b747cb2be0a1fd8b40d01fc179420d6c35942cf92b1e4371b017a915730e162bec2e70d64fd50aba0a0eb4218868165719bd0af85ec3f917c1fd45f8091c40a9d721954d3a8045580365f0dbb56273582b4ce218b888accde1165c5965e0b0f21b8e58a064d66ffa57222f69fc8e497d0e12f59704e46a02ca10bec0d0d62a8482b0ac0af00306a2371f56a86be1fd8687cc47d0fe6657097c1c04c2c2c14597084cbc63096491ec1e92e418e258312c4cf28c17dca832f20de000907f5142fc082fe6545965e0b0da0c3345429fac5007f9c10b0d781b0596025de1b82b050d42b90bfcd78549505788566a859b50a41e6d84ff00097d3ff0bc8177848a2870b27095d97d1795c54f505414574d6812ca8a2b1890d8baa8a1b3ed81bec2cacecb224259d6342437d145145965e0aa15dc5c2a0ca9b9a1677058d8de3454d965c515d28416b8a85751735083410ba54597856165c2f25c56152b867aa2fa36d0c163c945495d1563505d03708bcafb807ccbe4375b970992c4be8b82bd282fe8b25d2d0e3509e2ff0029638dc9b25006c38140c58c96c632294cd12f4b04c5d0c5031385cbef5e5431ec34261e917a181118445e2171022482970a14265ca7d2626384f15f8490486b05e8383ec1ec281ea4243407a07a06b87e6715cc9a8cd21444a58a7d0c4cb85f948597d0b0a597a0bf0392506a807e07a0fb9c0787c87142565916cbea5a012ed4fb1ed0f706b826d8515760de43fa2e685ad8c7288e38b5334f844e6f12b939850afc244b29701c181a0363fa13d86c287a23e20896af0e1e37c34e37c2d9bb12d0205f85f425d259176d8b1570371a08722c5c0719f52a51c350e507a0f473704684e1977ff59440e09efa9604c262ef4c23799e08f562c0504d09cf43a71e6837294a5301729e96b5b1b81844770f6b450905d8d628a2b1903787c20b01fd89c045c80e78da7a3c50ad342dd66fb1c0d914286f34a28aefbc90d82cd90ae5e18d9ee35873ccb89e303f71514270479205d8541f0135f05ff81a539142e85365e6bbfc710d7005c21f84260e10307bca5839e6280f917b31eec0bc01ed21bd14941d7c192a1bc9296ff0d43428709ed83149a83918940481a03e20c9eb1f7329dc87aace60e5a271f42d30bd84e904bd3379296ff1a41b4caf46f2c39e65e843c04472a20d5942fbd0805e0579e7a0d31e828dec884379252dfe461f90bce5a91284e1cc6d1ad6c4c871e1435c4c44cfc4423122a1bc522a5beb5d5f0358b94f846932c5150bb2073a8a643801ac37825cc2ad358560f057ea7051e089e613343435e704e3260738c3a03632b2e1a28afdac3948265021bc8943222e0289bc1b85e051f3c25a25457f83e435d52b95a83e144968044486f46dc2e8bcebf3a60980cafb545ac6cbff00098314686454d6561e0e17fe3790e5a4a2b0c95fe84c4f02609ee47c4bea4c7d84ff00c561cbc5aff4e191e039d01a93c0a5f6a3518bfc28e0923824acb80ca958122b24c3d85ff83b92986c621769a284a0c95857f8f11a982c36ce2b81b17d7f617ee9c1246164c2b2286ee28913fced65b92c136c2f07fa02daff0032e26a4ac4a79890487f80be84ff001960b0a970b26af4aa450a94865ac0d669fe36143fffc40029100002010303030403010101000000000000011110213141516120718191a1b1f030c1d1e1f140ffda0008010100013f107fdc62f83d0181e10b942ee09619f702cfb580d74600ef0ec04d0027b595383c819804486089811b07dc1ce901e6bda1231a02390bdb0169320e19f61c74c45522c1ef8941b5e152a38b0537133f73aa4d280f3f42e908723a49ece23b80cd978630ca911a3b02ded8c425bf6ea36b8851811a6125802c505c88191509d8ec4dc0e35124bd08acf410c65a3a744f8831132389e5ba301928605c1c518ce18a994e9361d9496d0b144c2d55793300e65385053266d16e982c2084aa40130500d5a10e7c24102e1b170f7f784a9719b8202d200a6d02fbb8722f025c09e1c00a0f906f211ade0a150e4201202e6a0f2007a4c4074c80d23c902f2600ee05d20026984cee07d2928408c3a7360e3ce2374258522ad4d82c13d3215a1667907eb69ba129aa84a080b567b110dcd421731fd1b2069b8b860a6402d258e818d8e0274b26ac9e28fb4fd8027204240c07985009e4d5588814960623f070e804131025397e4917807f7b1dd41ba367a05ca194d4a085d288c54263dc934bcd9a2489036dc8b62be841b054816384b0172993c70583e4b1452d01ac1a24c17d2909dc124a5e741f047104da5f208961b042c081321980be0c6bc02d9abd14872a0f5a00ae806c4b702f63b8300635410521df2280992384686a058756ca0cbac488c0fe0a343418aa0477bda203358bc5363df80b6f0fb0d4fa86fb1e728d920d92c4a55095a00044f3441cce8ca9513b87fac1d5272f886f9f408cb5024db66022384b1dacd3c0d4033a63720b3b8166e0d03e81ab50b20c5a869b1bf6034ddd03229dd56430c2405921b206c707090205d151d5f473f23cb0158a7bfa9d4781303d25364284ca2462887444a93b411081a81c8844aa786ad0190a97f81e9e94ccd03463907a448210728e68cb1d0398345a09224b85c51cd22c01adcce15da144894d681d9940d504fe100d601801cd604d0e1a0374a6a97425ae98c5011de1073ff000f0fd4e03c0639aba4810e28534b444454026d74d8694e0a2da0c590b833dd81159437239afc05ada8f5b0fa50613a02b2d4534fad2084e92d42ebb8eae18648cc25b018d4c0885ca821105f2191ba84806229cb5b5a1d95b8ded6a22aa09960e430a7188dd24be1496e8222122d92cdc26d7a5409d826116c09dc06fd0aef8c0881a5a2d2144bad06a3e2858091a0a1f338133ad2012d4004db41163efc24d24d3588f3bb004fd110ad378a274738b42489026e47613e5016df8438ff50409599822dc05e080243cf029ce111301ee3a50a8a8d68b70aae555479aa3fdd481c9f6c98010bca82217e812cac809387d919941a119140a41b9d835d85b8691e68e24a235ac48d2928e2453cd60250a805b40a47421318541cc08445da091bf007212a8712d8104f50b98652b054ba1ad6a8eca50e8f054b64338e0b21b0d146a2b030b39314f9e6c61c5d3c1a79c51c2d41a9c8dc60b41038740ec61cbde36e426203b47b86ab2d4f2514adc99c3b04c01c8aa436e6091319e7808be41cc10361827867612242528312c94516267839026850ecdd01752b3451ec12530c7d1a00a5c2827c4e38d2ba1645a37c5fe14030321691b04c6cf3fa01dfa685db7e40fe9ab84cfb0822a5c828287b034a3902502872613db228e1396e0270149035505e2ce2d3a1133650440fc0c474354c4740244431b506394120d370431cc2d644c140618607941935e287c840c509c328f8a9d1358472ede04651da3815ff1373c4128a104e28d904e8ca9079000e09684251e13f40e20950c076bdc2da4406c8941dc89d7a804e80a105bc3780e904e86341703109f00c88c07b8f650b35e1640ecba989b8015d77c071398d76e13826b2c3eaf083d2921511063e872405c293c082d263e396f2a5f6cc11e22626645bde5eea8e301f4847119a4eee11aa888930a04f6b44238de851d1222c5188d839e34123d01c686ec38ed44ce415d65145a401e9169f54c42110845708b417182b048077f208aebab40d04661cdc2bf18c1e20710704700a403c8c70e41c21e255f45094bf22fd04904e0f41cd459ea010ca30a111d5afb18d0b87dcf2c571005912ac42d07b48402c04636062ae3b9873313ae8badc38ec83ee0233222d66881c9541908542a159ab1d3681d42bda900f508c2867708bf0150624393e1f716913c43c060ec35d1a40a401722ea64b63a9cadc332f41274a288713a0f56516b4c2f0708265710821acb00bd34536461422132c8d9842dbea0ab1ad0751219301dac02d37506c52235da4cc3ba86c203b898225d15452f08a58188dd0a28abe6e43fda35c5ea3c184ac3414821229048500c4c3090da016eca375474589e8c1edd85ae40f710e183695bca82d11441743d20d97a857287d7daeec22775d664b8970f93016de187df9d84c0b830267a158173d82e02b016d076a395b86fa3250cb04caac0643d420ac908601e9c53a8b14613300d4b02ea1e6c13a0a2909d03b702c3a00e51dcaa87d24b7ac0441779a1640f1398106c42d86c39eb452dc018f4c0492800a6095f90501de2e3a13508c813062f0d9c814fc84ba337506cac5be8d3b60ec9a9a30848aa006a5051bb012049a02a298674184000942306f47bc1b0101ca124301786a0b794a0cc2a9503eedf0a2780c0cba0609dac1e84dba42a060e3d209d11db781485d09454c150c42ac3823312a4a56696844d104ed910ab71bb0aa43ad3019600ded8808c926c9e3b370b7e21930e402126f42a1886c0d32185100ba62835d5363a1563dc04b5e289a5115115b5402ad9901fba1b4810745697e02f2522f1aa0d463e85b85b502ca02d08b4e79d06754051096a647b2c61807a65039653a0ee14a757cda1901d500384601e410a68318f472445a91824815d520242727124babb816aae6e2dd0017fd329b83a02e85f3c6875a68c5a0be5af70cfeef099dcc8a020b66f905537859c0713a0aa664be048ad5f4ab04521560cf47128258553f4c20bb3e84f7afca80b250a4c342caee3a100230b8901c6ca1d2091f47ed430413f60dc969a3ee3ca44985e44d0c88d805740ba1a4d2154900186152d8c9341005b41c890cfd0431e2e86364b71ee37ec1450aed017db74a0fa64541ad68506a2b125d065568d0af822843128cd00751ebc025e443034cc6a90f3d0e5726b423ade85f740165d0fc8e84244d28c6e4832a290253202da1c920b007a230d1fa590c041d59b0e14b5392a391feea7c794c102fa58400b618c37f9f040aee70f689b41e2890ace84401bd5f891bbcb1b6b8041d7658804d8c088e344eb0b013519e1790082411818b51d18925e04c734614a1031bda409845e15c43786c18c03041a107711ad5c0c174189b01d0197e1479a66e98e6850f3d0c788544d88b4dc1ba812cc20468345178141d0f1a06a67551673d5c8908c811c6ec22b746a2198d8094415d4d9d840eec132de35904c9028b906a4828948924224c63615468153ad670d838ea50c0770a8d56cab2bd04bc9bb4e085e46a60faa18524e29492120c2c4cd011356085030d0dfde077dfaa3582218088fe80340a4b5ac02ed022738e20403288b064e28d9139f805fb28aa715fe8037a31152869e48410a4ac22760990b237f2a0da866636ec5e49116d08580f580dba3168c826b114a5485e0e030a12105513123250654306cda9ad0b66016610eec984d51d02b89281a022cc42dca0606ac94647bee522947652324f407601d5b88f014809ad4b4061308bfc0a2a1f41581d954310ac1dc23c301ff00f72916af9ae4e20d389c05698c0cf1ab06009343a690041d063a300693923cd0a68ffdd751402ab179231d355428325fb60cc0d74818800f29811ac02161cca72412d1f061ad976330c93d6f818e817ca77033225ae80d048c44d4da480e97bf28088b1c07b82d35d8572f38ede34a76102ba6bd2782123092c28c0c9298bb930b18bf4680db666a1c8225112c23f3441dc2345823582de803d0c7a54fb9261a4203b2a04a0e2741d858141ae444a3b02e80ec3100a942c606b9426646644bd9a034380f2df62331bff266a985455e1f7e68a2ad18854deca7043ca0d7312f3f90ff0099ce0902e55044b453469c11ec48e3bef788768740011e076bf8028b4db14399b80b5b0a25af20f58a218584d42e8a27b063defe108c95a19c95a5c51a4559c86c0e4334ce000e2324821b5125cfc832e1bfefc321026f1e401754454d9ce83d5823d97743a4f44603128842007788002229e0bde8f46334a02553402e880d260556743c89f186dbe85cdbd40101a88ad2b0c505c4330350de05c4b46a9c2fa92031861c0bc4515f5809201a38fa5355685d288148423047043c981b0bf8e8fea0de93d48779826805a815c1103d00c6c041909d61125e048fcea4169264259c5a02542e01da15ed012e1a3580473819a80689cd80ae10a8a33916cdfe705a9648c23de529e085bb6089761ac070c3a084113c364402653c667094dea78f702113d002b55d89e0395d3c18c2848efc88ad5d81815fb931fe4a6f8931ebfd076025dc095f0122b3a2df1995aa09dc60b7ab620510a59037dfbc85046d89bf4d050e09b715339e43aa01e7e385d450201a1efcd8414ff8b463ca998885887ee718520af58267700209704ca33cf4c062ff00a30db0965a9f7174f2c31d32180c338345542897d3d60c4b6d23323d0074a529904e1f44a692ea88110c604ffb07f6c165b2c4a1d4ca0e21be6b365a02b96f4a990ea285b742f68433e00680a4700813e7045d426ad24d4c145895398aa179524a03f47e1b5a82da28f2e255c073078c1bdc49a4b2c43d6c823a24ed06545157744ff0588ec10f3168e00d3f6004de3fde32c9fb82bd0151667e800a807f7f144dd45b96d7901954509f82dcc856bf109ce92140b1275024bff97e41adf992a1b2ca4106f072f08c9db037a0829a6d50b96d288bba50114fd42d041dc1c7ba8551bd2c3b466099a5829c8189983039ce4b7d20d4889616c7d170af414d135c98009652812314c994c5b1bc552026f2d21aff00b81199c18ef1409195b22ce1d8d76a4470e966184cd957a11508f53749d4c41a451d5f59689a36a0c9285ea719ede034c4d3150e873db9a8ba8de91c897cde697280028186c0a002bb53443510e97609a6b207140b1967ff00e79021082105d25d3182a8740b0ce72f6c016c2a836c90db8500ccd8e0062df12bf8405b87a20ed95b8f5b206ee66114a4198e0ef183b847fbad01faaa866319c2f3f2d21e6c477bc0c25038404a634985c2096793d080b4cac2c072730c40d75fc35d8878b9e270c6bdfda001df75522072a62478306d30c10a53821c3ce20c45cb70842caa50208430f48188116557818044c67e120b49ca0bd86f9702ca013d6efdb60e32c8dc04cc0d270808f980d64f6c772deb4d2dc4e4b018a7edb5c347b27ad00918ba3813012493fb81651c011c8e912bd4cb291a80841dd42774054614d4189187d20a28496c6157217fa5683428c9521097134942815107d581ab408c0200f4829f0285d09782455442683c40bd4e8dc471323edc345fddd0e2908d806988bd063dd435d22c1319d4f812cf6e02ecf7ed0bc640e8024976950224da1408d7b0be10101175610215422dd63f84c5d0e171f0b086fc128c70d400bbe8820b324911bbcb3d24a15a3dc828b04d0e6333f4bb933364c6a42c16b5f4342c3d5e4c24a3c17a300241a56f4666db1be0fef4e1e056ef780bfd66b00b7cf3d4e90db7a8185f580204cf501c685a90bb879faa572166d09723367d35c402b6861dcee1f266bd2407136e1891ac40d51c8af0408b6ff2f2064f050d9d013ed26a3fdd5810d4557c4008bbb680d8c3500d0d07b034c427e99bf929ccd423b18f9282d5059326553ce8e7d1fde15e2a75d3f55d4e833c46b605c2d41ea7d0715cf243b8b610444d8b805d416efd1426c0b063cd00842a150bbf6fc3a1a443c5c3b4083247bd807eec1daa69a009b961a79a779810a6b4e1828d7de5f016f8b9dc0baa4772410b4c7f4481777f1006e1adbe0a8c8588c37ab5a80cb8c0744d76dceb063c4db0ec1805436918a829884f8314ad932b62c922e838074950049c160508180101e194810d665064bf60e831970e41fa614b18b4ecf97388b9ee71882172f2911c76410e800a07eec30c0f708d020bc57979307a266496350805cec102b70670dbb072dc03dbbaab412448443e85e8c5564129981a59ef6d435f65196e7990bc93990205b884292538c0012c2b83a3b14c6c1c55280b3d1010a40649621480e83084d13a31a701b4582cba52c1ef8bee41721bb06f0b81f4482ea4ec50bc4089bfd449be4fc83002c2700c6211b8e1c296164852a117e0c08c44cd31f12a0842313f7cf275783eb98280923dccc12f34b8009eb21f0818ba7ac53e1fd195ff007004ec507233159d7ea560ee3aae045bff003c1181d9b7bff03b251fe1b2078b59e08383dbcc400eb9dbab94071862170b7f23b4a085e7c9ad30026edcd0154b0476c12d1f261d0c4c88a0071b4b5ac18dfa76bdf0122deaf7b80a686db4848172d2f25662dd70106d65ee81e80aa83e4a21690debe24d9aaec3000ba4604a4bf80e652b7c834625b0bee0daa2802527f5181620f13998945a4b81efcd00bb82d24d0d2d847fd702520355e43d798682167ecd15410a8a980d4b55c8bd84392f54ae28035501f221765225d1ad476dc17354533e85464481e0f06d095efe0535846a6082e436dc1102d4247d83a3ba00aa054575880c856de53029dc41e21c870c1a87c079c86803f01c94c2d25c701132224062a108464eaedb85e1d86473821f59f031958bec31ad1695860174f8a0026e5fdc920ed6e040f79c5736c24eebd67bc126fb7c99180b3453fe08c3e9bb5d0006f44a76f021f3b2a197d41f75613bee0cc8a01e388965a249c5167a05b08b2c345500de17c3d84d7322157593c24a00f1d5d04d1f7192bb779012a6a2fe40c2a289e4ac4f6e610ede9b8ce80ade15fe8059217948969b14fa3614d9ba1f21706f903c95cdb5c14102e88bec03b5011ec3778a4b2b54d0e2329a2d39bf760866f702d7d36dd189b2194109fc308a20bc8601303d227988f4d1a54d3a6395a193ae514d9601ba284666328337ee012051e9e82402e40f3a6092ea037f28131369db96047116caa2b3aec19aa5ca2cb735162c13058814fa9130341c71ae10eca472efaa41054472da8e164978c0d4816271dde819325480040181e09939b003fe78a0438fc6440002b9cd00d817784eff00830766d60a0a276860e4fd30702f4d34230fe1448a185749ae677570fb379b83b0808069dc1300a7a29de3b443cbd784919e12d679b01da82fd26599182da92915a1001b41970d2a51821d0d83dd12dc2de1ed202c3e42d4a3643e42f6340da4ff00d113c91997c4f6c6142f5782c8639ff65d107aff00f5b543f7f485818a9ed9dda02c6bd9d880fd475400fb0fe4d20b6301d05ce641fc002e34172c0661218592c13e545816110d202066033489f5558cf910d1be068a0d370e6109c232e0ac009cc80212a80c05a6090df8a3195752ba71661695972ba002ca8901cc274868540c75894a82b84154062ebc5580e81017bb11a86c10bde017c044fd4069bda45c3f64832fbfa810420ac9191045af3b5ac2ccf224085e8bf9ee5203bac316472474f2e76b401eaa0f1510edfda8bc0f88a30a1038218016c2faf3b85bb48391302ed21058609edca5f09287d048eceec81da28b7a06461942742dae1fa380db412a46e29b36821f89062220989f97b896fad78e436b884a45a1959b7e6038dc3bf788c3c1bdec473e365f01f725fdec0de25de001f3458581aef4cee8f03a2d35c8676c067b247b7fd9141761f5463a246f86f22a86a6b25ae53188014e71020ab31b50bad5f35d1195036b01863bcb7020b5d9856ac11711f1de81e7910a65676a0842a102eb58a60106194d97580fb89212408e1b03d20a262ab908b6382d80795848c206c333b10f06912668023accc14da154b9e807cfff00246c608ffd99f003fe44f8510a6361bb80d729e120049cb21826d02a10a5b3a1968098462551e83d0e0b666f60c181d3beef1fb0a08cc74abd89388f5cb743eeee0542103b6c5e6f7432a09815f69d6133c048d42ce80b83708fabe34d9ee0242bfb00c17efc09a3467dcd80aa85f3186e34aefe5a866a1c38957b085ef2282926c9ac4c4e2766c054304cc4898d1738b582884ee1d074245f8c02aace85d03bc8c8bc7736024c019e0c4902c1d014f93ea0ce400ac985890d34a8235c80f5089c338156a854e429fb3fb284869da6f0906fe824f000252bdcb66200deba664d0f6f92048a8733c420ff0087cd4009acb440a1e989dc06e11d736f8c002f418b3830c5f908f790cfcbe610820f5f493dc00e12438c6bc2b03505400a17b02cdb08acc2985bf02a624b881b982e604dc3b68e6d30da006f87e8257a0346e8fc6b2c87a77b5d07b026d3cc700426b69dac26c1181fcc0058e4bf303cdf8d500a0adbdafee3b6479461158e5fadde500c3c6151a3691e246b901063fed3813221b13e7215b3407649805bb00c4908108601ac45a934445408d178234885a21caa8911a8e4268634c41502ea10ca8ff09d02a9c4650c2346062dc8a0c64b476a88e775442152a846cf250926dcf3341ebc0010720bf5610f117495ea2c09931b258cd7a2e898157353bb0e801e90c2a408992838621043d44b580a7de062018f50c501be241c868c51848ef0df013e0730576738082db1a783cf38d29a55f4b5f06ec2d467a3a137106fd09d014c2fb829867f24485b397417cdb4cb8c048d311ba0f44817fcf24d00ba2335ff002f80bd453872188443d5158504239bbac18a8a067ab2831015cff10d87d837fb7684d40c4e840732b93ac85db136b4524d0a08196226c30eed06329131dd170184efb05b4e80538a8901b8901c7825ca04f976122ba0a4d344b30a89b00c72112ba125519f56058311d1503c8b88b541e261ad277685ad6b1a7a22756c292085a116b4fba4232eba401ba70036cd5e5c7bb4f68b15c2ddce0b2811fe63b4c373f57dbc147d8c102f115016778020f5a80288cdaf0db0f14a525b092306b7728f7c9da5d5acc2fd810838a85a4c40a1cd38cc45e52e17d3fa0ee3d13ebc09648f6c8a5f5ca8e2c049920f59a038121483f82107121e8c26e4121511c3246ddc089880b24709f62635b071fd504eadf271c01353ad6afaaa019cb71669aa8784091d381d9c09d419287943d818ef8f216a2c01982c3866d4389cb32075b807e9f80c4cbb6406cc45b267dd00408e414fce20552790e42f2e0b52613ae84033bdc0bd2b8aed4163a2e55b5685d0bc0bc20706bd504e6ebc0ddf71a5e629b09b281c118d2303a16938c5fea53f4a8aa2a8dbf74b2901b1df6401255692e86483f771d801002d371fa1814035f50acc18f8cbb2006e904e6a80b7dd7f92320f1388350810a72e9379f8b0770177a839f2427b314194041a35824f5070252e3939054c9a61e970c180be1a7213b4d2128389cdba11af5902e00b51af69d89d2602b842a0e074992c50f476f902f8410c655e965c037588a00f7eaa276e300f9e410bc6a7501be1d6310dca6034c7baee3104831369331679fa000a35f6b11c2e84d8cee7fd6352414120c5b018740c1a9685a5804510639d85c5106beb0f1436cd8ee169c85142edbaa97e1088ccb5460a641cc0e834b4122c1a43245d198fb91011535bfc05e105d283c79cd6969a511f09510cdcdba43f449ea7a017c75ec5ef28122278a30c49ed80020576cf7a1d4007ea69c20923280ebdb94200a6589b031c36584836401c7fd16c27e688005c3606780cf64625594c05c6002fb40b91909dee909d76802292ca80ead647c848600d47131fd35a741f4229623eb02fba03550d8544f489eff885bbc0fe60149118715b4fd60e463a96223a96734406c658dc51dc35c022bf6415e2fe831b845cb91052f86ef421164ece71234d8bbb2830126023d43c69f7e210567422043237c0d783409ffa0a42077547840c862a06caed162810bab02e57b5b0725ac80ac0c4184038468298440e0931c425dc181702910dd5884230070d16270550851cc00ddda26743ba4008b3e04807dfe12a901f5a6f669f2011d2930013fdd5b04291d48d69221797da9f204b2bc2b93ec4d0fe1b1000b736db100dfd04a12a2bec730acb37061874ba35368c380bcae0138c5569dce417e668d06423e906b2f2226543cc04c750142202260ab959042242e833cdc38b91b02e0340a43161b8319a0809c3a3a097d4ff008e02932ef1609dee59653f46ad83cd5dcb3a759c8a097f93c4bf94569fd04ee227a7107400ab6886770a44136003fe9216a6869e804815f809dbab0043a014185140acd42f0bc86a4c050fb08190b70c890225345e17e0515a85caa607160401c7707350581d2113a4c57fb6ad05423cb921aee4a6c0b9b641c91a811b8082f870d0429659774b526c873a1101f445d0e8635392bccdd8153de7c040071ab98daec09324a2709fa6186c81e71deb001ff3fe6294d7048895b28778fa4f6578c292f87c82f69fb42e0ed02f3cb1e3fd3e10d5b45f13b1fbd11772e1111e36834a7a3408e7d22298619a062e87d0b1402f3f5bb0df600ca7884c63882e2d515793f669352fb01caae4ac7867dcdd2ec24d296b4099bb88bccc1195cc420fab6d8832cb43a8663ec38016da428841fd40cc150301e9425c2a04e39610d418540720a1aee8c2d17ba02adc7a15ac6a88380700a1d0760fa16ad3aaf2a10a9b084018fe91d116ab0a93c40f6e0e00057ef3d00df58409e7ddb063d7376a000585bdbe2e02f670ebb1ef088f4b5880007d7fa2c1e4504c96000fff000784bf80078bc2462654f26082d782f9e72106381c8b025db0a044623324d59404abf832312c066400fd120c227188dc37d1708bd7d3dc3343c405f0e841c7401a61f5207220d50256ff0043190e7c054f18d6c7d820712323f40d0f59abd824c27c5e02fdb5ec70b6df72c488586a04507429d6070735ae493f05e60e25adc079c1b22328f69db707705510a095010198765b4d3aaf1d9d59808b4785c052f0b0825341f7a852a08823e80246a41ceb02993f34130b152c360e8cc3740e8b2332d0c79f945a15053525c1bdc13b0412c5f44f9086d8832ef7c1320c30f4bdbed1846e603ea43e8bf653b2ff00734fdcb186e72163c9495fe85203ef9c40cef59149aa24029af72320032b312c80af594d0a911342bd834b2b4cbeb60c5fe4639a0c632af103006a2e018ce6067931298ed36122d4e17ad15c537b65cb68cc7049b66c85d8276514e1dab741e59c22afb4278630c885ab0a2ed16006e5f056c13cb406b592cd3b62c821777d2b813e67e28a31cecfabca63c7d45c923d77a543e11fe85150d1ac268de1aa891abf81e41b69d410f03b3888e201037bf03262190f66102326fa9624338a161715d2303d818aeac2e28d091173aa675497ba4180c9c5226493918b34e9c625eb52742bc5a1450869b93ed30502f5144cbe0923fa8cfd41344d881207da766c07d8b01257085f67b40198cc0013ce88e847b823ec1fd5901e2cfa411348caf213359003bd129c16c048ff009d0aa33f101878335a10c74ae34906221680bedf71a48e9409c40a21d7d0caee18241302f1b911349ffb1010d6b180c9c5a23422be8c1addc27fed42c48161ce2ea5f5d833f8035c1fac0bdbe833134936395884c6a4322f240e6cb49bc1d9016949307ca20c79ca79844c452b1b73fabc10b7659c1a4f808aac76ef7fc839853501bfa719ce550178e086a062117e360fea10ebcd1a2f5d534068190602524c88942a22d3aa004fa14bac8865499d150c96d7216159976e12b8a0118639a95a2f0c81871eaaa23e8fea7b833c0af9c629a74b146ebb8502d67d54642d2aec91a41289c7368d0127fd857e61decd5e88175d340d400ff8f278d20097711fd2847fbb475a807b0edd4009e938a131624504145fbac5c85e86f003b42864be87d25248a4f8b02164239efe968078639091fbe3ba1e687092c95cb3abc962802e8c595c8388981ba4fd748241f9af8f02cc27e06d788f4b9c3bd72c00296f8a6dc06bd92882895d901d1b8678a9670ac5a58095e3711d5986a2c57dc22df43ac5f3ff009806634982b139539c1df40bd047623b8f1e90002eb921e0c224c46ed27a40f86d6b86a17d257df5b033bf4208e565b8011b0003909804bcb64a0c26f75d618be300819239151056582bb16a5d342a811c0c1b527b1fe2b6ce5557de303da17c3a0919e914c341862f1e7e5242a6817072e206cefa2386e7b1c7aff426908101e936d1ee02f9432104e9c404f71ee04cafef020a4083edf784837fc6aa6f64ab26060bd802266fee27a51602d211037fa451f003f5bff410f4bf22826a1d769781e2fb077681581520bd08a280860013e784de671d228ac6c72ab74209b7c0c42a3418ed777034af113236bb41031c341941a0d65ed1b98e61eac241c1c7eea0bd4a90fed982f5b605341093be5d43ce15a84696e7703e8fab03ba1fe971c8db6ae0321840913c6f0fcfdee7330d3d8f937100141e0ac6a9622102c0153602d5273d88e37c4366a457a08be83fd427b5c3ac1d22cad02f501e50ae2344525dfe7822dac05ea1728041b8668202d8580488788e5a0142e918bad00b3a7232a579171a877d542744ea227b945e112eff006dfea31ad0a452f64f1fe3035ca448a786401cdf3e08d74c0609d034482df50a10ce04dc5b003ec8e8a1dbcda3f750c246e0b600df36eb2bc05dc5a5e0111d662f11833ae4ddd003f7ad0001ccbcb50971dbc3593bb28083eb7f0429ec03452d0a69bea844824b22a01ae5288245f547023fb1c7ec458ffe500140b102ab0060c52d1d6071a556491c1296cda534c4d340d2d8441024d9496b322db70be70bd013af26c33ddc01981808e952500d2208621aac3a8704849603d8ca77a0722fa6e9c822b2cd8425f1034208367e74623a8e09927edb031c7c943fdb26c1f4906c17945e813599eaa02980f3d32283d4194a8dc10a095484ecaa838816c222074755ee91e345ea89827e5e8a65a1d943a9dd9ddd14171a01043e633425590e1f4dc2313f6e8048f3900924983c03087b40227d7f458811e8f34c3d40813ae91518207d11beac837853a70a0f700e7d7dcff9e47fd8cddf407f89a1614606aea344b659ff00940b0201b4bbb5cc3ef999f2126c2bc01e9e344e46dc7ce09e9ac90cc2b19bbfc1449f188894724601625f402c17d578a0086a0561a77c7fcbda02bedc7a9801575cb40c685c47ff00000854f7850998286a25ac60588ada520052197fb537130bde1cbd0fa10781104086e6046a5fe31150a649647ead41ca0141026f7d80099e9b8a9009613ad016fa84ae4470ff00e5242dc90fa910c10f362c8180c8fb6d80a5fcb415fbfae217b2b07b97a6001e0ca371fbbd32ca308be48a09941c662a08ddd41b005e82a30104c9d07193405e00e1062992105778662ad7fe350442d57006100342089d9150784dd5597d2b529cdf598d834b6687643b284cd24fa720a0e007ce72c07ae8503f5cf604c5bf6d3e4042a44dd6677004647c801b6bf3020a6f88a0d3c835e1792ebf4a1915a80188c4099001d963921a7ffe84283ef3b037d21bda08eeeb04f2ad8a819c855008536833fe6703e0bcf3077977f5700b0573db540a9b44a08077f4f1e62f7d6ad16405eedc9008eab49589099d58c87b7b43077e81d181067ad8023f8b003194b7775169de0e0a39a221396d24031659991bdda14110984d9d7c433578e09fc6ec02298cc468851d941c57b6218987228d6da7fdff00510c762308cacf5030e0d5ade40957a1787b2c3333601db219840a2f954213628ca07a120e3785adf3f408950546a3c88e06360b500807e185002c722640780e97a969e94abd589c5f1f1db8446661440c3a13acc74b0fa090d8479e84c00f6ad0f0ba217824770598333d5d6a12e5e470fed31805780028a9a04291389e2bbc84e703e11302e3f1f894f205f3655a07a7bea08d017c2b8021cfd918d842123b1f05e00c6699ef48826bca3e8101c6baf60e58178d31b184195008cb24e023a6921822211c0fe5dc830d06990001b8a42efc720a172fbe25011d97ccee6d18620769e0d1820d514808071603b3a541109e249062147981d8239fa850165c05bc5615daa505538ec60772faac4ee7003701cde48c08dd3229caf5c073d760bbecc335f60bf448bf5c2cc04960d010a1eddb203cd44cdada3968221408066021ba67f40472143e92e7373202b48d862f5f8088ff00eb4dcb02fb5f5cc2e04550efc540c49ad868401a3cadf5703b2114a00d28901d02c912d4158072d707802404e8dd321c94daa95ca085ee805a17cdda37240b1db432512fb312554a21d24c187563f4d90007d0587eb7d80b001b1a31fa29b1a0ebf3171e2036eaf1b4db4502dcb321ea5544404d63b0b01eff0027e8800b350bb83c0db0c53603dabf6d63160dbe587df02e7c026a0178bfff00604055d48348dc33df84200d258a0bc77abe8244ee71104e41f459df912f78cb600d233d045f4c4e09ae66da35b9652ae20ce2b1173562fd00784944a001d82fbcf0d41f72433a837e7a75b92b298b60278737cbb02ce5fc3bbbc58981cb279e400684bc2c1e1ff7aa0406a3a20b8f040f69f6a1e026d40bf4c3bc0d5248ec2240284d533d7880c4db70d24c4e80626942fc0b72d51b1460e8f89007b40747266640c637c05522aa82f793b56cbf11f7268ada82317ec07cc359dbcfb0af406a38cf0b1cee06081b79be9dd455d8cfe902047ea20c2ed46218565072488e66144401126a2ff02212a4b85c3408c2091f601a2102bbd77c88eeee27ccbc112a19bcf02e2a1099050dfd22154e1c5e0d2e71883f60fb24106afc3f02402e7e1171f11341fd080e91009b7f642840ed9fd856ed7efa2e30a534177426179682d055dc16600c8c1f8bfb08fb91be2d2f8c11968c2587fc439b4e07923b0063083212894f8c786884c001184e2c2581d6bd073ed31085584461285685eb0a50740178c4b09419b7885f2fd0801df898913401bca61c49790449ce7a8451d2929a22d1cddeb96a0ff74bb4172898b01859c54111bf660c504f1f4ad08247739e980c3574735e8bde110d98c6be83d8a8b7faa13ae9332b6bc0234cf1ed202b6d3f50d3988c3c950d695812c4641c680838dfd4db4286cda025eb76cf32101296880284d953fdc089044c8bb72c2fab420c546d714f2505010058725081770696082c26824c6c065c15106220a8216901e5c30c7a9916ba2ab5d356e178be1a2d720b4808a90b8c123d04316c252b0663ce4dc456324685600aa08099a809c789b0bfe1b0a6e428c6678bba9c3b11ea6c35a2203edd091590eec815fdce21efe607167c0199b717fcf02591a7ab060a48484887067ad1443b8a051424ca9c007515d599f91006151e23e6c8a60b72edbdfa381795a60983ca0330021482e47fa4022680fdda80e19b413410ea0103b8d6d6b842b31852532150c3d6551edf237101dd647d3b0399f5bca1406bcf053c4fad40b57981221dc5662800ff0087bb4b5d841cb3208b7c4475c9a941b58880eda106b2630b25ee8364d00747d5b4317b2376a194ade64d0449a5910d909335fc0047304b401f4f253c1558050be39645605043c1085c4717fc0409a72886e6a6b4b0bd837be301209137fa1a74cc810503b40ba602665fc1ff0061443583b84b08a97f061418840390257da8c7ef4b1d00b5d355f2e97fa6acad0c8a69805d05e426c8e0f6c242fdbfb84eb20c752404187df2015acf6c9a9930e79f21f658a3b70b148ed637529049bc84a0009f5247e081ecbb98fdf007faf2c453603839d052a48173ebbfa0e4629531be201dcf8ce24f3b35de3bed6d8807be8196a36f68067e4e8a5c10bd5a934080763a4d7ed02135c8b6c4f616e02d4383868bb5807f101c17d025520865beedf000c5230bb3694873c60f13c211dee001e86311e00951ba0007b304dd7300bc3ef5f8068d07a661b0ad701d5b4e421e04953c301c34244c67f8817b8307d0f303d8241de352a1a1e7521dd03a8befa659ea05b45d816c67398b7883d2a46fe803a6561b40468f43103df59c69eda8f700ec8398249d1277bc8a5fb8fdbc9e7c94bed0fa0381aae6a4c48252124060f5973dc4264b0141dfa180c3e898d4aa2b82e08b05a275013d4bca896d5dde1512a8aec0c4f42083b8b596e8cc99be5b1f2d9c00908d92f42385009db8be905c6427f1f184c27ae57c08f608c2db723ee08118bcf6bea0447c9f60c00ab527a18005a368cf9927a1042f149e084215d0f73fa6185a8a1803d433ceed41f1ab1a9d820416268202544012d88ceab0180776a919cecbeb01d27b4633603d178038ed98cd0f82cc6cab892224ce37ec50218426c4a61035b96324ed16fb25da008b080f6aec061d2e2067495969c010c5895686dfe20fff00c501487b16f66434b921c782f4781c6eccb203023a7ad11e4045f8201ad8c5826807c09dfa4aa17f417f099f4353576aee0d31a3a397f616b3eb99fe9b6904a0981f6ed71bc1c4600887a9834426d47a0330245c91212a1d9f8516f354ac55355cc978b46755d0575c71422112a5e1b8f7956c1bf687fde6b1e180cfe06046001567347dab4067eb1fa692924b4167e41fd781d77a4b1324aca3a01867ef9d9ee6012890ad1400216520959b5d04641b84c52edb72a8064df3b1b7a1302f241465800b9b40a81a448158538e22bc4f923c643166de4218391c57d40ad102b43b4822a120bb110bda2c208274fe0f5cc3216b6c068c19fedb8f1b2a3a0c01798d7fa150cd35b01defe5600feab9a848a2ecd7f3083f516fe3074f8006a9a141c442d07ec3150d9a9f040d608fa6c90a0e4d02493dc2cc430b91b800193d64036b4063aad76fee582805b3671c3f78445121f09611f8022cf3bfd3717b4f3b7d11a9abf4b0f985ae702c84ca72d443a3606e2422170730c83a69763b189882b85bcb935b41563a2e54218082e8131a6862fe6990953c75a98410501b6a506c9782520dace826fe042f13bd311e81667ee6010de4f925e0331a774a82f227cf3c8222fe5f7f42eec3420bf9fb626809f5f425dc27e83779053efa318b0fbad21512026cdb6c84010eb78f1c82c0649f268830631d054c7a205b6a5e120fd8585c0cf41004555355453e00bb30803ea447ed511e41d8d02303bd900bd539506d587c8c278233fa0ee2591ee703757e082da5a486c0b9fb4fb170a45ba704f192f68861b6d5da83dff0b04c8c2004ad82ad5107cc040c2a8f4c16642f4142095e8c2b0418016eb6b873fc822498226e0d62d2432f162876034f917c6c1998d7dff618d21e8af698e619866a72032251a0b7e42ecca7265f31fa81f0e893520faf42fe44a032bc7e024e81ff0001a402802870e590664921ef06297d8a3a2e74802e82ad5694e0df5565be9e65448e247ee223ff00213b00a185265d827c5b1167d8b164abf7e011919c8aed84cc3178808cf3aa16d580450d62048d596efd6803e9cac3e034b02c12b78e431834f8177126eeb00bb720dc4a09fd7ef19826d3c96c0657f32a07e69ad1a8883982d3fea4e83346a5a966ecb061e6c06c49214047e833937fd042f367830465134721a61390815943d6507a0941e7944662b62ba109a005aecc0eb780db02081c589c2c6803ef524e0a5102d60433305b10c768807172b10386d112840df148530047073959484ef405f28a0010fda28363e01dcb26407da1bb834313004c3c168f8c0014f56266b04f37e134031a51ea3fa4bf864038319a2c14b090b14039058d86105a844c0dc83689e44b19818fce02cc6497ab2b5d344aca2a3a017c74567a76904153eaf377aa3c530e35d76662126c14360fc282dd66008229eb20326f530b0c84e286076d7bfdb005b0786166034d8448c11e3d021c503284cdb22035271c2e6540468ca3cdf18ff9fcb3380c49ce9700797fd894c822f2e313249becef0c5202deed8b03ff00f191e7b84f0902530863a80e36d12e5bb440ba302216b08027d437f5ad631a12d3e5bfa36d1aa5629dcfd1e0c0ff00bfd894d3fe5cc8c3d45305ea3664443da1058089fa9c834fa220b9e693b571de24a2da262dfa6e80530d7af040c0e27d86722415ae5e7d511b105f3960b341b6b017e024513d2e3f4e81d847af002e89eb86ff000a774dc3669eec3f90717185bf19b941044358b1638285f6bb0e22b434873018080ee076872295cb81a035916296f0624bd45e156905d07a9c5a8b6a6ba8b74d70b55a41514c4308dc0ee44566bb91e702215deb4c1d0b0c0808fc96a001306a177b332fe48071f20b6fe7d96d942fea203776e5bfe11626af300807a6601e20119a600896e52b9c800a04af646bb0048aa0f6e897c50a3273edad7014918a2005cbcbe80d043086c553cc74404ed77c14f99de6ee2342e0206aa4101c4cd11700e6284f28f62c40b5c2c64c80627bb662f7f72e15ef01173160618cad80631c44b9954c1306405a5f9a817632042a9a8b117013df3aa132941eb80f4fa01b526889ee238622468bf70858dd5fb608edc0197fd44a18902d2f8f166b6e08ebf0c004e42feb009002cab2680edc08140c3a807481f20e6cd541f8c2a045aa0555261d3c6e96231fdc391633d0e174116952410439fa8112d1f28abdd2f90c8050408e2207781cea45f59fb18b5df9650069681830023bf504ee2747b8cb903e372a7fc017ff002ac110fed6e37ac099884ffa810b7dbc3d43803d9cf7ded86d3e3f000111948b97070347ee8b2100558b687fa4111fcc5071a9de060cfe8a3430309018dd00847688697a70885fdaf00e6f50133eda1af98ba3b0b680685232e6fdb1527e702aff00805aee4d302f40059d1de0281b8a3979c3ceb119f4d83458a0c3e7cd8a8bcc801b4345008825b620439ea742229a1a4c9c09d9807b60610282ff00bf42d1b4e0a3ddc97334cc51896580ecb9e272794a405a31f90895008bf4aca8364aeb453065c7d80a01b84ec81b92cd6c5f806ad6ebaeeaa6bd5518255c0d7fdd4a6ca431b98429fbd622fbe68862200a926d20239d44ac004e01fbb6de0eea99e49c6473f48f21154f5b903d43ec9a8d98500ad915daa0c405cb7bb6cd7139d60ee3429a2e08468db8935030c2bbb63ee64ae17c59805b25d966367a09883be5475cce9e6090409fb6245d5822c01aed69104b666bf8c00855e23c07ddbcf8419edd1683865ff30a0b8581f5e1b9b4f311d1dc04e5e34071a6de0c40e420089a04913f693008dbaec12c60df16b7a15b42839c118ff50502e950f4d483e0fc05adcd4762d046b0069248db21a01b9c465c27a18142d9ec025be0f0bb208814e8cd20153f5413127556f04536852469d8840111d79dc3409407814f8890aa887d4020ca811162ae65873ecb81668a245d0e1555d3db2f8e84d3a849c16902de86094c89660d4e1ebffb60c04e71fa308fb8960f5a4d0833f5447b8c12ec58225e65d8062e4ee8c90a00a646263cc2345100e252580006a985820fc21e322027b369c86c4c708adfc5406e532aff000017aad642045d6b60cc3c83de10444ff431fd4256401f6c79684b2a1ca2060694979f73cd0d9b74d5fe07d9bcd077d822a3dd41f74b6e625fbbb134b470c6da301f218746ed2fe031900803730c986802c4f500af2d007e4c332ef395d05f5d8afedb8ee14d35c5d636d3990c03e1e05c80df6d476a511fdc077fc23b95e27965501d8585997026edb0c7db121ce806ba841e4d00407f218c08e764061c446097d5753ca8eadf7fdb5034016386738828249e780a85ca324e8516540869b88c76a8aa2b02a974b7eb31e6ac6059816c92b1716b14c26ec08229268a6a061584d10467ca21cbc87f25200e31b04dd06f54222611f7016196eb58122e121ac68bd09f69283d67faace9ff0077383eb8422377abe41fcef820ff008cbb822c87db90f409960248a5baf22e2d4b0009c7cddae21cfacfa7a404cc4442648ac0bccb19cbada634596c1fddb6175f6ea0ea8f3e838ffe8041ed3cc42cc552802cd63e0360a00c879cf41c5348b42d42697e85e89c1c1a3d936a05ae1018a185f24a234c10d2e70fbb55fa05972092987e3beda009a8b03c146d27444d06a0f393a00f28cd841b1ed503ca64188b2a79fe5e52b62608b67a202556824c89808ca006d31a2d9c9c16859e78a86b55c8afc48a254270862222f00bb32c507652ba8050552b3530ed180f135d8176e546a13e5aca42e152401136e81e31c205014b40b4f4c6e0f368dff4b0db0bc7772516b140c0702daf91d70d9fb100530b1a020413295be89ae9f702a384e495c0c9e9812aebaf04b0be3e15a1594c6a6c596e7fa2d445a764233c43943d018f6e4b445317ff00e6cdc01d6f491cd36c8c59e033fdb850e1ff00084c70ef5c81489d980ff17e85afd9ac2a46edb972246dd83a200b91b919cd45e4fd3990935e332700428868128ce0c560aa66daa926521c0f0300ee3f924246ee9e383f04000c1643d8b282b621b14a021bdf2802ae5a34ec489b130225000dabff00880232cdc8034c057bd0f114b5119fba2a9312c3e33ee80d603f92b11c0ae3108b4a5b406bd0ea604085b60bdc7604a3015609a886950bc212318fc4fba2f9c1c32e4c4a9c80b2160aa1045555b12f5563443e9f05aa306bf7e90ec44bfa51ea2b958a87247a5ba2098725346fa31d6a07a53e2e442f5e704c850c68ff00404f3e0cea697f83c5e8136138ad8e063e4ee9903725b2100b90abe002f2a6a16dd870b51f06736af140a61cd01582242634304573cf5c91febc09cd9a2d06064818d2c65bcefaa9e4d3b48276290fa670c8ade1d3a68959a2297e1205a0c232f3340be4eef145c20a0174d10270cbda321816a05000ee82b5b2415d0d9845d3918df9d448e9ebce277968c80800512d3df081b4b4d117df43357843cbef71892f531a74a04500fd551413b1910dbb50086c0367bf6b25ba8fb08872cf9e8c2c8109a0b405c92d464100bf42d41c041274042f54ab073310630e047be8142822f85a811d1520a8aac193aa33e43af180ef93681435136512e4f40681fd14043169e12d1a400dee101baad92365dc073a60377cc17e5900619ed8218479019dd2f0023f012846a1ec23a22f4c305b68936e80be75bda4316533d8f2be2282c680b90a0e90155a2ee727625e0edba0b5f842dbd5a00eb6168e8be379806394d013ad8209513a53aa2b71e13a05e68f09e03011817dbe6986cc3c06f6254c1830c5290336c12f08a2c411872405e62e07d48f754a1f0068acbe45a0059e297e4359477fdd910c5a09fcdec010a396cff601cba7b402db49dd0415992166e42e1a95dc832076c092663991614024358c7402f53670422c231023d84a5025a2c919ca8080f501541c4d30fc0e5b703352907035bc06dc3e96d41e6d6259a4901204e1220c2bb20d68c7b435d865b01022c30205c46ab88f4d709144832f40c622d07ec604040cd08220be83785348427a7a4592011aef084e51f746c0a784cb06034b56bff41ef200f019df6a03c437717e06f1088cbfc8323db0a805fa0a34d8016ecd66501a6c084b892a01e9ad088ad04a0ca2662b098682c9301ee734ed20f1d5130a12ae89c7f88a43820051215471012fda32057b58198cd60f0f62775809712f24226cf5df464c469b2b0c41a46c99130db9a17e82db623a2ba3a59210359f028156417a084b8ff084c9f738442ff0b4263847e8f4a287eba3c518be4d18122838efdd603fd29a0c9dca00f7751ea425e119bbc85bec40c887432909208b1adc0c620d1f096cb285006a27acef136d82211e012d5166851873e5c93d4280cad3d85e09b115bc8269326a307423d8202038a831dec1693c81c5f8d82a1d87660d20d95067c10f46f95030e05bc7de13825db9edd00c9a85dc0b0f061237f8009e49f50232486db226e65fe8d42c50f8032c41a02d3c20a18772812bab181fa1278f80c6c5d080a1dd340762816d679e6fe015e3924b9d6314d06b7c90002d6b581f4d82867062fae0b8751d3f87c96e20473fa542656f8e113f1b34c230d62019bd020389021c2d023d5c2758403b543221ce66368345c3220aa50e190661e8c826e50e9058eb04a86968b5701eb98c2ae05c68a4d1ef221893844a09baa2105beb3d0b95a14764139e1ce0d720840e761082c3eaf1c202ee0e3590a5bbb722365694180e5427205e6df28637a860a469e13b8a2826871320fd15bc197b8ad1130bb4aad3478bde086da8da099df63133120aeb9e31ecba8f23fc8b9ad982f904cdab48c6c41e22efaf400a72d0701898b1e1ab10852002e04aef304f8184b7672e760db871746dd58fb26842dd0234e5ec87c07d1cf0f619bbaf51fb1f330995c80f721112d7b1a056c6e23b4a4667c8305f4fb001b7313804ce1be5205a34928060ea6ee03e8231f70bec20adadc19fe50f3f61ff003af4234143a234f329ad0ea60120f59d20da0718e0f540536280cb1ca621030e4fb7d9b8a70c2c230c3226d985eb6e0c08500226e90db6c17ad0913f097dc45a8e32806dd91501677f883fe898ae2fda805fbb5f8124580609e5b0488fb1ddc114104af02b67b2608b218045e34ed740b394717a3e6400112d9917ff00770e0423afcc8213c526f906b38290d20f254fa348ceb185da43929f5857717f45c11c545dea4260b78a13c10435b862e408dc62030303080b3407509f343c9b4383ee1b444ab67e1bd8c87a8d4edc439efa9056299bcd10bc5ebcc8138e8184840663c817ef3e7452287963dde1c7a17db69956be927401162809d2c3aca5f07e52041237184ce03e6d3092481a373f981376d86adc4618ff004234812a38204bedc035243ad80279c6fa8215da8145a0fe0135cb5ac7f902fc6994203d9a1f7e2fe85a991a9a7a5341853749dcbf512fadeb984410c6d170e213cd07702b7833a61918062416217968288d55ec1dad805d7943f387199cf9f518c2e07a4c8a808135940a2c071b08b7008d80a6c5a6741e18352e284103a6f74051e443481e43fd77d8da970012d1c580517ba005ec6209b6602849a6985fbc4808cc18e1380060c78b010aa4575ff007c058c9900174c74fcced31d91dfeb830826570e9fc407187b7f60ae4eefcbf50f7b98dca179b73584930f1f97907d1ab43378c7a8a09720e5ade980c16ca6f09e827daa5ac01f1623aee12d2c5269451460637717d9816b5e3abbc806a1bbc10a71bdf8117a93529529c902840ae7ed03158c5f75045ba691604d76898d352ba0903a9a2d702047d1f701a0fe0c3807d828fe87d4beab85835f033e8d0d1b3de8a1ed4c9b82009932b9437a042108f054970c246653400e72b0019cde103ea8163c0975cb016bd8afd970feab32f7036aa4a0082b19bd2a0266c0887adbae02ba863a822f51bbd4a20ee4a19ca6687c75d282e666d0d37357d948ce7aa00504d1002ea6a0a91d2280857b74fd835d55ba09af3da4d8f9a5c0e26f6ad42858331d0b1581548eb12426922d3dd2588a46900a2dd81e9a16c5af8c1bee8627bed602562a8803da43a059ab2940bbd143b3548182ed9a15e3404636580b0d43ce22265cbd0fc001ff52d727e4174d841041584d22103c27b882935824d58d7f9c1863334091a5eb60022b4f2c3ff00229b02677ea88889de34fbd010a3e080201039c624d39c12d470b90ccb42c8bc80635c81cea9191771ac04d258180fb0bcda037fe8738cfacc901086d056b85c748225518755dee9f65d80ee3e8c1fe8a36c31d6ca00ec30e2c9037581cfc801264478019f4e607b934784fa480e1ff55ce82fba27f73cc03ca74bf4919329682508522b2806179b6768023f7438be48ae6b81a517872bdca47d0424f574880b05cb1077526209d49b0403e02a3a30fe99ad08097a64545290e9b77305b24b045c050d88d6805d3124ca5b4d4e242a6719823fff00d9270025a9d20101fe1d7239a306e019c7e9ce5c298ef206f5830be1043148448413bcb7821e5fcd7bc44b49b1ce005d76bfab50ac7c010b10b56497e4494e4838f4bc93b05dde961f532febab3011aea24880364ab78b7f724256000a1f2e05f3157050a360d0ba66646069f0ba19805ee6f4eebb1f0c0600ece2c1d0122c94ba72f814339f77e851643d0921259a1f77bef8b61b81dc1813bbd4303359d00175db7ea012d5deca095283609ffea4783db8989046aa70be18d70b7d818a1d1346d4fd1d1d2041b1b745ecd71ad0c0d552dea2faac41752f800fdd8004c5797ec7f095e94ed73f613df66889c02326af53e8014fb872c16338480ca9a9cff80220eb7f40221e877c90a2f1c440c38109000bdb5436001e5e57b1000b471e980194d31f97c78c22b5f910b8587d24c205979e88053c7c3416093c0505490678ae461a941d87f31e00772d83079d98b4b26e02027e311589b3629d1c8d37f882ea3f8509991883a74a6351e41b0be4202de880c3455fe1fba04194c0a5b2c51816e267cb10dc27c2fe10017c8a0ad025b78fdc0e7ac9a0fa50418d49ecd2448d5b20646b81000f8a25406b30316f797ddc81d037f1fd9716bfb40b76dc6c17145f4f42bb702e561ef0915614823ed6ee1dc2d753970004359dda0c02bbb89d03db89c545ea714c0d033d40a140f82043f9c2dbfeacf4058aabc31cd10c969460a53203e81cad012a69b8fc0b905956ddb58a4da540b460bb1fff001207b0da11a81f440826f3b088f7ca0e5df530b91e9b9016fbbf0e001d963ade157400ea07cd3e7a03bbdf051dae613ee4e58ac5534a06c9bb5b317721cb4a789370807d7219c10854150e8c26340fa734577d33606047c990409f46d79f504ac1051fbab3e1408cd5803d6cbf400ae2628964abaff910084c8edf6580efc13a088682938c582e12cb835e6909738c180116438dcb9d91230a09894e0a27c57716ef8a47a7564fc0304c040ba159e1422bd40fbe90607b7bcc1d4fdc629fb1805f3cdc381828801b16c23c0113523dd0153641218d7ab480e910c0197d8995400c848064104cee42410c26b85c295337b06b6b3e4024fc3081a123c297c2c6e0a05109c96095a512b00d9dd6482194cc4e2c5658a800852226b8bd82d8f3b02d3eee3fdaa18ca7e6118044f2580d05fdb9ea2428c9895aed40868f924025323c1ad4c2d1346919d3c4028d3a2f5e10346384f0492fc7a144ce0a5b9108f5c1389ee662dd59dcfd182b3dd82c1cd6f601c1ce105de049bfa6005cbd972f61197510bec00c95e91ec26c65d701a6589e2f8d3e4d8057f919239c0123f481bd4091fda8382396ff001ea6e0108347e8037eabc7c45382a4880de0bd5e417d1a02fe394ce0bac05b0848eca6c9cfb07a82b8fb704f9072605a10b65dc9fac56f796dfe005cc945f6d05fa6ec324f007501a5bd4e3ea6042155c4003cd1a102602c9e400960c4449e69830c0e16dcb30c3f4e8413760e2beec76e0115e63b00ac5fd14c6106d01bd4cba42a175f20f37308c448ed2035058191278563176c4ce83c0a910b2c01a2d1990c13d6c862e47eb767f61763161a9cc4201d3b9f95602798cc26a1016003e448236b9ed4a204e440df6c98ee1edcd3602e3d07023ae7fcfc1cbd1b75790ad85fbd25e5a54694611fa95100d746380cc7130a392279818f4845e93947fed5c8e04fd7fc9c38fc8f500d5c823e62b2e47bb01b6fd3c00b7c1af30bce9c5000c2dc406197c06618cb9ff81416dc077793499f78280601f48117073eb01f42e06b0020832b74c4021f39f44bf72c0b0ddb44c08e20d1e4211f71ea3012ee68820c6ee86414ed438ee24106c1042db0165aa07eae43c9651ad701133044d882f1e8104bed749f112369212257108d48675141d0b5decf01fbc2f4983edfdc93b360c5685222c096e7b92cd17623f29c82160a242f8e0ccf9a117a013e92a80c10acfadc3e49d903d419fd48009c04eb5fec01e6c4e7d0d04c90d44075e99441ed8acc3ad110d0554ded1839cb53c70939188f01230850166e00ed1c5d7b4585bc57183f198047e458442f340d4b0bd1c0b3491bfe84395e4032446491322d776d37117ddafd4989bab0004b696305c72cea56c80d56fd45b81eb9a20117ed1a1ee20f3f5266012e312007f9e6e06f3bee011ee61b1e1a3f9a6e82be626236d8d00a7371a9fac16ef04e6782f3c64ed2a710018f420fb164d0027e73808e0cde118ab78b10ab7b98009cbcc8779925a00a85e0f001e47b843126eca8e899e9c4160e779a141c75e1f4d1a426740420075525901aed8e9760079431e8f9a81513a36812c31c49f8f210db949d0761241633940113a293110e136d4bf82e683493313c8efd9207a8063a8c50588184a91384263cf08b2005df3d0310ad08275c50fb41164ba28848a11c846bd0cd41d371c887afd38e30188a3cbba3daf565c83bd94983a46b6004823a939d0248257708729ead578f8482abf6541561c0869dd605f8adf67607b7beec86024630fd8e43c5ccbd801a5bd9161adb3f0850504a01217eea6a099723f6801187750109ab3d029b764062044084527a485892a8885518ae12e05539a472145628c2e96321f9103d66899a2082fca8762d99e0893fc39b02000c80aa13b51cab984fe3b7e1476cde1b405ab50050690385749ad2111b106212b0404373d9c0a238502ffbd6272044752107ee283c8090b46e08047f0f7401a354203f24402368c8d7d9ca37bd90c74ae8222ea6ff0048a2f2181054756450f384a6f2830c7e07d098a73de43b4230ec76ed60057ae6802f5e6265c130807c07c4f47850442ef03086192a8dc0163b277b40330be434010911fb1d366902dc701ffa82db0fe01e3e557cd9e001e8d218605f869c647fc887a8c48c3817ec0d53140dd0a4a1b2cc9287eb5b0874913a19e513c2b4c01c58405d02c61413a0ee7d53227b4bf96e795736c5062679d0594099b1141285c090a2e426ef80843607eb0e00d443c0e17c82a393cc12d1674fa7210ce15a5aa07dadc7e94028401a3c9bbd031a6eb895a4c0940d63ee007ce4c08617f89705ecb36e9aeee814ba7fdc01e0e4128451f862a9c0d3c87806f3e5841ecae0c1e467f31f852664fdcbbf6152018f64a368c442285c686fe558112a249927c20132e78848b173457adff6af02f20d976d1303e970bb9478e03b1e9e611112d082fa5798249619ed623c208c446652430cb8333660aa768e187837a59461012d03a09fff0037053655216cd895e59073ef9ee2ff00b84b9c8c4c39071ddb580471e1b782837ab0d1549341860a4e5ff50985725e40f71eaa806d7b7f1c03468605f8bde40007e8af7340321448088ffa781a93faa981611cbe01f2a93d646356a882234d9d7dc19614136bb480465e7b000f322470068100b001f4438c6f6a434bc08e095b7167a862ca484d442b20818dab8585701d5ca6831b01a82d2304ba3c52692e4aa5312ba009c0c09b1b53a9c5fa8d844db1e3404d7c0685c1e610823d9c59020a11495683476f60808e932c3da350018e83cc639a0af10b181177f3447bd04972c05ff44f02990b750b3e81ee1965c6d5c4f640504cdec0d2fa3f7e8010d239e16a6f052d0cd1896f7a6e90229acbc3005237adfdcc024e1c28ce4db05db50d1870447416891005ea422e1af886d2229f6153b1eda8e458810c9610b477ab46fd73e01073897b10459e399046e1e8133d829089dcf9f640c00042bb3f826db9a00209410a59f052008a18b51ce7afd81bd4babb880c6ce65044f561bc0f817a200b6ae905e60eeaff006f0bfc9276042d6881b9d9b25c14a017c465f908583c29823cef3f000993bb1608c960f97609cd9f1f431b98e04d433a4d80ae771e05213d86806fd42811ff00d2077182c8065968e4860176a4f50ba78ba03dd99f061198d4068dc4ce1409c3dc1668602485022f130e3b3a39a107a44b90855a616b3420e5631d24a9580bb7c640caea589f530a275891cd2cd128115dcc2f574039c572612edf5744002a78831f903ddc076bbc78cb76240285d455833f82039fe1e0246c4c58d2fdc10050cf8ca00bbf66f04e03ec6a80601b04ae6822e9a0248438b5edbd42d072feadc039e307eef232ab68ced06ad26b37a005d767bea44b2bd7fd09c8a5f598d6d0bd2b07bd0330777d483083ea1ee06fea2cc02c5d42aa16b8085cacce2844e31b0a58f3405f27f17d08746f4088c5e619bf65b40b1662a19b64ec142215a09e8ce8225b06deebb0014058ad3d816cc7413d8695ba33fe231f4028f8dffd400bf790452f6175c680287dde04d8296c44790d62d02dc576067f43a2c0b02231c06e9d20c5e9a3c217967c097912778897173840c0bc655450422c9482c7b75837969c82ad4ae43efce383617f40020792d819d04305cf55771501d3b809826390c9c03f007f74a58aca486ac6703861fa0d12257504aa079970c3e0461dcb87272e34607ca5913f136016e805c7c1057e54b490c0cb0b14d807ca74d20279f804af70d1c8ccef20c28c1eb2ff0078c25bd0049d8c2885dbf4d5b1ec1ab39f57fc01f9d23480e4a698025b9a1b0842c3dfe7f414f25ccc02d6899891ceb389d8859682a6266de83a257f49d1c0f9aa6a522d500906b0c3df102d54624bbac1f9c1055897a219e995232307d090cea58a16ea740c972943e7188e222a5b308d604c6059ebb080a89480c82a3311bad831f3821ba0060e6b3d3d83269493075b82a7c03bcd68bc2e160d00a23be10c7fa0bb200303db1fcc060f50933a6c31a05b191fe9a052334c037c28b3104e7cbdb47508ff00c94c079ec34d81a9e8d6046f13000e2a22a700bfd203a1c50c7560e0d4a1eec052d6c3ed0810e4540d2d01862150f72f41fb0c45ea260bd5c509ed6ea02e212b5de82805b3d4b1634fb2d4fd2a236d97f185dfbb8c2d105b484d0442d2082e0ab89859082a90ab72225876a22548b36b5a07bd744193faf47b9287f93a525e0cf403a01aa0a883c342261d70a4fb8ba9aa42f567ea98e35fd26c0777ef200944da0003c2697304cfbfed80067b15977ca00581d7913d8160389ae9e81b58b6b300207cea7bc0b6a534f51023f9fb6005e6ef1635c02fd1c12293ed4820ae36797ca281de996a45fe131203ab6ffb345bc2b84127dfc5e41da157bfbb90a4ce8149181b772016c23a05a1e46ae050626f0006a8fa7db81ee44b4aa1a7bb9238d7c06e11dbd806f370f3d216f07b882a4cc730bdde528a019346b019d3d40e303aeb872b08d64a1424a50919a8dbe770c44631c2f5dd89081a1524db801f4543cc4033d5c09cf3ae2abe41af483951f50c2804b61de43013fde2a1213d3139a01e99a79b8009bfd12b700174df705c099f9a7b11c84c0fd6c38163df08071d0e905bdbfbc83c6bb20f60a0628412506a0023eaa227b106c360f9120490b2069c8adc032ee3b8efe93a6154b2254848c240bc8ba49500a505a917a8a9846a1ab31743e7f200175589869eff006d2405b2a5fd66afb106bb080c98fa10577651903e22c1ff00b16122d8224c5acb0da7ed902475a195045ba078c66f0c7e6e90a1c98e6cc6704b8ad0286b760a01de6552100854da103f9590b601dc028d7b413003da16d38105e6df7b70b74b0225a847e2668173d30c157fdf5812ef77c08a067ff3225badf340a168dc1815d8480c6001f2e0fd6b0a787283b6ef01b80d730e58871e86f686e0bf9a7d5b9a8241ad68cfa1733325dca39a52725a284725fb859e030dae8c03d132cd02829d463800ba5c611e141df701764588f80001feac51144aa00cdf7d3ea7a82efca9f405e7f7d30ec04268f9987ae6254b20138882c02208605f9bc000b60be222408111cfa8565932080462ea486a400de7e8e0477073553eb4813ae36900500262a976c16e23272df83f62c98131a45fa152404c20875954e8cf6a3475fa7aa1068c3b896e2040ba9b04a686882e85e02207cac30140ad0ee12b7aee6511d044402265b9dcd03089ec1f498b82b59877b2a8f2dca0aeb8444d468539cab721007bf5019836b289d06938526b4883bbebb91a1d700a5ca8af8958121c21191a80fa4c4a0069cfdf160414500687a957cb01162904907eae081029c425eca403796f8b3887cd12e079f54fbc311d38141a92259fa6b0040b6f0af986823dfe31212e8810656af0fa321662c0986afb3004ea5f32fdc9391912021d51cca8798c456153821165ec2349ce4007895222dbff00f4704ae0f30597edc319b13fa053b6e60532a09245e025699c07568c8f81050ef6f6c19e00fa0321c6e204252148f114a2c92dc88d811e895dfe83c2fa0582daa6a10015a0a836ff00c338055437b00b0c109500175294ec82223b8b88016ee5ec1f0801de3c3533501ed4627fac50e35676c5b8020763d984720a748c80d6c5742a84c7a8941cdf4c1046e04b108b52dc125fb491262479b21a04b0823a1d2919daa340234beba1f9101514cb32005c15911f6055ff00841b109cb02bec6102a5910203ea2c9e8939bd326771489e94050b703da011549c82fe740af9dc07172350241688188264118cc83290010df861397a03294c33f66391a4803fb64355a42a6909a0243b4a4d1183a1109b0110db06a1e447f685a77b5c6a3d403a9fb8f9e001a13fdae0005189c0c80114a112fa19c022b8204e0a6a754080ad022643fc761c80bd310802661118194820ab96b6ad10448c4c39145050de7021dc3e437aa0505ab2df104993ff00ca8138715ee9a7af6b02a5d41044d896394c76398b462e0d417da152e1140664006dbfe4505e1a030fc4f503f3db30a4236401236031ec3d090013b081083bdea047ed695fbe86410a33b7813d966a46412f06d095e2e24143db92292eed6100f60f4e37705faeab1ed2b7083c622351f2a988064fa1e6d019fe260d10040b69b6b13f70f1aae0c012196b0a2909273b8c447b6fdd5da0d647aee6013324af88957bcc082095393b6236ce7981b40c30e07f9f611a0a0e4022e23000086172643fe8676f0197a011dc2f282d2ed833a1c9a7284cb9510f100b29a50ae045ad417c0a49512d8bd0930cf618c4093000b18c81eaca33004db6c20566d015c20509880c02cc7357f088203907e206e18851b92406bb007b3a2685d1785a485886a80e5f251eb9af5d056bd6e4f80306c7821942ba48ac090dd202fe84fa906860c383e941fac80b606cbddf7018fd8ff7040215ab2f5040b6ba7d05046c6d2465406941c7f301ebc943842bbcc94e804c14ff00010429ee1829d75ba90a9287d98084c074c00bdb424698669039c067007687328008998443605b2ea807a089ad50060fb696611d42f7ccc29c9088a325e30c91073a297ec14137175527941b848b198ea9c42fdc21cbf50f1a016d4de3b77f410a6aadd80772b002f29ef1429f049c82bf13460217a4362e40a01597a2603e6fb5a3ead0c4ee4910a5a479f881e8f57b0c42659cba707705d74b7861016e2d0adb573f4a02e0888853b790d005de29de53c008f85419aff26ee70e3018df63338659135131ea3b8e32e2be5000e8cff3f051ba6908432c28f4a309f78d49f131d8013697b913fb822908999e4c41c4fbc0391859a5c1c228e889e440d27c2a266347fb93a1eb874ae6ea15b1cc50c6c9bec984cd560e10a641f7d402772f966f07abf1b84105001810010f8fc0b6cb6ec28b7120bcd604c58e1137c79361ec0ef6842fb3216a0bc3ede335ee05d5039c9c06209466fc0779824640c031d1203996101bfdeac0026e5630240490469fcc5a61471690c0a4e37da8dcf00a4a141b433f73cd107b343e10c01cd8b0d4c26bac0cf01ab2647f479400dba6f5b003bfeb307823ef70700bc02297e26f87e8bcda00ad2b5480c034f199dca8347b5944e9082486421ac87d251382c663bb30140487a622af310150864dece9bbc4fdf7ac281a7468dfc036bdbf7a401df34b00017dab0505eed998440b5b40128080b414aae51934c62d100fbd796e82403e8329090040c0a1723013d8199b20577c281930da2dbb8103ae3db103419095007f4085470b8451f2c83dc010d72eddd6e601e7b5e25002f258496d3993a08ff30d2f4c29081a6d6115ca72640b6c93f1a02b0b256844885a3f3e0174bdb190f3e8334a90076d2ab2064bce166c22e17547f7f54a0ae33d845821ae6083dda7901043187b651c000b0c9beae85ffe1c8137cd262de13db81af0ee41332b604be485ebec12632a6871e940ace03c120680c734482f3593a07dada2393ac5f3dd5081a5af7c1ec027e7ebf5eb0314dbd702e40047a7bebcb0212b4b64d308e349dfb3802cb6ac8e010695a0e2470613380317fae9029105c8a972a0f74f62c1e611ce104561b0edc5a22e127f08835eaf6a5fa4769d0a02dc2ba1da2a3302739d0d0d464228bb9ec4e0b922c00a3009e1fc70e980d424d441c4ca621133a4ba900363f6e22b683bc6f0102a615cc0936f4bf43b6573700c6cf40b4555100f48074d9006919156d415e303251500834fbd1170371831a076336663fd2501e849800079107208107fda8a2f301bdd18810865db3fd282064703870012f87c8001f3513bac1e2af55e84c5d871a3380793dfbac701adc01defb04585b0c3fe02c8130c407ce90028b86e3024b1a1816c4027b8286dcccc5717ca8264a0ad8784c5ab0c70643a26ac515392d7b2dc91f3244f9f20ae0d7b40712626478bd2b1ec1c5ee41f6f0d06e023c7f3804ddc8ff7ed501f0b5b7f86115924cdf8a6b3bc013c4a492fcdd860421515610e9c5e443f9813f47134c0f921f597a87a4a2947285baef88a82449a5e9cb3e6aa00668428c0023e072000002c30f8940213081e04014f8b22981df743370400235cc1c861636564f9f924112623c0dff11bc120318a8312154cd5fbe481521837c7246ab8b3090d6d534001f40d880956adc6158f6e26d41cf5de112181857e00341b6f8ed5ba06b89bb8125d6ab1b815ebb461f713f9731d03f90ee61738f25c1f1a06abb0313de401b5424e5cb8c07facebe40178de20238f6a49b3d35220ae806089c551fd9901ac816b502a81ac7a0b600734742cf21c8530a000b327348e292db5190ea6ee8d1dc19e20d1bafe2133573d0623c1a231084c1ef0581f725707a41671aacdbf11f07dca06b94084ed8a0a005516dd1086a548010a47526c516261426341c1c1942aea2c42f0efb628705c4d63bb712d2e960d45eed217662531933c085270be2202383dd8016ace7a474098812c356c6000534eec424806081202377127859c04449d254224925cb5161d59cb80570a73de46011b0af084fc11063e2f9221adf4e09b773734201dd3bd470f7c01782a9c4474290616283220b4a1c2a40adb70c120fa58b8fb840bf493ed244ae687ab1455f15f7c7408d56c178017f36648b302a9a17644da1c2d20230ee63028f438a005b14500fcb8df05d04c7974a593e4ef1b50d04948511cc28083b44d8c86e0c43f289f00f9f5a31e3d8368fc8a3913727f007be252cd910ce59e7005bbb577200f884982f51f9bc817c105e5440b948a1fcd92a040879816300b40a12ac21a284de216323b5d7e5ec027fe5ab30015b79569a9d2ed00325d48a063f131208121a0836d3780e6a10b7940ded24c2d81a3ff00e0004b51626812f9c0849300f91f09042c7c06dc6ea9854a29a0cccdd0c48019a23074d5002f172a2bb42d4becbff8006dee8420b2ec97320d2e2e4e84babe2b6a03b7152686292ecdc1f4a93e34425c68ed34008f8ed8036803da23f1042e9232354e243af00d482599da69a6084b91fe480911a05cdaba4a9fd910c104ed861cdc2a71035fd212c41183785a12a0088bd1093017fcef80db81d3341c1289d62202206390927fb7f4123d80cc1874efa77702e48b789c29e958f980637a04a2feae45017a57c5a010e87c015f7d0fbc19a826760f08977240bb796504f06816a3b019069ab4c6973510bdb15ec407fb9423a1a3ae49600bedf58a1fed4ec3c00455f5e6700871c9ae4611b413ff00dcc3a04212d003f43e5867c1947b4069ddaa980084bfda86c0826d5c4208878ccb6ac00ec09048803d143d9cc80fec2759306d2a0a087f725fd420f00a93c5048feef7e040275f5c602838c0758f33dca7b2a6c0071a1d7841f8e60ef1cf27e421fef1c77c32a17a4e24cba0864147607d451e6589985c512d2f14227be500c8ddc20df2ee5cc27fca4ac3ba2283e7e2012985748007f92530c9d21e55c013d0ba15249a89dd0d6003d3cb5f8d37a403d80db20f0468c28031f13110842a6312b539173fdcc0fb0598877fc6b584069fa9902b7bf41e08f96ca64b94454e177d8c79b685310c6ffe84f904e801ebc00f8cf1caaf92a4047bdd1e0c107ce4b98017ed6164900ef3a342e009481e039ae2a15b0108e61c068b7d61a5ee3fef4580fb8f9904028101eaf37f003fb48510ff00558858d3e2e03d4eec8131f3b8b939802f2f6581e709520a986d8c5183d81ec650a6400a4c272040d722236d0f9e70421b23b13b5dc181190b42001915d6720820ef0ff042060a50aa805bd86913e3785e9a06678969e08088961bd8c417668b852d8404d7a542c404a6b640c3939b33042db982ff00d20409a5a1b1539bc7bab7029972f805507220245a0ed87145684b571aca32e3e0c35b990061b198b42cad405552080a0bea32ad86113f63d4017d7861040f6259db5000883f6048150218860197520f7be6c307d8edf210ff00b1393905f4cfd7c105f941095d347b8498441fd220d355073606101130f80c3c471515d44097385a628218d8752e3c831585f91097776026404e1ced283646d008f709860f31ebe940242034880fb11f7c1454806069093ee42b48090773ddc6356c56aefb2227eddd5a01707d2bdc0f9c32d00c16ab4b62e25cf342ba2e8711337a18f346a73424e614a9544467b88a5ac846da37c0c3ce5b60ae490a406e70a83586f0c8ff00ebf205ccc11b66eb43ee8e36ee3dda87c1e09a77e40ed2e060808204c21f95540027c747054086121a1bf1a0775fdf81221fa069820e47a3c4d8948bc0042105a93c66005db3a84d89b20b88505044781b92eaca779404f4160e091171e86e5005f8d1748b354f631c9cb0a1722de80237f880060dc4d0ec14723ee28c1d11200f4ad803eedb50ec31f0eb3551193a08434949c942d0cb5b6068db3d32100046a2deb268019181f55bc8095b8fd4a213354a0496145f142961ce1339e0c66789b870d44fe1124fe20c6f3d01a4889c8208193291ace42dd0a9c2469150008dce9f32803353cbd85b04f3098d90087a751bd8163253b64002b7e5a16910709c141a68d08dce03e5f72d2419b44c40ecbea35033df8fe5429febf9d7980f5bc0e08661d3dd607e8e480a05bbe7242802508dfd88308d442c9740a0f26089ff000a20b564f0576acce0167598e0128a6310320f438a7581fc2a41c728dc05f60af9a3109c25fbe9751460e5f0417964b0b6683cf412fe6abda802f26db38c0856d38d910d29607689780181386120291c2249fe0a002f539a1dd282efbb721b4017c8c04957c3b86ddf01cabbfe1b730a72b27d10c47272d809ab2dff004050c30bcf94035559248e7a457dd803494937a100043481aacf9a120fcc3a9b24c28ab8db35fedc000fd6e3f120099e8621683600ad500fb1a1769609130fbdb7efa94037839245780deb4c5b54aa109fc2008493d41802c73cba89c04cced360196c3a420d0ca71c408dc4c9300b56fc8e892a0cecd6e281116a814e8d602bb7c8800b7b54ead36798b8059dff0087e3e0015ea98df30018a8223e40efc5f3760007af8c90423cdd7abfec10db86e3b3206b3a7b89468f20a508a7503f9b7ce40ca86b9ec8c00370a0184726d17d17108c30d44449284128991322ac8c25930861231820d9050d23a8e636d1ca80ed7592e004e2fd70000c1539a24ada0e9821d803726bd3906b0579b534809b0110bcf53028c3239b92e4580f6de532034ec3c72007ec71b8215666a6083dba4889807f6a16b9805c83da36ec1bd1aa004ade08256956f60ec0fbbb0f213ffa9700e6972fef9e0740a00e0ac500c30c30ee345b386b553ffb2c055e5283d78ca81c54a2861444c2ec0f92e08fbed001135f1d28038c81e76105bfbc2a057c3560808b46ba77b445c4d85510049ff8443b32c6249e82f481502c3eb678d774deb0cdfd6c420e00410ef39e0287c0f3d49989e83b28c09e8cda79642051a45e3697c06643aff4300e3a5c04191fbfee261ac0421fcb7a840805083a240c2057fab7d3433d12c33411364fdfa9202ed881f0c0c16a92d26212ebb22007a0ede160c1430312ccedc3dfb2b040e300ac58d8f505cd22014ce781126a7a4402ebf405713e41f53f10c74c3896a81e5379000de5a8a873142b851f44ff00a05f231a30059cab7e3f8013c0c39e4603dae1a6a1a20356081dcd201b46168e16e21de9903d807e9106e020156ba060812d67d891a10666bcf0cb64aaf753704cbc4444f45cc3605f0e8fb3627190f043007ac92f5cc186187b52f341c2001d2bf09820a907b40842b6b69478ea3392c322c853c827b61af943da136ae3fb2b13a61f22f805b4c566fb100920d59590049cc853205b1ff5528a60cf02e7f15d03744614c350c249ff00c01ffdd2605363b84fb5f6979002d7db80a77c440eb58c3b86f3171b6770222b984fc9220a7de584722284350546c0234cb6c77a1833ca0033f8420873940f55836fb2a6741743febdd842a1b7c440fbf9d08cf20b706bd94221e4c21a11a0498980853770b27c300439e5e44040a73a8e80146378930b2803da0002ede8fd2400ac4d85a02d0d8200a2ac1b26088a424ef652022401025ea682740c721030e380008e75c9e6497799646a5a2c384041601020860481ba19a3a06bb31cf202049f18c00cec20c00dc7740a0f50817bd5bc036b1ab818c32118352c46e4749dc237be9db84d78613258cdb5f7c8d83bd7006295c8c4b140c775083af646283dae4e042a23bbd20b5f45b45840400cb8dbf58010bcd1614456870701207b6ee1214f65a88a0fae066b00fcd380bb57323b78a2c7cd0d8921858fc405f230e9baf3e66682db223889fa0359408d30bd18616a6ff90c0cdd5972161e46cfc047460b7a184a316b8422832240b9a1733b8b7d57e29282ff0005f29083ecb2070093e5fb7c449043529ea00c5b84f4624266f0893e97f1564817c201d06e3509bb2a50018be2438f67ac03ab6be8fd05a89b9a6c6049a1529ec1114b438e03b259b5ec80bc649e72807c8357118bf294501400d84e90e24d0152d6554458052a1bedea19bc5b141073eba63480442288b38923b5b059801fa79a7c049ecd753c090677d381244c0e771a87aced044f1ef44047d0106a5fbe25647df526b080b12a76200b92705d88ccfdaaba03a85d1fa439026570153710282523232a30e41cc8c97eaf12ff001fa1818d85efb48141dc1a822d5c44b58e15c0473f2c901f14c57713f82237eba1b07d1aba4cc20340f7061f2a611d9aa62b3ad19ac5447f4409817aff00417b1f2637e8117a1699497457225a0a7213ac4cf26ac112763ede04c17de0310b161bc20d81269fcb68071b2f53b0ae3f3a40201818d580789e6d7c0841270dc4260b1673f5b80779ae93826c4e914010a6120668059ab27500d1f1d74400096b19205b515b40a005c08f586c567624a4187c865274d2e1796137c9ae80092679ba4038a4e8180fb27911e8a6a12f6426006cfb004bfe5328341dc2703a8c4a316fa1c00a2532a8f3e320de4ef4f0224022adb4350731653c2a22c008e2a822aafc090b6026ee0d116f58e14571a8ac3e4ff1203f3592208439cf55a006cdf3fbcd7600be93ee77fd03e85d8ce142640004b583720061d40c3061bea62d50d0680d423a06464e9df44322147b09823283a6d533269b464712a068538d1c68e3471451d0b081ee6836e543822fc6b47801ddb767811a60425d8205e1ae1cc50d88aa27be89902b83c32925dc2037134f6c7da96a56b00938dc95f6004b8492a248cdb7fada0066179605a46509b5bda5720240fab1303838a167a18c9d79113108801fdfa0474a281d1965c9bf010353513805f71a4340511a3083cca6770327fdf840751b39a3901eb0d32e52e14ee5956fd53175745c17e278a0c3cc90eca150cba015010f651256cc0b4e3280544a6b28ad68404e11db09e89c445b08c06549918f5db16691d9bfb8629c3968655c0d3f159a820d8c88bed900039ba395006710150841ee0c3dce8e44c6c3550cc7bd432c9b86e506981a877896862354a0510b5146199cf4d1a597330d1ad081a7dc05d0381044685e2d0b00ad3d8588684e14cf6003e70b144c796b0cd127d1804819cce0b9502c581e46db307b9013ff0000c4e0d5685a8a09bfed44026527f2483df89be809fdf3b5e007b692ece809dd0509b8531632d0de7736077a127a5845d27ef1c26cae9a56f4f09d7c40432066c8777a00a15d2a557fa2ba521f7816829ef83179ec06b00c62440936f8560637e8e1721830b2ae309808010d96f2049b4f96a219362491ef13295c00cabc01888d5c412102eb2831a911c27781ed77019d10241bb3c04f42a9d5aacd154229ae68f07d40069d08b70021b72d85d80e26f44183e46708ded41866d1ef12a228b52c0a9c21d13a088b8a83481690603ec3501e9869629755220ac551833b1d2797f50ed8e2e7d441a05cc84cd736095b115bb0036e558f60055e841fcce20aa0910e16cb100a92d701fd0d05bf0a21215c618d110918cbc2894065280f8104600efcd922e881f600d0dc8d9a92c08f7fa2c0a65817b128c897481e1bc338049d9c4b014468a323b33a215860277aa865d25d942d6432bbbc4188b492038866a68528234e3c34410868d1c2f3aa131a80334416771aff00a001ae141ce3d55009b3a180821950ba033233be80cc741f4351ae0f8fa26aa0841147aca113443d70f298c0fa862440c3186271a45511c1169841b53c082fa67565499eba5ebf50c42a7a5c949312392911caef20c17309c0d615262b8e9007c0890f038372542d3d8009ad26e202e027d896edee21360838b233d9c07ef949c3fa3417f79d00e57418a1ef7a119500629b0232e8357c41866dabdc806fc4e801fe2964d40c1b36f2848f9fa5bf99347a8c8c21c5e093e7fed0015fbc05933080662815708a1ee30a1add840da29ab940e39dd5d03985c0c45c52e2fb005c0ac022439c8d31aa44cb0a069a9456895cee10105f840172366a401dc66322d0062da81a8722ab07901580eac8c31f41be81330844080c59442f40c04b52bf94ea141963a034e0f686988e041caeb9b00554eb960135c62cf1e978ec6dc88c2782c81bb0ae380511341eaf8058883ba5237390570948c221eec4528a1963b2f778840ec2f8fac0befca1a4242d1c906d3005afd10380e808098c29f8bb0574fd6910cb12fd904f45b754cc99f46d3541969410823c10cbc8572675893d9a0d350735ea6edca134d403469a7aa28fa64da2db531e3224d167b8bebcaac1c272f7a9b72a2d4d0e83a8b9022ea65905ec034042f1effaa40940561020bf012aea9ce88c8ea05a443e81c04c0aaa0c4b02da54435e93ae66ab7a038c1641d067a8badf13b003b1a4d8005b790d20d7290161f469d08c7f6155eea0c17fde801c600137178b904866e02e92b02e9fe09b3340f2e30e1869013588a19a797145487a226808f228ab33e4071ae4a8c0f2e701f4fe7e06d9602048256f007a9d28492c12f406b9d1e631f4159411e8d942285281e16c56bfe05091cf635117ea502aa041955d5286886be02a102654c904083017e1271bc0c4bb631da7083d50e41766babd02826601919412ec05b8c7a80b7c6d873101813528ca23f7d229a33f25a45d2005518660d038584fd7713d46e02b69fac7b96bac502de6ba90a636a0d274484aa026aa7a6924b3472da8c6ec0a7f8c20d5c5a21fbd06732c4f0645cf51565d80af7f1f1002fc00300f356d1d4848c3b80f2403e6df5c21a04af645041e90ba6db77a3d238e912168baae79484515b09002e3e5ede03dc20f4dc31e8cee06762a4528e68450467526d0a1dd4190a7ea0c43f61508fc48dc1ec0c700f00f87c1e438834e075d098c8541089860d285653627343a9a21477ad8d433d9206ab7de100117f36701c4130479f822a438038c5f5eb90548c8a24836ec810381f67e9442e76690bef1039edfb7f4449ab60694a045dc94c37d236087252491590269b645b84d02d2fc22014d8bf3518740c35e1c552fd84c12e1dff78274655481c831055ee305a04e618ee9402e4ab5740d54382a2adb26491421d8632a6798a0f1f420323110dd56201045122abf270d26ae807455c3a50a813da808a9a7e27ac0629b0df0d883e108c90f7469c360a62e4ea48832016a85b016906c066497c49c5aa197c4e778446c23fa184d8a97c6c0064eccb00128e75c70a0048f709bb4c52e66c12941215948c2c598065c08998755adc44773885118eec809bec08096100826aca8868bc42e16702957050e40f82708d2d10e2cd4a1a4d27102f33d2103d85d206c806ccf43a0e018c852483f9f3910359f6fcc081d016655902b7ab11789916d99e8a37629dfd992958e04f87bfcc80325f9dc0ecba153d912a6a9a8c6f1099a09a89999bf4b4014146b47f841eb818af440f783590d79520d51d1b12a4b905ba1036017210d4815fb04404321bd0c1f7ec4a00fa7ea06f1819f4ee476503be5807c693932cd610a58c23802ea261077e5c00ed9f84cc1d2ca4005290e03bf07a9460dd7a023bfeacea0950081ea639ab01797debfc07718189a19288376c719172157d7804a5e480fd8a618130835934065af3fbe0d5fe0435e83f082bd5800f03d20681294f2198774510631b092438b1de78581a8ceeaa80aa42e93b6bab012b4ceafe0992e0bb9405f62704e140cfef70a030a91542b618c130542d85d688df4b2a210fa9d5a07bc1005a688c4d4146fdc6595718f0869512a032461003a76049592a137d813e08d4117fac700f6112b3dc37081fae6bbb9d86edf5cc0223f408ec139ad4c4c05dfc410e3ae181fc2d2dcc412bfdc0d044ffecf433949c56b0c3c08d41489126107133180ea16c43808de083a37680713c85d08b4d6359069ad20805bf6e1174d65f20bc2040b9febfc09ab800ed0d80f17041784d0d667e9da2f886e02ee3f53063ebca1aba8127525a0cd9133550ea7b18d500a113bea473d28417c5f82217110ce59a17153ac205d8764356e92601662a5c436944b69974812b589863855cd02042e9371708021a4a4547f803154ac64229c30c664707d5082c8c088b482c61162541fcb636ba2e0d0fa4e8c0403fbf8e4ac40673cfb5dc4bf5b0c3f4e818d160d6a00500fb3de4824804101e3e25e99091bbdd282348d34128d9e878c83d6d8497f016004b7b190ba402cac099fd88cef04052dda686c9ec883075f220fd20f92051b84f9dd17c80b85f32df328f488dc01580e44ca0da865580c4cf61fba08d07d7f783b86ac82b0a169e401e6196f704ea19af15932e649ad848252207d2a41749616284617dd0d02370c832be0bfc20f130b5421443ee40460f25ff63a01edaba030b0560a2105f8220b66001fe068336f238a2658659d70642d613dc9ee2708892d6acc7bfa44a30f1e5208e3641c93170404202e6ffa0ae1fd881d93bb928f1fd1e776640a984c070e5c5112f72171c823e885f2397e714265d42290f05f5001af74205d5c40250ec9c625a302da684b0079cb4093cc66940454f0ef1903eeaa241eac830f18534345a87392090f1335a5881226fa4815e8e82cd8c824b512047606c78e0fda0a19e0664f215e22d905d0d48e24bb5808eebb282fadd104147359b020c3a1e21eb0a9a03e89c3902013a460e2c686e0241a8a5260ff00ab8d86206a380ea01c4bc801faae9570604a38137694e0e06c05bed3b1b21ef6dae914d4dac0fb92de7621a6a7f2061d1b8f0cb0c3e83e90b480f54a806ec81ff626d814e311b3d0612efe1027408390045848b11e6ac50a0ec1e28d70bfaf6801afe0273be137029b914c5a91eab300617823b49213d6ac5900cd3c14256c8dc1a3c2195d863a332bc8469ffb100db14454cc40110018cfd00594a00960821a6e80058aca440b0b7680821175f7f6102b250611f100a7d59097b9069e90089cb64700e13644348a00666406d61fbf8814dad0e023287be0e6fb51835d17d998d1b144ca921769e305f09cc40b6df81323f52763fbafd4067581292326642cdda8455c0150235da05f1026e3884d4efd484f7a65201cf37205e25503439a1008388540b791fd982f526a31f7d721f9ee719f40aee70c8a9de32acd28a4d7a1d1e62f5c2a63a1f5baa584191a40e00b4271bb34b50010004ff78894ed107e3152733ec086a597a482cbf05d14111820a4e40b34020721383f95d940fabd61d1549cdf380425085c1ccf203e9b09813bd8b43572248b60673f704d83217948f308368795032e916813d1523fc6d7016e5f06bb6a20178db001b3e7e58a4c0fba6140bd20bc4227a6b49c08bb20588f8f8005dae4c6b50665ea93e9b0c33a899073fee121e7ac00e8a65be9e23e6937fc1049f1510672da2e85aae4e9b04c9a4bc20e154801efb1e0005deb7002d2f90018d7601c170cbdcc06b7e6108baf60b10359213f400b8062e20fd6dcd0d9bb754db130624c0a81ff005a43b3f11f43a0a930ff0016f388d6249d84707cc12fb6587bc0bdf9a46b62422764f684b1801d1069764f4019d2e629c5719040e601d7514698a1aa131a41c8374ac227fa1847336b05c16d83d040d8377e2e4250dc7a6013d60924672f2e8664cb6cbcc628e415ad991bc7800602dc446f601c829e8932beaa02e1b05da314af1451771bcf3bc114596f402bc689e97fa00866d0e45d78469b526a1afc335ee0b510466a77782f4799fbfc4fcf8c6ba0d2ddc1bf2c2a4a521308b6a0235219b8b543c009f4306630f7800a7562025011f5a4d01722e6c122ec6a968246862ea3b04e77602424c840e7732887307b1c8a04084680bcd0874f01bcf26988475b00aa4911a1a1662ae8630e82fba8903a1f58a62f051d0d258158ee040b3a2c2cde70263830d19e5789815105d0408cff006841373b63d824995b57009e5d90e2e54405ed5bc85fb91059d87d81072122cca031f0ff00b4a1d37961526781f3ff00cd1c6a05b70464b0fd1071e77970822a013c142d374dbcf48bb142563a5cd293a85c5b16e8cf625019392b3fa2d60ca80fc18b8f68ff0002d5fcc0ab00a36990bfed1805bebcc08497040d22140e003af48a02f0a016b16c12420cb0dfa096fe3c51ea69fcae8633210fff005d207305c180604b9fe80939ecc8200db5d40c19bf70a397e08cef158390d11830f019e1c059a2fbd8259012eebb6f6451bb80f050e4d7ba001adbe1413e8891b1407ba71067eb7c360d7a19a8c234ab1d4e8d476823570535cea30630c3a84c0b8c0777b9039e50e26e408d6a467ba4d57ac111adf0027e54b12f01c7e1dac806f4a7b20770143652068cc0a62594a8d587fbff00d6344a6720a626800b0ed2408f0805126fdcc8be726016b0d7b9010d0460f250435c5a89732947d37edbc1fd84c821a201e400984f801ccc8d57fb62ca051118ab580dfc5099be3b504076c29fd7981fad9a9e0cd5813fd6faff00a862e3c1678d809e24d00d8021ae8902d3365bdeeb6ef9740182200942dd093bc023a2217d5ee2bad88d3ce6a5848f3e01a39e4be8024c6eaf54ab353bba35ebba1889d02fa024560c3a18c6319eb3906a0e006c45064fb97048ad99110c3672863dd029a2285cbf61753c816a6d1a8e53041e063df3e18b11d25960dfc4013ddf1cee697da1602329ff002613f0e24554aa030eca3d99c025a30432b8a066a8983a4fa82fbbb08e3cb013bbe9008dc00534349bbb5647401ee159101079336366029961fa882ceece14005a04220241ae9a1c2c4dc3d026327513ee1143ace2082b842c50e8e96943029330b410124508b716f0f761fed23a05a1425b57f62a69d06bd43a8e830e86d0d50d7c58938a550644743a18c5b22be983800541e9b6b94497fd90388117500a416db242521c71108d0827244f4582e23815e4a585eeb9acee464be0a1b6921689d7a1212752c505adb50a692978078884fd037bd84375bc2405ecc4067cd959d83bc6a0a05dab49b0c77098728383106226609c47bc9f028c79b6991885b4383245f0d202faf58f808c1b74a3b8bcb1c8e835b1c4280b8ecbdb2028cf13c370f4a3de848fd2030f508f0fe7a082082a154d28e82381728b22c0f80846f240a6c9e7da6930602f171190f9241cf4d003a9dd43fc604155b4721bf86f8548e8745f5fc23dcc684b4e4cdb00394d6418110c88fe814e85daf885430865214c13dc6c240dddd04ac867702414720e431a380a7d960c8f493f0b61866bcd0889a86c13ba639209aa6078a686c604607b144dff00ac85cf85ee016f10e9d63d8418dfbfeaa4f24446f6a8aba80af0abe9246a8d8066421c07bfd801eeb640ee841a1ad3aee984f9a73eacfd00543a34d47d2b401e5baa4e82f48aa1d43e923226502d0b5e40bddab07aff00501d3ca41a72a6f13810447f3d19fc00e8c6061d4fa042151106d43b3b40a641533ad21103c60fea85603d9ec028ba2758980a4044b647d260bc5f842e015df018a68441a70fbb352432a62106e06d9bccb705764c4c7b1daa178ec87826d80313ef025241db02ba5a40ee59b14849028010b2c5b62107c1ee3f05b778871cdbbc2236520c93828870bde6ca0b61be860435fe3220e039bda002d9734aea5b3e208cc69789024d8178a8087210cdec6d0233a538fd340aaec8909831d40c0747ba18902ee4524567448c1012e4863397cbd44cd44f3abe8b154d51d6f08041bf467075bcec298249a492644d0e861d47d40a8545b0786bae850b302a5c4626202558a0ebc46a3106031f71d82d4072f4fdd11cf09d33c3090c834b1fe2ca917029ba05f43007e9211e222c3c4056a441017a3029738122aab68016feb2dc20a88780c815a7054db448a0642308725ab5481fe7616532a0c60d40ee9ee4281621d02c0662b51dff00a5693ca9ae86b803490c01adb80502ce6bf79cc0597b7936031c7478984ca9ed580aa59e8026adeab0652bea8f065530ea0f9744803595d3a436d991f235a93065a8fbe8347fc14531a16a4bc9468fc0ac34eb00e86419352a0eaff3b42fbd254544283120f7250910657c22496022160954190e0b6601eb26e08b4b334665b2374d10b870ee3d03c2e83398c940de087935b9036b5b816f6b0426a58185de85aac218312f32eb683af4009ae10728b28e675c83b5d680b734ad8a32653d7958257721770c0f49e14dfe11ba0ca629dbb7be770684019dc4564de602cd7700e517ee8697df783725c08987ac584831479e0e038e598bec3d5f9e00e8c3ac0705672632f13058a61481a820d1e1fca094bd20c56e33c609ec082cc8ace92e8268e83fc2571d2a6ae82112068b101c520fa12b523b0f8e350cb43279427807dce1a546eb2895206417175941a47bd5b06e404465db4815b1051027a70583c998480bfcec3a3a103db5214e0d4303680d5704758840b80b6bd5c2e3778a08bb9dc30968c0f800fd5a212b39c471cd240e022ba0258f8165424bd41fbd0deb6deec205526d8024b4ff009442063c45ce4b871bb38d2896040cae37a065716ad802797e822460174685c1d26aac5005d52b9409946b462180736f71910229855582300ac151d8a4f48741f409a310e8ca1b54b62f97aa15108320e0ec2a8c0682b5e41d0c804adb206a9a308bfa8204787244b61186becc007b7740020e5db04cf6e28a20bc48904a219576633cb163b62a93805ff28d1001c936c0a34275690f3b8178c0a8e90028cce896a11090c9b07ba780b817f2fdf30a23e1ce00b257600becbf8b41e25ea919020a68e80799e24f10c92d0f070c11995707989161f20448a0be5df926f2bd154405801c758770e8b5bb9384ea90730b480dd1aa4fa64a211c1577bf08063569fc01a8fa42357bd2f4e04c28854420c1885672030871d135f165241dd465c9e972c0312f3780bb221d07f762835c66d1a2b3aa509253609318ae706ea389508537b93c5455b5816746dfa11900219e06400c5c245025e454098d226c501a26452ba2f18bc496ae3f405c7dbce905b7d950365675578d103477d5887f92f9426a5304f7190b135dc2640b39d8e90ac491b64163ba81dc858a1216241dc369ad222e2c02801504175074687507b307b5272526025580aec1a60ada12b07420a03582150caa0ca861e3f080c2a2b059dc6c03e888346e40d00fecdbd5e4155522621883568709ec15c296d0102ac41057874f49918ae4512642ddff000119117ba81a65d220e84a5103148479ad831058211b00b7d4aeb3410aa0710d6b40508fe46069047b812d9201852e81cd41044059da1c0020ebc16440eba6141a768e7410227c032942dc6ccc9433c944cf96686be2713df98a5f731fc2bc131a6813705483e8a352b7bd395fc098e81ec2907fc54fb061f21a8a971c9a3ac18756cb58256c260c3054b4b0b5846a4aea4874421882b076084d0fa0fa42eb4674c20f6c88d9310b8c3211ff008b0a82154d5e648236aecc820b1572e4e483408cbe985e332dbc87557b805a20889425a08ad2f8344c29d811320a119e28259f47033be81be581924a074b5063adb00c66fb4017b7910996c820d7f86e3f348051f1a4f98edab8be003f2cf87609f95def11c88a17802dbe7fa2ff0007a120ff00f0136809db510c1307e907b6dc9a6900893d45001cb08aaf9b4a850e990d69e9a1bb002866a5700001750c9d7b2d6eac1091342a4a98169ba3520ba0421542a8ff00100a8415081c52586dc90a62c245477ce1ac135d439878095674952a22c32bf412a120b5a31374f08aec9ff888250c914e3f90aa282585c9fbb323a91c1550090b3f3839dd0d72dc1571a22d494d41a20e858e1f4c22ecb33b88f4842d338071740f57862da80915c224757191445a0e06cd8435800fbf6f9105c60a56330346c6c4b340b0f18381300fd73a124d89bc8b99c3dc166c265440ddea89700bdfd9d4009746832ed19be3a4c3520b64099d0e4e702141652430a4874300a82e90ea187e1189a2a3201c121609a1a0b78426188b5740ac4e4134b54088ba107d1dadc79340288867df468a18f08982fd9a830c3590c3dbc76e43fcbc84dc1d98133d24fb878fa1d4b146241c16b695148822bad5e2ed09679847eb62e02701d32ef70bb78016bc705e1be6f61a7767d604857134039c005d730140f18894858138b8077214a920295c0b028b0933010e31298c2b016b911fef508cbb14d7c55f9865da3258d83e7466154cb61852add3952a4d0c38a082e83021d23219a51f43526aa700c7218c3d9a2568d7a84cc9011dc30a88347029ef5503b03511dec039a1b269a295720359cd2d3f1d9a0046c30e8942b3307c84b5082b3dc09fb5049ea5a405024c27a7544630b6660bef7922b8b6925131d84d80533ca07fd64881c2806543680cf3cdee15bb24995c8c0d698711c050324459044311b0b42d16c82cf96600135605c301d6ed99e8052cd71874163de66d620a898ad465eb1158e9edd92705e4b1746c2ab63b4d84af4054baa3ea03a30113d065f80555d0552120655ba8426c4968cea22f1a94a2089aa5d801a9fdf69702ba4258627ce43610e37ded21731961410c09de531a4a1aecd844500fd9dc06f2e4cd023ea9e9f9f09e21dca04636de4295276e6b99d668e08380a8cbdd801e51902ba3e9ad1f617a48ba7423ce99202a80cc84d0c01ca94d0bc2fadf142f414d00d2027df0a1588345c3dc1e5b5ade62539100125ae8d67422a0428265c63285fa1b64e054114cbc5e1041741230c210ac17e305d408cba224c47ec03ee93706fb17d1de9e719682f1cc1120ec8114e48af304b442da9407ebcaa2141250499ac036952df4562f17cf820ff957c145722ded073b0a558c12bb8826bdec1112f8435158a69fa005c8c2931008f11e23480f7c182c1e5f8a00e8d0249100e3f1a137b39402aff93008e288714302387ca4585a2b4de242c8a832758e83dc645bfe6e0156e391d00745ec2a4bc34c31c6e0aa7b002d1f43c4230a10a8618760c2b2aac10431d0fa5750210ba7d016523ad8f072507a02fc8ca8410618a8c0c65c8bd3c2e8d00195ccab5e0396d6009d0a1353d83059814b4d60ae0502777884f091d1ce70026284858b0d845dcc9e6b3e0fc22e0b2f20e6dc7856271b06d0b0ce28692703104fc40eda45319d08d4521200131b0c3f970c804e7205fbc78f10da48723b94f15b8e10a1f921e05d73fc0c0c15c39493601be29242257db015c21ad5228c1409917383a41f02a27b856216eada8a8544307d06a215c2fce054542328174831d05508e0b63e8374685fc135b906306ec126e2601eef05ad8b201846acc7ec0f8fa35f152486ac327828d0523a0fecc885fde214d426b2c5e308b414c0ba0b7c26cca90bee5a912d9815a46a068b345b57a143b9604ff7600d6212a62ea036500cee223e8607102121a1b17033c9144abcde049e5ba8a3320818e08a33a78330d84878cb7497a282a0c0a2779ac08c61052749503a0c2a85d0fa81574eb07636ea21514152101e5404eece1ee4962012287a04e0860eea2214c4082d342c6e828c8edb754c957ec68650b0ce8d8b825697b1cc8212327504a6b2eb2e297c465a044f7012a5bb883a9e0a2ca320275a0173252256e808b2118c2f304da1571109ab126226423b82c0336103dc42f6dc5f9191a980721101bc66c2a02265480ff79859835ecf48cb0540d5185d44ccc45146445dac2eea8339854210ae811a1850fd04f5042a2a6541f43eb0aa460233a0be824947d41b8f62ca02df61e88cc5ecf511074f1e9091a02d756e40805b809513455b8a9dc1a0016efc861f7185f506c5783203e6b904f541d20a4fc667e1b17702168ce5b69e8bce9dca203c78418fc08e9d410e66cd87139806996c011c091d3600e2eed90b19845e116ab5b9118000faded4e83a0904505171e0c9917888e8aa182fd1b8a252e3183c1bc082a556d28998199050519120aa08c04151d0d29729a5082aaaa3535e82ea2aaa60688252213d641adc6047da02d2506206f205fc18897230a4703511189b30fd857e1ec0b2348f52f18c0187a95055e828df61cc047aefaa1dec719e828d52074d97a85c59a40007665016d32b604913a434c047c02bba09268d346a04b14267c0f55e60e7e40a7836813097800fd3dec7990d5c4232159858f80443490b6504444394f5800e2fb94a84b13f2402817197c650e521514512a44702a7562bf0ed150543a9d4e8aa4f586bf8011854cd6912443ec06910104d6c349c24d804400827010c23e05821487dd87706b0f21e83f54215450007712c15103137a031229b4348a3135d6311f56d5d05681986604fb4fb29dac884d6aec8110a00485f6822b7eb3208aa182e079d820c814779b0bdef590ee487a7df491b6e026360417fe208aa811dfb6448160aefc042513f80c815adea38aeb314d4d534515558fa1d32e822bbf8c03a49349e96a1502156f15154c2b28ba02c21c08418b6a25e3fa57e821e1c17407252004d9c13257d407624accc067451ddd061204f1e00cf3868c557d3073e408e9b40a32d6a487b5db63ca05836ad018ec02a18260feb76a07498ff00a33928550e0d025038bd46f08be642c6c2790502b38350b501f311f5b16c28a8051bc2c87f4d28737381d38540822808ab44152c87b5318c08ae80a82a9a527ff002a2a27a0753bba550a91491305b169004d370b0a1fba0345a19da8050a07b56c09ddd80dfc9fa0dcecb60c2e4c110c2083908c65239a822522d928c760732a097f02c6d06920b2d5d488acdb2451dbfec106b2c20732a098f21f623e4db04a590a22505b404b4c8844854920151d821f5fa66604726e8983971d9034f23119346fe60da68aa6a9c8915c465698f302fc70d69a922e907d21950141d210a85d2094f56b542a09a4b4162685e11ca341d8d8888dba031df3745f52da137e0fb291f9e4346281a82a779858a4ee1940f414b2f1f202af6431861863388127268e89714fae26e6fc009df0c0b7d84d6b10a55305f8240a547508dd8c8e21b61ec16423236141c3574e34845154b41586d0c97008c11d38fc61751f502a2ea5b14175211d28a5ea180bb520459480792061917d02452142084902992aedec998d9efb0a2da80694ac074552c820390be00369ac06a40b2f584334831d0c3a063430e303111283918c95405a0d10b0b5218a8ac0adc17422da31ba2817d05a41754335ea1d5555dd4fa0d6886bff981a0a96a46b41505040e34905bc909a124083b3005c503d820903d34600596c2640580cb7b0170622617e02d49203b4224c4a98260617763165d44630c30e83a10bc94c0f5e8a0dc4c4ca19074241db1b41dd00328b48663fc003fcc10465d3a550882e50bf002a2e854552a886ec048ac8b90416cb4d88051c8ccb0226d02045adb01290706021ea2c327a0b00d6a050570c7819a538ec1c1b851c8c10bebee751bdad40753ab0c2109d4069cc1a78b74642c1902ad8d2c5f8e4030e863e87d4ba17e03042e9543a2a15175174155c6a48d2232a62399fbe0b2171994701d0902540970b87a83d87f010d8c2aa1af7cc67b310a1e03df8106410af211dc1b9a046a61781690928e025a3a0640ea64ab85fc1ce62a40ee0400c3293bc7ebe90fa0618743aba3e87ff845542aea3fca30ba4317a2916b34aac803ced9f0216f785415aa80b1614d28807f95217e94516734a360229484eb942f72b50c266d94ec0b24908c5594e006e21d9030e82505fa0b52410e9993f71141274311531a20f690e87141f0b47102951b032cba0c30c2030c31fe17ff00946bf8de0150e882e921042567df22cf0b82a190304d78b8a110c6c2a046216bea83609258006dd84104230a3024de4147a73b13048dd96d16da0b481c380141d986dc3d0fda856702263104503ff605fe83ad861d189e1030e82c5b22bba811860618c63150c743a8ff000cfe36a45574cb087510ba0ba4ba5740c61b991d42bf79e27dbe89ed4cb85c2545844286253bbaa05c249a80485a03350c0c5d891f0f61f0f15bfd416e99826d404c3abed80c994070ee190c5c061b32c3de70a56e90631d0e808ed043cfa89496824bd053eb0834a1fe1547f855555744d2011202e821742042e92185e2e1e00b511c2b49f303dd9cd50b002f50a96fc22e0ce99a067ead1c08d32cbc26539bb9a4116c12b01840da034cad101c011611f985a060432a482f199e910135d40e8e86318741dcb05abc55611b240040c1863ab1d190e8ff0031f434e8555d3954ba1a88417432a9511aa350e5d70ce7508830aa908391a8bc82e2f3080bc40924515a67288cc351fa36e9f673982d9e5f60ad4a4a71318421f26b1ef1ad4fb879385512fc0d0b43b06991eae849dc5e903fa62465a830e86318ea09d3a2f880d17a281130c31f4bff00d22a2a2e92eb150846bd046b4b39981cc4aa1d21910d738546c90d74b94a085e04804cfb6417a18a00bea12560a485452da00cbdef0c3bd75212c3df267de6b84d0491740a318637a264e90a82bf0031d0ea743a0cc13b204e8285cc432805a030c3abfc05ff0098ba05d6555d02ab43f7dcc9d29080d2286031b840f199d31046f11a819a2a4060c499e7c60e79d50150352906758f98cc5034db40e08b10537c599245e7d22cd0a208968328146e3d6e8d30ee246803a30c631d081a4a87f2cae4234c175c18753a3a9ffe73c0441a742228a88552248e926a05a34443a7c80e86940aead830eb96408590be92a85a11107a022c720c30f9795aec017d0a58c0e21d8301ac3cac05187bc8b00eda052cb0346c30c1d2c7864b109dc1b431a63b84ab032b41e9d8462a23a18ea451ec84f12b5316ed139aa318618747d478e874d68bad551ae4c840aa575174042e99e95f6148c2502a30a7408830aa89675b013a2202266a65da5c1e59b6809ffb1680762ba10a15038dc1aee07a120c2d720280b30da02040fa231970b4e427aea1e1988617f8206b8778e068a5bcad03acccaa476820ed8a600bd0145481861ffe02abeb4c2b8da0bf022042ea055180ca05a24d442174e6e10789609a484eb51c90412f742284115f8d543c30375d442f50a85668171a00c414e3c3809722b141afb512a83c0e80302f5501f28deee0415de321880660340328fd768298fc00eabe09cb0714f1157dc735718743fc85d4c2e831985d2542a0a8bf020f6bac312c2a1a50b0345c6b0e8fd112461e74ba4901042d09304dde6132e42d1c2f4941833e92000feb8049076b74bf194040a3c7782c89822504957961da240bae0307150f07eb4e5029f6230b13fd8a070c91aa042d059409026a3e8454e8d410c4264b815dc825a1aca1d4ff003953532a11020aa552fc4aa8a6a25b77e616a96a6869553555d44ec1dc2c922a4eac12ae08d0cd8ee0d35507c9f67e2fd9126a2b286a48b451109b003d4dfbe28a5e40b209d8188b8a0c04bce672338a50a83dae180a6e032a5880caeb48c8dc5c70dc304d4097141d4ea7d01f407de22508bc758a2a80ff00205582291d02a1510cba5f48aa5342a27184b2d1a843a88622e576070d0156aadc69b0171c6c01d5b3c09043402fd166e47edfd502fe8d500fd06e10dd21117613e9068266c339c086e04602453b1a884c04ef30712960a923c47350c7d021b196aa09388bb06e78784d941d06a5296b343a30e86187534a4de26238bed8b5551906207f845f84aa17e38fc5222448a8c1726bad527a8945a52b481c8d64803ef83c5e17856d0c2cd380c958a45693354395c48321cc088b00e8f6125c41c075a5687610544126071c0d8a19c46b6d15d86f75809b77bec149ad12b08b4035d1870ca83918b7409b2b3dce83a31d187419dcc79b05e02bb26505816941d1af530bac208a10550a85d2a9a749d0a8080fce4d044c21b805a2f0742e57602dea015462812e004ccfaa3dcb1d126371f2021c08611c3ae910c4382819001a88479702404d130a81401d83a14d4a128fd498f1c69f2a1850668e95e01961484f500aba09c5c1dda1a6adc4b25a8ea3a18c6189d828b61bbbee1761415c444129418623f102e90415df80ff002a2d8151bfb15940ed93c2ca09a0c2dca242e31a590a81dc5944ead03800c586c0e81e9002f5b20d15fd01d8ef46a5a153380b2e621ed0247f7374326fbee089562701a007268c4d019e007f44a3235d94969005e04a0b06e0f7043b3a02778c863801fa11672330a1d4e8630c3505b6c28d8bd15ea45a11a87f802081510570c40a869f807f8861a25b0bd30a893718994806d66541515004416a88420ac2f095943bac2f2be278bb584f21c978f185800ea048ba10e87819f4205190e03cfa0c04c694096170380e3029935860af60e2a14d9dd619c4652190511bba694b7c64c1cd05c69a28f0c7518e881860983788e1cc09cd18289e83c8aa3a1041505d03abe810bf3390e80ccc5aed44a7380057a600a848ecc4b7b0132a0f40ed066e241830519828a831c78853ecd06eea95445d195aadc21b8029202c3bb807f053a6a12400ded302c6002d70045b2d879a31e722cc2240fd385865845a80a6ea48c6830a097805dbc720634f31b896c520750ea3a3a0f2d27d274b9855ab6690b22407d00a82a44140ec2d7e42ff008c0d818974694c1e561541705341af49103a8cc057ba1234aed81f68ea5eb4ac242f5471518877c16e0e955603efa024ab16ba401d4cd1ab04a05e52a00862284e38438f420f80bc2350298d83990413d845b05030a963a001b1300c0680ad29bcd14260b3927c0c63206187430e80c419dd817adf17a2b591566588a102742a449a80ac3dc451fe400ec1f40e8312081d16342d6e01f220431303d3e31d922d020c6cf5a2c08615e23ab32507767522874c1170d3c581ed25409a19543a1bc243757400b3b4edb303791544224509585b620ed700c2e23efe1b121ca8c59d31305b05c0088c1c9d01315fdc52e8c44c6908f4417bb81d98a5195b50bc13f250d8b13518618c3a30c443f98596e0526bd31641d3379883a02e5058fc07f84ba1bef14a8da32a7810da8523a74113c3c0c0c184633205ac1c19a52f4053d68069621a00aab54dce19e6fb0169654b28062f0bae8028f5a4c0dafcb3311263315c17a84e08b14ed45d81722f205863339fa8a0a9827912010d65c5e42f5063381f402c040cc2904704a0980e84e41805b270e20a9abf491431d0e81a0a0da22164722b5737d4ca032cbfcc01fe47e07c4942122829241d19302c0e081c0681cdb8b21285bb0d415118955483c5841f439a0b5a3a067cc09980eff15d0b808cd49ccb4b1be2740eae1faedb0f809bd255dd34442f6c82c517360aa48c08217c2910f53a28148f42de20ba6af0cc36962f333a10d8402671c1d935dbc30f2db10c5e6a30c30c30c30c618520de465d5c08b916096aa24d49dd098ee091f0154d47d1157d07d218181f512184d0bd4667ffd9"
@@ -0,0 +1,162 @@
+"""
+Load mode: existing tests are run as user journeys by concurrent browser sessions.
+
+Each virtual user is a separate pytest process with its own E2E_WORKER_ID (so its own proxy port
+and downloads dir) repeating the selected tests until the duration is over. Users are started
+evenly during the ramp-up and all stop at the same time. At the end journey throughput and latency
+percentiles (from junit reports) and per step percentiles (from timing spans) are shown and
+written into load-report.json.
+
+    python load.py --users 5 --ramp-up 60 --duration 600 --think-time 3 -k test_google_must_search_for_a_query_string
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentile(values, p):
+    """Nearest rank percentile of sorted values."""
+
+    if not values:
+        return None
+    return values[max(int(round(p / 100 * len(values))) - 1, 0)]
+
+
+def distribution(values):
+    values = sorted(values)
+    result = {'count': len(values), 'max': values[-1] if values else None}
+    result.update({f'p{p}': percentile(values, p) for p in PERCENTILES})
+    return result
+
+
+def start_user(user, stop_after, args, pytest_args):
+    cmd = [sys.executable, '-B', '-m', 'pytest', '-p', 'no:cacheprovider', '--loop',
+        '--stop-after', str(stop_after), '--think-time', str(args.think_time), '--timing',
+        f'--junitxml={junit_path(args.log_dir, user)}'] + pytest_args
+    env = dict(os.environ, E2E_WORKER_ID=str(user))
+    out = open(os.path.join(args.log_dir, f'load-user{user}.log'), 'w')
+    return subprocess.Popen(cmd, env=env, stdout=out, stderr=subprocess.STDOUT), out
+
+
+def junit_path(log_dir, user):
+    return os.path.join(log_dir, f'load-user{user}.xml')
+
+
+def read_journeys(log_dir, users):
+    journeys = {}
+    for user in users:
+        path = junit_path(log_dir, user)
+        if not os.path.exists(path):
+            continue
+
+        for case in ET.parse(path).getroot().iter('testcase'):
+            if case.find('skipped') is not None:
+                continue
+            name = case.get('name')
+            failed = case.find('failure') is not None or case.find('error') is not None
+            journeys.setdefault(name, []).append((float(case.get('time', 0)), failed))
+
+    return journeys
+
+
+def read_steps(log_dir, users):
+    steps = {}
+    for user in users:
+        # Spans of the finished rounds are drained into JSON lines, the last round is in the session timeline
+        path = os.path.join(log_dir, f'timing-spans-w{user}.jsonl')
+        if os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    span = json.loads(line)
+                    steps.setdefault(span['name'], []).append(span['duration'])
+
+        path = os.path.join(log_dir, f'timing-session-w{user}.json')
+        if os.path.exists(path):
+            with open(path) as f:
+                for span in json.load(f)['spans']:
+                    steps.setdefault(span['name'], []).append(span['duration'])
+
+    return steps
+
+
+def report(args, users, elapsed):
+    journeys = read_journeys(args.log_dir, users)
+    steps = read_steps(args.log_dir, users)
+    result = {
+        'users': args.users,
+        'ramp_up': args.ramp_up,
+        'duration': elapsed,
+        'think_time': args.think_time,
+        'journeys': {
+            name: {
+                'throughput_per_minute': len(runs) / elapsed * 60,
+                'failures': sum(failed for _, failed in runs),
+                **distribution([seconds for seconds, _ in runs]),
+            } for name, runs in journeys.items()
+        },
+        'steps': {name: distribution(durations) for name, durations in steps.items()},
+    }
+
+    with open(os.path.join(args.log_dir, 'load-report.json'), 'w') as f:
+        json.dump(result, f, indent=1)
+
+    print(f'\n{args.users} users, {elapsed:.0f}s')
+    header = ''.join(f'{f"p{p}":>9}' for p in PERCENTILES)
+    print(f"{'journey':50}{'runs':>7}{'failed':>7}{'/min':>8}{header}")
+    for name, stats in sorted(result['journeys'].items()):
+        values = ''.join(f"{stats[f'p{p}']:9.2f}" for p in PERCENTILES)
+        print(f"{name:50}{stats['count']:7d}{stats['failures']:7d}{stats['throughput_per_minute']:8.2f}{values}")
+
+    print(f"\n{'step':50}{'count':>7}{header}")
+    for name, stats in sorted(result['steps'].items(), key=lambda item: -item[1]['p95']):
+        values = ''.join(f"{stats[f'p{p}']:9.2f}" for p in PERCENTILES)
+        print(f"{name:50}{stats['count']:7d}{values}")
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the tests as user journeys by concurrent browsers. '
+        + 'Unknown arguments are passed to pytest.')
+    parser.add_argument('--users', type=int, default=2, help='Concurrent browser sessions (default: 2)')
+    parser.add_argument('--ramp-up', type=float, default=0, help='Seconds to start all the users in (default: 0)')
+    parser.add_argument('--duration', type=float, default=300,
+        help='Seconds from the first user start to the end, running tests are finished (default: 300)')
+    parser.add_argument('--think-time', type=float, default=0,
+        help='Average pause in seconds between journeys (default: 0)')
+    parser.add_argument('--log-dir', default='/tmp/logs', help='Reports folder (default: /tmp/logs)')
+    args, pytest_args = parser.parse_known_args()
+    os.makedirs(args.log_dir, exist_ok=True)
+
+    users = list(range(1, args.users + 1))
+    procs = []
+    start = time.monotonic()
+    try:
+        for user in users:
+            offset = args.ramp_up * (user - 1) / args.users
+            time.sleep(max(start + offset - time.monotonic(), 0))
+            print(f'Starting user {user}')
+            procs.append(start_user(user, args.duration - offset, args, pytest_args))
+
+        for user, (proc, out) in zip(users, procs):
+            # Stopped by --stop-after the session is interrupted
+            code = proc.wait()
+            out.close()
+            print(f'User {user} exited with {code}')
+    except KeyboardInterrupt:
+        for proc, _ in procs:
+            proc.terminate()
+        for proc, _ in procs:
+            proc.wait()
+
+    report(args, users, time.monotonic() - start)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""
+Cache of the authenticated browser state.
+
+After the login cookies, localStorage and sessionStorage of the SUT origins are captured
+and then put into the new browser sessions instead of logging in again. Cookies can only be
+read and set for the current page origin, so each origin is visited with a cheap request.
+Entries expire after TTL and are dropped when the SUT doesn't accept them.
+"""
+import time
+from urllib.parse import urlsplit
+
+# Same origin url that is cheap to load, it doesn't matter if it's there or not
+ORIGIN_PATH = '/favicon.ico'
+
+CAPTURE_STORAGE_SCRIPT = '''
+const dump = storage => Object.fromEntries(
+    Array.from({length: storage.length}, (_, i) => [storage.key(i), storage.getItem(storage.key(i))]));
+return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+'''
+
+RESTORE_STORAGE_SCRIPT = '''
+const [local, session] = arguments;
+Object.entries(local).forEach(([k, v]) => window.localStorage.setItem(k, v));
+Object.entries(session).forEach(([k, v]) => window.sessionStorage.setItem(k, v));
+'''
+
+
+def origin_of(url):
+    parts = urlsplit(url)
+    return f'{parts.scheme}://{parts.netloc}'
+
+
+class LoginStateCache:
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self._entries = {}
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        state, captured_at = entry
+        if time.monotonic() - captured_at > self.ttl:
+            self.invalidate(key)
+            return None
+
+        return state
+
+    def put(self, key, state):
+        self._entries[key] = (state, time.monotonic())
+
+    def invalidate(self, key):
+        self._entries.pop(key, None)
+
+
+def capture(driver, origins):
+    """Returns {origin: {cookies, local, session}} and gets the browser back to the current page."""
+
+    current_url = driver.current_url
+    current = origin_of(current_url)
+    state = {}
+    for origin in sorted(origins, key=lambda o: o != current):
+        if origin != current:
+            driver.get(origin + ORIGIN_PATH)
+        state[origin] = {'cookies': driver.get_cookies(), **driver.execute_script(CAPTURE_STORAGE_SCRIPT)}
+
+    if driver.current_url != current_url:
+        driver.get(current_url)
+
+    return state
+
+
+def restore(driver, state):
+    for origin, origin_state in state.items():
+        driver.get(origin + ORIGIN_PATH)
+        for cookie in origin_state['cookies']:
+            driver.add_cookie(cookie)
+        driver.execute_script(RESTORE_STORAGE_SCRIPT, origin_state['local'], origin_state['session'])
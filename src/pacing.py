@@ -0,0 +1,115 @@
+"""
+Pacing of ActionChains based interactions.
+
+`human` pauses for the given delay before and between the steps (the original behaviour).
+`fast` makes no pauses, instead it waits until the element is ready: its position is stable
+across animation frames, it's not animating and it's not covered by another element.
+`zero` makes neither pauses nor checks.
+"""
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+HUMAN = 'human'
+FAST = 'fast'
+ZERO = 'zero'
+PROFILES = (HUMAN, FAST, ZERO)
+
+READY_TIMEOUT_MS = 5000
+
+READY_SCRIPT = '''
+const [el, timeoutMs, done] = arguments;
+const started = performance.now();
+let lastRect = null;
+
+function sameRect(a, b) {
+    return a && b && a.x === b.x && a.y === b.y && a.width === b.width && a.height === b.height;
+}
+
+function isCovered(rect) {
+    const x = rect.x + rect.width / 2;
+    const y = rect.y + rect.height / 2;
+    // Element out of the viewport will be scrolled to by move_to_element, nothing to check yet
+    if (x < 0 || y < 0 || x > window.innerWidth || y > window.innerHeight) {
+        return false;
+    }
+    const hit = document.elementFromPoint(x, y);
+    return !(hit && (hit === el || el.contains(hit)));
+}
+
+function isAnimating() {
+    return el.getAnimations({subtree: true}).some(a => a.playState === 'running');
+}
+
+function step() {
+    if (!el.isConnected) {
+        done(false);
+        return;
+    }
+    const rect = el.getBoundingClientRect();
+    if (sameRect(rect, lastRect) && !isAnimating() && !isCovered(rect)) {
+        done(true);
+        return;
+    }
+    if (performance.now() - started > timeoutMs) {
+        done(false);
+        return;
+    }
+    lastRect = rect;
+    requestAnimationFrame(step);
+}
+
+requestAnimationFrame(step);
+'''
+
+_profile = HUMAN
+_stats = {
+    'pauses': 0,
+    # Sum of the delays put into the chains, the chains are performed by WebDriver, so it's not measured
+    'pause_delay_seconds': 0.0,
+    'readiness_checks': 0,
+    'readiness_seconds': 0.0,
+}
+
+
+def set_profile(name):
+    global _profile
+    assert name in PROFILES, f'Unknown pacing profile [{name}], must be one of {PROFILES}'
+    _profile = name
+
+
+def get_profile():
+    return _profile
+
+
+def stats():
+    return dict(_stats, profile=_profile)
+
+
+def pause(actions, delay):
+    """Adds pause to the action chain if current profile pauses at all."""
+
+    if _profile == HUMAN and delay:
+        actions.pause(delay)
+        _stats['pauses'] += 1
+        _stats['pause_delay_seconds'] += delay
+
+    return actions
+
+
+def wait_until_ready(driver, element):
+    """Replaces pauses in the fast profile. Element not ready in time is used anyway, interaction will tell."""
+
+    if _profile != FAST:
+        return element
+
+    start = time.monotonic()
+    try:
+        driver.execute_async_script(READY_SCRIPT, element, READY_TIMEOUT_MS)
+    except WebDriverException as e:
+        print(f'Element readiness check failed: {e}')
+    finally:
+        _stats['readiness_checks'] += 1
+        _stats['readiness_seconds'] += time.monotonic() - start
+
+    return element
@@ -0,0 +1,128 @@
+"""
+Browser Navigation, Resource and Paint Timing of the SUT pages with optional budgets.
+
+Budget is a dict of summary metric name to its max allowed value, e.g.
+{"ttfb_ms": 500, "load_ms": 3000, "transfer_bytes": 5000000}. Budgets come from
+`@pytest.mark.perf_budget(...)` marker for every page of the test and from `--perf-budgets`
+JSON file for pages with matching url: [{"url": "regexp", "budget": {...}}, ...].
+"""
+import json
+import re
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+METRICS = ('ttfb_ms', 'dom_content_loaded_ms', 'load_ms', 'first_contentful_paint_ms',
+           'transfer_bytes', 'resource_count', 'long_task_count')
+# Snapshot taken before the load event has zeros for the load timings
+LOAD_WAIT_TIMEOUT = 10
+
+LOADED_SCRIPT = '''
+const navigation = performance.getEntriesByType('navigation')[0];
+return !navigation || navigation.loadEventEnd > 0;
+'''
+
+# Long tasks are not supported by every browser, Firefox 91 has none of them
+OBSERVE_LONG_TASKS_SCRIPT = '''
+if (!window.__e2eLongTasks && PerformanceObserver.supportedEntryTypes.includes('longtask')) {
+    window.__e2eLongTasks = [];
+    new PerformanceObserver(list => window.__e2eLongTasks.push(...list.getEntries().map(e => e.toJSON())))
+        .observe({type: 'longtask', buffered: true});
+}
+'''
+
+COLLECT_SCRIPT = '''
+const entries = type => performance.getEntriesByType(type).map(e => e.toJSON());
+return {
+    url: location.href,
+    time_origin: performance.timeOrigin,
+    navigation: entries('navigation'),
+    resource: entries('resource'),
+    paint: entries('paint'),
+    longtask: window.__e2eLongTasks || [],
+};
+'''
+
+
+def summarize(snapshot):
+    navigation = snapshot['navigation'][0] if snapshot['navigation'] else {}
+    paint = {e['name']: e['startTime'] for e in snapshot['paint']}
+    return {
+        'ttfb_ms': navigation.get('responseStart'),
+        'dom_content_loaded_ms': navigation.get('domContentLoadedEventEnd'),
+        'load_ms': navigation.get('loadEventEnd') or None,
+        'first_contentful_paint_ms': paint.get('first-contentful-paint'),
+        'transfer_bytes': navigation.get('transferSize', 0) + sum(e.get('transferSize', 0) for e in snapshot['resource']),
+        'resource_count': len(snapshot['resource']),
+        'long_task_count': len(snapshot['longtask']),
+    }
+
+
+def load_budgets(path):
+    with open(path) as f:
+        budgets = json.load(f)
+
+    return [(re.compile(entry['url']), entry['budget']) for entry in budgets]
+
+
+def check_budget(summary, budget):
+    """Returns list of violation messages."""
+
+    violations = []
+    for name, limit in budget.items():
+        assert name in METRICS, f'Unknown perf budget metric [{name}], must be one of {METRICS}'
+        value = summary.get(name)
+        if value is not None and value > limit:
+            violations.append(f'{name} = {value:.0f} exceeds budget {limit}')
+
+    return violations
+
+
+class PerfRecorder:
+    def __init__(self, url_budgets=(), test_budget=None):
+        self.url_budgets = url_budgets
+        self.test_budget = test_budget or {}
+        self.pages = []
+
+    def collect(self, driver):
+        """Takes the snapshot once the page is loaded, returns None if it's the same loaded document as the last one."""
+
+        try:
+            WebDriverWait(driver, LOAD_WAIT_TIMEOUT).until(lambda d: d.execute_script(LOADED_SCRIPT))
+        except TimeoutException:
+            print(f'Page is not loaded in {LOAD_WAIT_TIMEOUT} seconds, collecting performance entries anyway')
+        except WebDriverException as e:
+            print(f'Unable to collect performance entries: {e}')
+            return None
+
+        try:
+            driver.execute_script(OBSERVE_LONG_TASKS_SCRIPT)
+            snapshot = driver.execute_script(COLLECT_SCRIPT)
+        except WebDriverException as e:
+            print(f'Unable to collect performance entries: {e}')
+            return None
+
+        snapshot['summary'] = summarize(snapshot)
+        # The test didn't navigate since the last snapshot, so the same page would be reported twice, 
+        # unless the last one was taken before the load finished
+        if self.pages and self.pages[-1]['time_origin'] == snapshot['time_origin']:
+            if self.pages[-1]['navigation'] == snapshot['navigation']:
+                return None
+            self.pages[-1] = snapshot
+            return snapshot
+
+        self.pages.append(snapshot)
+        return snapshot
+
+    def violations(self):
+        violations = []
+        for page in self.pages:
+            budgets = [self.test_budget] + [budget for pattern, budget in self.url_budgets if pattern.search(page['url'])]
+            for budget in budgets:
+                violations.extend(f"{page['url']}: {v}" for v in check_budget(page['summary'], budget))
+
+        return violations
+
+    def write(self, path):
+        with open(path, 'w') as f:
+            json.dump({'pages': self.pages, 'violations': self.violations()}, f, indent=1)
@@ -0,0 +1,130 @@
+"""
+In-process CPU and memory sampler reading /proc.
+
+System wide CPU and per process group CPU and RSS are sampled in a background thread,
+a process belongs to the group when its executable name starts with the group name,
+so Firefox content processes are counted as firefox. CPU is in percent of one core.
+Samples are kept in array columns, one row per sample, timestamps are epoch seconds
+like the ones of timing spans, so they can be put on the same timeline.
+"""
+import array
+import json
+import os
+import threading
+import time
+
+GROUPS = ('firefox', 'geckodriver', 'mitmdump', 'ffmpeg', 'Xvfb')
+
+_CLK_TCK = os.sysconf('SC_CLK_TCK')
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+
+
+class ProcSampler:
+    def __init__(self, interval=0.5, groups=GROUPS):
+        self.interval = interval
+        self.groups = groups
+        self.columns = ['time', 'system_cpu'] + [f'{g}_{m}' for g in groups for m in ('cpu', 'rss_mb')]
+        self._samples = {name: array.array('d') for name in self.columns}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._pid_groups = {}
+        self._last = None
+
+    def start(self):
+        self._last = self._read()
+        self._thread = threading.Thread(target=self._run, name='proc-sampler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def clear(self):
+        with self._lock:
+            for column in self._samples.values():
+                del column[:]
+
+    def samples(self):
+        with self._lock:
+            return {name: column.tolist() for name, column in self._samples.items()}
+
+    def write(self, path, spans=()):
+        """Writes the samples with optional timing spans of the same period."""
+
+        with open(path, 'w') as f:
+            json.dump({
+                'interval': self.interval,
+                'samples': self.samples(),
+                'spans': [{'name': s.name, 'start': s.start, 'duration': s.duration} for s in spans],
+            }, f)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self._sample()
+            except OSError as e:
+                print(f'Unable to sample /proc: {e}')
+
+    def _sample(self):
+        current = self._read()
+        last, self._last = self._last, current
+        elapsed = current['time'] - last['time']
+        if elapsed <= 0:
+            return
+
+        busy = current['busy'] - last['busy']
+        total = current['total'] - last['total']
+        row = {'time': current['time'], 'system_cpu': 100 * busy / total if total else 0}
+        for group in self.groups:
+            # Ticks of exited processes are gone, so the group ticks may go down
+            ticks = max(current['ticks'][group] - last['ticks'][group], 0)
+            row[f'{group}_cpu'] = 100 * ticks / _CLK_TCK / elapsed
+            row[f'{group}_rss_mb'] = current['rss'][group] / 2**20
+
+        with self._lock:
+            for name, value in row.items():
+                self._samples[name].append(value)
+
+    def _read(self):
+        now = time.time()
+        with open('/proc/stat') as f:
+            values = [int(v) for v in f.readline().split()[1:]]
+        idle = values[3] + values[4]
+        total = sum(values[:8])
+
+        ticks = dict.fromkeys(self.groups, 0)
+        rss = dict.fromkeys(self.groups, 0)
+        alive = {}
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+
+            pid = int(entry)
+            group = self._pid_groups[pid] if pid in self._pid_groups else self._group_of(pid)
+            alive[pid] = group
+            if group is None:
+                continue
+
+            try:
+                with open(f'/proc/{pid}/stat') as f:
+                    # Executable name in parens may contain spaces
+                    fields = f.read().rsplit(')', 1)[1].split()
+            except OSError:
+                continue
+
+            ticks[group] += int(fields[11]) + int(fields[12])
+            rss[group] += int(fields[21]) * _PAGE_SIZE
+
+        self._pid_groups = alive
+        return {'time': now, 'busy': total - idle, 'total': total, 'ticks': ticks, 'rss': rss}
+
+    def _group_of(self, pid):
+        try:
+            with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                executable = os.path.basename(f.read().split(b'\0', 1)[0].decode(errors='replace'))
+        except OSError:
+            return None
+
+        return next((g for g in self.groups if executable.startswith(g)), None)
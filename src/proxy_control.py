@@ -0,0 +1,95 @@
+"""
+Mitmproxy addon to keep one proxy running for the whole session while still
+having a separate flow file per test.
+
+Run as `mitmdump -s proxy_control.py --set control_socket=/tmp/mitmdump.sock`.
+Then `rotate /path/to/flows` command sent to the control socket closes current flow file
+and starts writing to the given one, `rotate` without path just closes current flow file.
+"""
+import asyncio
+import os
+import socket
+import time
+
+from mitmproxy import ctx, io
+
+
+class FlowRotation:
+    def __init__(self):
+        self.file = None
+        self.writer = None
+        self.server = None
+
+    def load(self, loader):
+        loader.add_option('control_socket', str, '', 'Unix socket to accept flow file rotation commands on')
+
+    async def running(self):
+        path = ctx.options.control_socket
+        if path:
+            self.server = await asyncio.start_unix_server(self.handle_command, path=path)
+
+    async def handle_command(self, reader, writer):
+        line = (await reader.readline()).decode().strip()
+        command, _, arg = line.partition(' ')
+        if command == 'rotate':
+            self.rotate(arg or None)
+            writer.write(b'ok\n')
+        else:
+            writer.write(f'unknown command [{command}]\n'.encode())
+        await writer.drain()
+        writer.close()
+
+    def rotate(self, path=None):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            self.writer = None
+
+        if path:
+            self.file = open(path, 'wb')
+            self.writer = io.FlowWriter(self.file)
+
+    def response(self, flow):
+        self.save(flow)
+
+    def error(self, flow):
+        self.save(flow)
+
+    def save(self, flow):
+        if self.writer is None:
+            return
+
+        self.writer.add(flow)
+        # Flow file is read on test failure while the proxy keeps running
+        self.file.flush()
+
+    def done(self):
+        self.rotate()
+        if self.server is not None:
+            self.server.close()
+
+
+addons = [FlowRotation()]
+
+
+def send_command(socket_path, command, timeout=30):
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(socket_path)
+        sock.sendall(f'{command}\n'.encode())
+        reply = sock.makefile().readline().strip()
+
+    if reply != 'ok':
+        raise RuntimeError(f'Proxy command [{command}] failed: {reply}')
+
+
+def wait_for_control_socket(socket_path, proc, timeout=30):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if os.path.exists(socket_path):
+            return
+        if proc.poll() is not None:
+            raise RuntimeError(f'Proxy exited with code {proc.returncode}')
+        time.sleep(0.1)
+
+    raise TimeoutError(f'Proxy control socket [{socket_path}] did not appear in {timeout} seconds')
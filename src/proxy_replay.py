@@ -0,0 +1,189 @@
+"""
+Mitmproxy addon serving SUT responses from the local content-addressed cache.
+
+Cache dir holds response bodies as `objects/<sha256>` and `index.jsonl` where each line maps
+`<method> <url>` to status, headers and body hash, the last line for the key wins.
+Modes (`--set replay_mode=...`):
+
+    record  store every successful GET response into the cache
+    assets  serve requests matching `replay_patterns` (static assets by default) from the cache,
+            store misses, everything else goes to the real backend
+    strict  serve everything from the cache, misses get 504, so the suite can run offline
+
+Cache can also be built from earlier flow dumps with `python proxy_replay.py CACHE_DIR FLOWS...`,
+`python proxy_replay.py --check` stores a flow and serves it back from a temporary cache.
+"""
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+from typing import Sequence
+
+from mitmproxy import ctx, http, io
+
+RECORD = 'record'
+ASSETS = 'assets'
+STRICT = 'strict'
+MODES = (RECORD, ASSETS, STRICT)
+DEFAULT_PATTERNS = (r'\.(js|mjs|css|map|png|jpe?g|gif|svg|webp|ico|woff2?|ttf|otf|eot)(\?|$)',)
+# Responses are served with their own content-length
+SKIP_HEADERS = {'transfer-encoding', 'content-length'}
+
+
+class ResponseCache:
+    def __init__(self, directory):
+        self.directory = directory
+        self.index_path = os.path.join(directory, 'index.jsonl')
+        self.entries = {}
+        os.makedirs(os.path.join(directory, 'objects'), exist_ok=True)
+        if os.path.exists(self.index_path):
+            with open(self.index_path) as f:
+                for line in f:
+                    entry = json.loads(line)
+                    self.entries[entry['key']] = entry
+
+    @staticmethod
+    def key(method, url):
+        return f'{method} {url}'
+
+    def get(self, method, url):
+        entry = self.entries.get(self.key(method, url))
+        if entry is None:
+            return None
+
+        with open(self._object_path(entry['body']), 'rb') as f:
+            return entry, f.read()
+
+    def put(self, method, url, status, headers, body):
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            # Other workers may share the cache, so the object appears atomically
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+            with os.fdopen(fd, 'wb') as f:
+                f.write(body)
+            os.replace(tmp_path, path)
+
+        entry = {'key': self.key(method, url), 'status': status, 'headers': headers, 'body': digest}
+        self.entries[entry['key']] = entry
+        with open(self.index_path, 'a') as f:
+            f.write(json.dumps(entry) + '\n')
+
+    def put_flow(self, flow):
+        if flow.request.method != 'GET' or flow.response is None or flow.response.status_code != 200:
+            return False
+
+        headers = [[k, v] for k, v in flow.response.headers.items(multi=True) if k.lower() not in SKIP_HEADERS]
+        self.put(flow.request.method, flow.request.pretty_url, flow.response.status_code, headers,
+            flow.response.raw_content or b'')
+        return True
+
+    def _object_path(self, digest):
+        return os.path.join(self.directory, 'objects', digest)
+
+
+class Replay:
+    def __init__(self):
+        self.cache = None
+        self.patterns = []
+
+    def load(self, loader):
+        loader.add_option('replay_cache', str, '', 'Response cache directory')
+        loader.add_option('replay_mode', str, RECORD, f'One of {MODES}')
+        loader.add_option('replay_patterns', Sequence[str], list(DEFAULT_PATTERNS),
+            'Url regexps served from the cache in assets mode')
+
+    def configure(self, updated):
+        if ctx.options.replay_mode not in MODES:
+            raise ValueError(f'replay_mode must be one of {MODES}')
+        if ctx.options.replay_cache and (self.cache is None or 'replay_cache' in updated):
+            self.cache = ResponseCache(ctx.options.replay_cache)
+        self.patterns = [re.compile(p) for p in ctx.options.replay_patterns]
+
+    def request(self, flow):
+        mode = ctx.options.replay_mode
+        if self.cache is None or mode == RECORD:
+            return
+
+        url = flow.request.pretty_url
+        if mode == ASSETS and not any(p.search(url) for p in self.patterns):
+            return
+
+        cached = self.cache.get(flow.request.method, url)
+        if cached is None:
+            if mode == STRICT:
+                flow.response = http.Response.make(504, f'Not in replay cache: {url}'.encode())
+            return
+
+        entry, body = cached
+        # Index keeps headers as str pairs, Headers takes bytes only
+        headers = http.Headers([(k.encode('latin-1'), v.encode('latin-1')) for k, v in entry['headers']])
+        response = http.Response.make(entry['status'], b'', headers)
+        response.raw_content = body
+        response.headers['content-length'] = str(len(body))
+        flow.response = response
+        flow.metadata['replayed'] = True
+
+    def response(self, flow):
+        mode = ctx.options.replay_mode
+        if self.cache is None or mode == STRICT or flow.metadata.get('replayed'):
+            return
+
+        if mode == ASSETS and not any(p.search(flow.request.pretty_url) for p in self.patterns):
+            return
+
+        self.cache.put_flow(flow)
+
+
+addons = [Replay()]
+
+
+def build_cache(directory, flow_paths):
+    cache = ResponseCache(directory)
+    count = 0
+    for path in flow_paths:
+        with open(path, 'rb') as f:
+            for flow in io.FlowReader(f).stream():
+                if isinstance(flow, http.HTTPFlow) and cache.put_flow(flow):
+                    count += 1
+
+    return count
+
+
+def check_round_trip():
+    """Stores a response with put_flow and serves it back in strict mode, raises AssertionError if it differs."""
+
+    from mitmproxy.test import taddons, tflow
+
+    with tempfile.TemporaryDirectory() as directory:
+        addon = Replay()
+        with taddons.context(addon) as tctx:
+            tctx.configure(addon, replay_cache=directory, replay_mode=STRICT)
+            flow = tflow.tflow(resp=True)
+            flow.response.headers['content-type'] = 'text/css'
+            flow.response.headers.add('set-cookie', 'a=1')
+            flow.response.headers.add('set-cookie', 'b=2')
+            assert addon.cache.put_flow(flow)
+
+            replayed = tflow.tflow()
+            addon.request(replayed)
+            assert replayed.metadata.get('replayed'), 'Response is not served from the cache'
+            assert replayed.response.status_code == flow.response.status_code
+            assert replayed.response.raw_content == flow.response.raw_content
+            assert replayed.response.headers['content-type'] == 'text/css'
+            assert replayed.response.headers.get_all('set-cookie') == ['a=1', 'b=2']
+
+
+if __name__ == '__main__':
+    if sys.argv[1:] == ['--check']:
+        check_round_trip()
+        print('Round trip is fine')
+        sys.exit(0)
+
+    if len(sys.argv) < 3:
+        print(f'Usage: {sys.argv[0]} CACHE_DIR FLOWS... | --check')
+        sys.exit(1)
+
+    print(f'{build_cache(sys.argv[1], sys.argv[2:])} responses cached')
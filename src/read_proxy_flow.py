@@ -2,21 +2,31 @@
 """
 Read a mitmproxy dump file.
 """
-from mitmproxy import io, http
-from mitmproxy.exceptions import FlowReadException
-import pprint
+import argparse
 import sys
 
-with open(sys.argv[1], "rb") as logfile:
-    freader = io.FlowReader(logfile)
-    pp = pprint.PrettyPrinter(indent=4)
-    try:
-        for f in freader.stream():
-            print(f)
-            if isinstance(f, http.HTTPFlow):
-                print(f.request.host)
-            pp.pprint(f.get_state())
-            print("")
-    except FlowReadException as e:
-        print(f"Flow file corrupted: {e}")
+from flow_reader import DEFAULT_MAX_BODY_SIZE, write_flows
 
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('path', help='Mitmproxy dump file')
+    parser.add_argument('--index', help='Also write compact tab separated index of flows to this file')
+    parser.add_argument('--max-body-size', type=int, default=DEFAULT_MAX_BODY_SIZE,
+        help=f'Truncate and hash bodies above this size (default: {DEFAULT_MAX_BODY_SIZE})')
+    parser.add_argument('--host', action='append', help='Only show flows of this host')
+    parser.add_argument('--status', action='append', help='Only show flows with this status, e.g. 404 or 5xx')
+    parser.add_argument('--content-type', action='append', help='Only show flows with this content type')
+    args = parser.parse_args()
+
+    kwargs = dict(max_body_size=args.max_body_size, hosts=args.host, statuses=args.status,
+        content_types=args.content_type)
+    if args.index:
+        with open(args.index, 'w') as index_out:
+            write_flows(args.path, sys.stdout, index_out, **kwargs)
+    else:
+        write_flows(args.path, sys.stdout, **kwargs)
+
+
+if __name__ == '__main__':
+    main()
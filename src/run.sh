@@ -1,6 +1,11 @@
 #!/usr/bin/env bash 
 
 HEADLESS=0
+HEADLESS_BACKEND=xvfb
+LOAD=0
+SERVER=0
+# Must match DISPLAY_NUM in defs.py so that ffmpeg grabs the right screen
+DISPLAY_NUM=$((99 + ${E2E_WORKER_ID:-0}))
 
 ARGS=()
 
@@ -9,6 +14,21 @@ while [ ${#} -gt 0 ]; do
         --headless)
             HEADLESS=1
             ;;
+        --headless-backend)
+            # pytest option too, Firefox is started with -headless there
+            HEADLESS_BACKEND="${2}"
+            ARGS+=("${1}" "${2}")
+            shift
+            ;;
+        --load)
+            LOAD=1
+            ;;
+        --server)
+            SERVER=1
+            ;;
+        --bench)
+            ARGS+=(bench_harness.py)
+            ;;
         *)
             ARGS+=("${1}")
             ;;
@@ -19,9 +39,24 @@ done
 
 set -eux
 
-if [ ${HEADLESS} -eq 1 ]; then
-    xvfb-run -a --server-args="-screen 0 1920x1080x24 -ac -nolisten tcp -dpi 96 +extension RANDR" \
-        python -B -m pytest -p no:cacheprovider --exitfirst --record-screen "${ARGS[@]}"
+# Load mode runs its own pytest per virtual user, no screen recording there
+if [ ${LOAD} -eq 1 ]; then
+    CMD=(python -B load.py)
+# Server passes the rest of the args to every job
+elif [ ${SERVER} -eq 1 ] && [ ${HEADLESS} -eq 1 ]; then
+    CMD=(python -B -u server.py -p no:cacheprovider --exitfirst --record-screen)
+elif [ ${SERVER} -eq 1 ]; then
+    CMD=(python -B -u server.py -p no:cacheprovider --exitfirst)
+elif [ ${HEADLESS} -eq 1 ]; then
+    CMD=(python -B -m pytest -p no:cacheprovider --exitfirst --record-screen)
+else
+    CMD=(python -B -m pytest -p no:cacheprovider --exitfirst)
+fi
+
+# Native headless Firefox needs no X server
+if [ ${HEADLESS} -eq 1 ] && [ "${HEADLESS_BACKEND}" = "xvfb" ]; then
+    xvfb-run -a -n "${DISPLAY_NUM}" --server-args="-screen 0 1920x1080x24 -ac -nolisten tcp -dpi 96 +extension RANDR" \
+        "${CMD[@]}" "${ARGS[@]}"
 else
-    python -B -m pytest -p no:cacheprovider --exitfirst "${ARGS[@]}"
+    "${CMD[@]}" "${ARGS[@]}"
 fi
@@ -0,0 +1,91 @@
+"""
+Screen recording for the native headless backend, where there is no X display for ffmpeg to grab.
+
+The browser screenshots are taken every interval seconds in a background thread and kept in
+the directory as numbered png frames, the oldest ones are removed once there are more than `keep`.
+On failure the frames are assembled into a clip with ffmpeg, each frame lasts till the next one
+was taken and the time it was taken is drawn in the corner like in x11grab recordings.
+Screenshot is a regular WebDriver command, so it waits for the test commands in flight.
+"""
+import os
+import shlex
+import subprocess
+import threading
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+FRAME_SUFFIX = '.png'
+
+
+class ScreenShotRecorder:
+    def __init__(self, driver, directory, interval=1.0, keep=None):
+        self.driver = driver
+        self.directory = directory
+        self.interval = interval
+        self.keep = keep
+        self._frames = []
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name='screen-shots', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def frames(self):
+        """Returns [(epoch seconds, file name)] of the kept frames, oldest first."""
+
+        return list(self._frames)
+
+    def _run(self):
+        number = 0
+        while True:
+            started = time.time()
+            try:
+                png = self.driver.get_screenshot_as_png()
+            except WebDriverException:
+                # Alerts block screenshots and the browser may be gone at the end of the test
+                png = None
+
+            if png is not None:
+                name = f'{number:06d}{FRAME_SUFFIX}'
+                with open(os.path.join(self.directory, name), 'wb') as f:
+                    f.write(png)
+                self._frames.append((started, name))
+                number += 1
+                if self.keep is not None and len(self._frames) > self.keep:
+                    _, oldest = self._frames.pop(0)
+                    os.remove(os.path.join(self.directory, oldest))
+
+            if self._stop.wait(max(0.0, self.interval - (time.time() - started))):
+                return
+
+
+def make_clip(directory, frames, dest):
+    """Encodes [(epoch seconds, file name)] frames of the directory into webm with the real time between them."""
+
+    if not frames:
+        print('No screenshots taken, no clip to make')
+        return
+
+    list_path = os.path.join(directory, 'frames.txt')
+    with open(list_path, 'w') as f:
+        for (taken, name), (next_taken, _) in zip(frames, frames[1:] + [(frames[-1][0] + 1, None)]):
+            f.write(f"file '{name}'\nduration {next_taken - taken:.3f}\n")
+        # concat demuxer ignores the duration of the last file unless it's repeated
+        f.write(f"file '{frames[-1][1]}'\n")
+
+    text = f'%{{pts\\:localtime\\:{int(frames[0][0])}}}'
+    filters = 'scale=trunc(iw/2)*2:trunc(ih/2)*2,' \
+        + 'drawtext="fontfile=/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf: ' \
+        + f'text={text}: fontcolor=white: fontsize=24: box=1: boxcolor=black@0.5: boxborderw=5: x=(w-text_w): y=0"'
+    cmd = f'nice -n 19 ffmpeg -loglevel fatal -f concat -safe 0 -i {list_path} -vf {filters} -vsync vfr ' \
+        + f'-c:v libvpx -quality good -cpu-used 4 -b:v 384k -qmin 10 -qmax 42 -an {dest}'
+    subprocess.run(shlex.split(cmd), check=True)
@@ -0,0 +1,140 @@
+"""
+Test server: keeps the container, Xvfb and the interpreter with heavy libraries imported warm
+and runs pytest jobs sent by client.py over the unix socket.
+
+Every job runs in the forked process, so the sources (mounted with ./run --mount-src) are
+imported fresh while selenium, mitmproxy, psycopg and the pytest plugins are already there.
+Jobs run one by one. The job output is streamed back in frames: 1 byte kind, 4 bytes length, payload.
+Arguments the server is started with are prepended to the arguments of every job.
+"""
+import importlib
+import json
+import os
+import shutil
+import signal
+import socket
+import struct
+import sys
+
+SOCKET_PATH = '/tmp/e2e-server.sock'
+ARTIFACT_DIRS = ('/tmp/failure_logs', '/tmp/logs')
+WARM_MODULES = ('pytest', 'selenium.webdriver', 'pytest_selenium', 'pytest_html', 'mitmproxy.io', 'mitmproxy.http',
+                'psycopg', 'psycopg_pool', 'zstandard', 'flask')
+
+JOB = b'J'
+OUTPUT = b'O'
+EXIT = b'X'
+_HEADER = struct.Struct('>cI')
+
+
+def send_frame(conn, kind, payload):
+    conn.sendall(_HEADER.pack(kind, len(payload)) + payload)
+
+
+def recv_frame(conn):
+    """Returns (kind, payload) or None if the connection is closed."""
+
+    header = _recv_exactly(conn, _HEADER.size)
+    if header is None:
+        return None
+
+    kind, length = _HEADER.unpack(header)
+    payload = _recv_exactly(conn, length)
+    return None if payload is None else (kind, payload)
+
+
+def _recv_exactly(conn, size):
+    data = b''
+    while len(data) < size:
+        chunk = conn.recv(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def warm_up():
+    for name in WARM_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError as e:
+            print(f'Unable to import {name}: {e}')
+
+
+def run_job(conn, args, job):
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        conn.close()
+        os.dup2(write_fd, sys.stdout.fileno())
+        os.dup2(write_fd, sys.stderr.fileno())
+        _clear_artifacts()
+        os.environ['COLUMNS'] = str(job.get('columns', 80))
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        import pytest
+        code = pytest.main(args + (['--color=yes'] if job.get('tty') else []))
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(int(code))
+
+    os.close(write_fd)
+    client_gone = False
+    with os.fdopen(read_fd, 'rb', buffering=0) as output:
+        # Output is read till the end even if the client is gone, otherwise the job blocks on the full pipe
+        for chunk in iter(lambda: output.read(65536), b''):
+            if client_gone:
+                continue
+            try:
+                send_frame(conn, OUTPUT, chunk)
+            except OSError:
+                client_gone = True
+                print('Client is gone, interrupting the job')
+                os.kill(pid, signal.SIGINT)
+
+    _, status = os.waitpid(pid, 0)
+    code = os.WEXITSTATUS(status) if os.WIFEXITED(status) else 128 + os.WTERMSIG(status)
+    print(f'Job {args} exited with {code}')
+    if not client_gone:
+        try:
+            send_frame(conn, EXIT, struct.pack('>i', code))
+        except OSError:
+            pass
+
+
+def _clear_artifacts():
+    # Artifacts of the previous job would be taken by ./run --attach otherwise
+    for directory in ARTIFACT_DIRS:
+        if not os.path.isdir(directory):
+            continue
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                os.remove(path)
+
+
+def serve(default_args):
+    warm_up()
+    if os.path.exists(SOCKET_PATH):
+        os.remove(SOCKET_PATH)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(SOCKET_PATH)
+    server.listen()
+    print(f'Listening on {SOCKET_PATH}, default pytest args {default_args}', flush=True)
+
+    while True:
+        conn, _ = server.accept()
+        with conn:
+            frame = recv_frame(conn)
+            if frame is None or frame[0] != JOB:
+                continue
+
+            job = json.loads(frame[1])
+            run_job(conn, default_args + job['args'], job)
+
+
+if __name__ == '__main__':
+    serve(sys.argv[1:])
@@ -1,7 +1,7 @@
 import string
 import random
-from datetime import datetime, timedelta
-import time
+from datetime import datetime
+import glob
 import os
 import traceback
 import selenium
@@ -14,6 +14,35 @@ from selenium.webdriver.common.keys import Keys
 from contextlib import contextmanager
 
 from defs import DEFAULT_TIMEOUT, DOWNLOAD_DIR, DEFAULT_DELAY
+from dom_wait import wait_until, poll_frequency, VISIBLE, CLICKABLE
+from pacing import pause, wait_until_ready
+from downloads import DownloadWatcher
+from timing import timed
+
+# Select all then delete as the user would do, it's the single round trip whatever the text length is
+SELECT_ALL_AND_DELETE = Keys.CONTROL + 'a' + Keys.NULL + Keys.DELETE
+
+# Native setter bypasses React's value tracking, then input and change events let React and Vue see the change.
+# The setter throws on other elements with value (custom widgets), their value is returned as is for the fallback
+CLEAR_VALUE_SCRIPT = '''
+const el = arguments[0];
+if (!(el instanceof HTMLInputElement || el instanceof HTMLTextAreaElement)) {
+    return el.value;
+}
+const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, '');
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+return el.value;
+'''
+
+CLEAR_CONTENT_EDITABLE_SCRIPT = '''
+const el = arguments[0];
+el.focus();
+document.getSelection().selectAllChildren(el);
+document.execCommand('delete');
+return el.innerText;
+'''
 
 
 def random_str(length=8):
@@ -26,13 +55,11 @@ def get_current_day():
 
 
 def wait_for_element_to_be_visible(driver, selector, timeout=DEFAULT_TIMEOUT):
-    wait = WebDriverWait(driver, timeout)    
-    return wait.until(EC.visibility_of_element_located((By.XPATH, selector)))
+    return wait_until(driver, By.XPATH, selector, VISIBLE, timeout)
 
 
 def wait_for_element_to_be_clickable(driver, selector, timeout=DEFAULT_TIMEOUT):
-    wait = WebDriverWait(driver, timeout)
-    return wait.until(EC.element_to_be_clickable((By.XPATH, selector)))
+    return wait_until(driver, By.XPATH, selector, CLICKABLE, timeout)
 
 
 # fixme: this didn't work
@@ -45,7 +72,8 @@ def wait_for_element_to_be_clickable(driver, selector, timeout=DEFAULT_TIMEOUT):
 def wait_for_new_window(driver, timeout=DEFAULT_TIMEOUT):
     handles_before = driver.window_handles
     yield
-    WebDriverWait(driver, timeout).until(lambda driver: len(handles_before) != len(driver.window_handles))
+    WebDriverWait(driver, timeout, poll_frequency=poll_frequency()).until(
+        lambda driver: len(handles_before) != len(driver.window_handles))
 
 
 @contextmanager
@@ -59,56 +87,87 @@ def scroll_to_then_back(driver, y, x=0):
     driver.execute_script(f"window.scrollTo({src_x}, {src_y});")
 
 
+@timed
 def hover_then_click(driver, element_or_selector, double_click=False, delay=DEFAULT_DELAY, timeout=DEFAULT_TIMEOUT):
     if isinstance(element_or_selector, str):
         element_or_selector = wait_for_element_to_be_clickable(driver, element_or_selector, timeout)
 
+    wait_until_ready(driver, element_or_selector)
+    actions = pause(ActionChains(driver), delay).move_to_element(element_or_selector)
+    actions = pause(actions, delay).click()
     if double_click:
-        ActionChains(driver).pause(delay).move_to_element(element_or_selector).pause(delay).click().pause(delay).click().perform()
-    else:
-        ActionChains(driver).pause(delay).move_to_element(element_or_selector).pause(delay).click().perform()
+        actions = pause(actions, delay).click()
+    actions.perform()
 
     return element_or_selector
 
 
+@timed
 def hover_then_click_then_send_keys(driver, element_or_selector, keys, delay=DEFAULT_DELAY, clear_first=False):
     if isinstance(element_or_selector, str):
         element_or_selector = wait_for_element_to_be_clickable(driver, element_or_selector)
 
+    wait_until_ready(driver, element_or_selector)
     if clear_first:
-        ActionChains(driver).pause(delay).move_to_element(element_or_selector).pause(delay).click(element_or_selector).perform()
+        actions = pause(ActionChains(driver), delay).move_to_element(element_or_selector)
+        pause(actions, delay).click(element_or_selector).perform()
         clear_element(driver, element_or_selector)
 
-    ActionChains(driver).pause(delay).move_to_element(element_or_selector).pause(delay).click(element_or_selector).pause(delay).send_keys_to_element(element_or_selector, keys).perform()
+    actions = pause(ActionChains(driver), delay).move_to_element(element_or_selector)
+    actions = pause(actions, delay).click(element_or_selector)
+    pause(actions, delay).send_keys_to_element(element_or_selector, keys).perform()
 
     return element_or_selector
 
 
+@timed
 def just_hover(driver, element_or_selector, delay=DEFAULT_DELAY):
     if isinstance(element_or_selector, str):
         element_or_selector = wait_for_element_to_be_visible(driver, element_or_selector)
 
-    ActionChains(driver).pause(delay).move_to_element(element_or_selector).pause(delay).perform()
+    wait_until_ready(driver, element_or_selector)
+    actions = pause(ActionChains(driver), delay).move_to_element(element_or_selector)
+    pause(actions, delay).perform()
 
     return element_or_selector
 
 
+@timed
 def clear_element(driver, element_or_selector, delay=DEFAULT_DELAY):
     if isinstance(element_or_selector, str):
         element_or_selector = wait_for_element_to_be_clickable(driver, element_or_selector)
 
+    element_or_selector.send_keys(SELECT_ALL_AND_DELETE)
+    if not element_or_selector.get_property('value'):
+        return element_or_selector
+
+    if not driver.execute_script(CLEAR_VALUE_SCRIPT, element_or_selector):
+        return element_or_selector
+
+    # Widget rejects both, erase it char by char
     while element_or_selector.get_property('value'):
         element_or_selector.send_keys(Keys.BACK_SPACE)
 
     return element_or_selector    
 
 
+@timed
 def clear_non_input_element(driver, element_or_selector, delay=DEFAULT_DELAY):
     if isinstance(element_or_selector, str):
         element_or_selector = wait_for_element_to_be_clickable(driver, element_or_selector)
 
-    ActionChains(driver).pause(delay).move_to_element(element_or_selector).pause(delay).click(element_or_selector).perform()
+    wait_until_ready(driver, element_or_selector)
+    actions = pause(ActionChains(driver), delay).move_to_element(element_or_selector)
+    pause(actions, delay).click(element_or_selector).perform()
+
+    element_or_selector.send_keys(SELECT_ALL_AND_DELETE)
+    if not element_or_selector.text:
+        return element_or_selector
 
+    if not driver.execute_script(CLEAR_CONTENT_EDITABLE_SCRIPT, element_or_selector).strip():
+        return element_or_selector
+
+    # Widget rejects both, erase it char by char
     while element_or_selector.text:
         element_or_selector.send_keys(Keys.BACK_SPACE)
 
@@ -118,19 +177,22 @@ def clear_non_input_element(driver, element_or_selector, delay=DEFAULT_DELAY):
 def wait_for_file_to_be_downloaded(file_name, timeout=DEFAULT_TIMEOUT):
     full_fn = os.path.join(DOWNLOAD_DIR, file_name)
     print(f'Waiting for file to download [{full_fn}] {timeout} seconds')
+    # Exact name, [ and * in it are not patterns
+    return wait_for_files_to_be_downloaded([glob.escape(file_name)], timeout) is not None
+
+
+@timed
+def wait_for_files_to_be_downloaded(patterns, timeout=DEFAULT_TIMEOUT):
+    """Waits for a complete download matching each of glob patterns, returns list of Download or None on timeout."""
 
-    start = datetime.utcnow()
-    end = start + timedelta(seconds=timeout)
+    with DownloadWatcher(DOWNLOAD_DIR) as watcher:
+        downloads = watcher.wait(patterns, timeout)
 
-    while datetime.utcnow() < end:
-        exists = os.path.exists(full_fn)
-        if exists:
-            size = os.path.getsize(full_fn)
-            print(f'File size [{size}] bytes')
-            return True
-        time.sleep(1)
+    for download in downloads or []:
+        throughput = f', {download.throughput / 1024:.1f} KiB/s' if download.throughput else ''
+        print(f'File [{download.path}] size [{download.size}] bytes{throughput}')
 
-    return False
+    return downloads
 
 
 def element_text_matches(locator, regexp):
@@ -144,6 +206,7 @@ def element_text_matches(locator, regexp):
     return _predicate
 
 
+@timed
 def click_with_js(driver, xpath_selector):
     wait_for_element_to_be_clickable(driver, xpath_selector)
     driver.execute_script(f'document.evaluate(\'{xpath_selector}\', document).iterateNext().dispatchEvent(new Event("click"))')
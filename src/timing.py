@@ -0,0 +1,147 @@
+"""
+Low overhead recorder of named time spans, e.g. fixtures setup, navigation, waits and helpers.
+
+Spans are kept in memory as tuples and written as a per-test and per-session JSON timeline,
+optionally as a Chrome trace-event file (open it in chrome://tracing or https://ui.perfetto.dev).
+Spans of the running test are also kept by its id till end_test, so its timeline doesn't scan the session.
+Long runs (see --loop) drain the session spans into JSON lines file, only their totals stay in memory.
+Recording is no-op unless enabled.
+"""
+import collections
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+Span = collections.namedtuple('Span', 'test name start duration thread')
+
+_enabled = False
+_current_test = None
+_spans = []
+_test_spans = {}
+# name: (count, total, max) of the drained spans
+_drained = {}
+
+
+def enable(enabled=True):
+    global _enabled
+    _enabled = enabled
+
+
+def is_enabled():
+    return _enabled
+
+
+def set_current_test(test):
+    global _current_test
+    _current_test = test
+
+
+def add(name, start, duration, test=None):
+    """Records span measured elsewhere, start is epoch seconds."""
+
+    if _enabled:
+        _record(Span(test or _current_test, name, start, duration, threading.get_ident()))
+
+
+@contextmanager
+def span(name):
+    if not _enabled:
+        yield
+        return
+
+    start = time.time()
+    counter = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record(Span(_current_test, name, start, time.perf_counter() - counter, threading.get_ident()))
+
+
+def _record(s):
+    _spans.append(s)
+    if s.test is not None:
+        _test_spans.setdefault(s.test, []).append(s)
+
+
+def end_test(test):
+    """Forgets the test spans kept by id, the session timeline still has them. The test may run again."""
+
+    _test_spans.pop(test, None)
+
+
+def timed(func):
+    """Records each call of the decorated function as a span named after it."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with span(func.__name__):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def drain(path):
+    """Appends the session spans to JSON lines file and forgets them, slowest still counts them."""
+
+    global _spans
+    if not _spans:
+        return
+
+    drained, _spans = _spans, []
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'a') as f:
+        for s in drained:
+            f.write(json.dumps({'test': s.test, 'name': s.name, 'start': s.start, 'duration': s.duration}) + '\n')
+    _add_totals(_drained, drained)
+
+
+def _add_totals(totals, selected):
+    for s in selected:
+        count, total, longest = totals.get(s.name, (0, 0.0, 0.0))
+        totals[s.name] = (count + 1, total + s.duration, max(longest, s.duration))
+
+
+def spans(test=None):
+    return list(_spans) if test is None else list(_test_spans.get(test, ()))
+
+
+def slowest(limit=10, test=None):
+    """Phases aggregated by name as (name, count, total, max) ordered by total time."""
+
+    totals = dict(_drained) if test is None else {}
+    _add_totals(totals, spans(test))
+
+    rows = [(name, *values) for name, values in totals.items()]
+    return sorted(rows, key=lambda row: row[2], reverse=True)[:limit]
+
+
+def write_timeline(path, test=None):
+    selected = spans(test)
+    origin = min((s.start for s in selected), default=0)
+    timeline = [
+        {'test': s.test, 'name': s.name, 'start': s.start, 'offset': s.start - origin, 'duration': s.duration}
+        for s in sorted(selected, key=lambda s: s.start)
+    ]
+    _write_json(path, {'test': test, 'spans': timeline, 'slowest': [
+        {'name': name, 'count': count, 'total': total, 'max': longest}
+        for name, count, total, longest in slowest(limit=None, test=test)
+    ]})
+
+
+def write_chrome_trace(path, test=None):
+    pid = os.getpid()
+    events = [
+        {'name': s.name, 'cat': s.test or 'session', 'ph': 'X', 'pid': pid, 'tid': s.thread,
+         'ts': int(s.start * 1e6), 'dur': int(s.duration * 1e6)}
+        for s in spans(test)
+    ]
+    _write_json(path, {'traceEvents': events, 'displayTimeUnit': 'ms'})
+
+
+def _write_json(path, content):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(content, f, indent=1)